@@ -0,0 +1,68 @@
+"""Add qr_scan_daily rollup table
+
+Revision ID: k1l2m3n4o5p6
+Revises: 1f3d265025ac
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "k1l2m3n4o5p6"
+down_revision: Union[str, None] = "1f3d265025ac"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create qr_scan_daily and backfill it from existing scans"""
+
+    op.create_table(
+        "qr_scan_daily",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("qr_code_id", postgresql.UUID(as_uuid=True), nullable=False),
+        # Bucket dimensions
+        sa.Column("day", sa.Date(), nullable=False, comment="Scan date (UTC)"),
+        sa.Column("device_type", sa.String(length=50), nullable=False, server_default="unknown"),
+        sa.Column("country", sa.String(length=2), nullable=False, server_default=""),
+        # Counters
+        sa.Column("scans", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("started", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("leads", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["qr_code_id"], ["qr_codes.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("qr_code_id", "day", "device_type", "country", name="uq_qr_scan_daily_bucket"),
+    )
+
+    op.create_index("idx_qr_scan_daily_qr_code_day", "qr_scan_daily", ["qr_code_id", "day"])
+
+    # Backfill from raw scans
+    op.execute(
+        """
+        INSERT INTO qr_scan_daily (id, qr_code_id, day, device_type, country, scans, started, completed, leads)
+        SELECT
+            gen_random_uuid(),
+            qr_code_id,
+            CAST(scanned_at AS DATE),
+            COALESCE(NULLIF(device_type, ''), 'unknown'),
+            COALESCE(country, ''),
+            COUNT(*),
+            COUNT(*) FILTER (WHERE assessment_started),
+            COUNT(*) FILTER (WHERE assessment_completed),
+            COUNT(*) FILTER (WHERE lead_created)
+        FROM qr_code_scans
+        GROUP BY qr_code_id, CAST(scanned_at AS DATE), COALESCE(NULLIF(device_type, ''), 'unknown'), COALESCE(country, '')
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop qr_scan_daily"""
+    op.drop_index("idx_qr_scan_daily_qr_code_day", table_name="qr_scan_daily")
+    op.drop_table("qr_scan_daily")
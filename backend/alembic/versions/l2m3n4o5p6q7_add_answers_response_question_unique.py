@@ -0,0 +1,47 @@
+"""Add unique constraint on answers (response_id, question_id)
+
+Revision ID: l2m3n4o5p6q7
+Revises: k1l2m3n4o5p6
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "l2m3n4o5p6q7"
+down_revision: Union[str, None] = "k1l2m3n4o5p6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Deduplicate answers and enforce one answer per question per response"""
+
+    # Keep the most recent answer for each (response_id, question_id)
+    op.execute(
+        """
+        DELETE FROM answers a
+        USING (
+            SELECT id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY response_id, question_id
+                       ORDER BY answered_at DESC, id DESC
+                   ) AS rn
+            FROM answers
+        ) ranked
+        WHERE a.id = ranked.id AND ranked.rn > 1
+        """
+    )
+
+    # The unique constraint's index replaces the plain composite index
+    op.drop_index("idx_answers_response_question", table_name="answers")
+    op.create_unique_constraint("uq_answers_response_question", "answers", ["response_id", "question_id"])
+
+
+def downgrade() -> None:
+    """Drop the unique constraint"""
+    op.drop_constraint("uq_answers_response_question", "answers", type_="unique")
+    op.create_index("idx_answers_response_question", "answers", ["response_id", "question_id"])
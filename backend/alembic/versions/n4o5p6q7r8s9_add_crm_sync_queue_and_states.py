@@ -0,0 +1,82 @@
+"""Add CRM sync queue and sync states, integer sync counters
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "n4o5p6q7r8s9"
+down_revision: Union[str, None] = "m3n4o5p6q7r8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the CRM sync queue and sync state tables, make sync counters integers"""
+
+    # Counters are incremented in SQL instead of read-modify-write strings
+    for column in ("total_synced", "failed_syncs"):
+        op.alter_column("crm_integrations", column, server_default=None)
+        op.alter_column(
+            "crm_integrations",
+            column,
+            type_=sa.Integer(),
+            existing_type=sa.String(length=50),
+            postgresql_using=f"{column}::integer",
+            server_default="0",
+            existing_nullable=False,
+        )
+
+    op.create_table(
+        "crm_sync_states",
+        sa.Column("integration_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("lead_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("crm_record_id", sa.String(length=255), nullable=False),
+        sa.Column("field_hashes", sa.JSON(), nullable=False),
+        sa.Column("synced_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.PrimaryKeyConstraint("integration_id", "lead_id"),
+        sa.ForeignKeyConstraint(["integration_id"], ["crm_integrations.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["lead_id"], ["leads.id"], ondelete="CASCADE"),
+    )
+
+    op.create_table(
+        "crm_sync_queue",
+        sa.Column("integration_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("lead_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("enqueued_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.PrimaryKeyConstraint("integration_id", "lead_id"),
+        sa.ForeignKeyConstraint(["integration_id"], ["crm_integrations.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["lead_id"], ["leads.id"], ondelete="CASCADE"),
+    )
+
+    # Claim query: ORDER BY enqueued_at
+    op.create_index("idx_crm_sync_queue_enqueued_at", "crm_sync_queue", ["enqueued_at"])
+
+
+def downgrade() -> None:
+    """Drop the CRM sync queue and sync states, restore string counters"""
+
+    op.drop_index("idx_crm_sync_queue_enqueued_at", table_name="crm_sync_queue")
+    op.drop_table("crm_sync_queue")
+    op.drop_table("crm_sync_states")
+
+    for column in ("total_synced", "failed_syncs"):
+        op.alter_column("crm_integrations", column, server_default=None)
+        op.alter_column(
+            "crm_integrations",
+            column,
+            type_=sa.String(length=50),
+            existing_type=sa.Integer(),
+            postgresql_using=f"{column}::varchar",
+            server_default="0",
+            existing_nullable=False,
+        )
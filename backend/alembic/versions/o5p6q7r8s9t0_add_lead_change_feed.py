@@ -0,0 +1,56 @@
+"""Add lead change feed index and lead_tombstones table
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "o5p6q7r8s9t0"
+down_revision: Union[str, None] = "n4o5p6q7r8s9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index leads for change feed reads and record deleted leads"""
+
+    # Change feed reads: tenant_id = ? AND (updated_at, id) > cursor ORDER BY updated_at, id
+    op.create_index("idx_leads_tenant_updated_at_id", "leads", ["tenant_id", "updated_at", "id"])
+
+    op.create_table(
+        "lead_tombstones",
+        sa.Column("lead_id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+    )
+    op.create_index("idx_lead_tombstones_tenant_deleted_at", "lead_tombstones", ["tenant_id", "deleted_at", "lead_id"])
+
+    # Same tenant isolation as leads
+    op.execute("ALTER TABLE lead_tombstones ENABLE ROW LEVEL SECURITY;")
+    op.execute(
+        """
+        CREATE POLICY lead_tombstone_tenant_isolation ON lead_tombstones
+        FOR ALL
+        USING (tenant_id = current_setting('app.current_tenant_id')::uuid)
+        WITH CHECK (tenant_id = current_setting('app.current_tenant_id')::uuid);
+    """
+    )
+
+
+def downgrade() -> None:
+    """Drop the lead tombstones and change feed index"""
+
+    op.execute("DROP POLICY IF EXISTS lead_tombstone_tenant_isolation ON lead_tombstones;")
+    op.drop_index("idx_lead_tombstones_tenant_deleted_at", table_name="lead_tombstones")
+    op.drop_table("lead_tombstones")
+    op.drop_index("idx_leads_tenant_updated_at_id", table_name="leads")
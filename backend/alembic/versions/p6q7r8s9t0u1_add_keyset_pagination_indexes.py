@@ -0,0 +1,40 @@
+"""Add keyset pagination indexes for list endpoints
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "p6q7r8s9t0u1"
+down_revision: Union[str, None] = "o5p6q7r8s9t0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# List pages: <scope> = ? AND (sort keys, id) < cursor ORDER BY sort keys DESC, id DESC LIMIT n
+KEYSET_INDEXES = [
+    ("idx_leads_tenant_score_created_at_id", "leads", ["tenant_id", "score", "created_at", "id"]),
+    ("idx_assessments_tenant_created_at_id", "assessments", ["tenant_id", "created_at", "id"]),
+    ("idx_audit_logs_tenant_created_at_id", "audit_logs", ["tenant_id", "created_at", "id"]),
+    ("idx_error_logs_tenant_created_at_id", "error_logs", ["tenant_id", "created_at", "id"]),
+    ("idx_qr_codes_tenant_created_at_id", "qr_codes", ["tenant_id", "created_at", "id"]),
+    ("idx_users_tenant_created_at_id", "users", ["tenant_id", "created_at", "id"]),
+    ("idx_crm_sync_logs_integration_created_at_id", "crm_sync_logs", ["integration_id", "created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    """Index list sort orders so that every page is an index range scan"""
+    for name, table, columns in KEYSET_INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes"""
+    for name, table, _ in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,36 @@
+"""Add pg_trgm index for lead search
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "q7r8s9t0u1v2"
+down_revision: Union[str, None] = "p6q7r8s9t0u1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index the lead search document (name, email, company) with trigrams"""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    # Serves ILIKE '%q%' and word similarity (%>) without scanning the tenant's leads.
+    # The expression must match SEARCH_DOCUMENT in app/services/leads/lead_search.py.
+    op.execute(
+        """
+        CREATE INDEX idx_leads_search_trgm ON leads
+        USING gin ((name || ' ' || email || ' ' || coalesce(company, '')) gin_trgm_ops);
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the lead search index (the extension is left installed)"""
+    op.drop_index("idx_leads_search_trgm", table_name="leads")
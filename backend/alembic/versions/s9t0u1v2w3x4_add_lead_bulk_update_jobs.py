@@ -0,0 +1,63 @@
+"""Add lead_bulk_update_jobs table
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "s9t0u1v2w3x4"
+down_revision: Union[str, None] = "r8s9t0u1v2w3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create lead_bulk_update_jobs with tenant isolation"""
+
+    op.create_table(
+        "lead_bulk_update_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("selection", sa.JSON(), nullable=False),
+        sa.Column("changes", sa.JSON(), nullable=False),
+        sa.Column("reason", sa.String(length=255), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("total_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"]),
+    )
+    op.create_index("idx_lead_bulk_update_jobs_tenant_created_at", "lead_bulk_update_jobs", ["tenant_id", "created_at"])
+
+    # Same tenant isolation as leads
+    op.execute("ALTER TABLE lead_bulk_update_jobs ENABLE ROW LEVEL SECURITY;")
+    op.execute(
+        """
+        CREATE POLICY lead_bulk_update_job_tenant_isolation ON lead_bulk_update_jobs
+        FOR ALL
+        USING (tenant_id = current_setting('app.current_tenant_id')::uuid)
+        WITH CHECK (tenant_id = current_setting('app.current_tenant_id')::uuid);
+    """
+    )
+
+
+def downgrade() -> None:
+    """Drop lead_bulk_update_jobs"""
+
+    op.execute("DROP POLICY IF EXISTS lead_bulk_update_job_tenant_isolation ON lead_bulk_update_jobs;")
+    op.drop_index("idx_lead_bulk_update_jobs_tenant_created_at", table_name="lead_bulk_update_jobs")
+    op.drop_table("lead_bulk_update_jobs")
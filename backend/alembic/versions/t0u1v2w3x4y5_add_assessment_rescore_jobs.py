@@ -0,0 +1,71 @@
+"""Add assessment_rescore_jobs table and rescoring indexes
+
+Revision ID: t0u1v2w3x4y5
+Revises: s9t0u1v2w3x4
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "t0u1v2w3x4y5"
+down_revision: Union[str, None] = "s9t0u1v2w3x4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create assessment_rescore_jobs with tenant isolation"""
+
+    op.create_table(
+        "assessment_rescore_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("assessment_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("total_responses", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("processed_responses", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_responses", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_leads", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["assessment_id"], ["assessments.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"]),
+    )
+    op.create_index("idx_assessment_rescore_jobs_tenant_created_at", "assessment_rescore_jobs", ["tenant_id", "created_at"])
+
+    # Rescoring walks an assessment's completed responses in ID order
+    op.create_index("idx_responses_assessment_status_id", "responses", ["assessment_id", "status", "id"])
+    # ... and updates the leads created from them
+    op.create_index("idx_leads_response_id", "leads", ["response_id"])
+
+    # Same tenant isolation as leads
+    op.execute("ALTER TABLE assessment_rescore_jobs ENABLE ROW LEVEL SECURITY;")
+    op.execute(
+        """
+        CREATE POLICY assessment_rescore_job_tenant_isolation ON assessment_rescore_jobs
+        FOR ALL
+        USING (tenant_id = current_setting('app.current_tenant_id')::uuid)
+        WITH CHECK (tenant_id = current_setting('app.current_tenant_id')::uuid);
+    """
+    )
+
+
+def downgrade() -> None:
+    """Drop assessment_rescore_jobs and the rescoring indexes"""
+
+    op.execute("DROP POLICY IF EXISTS assessment_rescore_job_tenant_isolation ON assessment_rescore_jobs;")
+    op.drop_index("idx_leads_response_id", table_name="leads")
+    op.drop_index("idx_responses_assessment_status_id", table_name="responses")
+    op.drop_index("idx_assessment_rescore_jobs_tenant_created_at", table_name="assessment_rescore_jobs")
+    op.drop_table("assessment_rescore_jobs")
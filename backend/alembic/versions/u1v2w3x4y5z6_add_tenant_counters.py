@@ -0,0 +1,68 @@
+"""Add tenant_counters table
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "u1v2w3x4y5z6"
+down_revision: Union[str, None] = "t0u1v2w3x4y5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create tenant_counters with tenant isolation and backfill it"""
+
+    op.create_table(
+        "tenant_counters",
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("counter", sa.String(length=64), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "counter"),
+    )
+
+    # Temperature buckets follow LeadScoreThreshold (hot >= 61, warm >= 31)
+    op.execute(
+        """
+        INSERT INTO tenant_counters (tenant_id, counter, value)
+        SELECT tenant_id, 'leads.total', count(*) FROM leads GROUP BY tenant_id
+        UNION ALL
+        SELECT tenant_id, 'leads.status.' || status, count(*) FROM leads GROUP BY tenant_id, status
+        UNION ALL
+        SELECT tenant_id, 'leads.temperature.' || CASE WHEN score >= 61 THEN 'hot' WHEN score >= 31 THEN 'warm' ELSE 'cold' END, count(*)
+        FROM leads GROUP BY 1, 2
+        UNION ALL
+        SELECT tenant_id, 'assessments.total', count(*) FROM assessments GROUP BY tenant_id
+        UNION ALL
+        SELECT tenant_id, 'assessments.status.' || status, count(*) FROM assessments GROUP BY tenant_id, status
+        """
+    )
+
+    # Same tenant isolation as leads
+    op.execute("ALTER TABLE tenant_counters ENABLE ROW LEVEL SECURITY;")
+    op.execute(
+        """
+        CREATE POLICY tenant_counter_tenant_isolation ON tenant_counters
+        FOR ALL
+        USING (tenant_id = current_setting('app.current_tenant_id')::uuid)
+        WITH CHECK (tenant_id = current_setting('app.current_tenant_id')::uuid);
+    """
+    )
+
+
+def downgrade() -> None:
+    """Drop tenant_counters"""
+
+    op.execute("DROP POLICY IF EXISTS tenant_counter_tenant_isolation ON tenant_counters;")
+    op.drop_table("tenant_counters")
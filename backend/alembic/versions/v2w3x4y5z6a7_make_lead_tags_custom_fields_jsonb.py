@@ -0,0 +1,57 @@
+"""Make lead tags and custom_fields JSONB with GIN indexes
+
+Revision ID: v2w3x4y5z6a7
+Revises: u1v2w3x4y5z6
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "v2w3x4y5z6a7"
+down_revision: Union[str, None] = "u1v2w3x4y5z6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ("tags", "custom_fields")
+
+
+def upgrade() -> None:
+    """Convert tags / custom_fields to JSONB and index them for containment (@>) filters"""
+
+    # Both columns in one ALTER TABLE, so the leads table is rewritten once
+    op.execute(
+        """
+        ALTER TABLE leads
+            ALTER COLUMN tags TYPE jsonb USING tags::jsonb,
+            ALTER COLUMN custom_fields TYPE jsonb USING custom_fields::jsonb
+        """
+    )
+
+    # jsonb_path_ops: smaller and faster than the default opclass, serves @> only
+    for column in COLUMNS:
+        op.create_index(
+            f"idx_leads_{column}",
+            "leads",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Drop the GIN indexes and restore JSON columns"""
+
+    for column in COLUMNS:
+        op.drop_index(f"idx_leads_{column}", table_name="leads")
+
+    op.execute(
+        """
+        ALTER TABLE leads
+            ALTER COLUMN tags TYPE json USING tags::json,
+            ALTER COLUMN custom_fields TYPE json USING custom_fields::json
+        """
+    )
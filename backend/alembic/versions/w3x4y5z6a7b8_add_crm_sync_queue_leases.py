@@ -0,0 +1,28 @@
+"""Lease claimed CRM sync queue rows instead of deleting them
+
+Revision ID: w3x4y5z6a7b8
+Revises: v2w3x4y5z6a7
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "w3x4y5z6a7b8"
+down_revision: Union[str, None] = "v2w3x4y5z6a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add claimed_until: queued leads stay queued until their sync succeeds"""
+    op.add_column("crm_sync_queue", sa.Column("claimed_until", sa.TIMESTAMP(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("crm_sync_queue", "claimed_until")
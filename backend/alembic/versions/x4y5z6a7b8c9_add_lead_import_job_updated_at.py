@@ -0,0 +1,28 @@
+"""Add updated_at to lead_import_jobs for stale job recovery
+
+Revision ID: x4y5z6a7b8c9
+Revises: w3x4y5z6a7b8
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "x4y5z6a7b8c9"
+down_revision: Union[str, None] = "w3x4y5z6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add updated_at: bumped by every committed chunk, so jobs lost in a restart can be told apart"""
+    op.add_column("lead_import_jobs", sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")))
+
+
+def downgrade() -> None:
+    op.drop_column("lead_import_jobs", "updated_at")
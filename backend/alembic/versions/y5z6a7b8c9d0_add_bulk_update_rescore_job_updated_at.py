@@ -0,0 +1,30 @@
+"""Add updated_at to lead_bulk_update_jobs and assessment_rescore_jobs for stale job recovery
+
+Revision ID: y5z6a7b8c9d0
+Revises: x4y5z6a7b8c9
+Create Date: 2026-10-20 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "y5z6a7b8c9d0"
+down_revision: Union[str, None] = "x4y5z6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add updated_at: bumped by every committed chunk, so jobs lost in a restart can be told apart"""
+    for table in ("lead_bulk_update_jobs", "assessment_rescore_jobs"):
+        op.add_column(table, sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")))
+
+
+def downgrade() -> None:
+    for table in ("assessment_rescore_jobs", "lead_bulk_update_jobs"):
+        op.drop_column(table, "updated_at")
@@ -13,6 +13,7 @@ from app.api.v1 import (
     audit_logs,
     auth,
     error_logs,
+    files,
     google_analytics,
     leads,
     qr_codes,
@@ -40,6 +41,7 @@ api_router.include_router(audit_logs.router, tags=["Audit Logs"])
 api_router.include_router(error_logs.router, tags=["Error Logs"])
 api_router.include_router(taxonomies.router, tags=["Taxonomies"])
 api_router.include_router(google_analytics.router, tags=["Google Analytics Integration"])
+api_router.include_router(files.router, tags=["Files"])
 
 
 # Placeholder endpoint
@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_current_user, get_db
+from app.core.responses import ORJSONResponse
 from app.models.user import User
 from app.services.analytics_service import AnalyticsService
 
@@ -47,6 +48,34 @@ async def get_overview_analytics(
     return analytics
 
 
+@router.get(
+    "/tenants/{tenant_id}/analytics/counts",
+    summary="Get dashboard counts",
+    operation_id="getDashboardCounts",
+)
+async def get_dashboard_counts(
+    tenant_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Get lead and assessment counts for dashboard badges
+
+    Returns:
+        - Leads: total, by status, by temperature (hot / warm / cold)
+        - Assessments: total, by status
+    """
+    # Check tenant access
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access to this tenant's analytics is forbidden",
+        )
+
+    service = AnalyticsService(db)
+    return service.get_counts(tenant_id)
+
+
 @router.get(
     "/tenants/{tenant_id}/analytics/leads",
     summary="Get lead analytics",
@@ -141,4 +170,5 @@ async def get_trends(
     service = AnalyticsService(db)
     trends = service.get_trends(tenant_id, period, metric)
 
-    return trends
+    # Rendered by orjson directly, without a jsonable_encoder pass over every data point
+    return ORJSONResponse(trends)
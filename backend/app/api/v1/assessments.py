@@ -4,20 +4,26 @@ Assessment API Endpoints
 REST API for assessment CRUD operations with multi-tenant support.
 """
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_current_user, get_db
+from app.core.responses import json_response
 from app.models.user import User
 from app.schemas.assessment import (
+    ASSESSMENT_LIST_ADAPTER,
     AssessmentCreate,
+    AssessmentRescoreJobResponse,
     AssessmentResponse,
     AssessmentUpdate,
 )
-from app.services.assessment_service import AssessmentService
+from app.services.assessment_rescore_service import AssessmentRescoreService, run_assessment_rescore
+from app.services.assessment_service import ASSESSMENT_LIST_ORDER, AssessmentService
+from app.utils.helpers import next_page_cursor
+from app.utils.projection import FIELDS_DESCRIPTION, parse_fields, projected_list_response
 
 router = APIRouter()
 
@@ -32,12 +38,17 @@ async def list_assessments(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     status_filter: str = Query(None, alias="status"),
+    cursor: Optional[str] = Query(None, description="Cursor of the next page (X-Next-Cursor header of the previous response)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     List all assessments for a specific tenant
 
+    Full pages return the cursor of the next page in the X-Next-Cursor header.
+    Only the columns of the requested fields are loaded.
+
     **Security**: Verifies user belongs to the requested tenant
     """
     # Verify user belongs to this tenant
@@ -48,9 +59,14 @@ async def list_assessments(
         )
 
     service = AssessmentService(db)
-    assessments = service.list_by_tenant(tenant_id=tenant_id, skip=skip, limit=limit, status=status_filter)
+    try:
+        fieldset = parse_fields(fields, AssessmentResponse)
+        assessments = service.list_by_tenant(tenant_id=tenant_id, skip=skip, limit=limit, status=status_filter, cursor=cursor, fields=fieldset)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    return assessments
+    next_cursor = next_page_cursor(assessments, ASSESSMENT_LIST_ORDER, limit)
+    return projected_list_response(assessments, AssessmentResponse, fieldset, headers={"X-Next-Cursor": next_cursor} if next_cursor else None)
 
 
 @router.get(
@@ -77,7 +93,7 @@ async def search_assessments(
     service = AssessmentService(db)
     assessments = service.search_by_title(tenant_id=tenant_id, title_query=q, limit=limit)
 
-    return assessments
+    return json_response(ASSESSMENT_LIST_ADAPTER, assessments)
 
 
 @router.get(
@@ -145,12 +161,17 @@ async def update_assessment(
     tenant_id: UUID,
     assessment_id: UUID,
     assessment_data: AssessmentUpdate,
+    response: Response,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Update an existing assessment
 
+    Changing `scoring_logic` starts a background rescore of the completed
+    responses and their leads; its job ID is returned in X-Rescore-Job-Id.
+
     **Security**: Verifies tenant ownership before update
     """
     # Verify user belongs to this tenant
@@ -165,12 +186,73 @@ async def update_assessment(
     if not existing_assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
 
+    old_scoring_logic = existing_assessment.scoring_logic
+
     # Update assessment
     assessment = service.update(assessment_id=assessment_id, data=assessment_data, tenant_id=tenant_id)
 
+    if assessment_data.scoring_logic is not None and assessment.scoring_logic != old_scoring_logic:
+        job = AssessmentRescoreService(db).create_job(tenant_id=tenant_id, assessment_id=assessment_id, created_by=current_user.id)
+        background_tasks.add_task(run_assessment_rescore, job.id, tenant_id)
+        response.headers["X-Rescore-Job-Id"] = str(job.id)
+
     return assessment
 
 
+@router.post(
+    "/tenants/{tenant_id}/assessments/{assessment_id}/rescores",
+    response_model=AssessmentRescoreJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Rescore an assessment's responses and leads",
+)
+async def rescore_assessment(
+    tenant_id: UUID,
+    assessment_id: UUID,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Recompute the scores of all completed responses and their leads
+
+    Use after option points changed. Runs in the background; poll the
+    returned job for progress.
+    """
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
+
+    if not AssessmentService(db).get_by_id(assessment_id=assessment_id, tenant_id=tenant_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
+
+    job = AssessmentRescoreService(db).create_job(tenant_id=tenant_id, assessment_id=assessment_id, created_by=current_user.id)
+    background_tasks.add_task(run_assessment_rescore, job.id, tenant_id)
+
+    return job
+
+
+@router.get(
+    "/tenants/{tenant_id}/assessments/{assessment_id}/rescores/{job_id}",
+    response_model=AssessmentRescoreJobResponse,
+    summary="Get assessment rescore status",
+)
+async def get_assessment_rescore(
+    tenant_id: UUID,
+    assessment_id: UUID,
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get the progress of an assessment rescore"""
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
+
+    job = AssessmentRescoreService(db).get_job(job_id=job_id, tenant_id=tenant_id)
+    if not job or job.assessment_id != assessment_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Rescore not found")
+
+    return job
+
+
 @router.delete(
     "/tenants/{tenant_id}/assessments/{assessment_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -13,9 +13,12 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.responses import json_response
 from app.models.user import User
-from app.schemas.audit_log import AuditLogResponse, AuditLogsListResponse
+from app.schemas.audit_log import AUDIT_LOG_LIST_ADAPTER, AuditLogResponse, AuditLogsListResponse
 from app.services.audit_service import AuditService
+from app.utils.helpers import TotalMode
+from app.utils.projection import FIELDS_DESCRIPTION, parse_fields, projected_page_response
 
 router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
 
@@ -44,27 +47,42 @@ async def list_audit_logs(
     action: Optional[str] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor of the next page (next_cursor of the previous response)"),
+    total: TotalMode = Query("exact", description="Total count: exact, estimated (planner estimate) or none"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List audit logs"""
+    """List audit logs (only the columns of the requested fields are loaded)"""
     check_audit_access(current_user, tenant_id)
 
-    logs, total = AuditService.get_audit_logs(
-        db,
-        tenant_id=tenant_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        skip=skip,
-        limit=limit,
-    )
-
-    return AuditLogsListResponse(
-        total=total,
+    try:
+        fieldset = parse_fields(fields, AuditLogResponse)
+        page = AuditService.get_audit_logs(
+            db,
+            tenant_id=tenant_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            total=total,
+            fields=fieldset,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return projected_page_response(
+        AuditLogsListResponse,
+        "items",
+        page.items,
+        AuditLogResponse,
+        fieldset,
+        total=page.total,
         skip=skip,
         limit=limit,
-        items=[AuditLogResponse.model_validate(log) for log in logs],
+        next_cursor=page.next_cursor,
     )
 
 
@@ -86,7 +104,7 @@ async def get_entity_history(
         entity_id=entity_id,
     )
 
-    return [AuditLogResponse.model_validate(log) for log in logs]
+    return json_response(AUDIT_LOG_LIST_ADAPTER, logs)
 
 
 @router.get("/user/{user_id}", response_model=list[AuditLogResponse])
@@ -107,4 +125,4 @@ async def get_user_activity(
         days=days,
     )
 
-    return [AuditLogResponse.model_validate(log) for log in logs]
+    return json_response(AUDIT_LOG_LIST_ADAPTER, logs)
@@ -16,8 +16,10 @@ from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.responses import json_response
 from app.models.user import User
 from app.schemas.error_log import (
+    ERROR_LOG_LIST_ADAPTER,
     ErrorAnalyticsResponse,
     ErrorLogCreate,
     ErrorLogListResponse,
@@ -27,6 +29,8 @@ from app.schemas.error_log import (
     FrequentErrorResponse,
 )
 from app.services.error_log_service import ErrorLogService
+from app.utils.helpers import TotalMode
+from app.utils.projection import FIELDS_DESCRIPTION, parse_fields, projected_page_response
 
 router = APIRouter(prefix="/error-logs", tags=["Error Logs"])
 
@@ -112,10 +116,13 @@ async def list_error_logs(
     days: int = Query(7, ge=1, le=365),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor of the next page (next_cursor of the previous response)"),
+    total: TotalMode = Query("exact", description="Total count: exact, estimated (planner estimate) or none"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List error logs with filtering"""
+    """List error logs with filtering (only the columns of the requested fields are loaded)"""
     check_error_log_access(current_user, tenant_id)
 
     # If user is not system admin, force their tenant_id
@@ -126,24 +133,36 @@ async def list_error_logs(
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
 
-    logs, total = ErrorLogService.get_error_logs(
-        db=db,
-        tenant_id=tenant_id,
-        error_type=error_type,
-        severity=severity,
-        environment=environment,
-        endpoint=endpoint,
-        start_date=start_date,
-        end_date=end_date,
-        skip=skip,
-        limit=limit,
-    )
-
-    return ErrorLogListResponse(
-        total=total,
+    try:
+        fieldset = parse_fields(fields, ErrorLogResponse)
+        page = ErrorLogService.get_error_logs(
+            db=db,
+            tenant_id=tenant_id,
+            error_type=error_type,
+            severity=severity,
+            environment=environment,
+            endpoint=endpoint,
+            start_date=start_date,
+            end_date=end_date,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            total=total,
+            fields=fieldset,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return projected_page_response(
+        ErrorLogListResponse,
+        "items",
+        page.items,
+        ErrorLogResponse,
+        fieldset,
+        total=page.total,
         skip=skip,
         limit=limit,
-        items=[ErrorLogResponse.model_validate(log) for log in logs],
+        next_cursor=page.next_cursor,
     )
 
 
@@ -312,7 +331,7 @@ async def get_errors_by_correlation(
 
     logs = ErrorLogService.get_error_by_correlation_id(db, correlation_id)
 
-    return [ErrorLogResponse.model_validate(log) for log in logs]
+    return json_response(ERROR_LOG_LIST_ADAPTER, logs)
 
 
 @router.get("/{error_id}", response_model=ErrorLogResponse)
@@ -0,0 +1,78 @@
+"""
+Stored File API
+
+Serves content-addressed files (QR code images, export artifacts) from the
+configured storage backend with range request and long-lived cache support.
+Public endpoint: keys are SHA-256 content hashes.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.core.storage import (
+    IMMUTABLE_CACHE_CONTROL,
+    RangeNotSatisfiable,
+    StorageBackend,
+    get_storage,
+    is_valid_key,
+    parse_range_header,
+)
+
+router = APIRouter(prefix="/files")
+
+
+@router.api_route("/{key}", methods=["GET", "HEAD"], summary="Get stored file")
+def get_file(
+    key: str,
+    request: Request,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    storage: StorageBackend = Depends(get_storage),
+):
+    """
+    Stream a stored file.
+
+    Supports single byte ranges (206 Partial Content) and conditional
+    requests via ETag. Files are immutable, so responses are cacheable
+    for a year.
+    """
+    stored = storage.stat(key) if is_valid_key(key) else None
+    if stored is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "ETag": stored.etag,
+    }
+
+    if if_none_match and stored.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    try:
+        byte_range = parse_range_header(range_header, stored.size)
+    except RangeNotSatisfiable:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, "Content-Range": f"bytes */{stored.size}"},
+        )
+
+    status_code = status.HTTP_200_OK
+    start, end = 0, stored.size - 1
+    if byte_range is not None:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{stored.size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    if request.method == "HEAD" or stored.size == 0:
+        return Response(status_code=status_code, media_type=stored.content_type, headers=headers)
+
+    return StreamingResponse(
+        storage.iter_range(key, start, end),
+        status_code=status_code,
+        media_type=stored.content_type,
+        headers=headers,
+    )
@@ -17,6 +17,7 @@ from app.schemas.google_analytics import (
     GoogleAnalyticsTestResponse,
 )
 from app.services.google_analytics_service import GoogleAnalyticsService
+from app.services.public_assessment_service import PublicAssessmentService
 
 router = APIRouter()
 
@@ -66,6 +67,10 @@ async def create_or_update_ga_integration(
 
     try:
         integration = await service.create_or_update(tenant_id, data)
+
+        # Compiled public assessments bundle the GA4 public config
+        PublicAssessmentService(db).invalidate_tenant(tenant_id)
+
         return GoogleAnalyticsIntegrationResponse.model_validate(integration)
 
     except ValueError as e:
@@ -148,6 +153,8 @@ async def delete_ga_integration(
             detail="Google Analytics integration not found",
         )
 
+    PublicAssessmentService(db).invalidate_tenant(tenant_id)
+
     return None
 
 
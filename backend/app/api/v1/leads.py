@@ -4,25 +4,43 @@ Lead API Endpoints
 REST API for lead CRUD operations with multi-tenant support.
 """
 
-from typing import List, Optional
+import os
+import tempfile
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.deps import get_current_user, get_db
+from app.core.responses import json_response
 from app.models.user import User
 from app.schemas.lead import (
+    LEAD_LIST_ADAPTER,
+    LeadBulkUpdate,
+    LeadBulkUpdateJobResponse,
+    LeadChangesResponse,
     LeadCreate,
+    LeadHotRankResponse,
+    LeadImportJobResponse,
     LeadResponse,
     LeadScoreUpdate,
     LeadStatusUpdate,
     LeadUpdate,
 )
-from app.services.lead_service import LeadService
+from app.services.lead_bulk_update_service import LeadBulkUpdateService, run_lead_bulk_update
+from app.services.lead_import_service import LeadImportService, run_lead_import
+from app.services.lead_service import LEAD_LIST_ORDER, LeadService
+from app.services.leads.lead_scoring import HOT_LEAD_ORDER
+from app.services.leads.lead_search import parse_custom_field_filters
+from app.utils.helpers import next_page_cursor
+from app.utils.projection import FIELDS_DESCRIPTION, parse_fields, projected_list_response
 
 router = APIRouter()
 
+CUSTOM_FIELD_FILTER_DESCRIPTION = "Custom field filter `name:value`; repeat a name to match any of its values"
+
 
 @router.get(
     "/tenants/{tenant_id}/leads/search",
@@ -34,6 +52,8 @@ async def search_leads(
     tenant_id: UUID,
     q: str = Query(..., min_length=1),
     limit: int = Query(10, ge=1, le=50),
+    tag: Optional[List[str]] = Query(None, description="Only leads carrying every given tag"),
+    custom_field: Optional[List[str]] = Query(None, description=CUSTOM_FIELD_FILTER_DESCRIPTION),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -42,9 +62,13 @@ async def search_leads(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
 
     service = LeadService(db)
-    leads = service.search(tenant_id=tenant_id, query=q, limit=limit)
+    try:
+        custom_fields = parse_custom_field_filters(custom_field or [])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    leads = service.search(tenant_id=tenant_id, query=q, limit=limit, tags=tag, custom_fields=custom_fields)
 
-    return leads
+    return json_response(LEAD_LIST_ADAPTER, leads)
 
 
 @router.get(
@@ -56,17 +80,26 @@ async def search_leads(
 async def get_hot_leads(
     tenant_id: UUID,
     threshold: int = Query(61, ge=0, le=100),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor of the next page (X-Next-Cursor header of the previous response)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get leads with high scores (hot leads)"""
+    """Get leads with high scores (hot leads), highest score first
+
+    Full pages return the cursor of the next page in the X-Next-Cursor header.
+    """
     if current_user.tenant_id != tenant_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
 
     service = LeadService(db)
-    leads = service.get_hot_leads(tenant_id=tenant_id, threshold=threshold)
+    try:
+        leads = service.get_hot_leads(tenant_id=tenant_id, threshold=threshold, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return leads
+    next_cursor = next_page_cursor(leads, HOT_LEAD_ORDER, limit)
+    return json_response(LEAD_LIST_ADAPTER, leads, headers={"X-Next-Cursor": next_cursor} if next_cursor else None)
 
 
 @router.get(
@@ -83,28 +116,209 @@ async def list_leads(
     min_score: Optional[int] = Query(None, ge=0, le=100),
     max_score: Optional[int] = Query(None, ge=0, le=100),
     assigned_to: Optional[UUID] = Query(None),
+    cursor: Optional[str] = Query(None, description="Cursor of the next page (X-Next-Cursor header of the previous response)"),
+    tag: Optional[List[str]] = Query(None, description="Only leads carrying every given tag"),
+    custom_field: Optional[List[str]] = Query(None, description=CUSTOM_FIELD_FILTER_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List all leads for a specific tenant with filters"""
+    """List all leads for a specific tenant with filters
+
+    Full pages return the cursor of the next page in the X-Next-Cursor header.
+    Only the columns of the requested fields are loaded.
+    """
     if current_user.tenant_id != tenant_id:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
+            status_code=403,
             detail="Access to this tenant's leads is forbidden",
         )
 
     service = LeadService(db)
-    leads = service.list_by_tenant(
-        tenant_id=tenant_id,
-        skip=skip,
-        limit=limit,
-        status=status,
-        min_score=min_score,
-        max_score=max_score,
-        assigned_to=assigned_to,
-    )
+    try:
+        fieldset = parse_fields(fields, LeadResponse)
+        leads = service.list_by_tenant(
+            tenant_id=tenant_id,
+            skip=skip,
+            limit=limit,
+            status=status,
+            min_score=min_score,
+            max_score=max_score,
+            assigned_to=assigned_to,
+            cursor=cursor,
+            tags=tag,
+            custom_fields=parse_custom_field_filters(custom_field or []),
+            fields=fieldset,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    next_cursor = next_page_cursor(leads, LEAD_LIST_ORDER, limit)
+    return projected_list_response(leads, LeadResponse, fieldset, headers={"X-Next-Cursor": next_cursor} if next_cursor else None)
+
+
+@router.get(
+    "/tenants/{tenant_id}/leads/changes",
+    response_model=LeadChangesResponse,
+    summary="List lead changes",
+    operation_id="listLeadChanges",
+)
+async def list_lead_changes(
+    tenant_id: UUID,
+    since: Optional[str] = Query(None, description="Cursor from a previous page; omit to read from the start"),
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """List leads created, updated or deleted since a cursor (incremental sync)"""
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
+
+    service = LeadService(db)
+    try:
+        return service.list_changes(tenant_id=tenant_id, since=since, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+# Upload content types accepted when no format is given
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@router.post(
+    "/tenants/{tenant_id}/leads/imports",
+    response_model=LeadImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Import leads from CSV or NDJSON",
+    operation_id="importLeads",
+)
+async def import_leads(
+    tenant_id: UUID,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    format: Optional[Literal["csv", "ndjson"]] = Query(None, description="Upload format (default: from Content-Type)"),
+    on_conflict: Literal["skip", "update"] = Query("skip", description="Skip or update leads whose email already exists"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Bulk import leads from the request body
+
+    The body is a CSV file with a header row (name, email, company, job_title,
+    phone, status, notes, tags separated by ";", custom_fields as JSON) or
+    NDJSON with one lead object per line. It is processed in the background;
+    poll the returned job for progress and row errors.
+    """
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
+
+    format = format or IMPORT_CONTENT_TYPES.get(request.headers.get("content-type", "").split(";")[0].strip())
+    if format is None:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="Send text/csv or application/x-ndjson, or pass format")
+
+    # Spool the upload to disk so large files are not held in memory
+    size = 0
+    with tempfile.NamedTemporaryFile(prefix="lead-import-", delete=False) as upload:
+        try:
+            async for data in request.stream():
+                size += len(data)
+                if size > settings.LEAD_IMPORT_MAX_BYTES:
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Import file is too large")
+                upload.write(data)
+        except BaseException:
+            os.unlink(upload.name)
+            raise
+
+    service = LeadImportService(db)
+    job = service.create_job(tenant_id=tenant_id, created_by=current_user.id, format=format, on_conflict=on_conflict)
+    background_tasks.add_task(run_lead_import, job.id, tenant_id, upload.name)
+
+    return job
+
+
+@router.get(
+    "/tenants/{tenant_id}/leads/imports/{job_id}",
+    response_model=LeadImportJobResponse,
+    summary="Get lead import status",
+    operation_id="getLeadImport",
+)
+async def get_lead_import(
+    tenant_id: UUID,
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get the progress and row errors of a lead import"""
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
+
+    job = LeadImportService(db).get_job(job_id=job_id, tenant_id=tenant_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import not found")
+
+    return job
 
-    return leads
+
+@router.post(
+    "/tenants/{tenant_id}/leads/bulk-updates",
+    response_model=LeadBulkUpdateJobResponse,
+    summary="Bulk update lead status, score or assignment",
+    operation_id="bulkUpdateLeads",
+    responses={202: {"description": "Large update accepted; runs in the background", "model": LeadBulkUpdateJobResponse}},
+)
+async def bulk_update_leads(
+    tenant_id: UUID,
+    data: LeadBulkUpdate,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Apply a status, score and/or assignment change to many leads
+
+    Select leads with `lead_ids` or `filter`. Updates of up to one chunk
+    (LEAD_BULK_UPDATE_CHUNK_SIZE leads) complete in the request; larger ones
+    return 202 and run in the background; poll the returned job for progress.
+    Each changed lead gets an audit log entry.
+    """
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
+
+    service = LeadBulkUpdateService(db)
+    job = service.create_job(tenant_id=tenant_id, created_by=current_user.id, data=data)
+    if job.total_rows <= settings.LEAD_BULK_UPDATE_CHUNK_SIZE:
+        return service.run(job)
+
+    response.status_code = status.HTTP_202_ACCEPTED
+    background_tasks.add_task(run_lead_bulk_update, job.id, tenant_id)
+    return job
+
+
+@router.get(
+    "/tenants/{tenant_id}/leads/bulk-updates/{job_id}",
+    response_model=LeadBulkUpdateJobResponse,
+    summary="Get lead bulk update status",
+    operation_id="getLeadBulkUpdate",
+)
+async def get_lead_bulk_update(
+    tenant_id: UUID,
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get the progress of a lead bulk update"""
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
+
+    job = LeadBulkUpdateService(db).get_job(job_id=job_id, tenant_id=tenant_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Bulk update not found")
+
+    return job
 
 
 @router.get(
@@ -132,6 +346,31 @@ async def get_lead(
     return lead
 
 
+@router.get(
+    "/tenants/{tenant_id}/leads/{lead_id}/hot-rank",
+    response_model=LeadHotRankResponse,
+    summary="Get hot lead rank",
+    operation_id="getHotLeadRank",
+)
+async def get_hot_lead_rank(
+    tenant_id: UUID,
+    lead_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get the rank of a lead among the tenant's hot leads"""
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
+
+    service = LeadService(db)
+    lead = service.get_by_id(lead_id=lead_id, tenant_id=tenant_id)
+
+    if not lead:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
+
+    return LeadHotRankResponse(lead_id=lead.id, score=lead.score, rank=service.get_hot_lead_rank(lead))
+
+
 @router.post(
     "/tenants/{tenant_id}/leads",
     response_model=LeadResponse,
@@ -1,13 +1,15 @@
 """QR Code API endpoints"""
 
-from typing import Dict, Optional
+from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from sqlalchemy import and_, func, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_current_user, get_db
+from app.core.storage import get_storage
 from app.models.qr_code import QRCode
 from app.models.user import User
 from app.schemas.qr_code import (
@@ -17,10 +19,16 @@ from app.schemas.qr_code import (
     QRCodeResponse,
     QRCodeUpdate,
 )
+from app.services.qr_analytics_service import QRAnalyticsService
 from app.services.qr_code_service import QRCodeService
+from app.utils.helpers import TotalMode, apply_keyset, count_statement, cursor_for, explain_statement, plan_row_estimate
+from app.utils.projection import FIELDS_DESCRIPTION, parse_fields, project, projected_page_response
 
 router = APIRouter(prefix="/qr-codes", tags=["qr-codes"])
 
+# Sort order of QR code lists, ending with id so keyset cursors are unambiguous
+QR_CODE_LIST_ORDER = (QRCode.created_at, QRCode.id)
+
 
 @router.post(
     "",
@@ -81,23 +89,34 @@ async def list_qr_codes(
     enabled: Optional[bool] = Query(None, description="Filter by enabled status"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor of the next page (next_cursor of the previous response)"),
+    total: TotalMode = Query("exact", description="Total count: exact, estimated (planner estimate) or none"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> QRCodeListResponse:
+) -> Response:
     """
-    Get paginated list of QR codes.
+    Get paginated list of QR codes, newest first.
 
     Args:
         assessment_id: Optional assessment filter
         enabled: Optional enabled status filter
-        page: Page number (1-indexed)
+        page: Page number (1-indexed, ignored with a cursor)
         limit: Items per page
+        cursor: Keyset cursor from a previous page
+        total: Total count mode
+        fields: Sparse fieldset of the QR codes (only these columns are loaded)
         current_user: Authenticated user
         db: Database session
 
     Returns:
         Paginated QR code list
     """
+    try:
+        fieldset = parse_fields(fields, QRCodeResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     # Build query with filters
     query = select(QRCode).where(QRCode.tenant_id == current_user.tenant_id)
 
@@ -108,26 +127,40 @@ async def list_qr_codes(
         query = query.where(QRCode.enabled == enabled)
 
     # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    count_result = await db.execute(count_query)
-    total = count_result.scalar()
-
-    # Paginate
-    offset = (page - 1) * limit
-    query = query.offset(offset).limit(limit).order_by(QRCode.created_at.desc())
+    total_count = None
+    if total == "estimated":
+        explain = explain_statement(query, (await db.connection()).dialect)
+        if explain is not None:
+            total_count = plan_row_estimate((await db.execute(explain)).scalar())
+    if total == "exact" or (total == "estimated" and total_count is None):
+        total_count = (await db.execute(count_statement(query))).scalar()
+
+    # Paginate (one extra row tells whether there is a next page)
+    try:
+        query = apply_keyset(query, QR_CODE_LIST_ORDER, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not cursor:
+        query = query.offset((page - 1) * limit)
 
-    result = await db.execute(query)
-    qr_codes = result.scalars().all()
+    result = await db.execute(project(query, QRCode, fieldset, QR_CODE_LIST_ORDER).limit(limit + 1))
+    qr_codes = result.all()
+    next_cursor = cursor_for(qr_codes[limit - 1], QR_CODE_LIST_ORDER) if len(qr_codes) > limit else None
 
     # Calculate pages
-    pages = (total + limit - 1) // limit  # Ceiling division
-
-    return QRCodeListResponse(
-        qr_codes=[QRCodeResponse.model_validate(qr) for qr in qr_codes],
-        total=total,
+    pages = (total_count + limit - 1) // limit if total_count is not None else None  # Ceiling division
+
+    return projected_page_response(
+        QRCodeListResponse,
+        "qr_codes",
+        qr_codes[:limit],
+        QRCodeResponse,
+        fieldset,
+        total=total_count,
         page=page,
         limit=limit,
         pages=pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -308,6 +341,8 @@ async def get_qr_analytics(
     """
     Get analytics for a QR code.
 
+    Served from the daily scan rollup; the window is day-aligned.
+
     Includes:
     - Summary statistics
     - Scans by date
@@ -327,10 +362,6 @@ async def get_qr_analytics(
     Raises:
         404: QR code not found
     """
-    from datetime import datetime, timedelta
-
-    from app.models.qr_code_scan import QRCodeScan
-
     # Verify QR code exists and belongs to tenant
     qr_result = await db.execute(select(QRCode).where(and_(QRCode.id == qr_code_id, QRCode.tenant_id == current_user.tenant_id)))
     qr_code = qr_result.scalar_one_or_none()
@@ -341,75 +372,9 @@ async def get_qr_analytics(
             detail=f"QR code {qr_code_id} not found",
         )
 
-    # Date range
-    end_date = datetime.utcnow()
-    start_date = end_date - timedelta(days=days)
-
-    # Get all scans in date range
-    scans_result = await db.execute(select(QRCodeScan).where(and_(QRCodeScan.qr_code_id == qr_code_id, QRCodeScan.scanned_at >= start_date)))
-    scans = scans_result.scalars().all()
-
-    # Summary statistics
-    total_scans = len(scans)
-    started = sum(1 for s in scans if s.assessment_started)
-    completed = sum(1 for s in scans if s.assessment_completed)
-    leads = sum(1 for s in scans if s.lead_created)
-
-    conversion_rate = (completed / total_scans * 100) if total_scans > 0 else 0.0
-
-    summary = {
-        "total_scans": total_scans,
-        "unique_scans": qr_code.unique_scan_count,
-        "assessment_started": started,
-        "assessment_completed": completed,
-        "leads_created": leads,
-        "conversion_rate": round(conversion_rate, 2),
-    }
-
-    # Scans by date
-    scans_by_date_dict: Dict[str, int] = {}
-    for scan in scans:
-        date_str = scan.scanned_at.strftime("%Y-%m-%d")
-        scans_by_date_dict[date_str] = scans_by_date_dict.get(date_str, 0) + 1
-
-    scans_by_date = [{"date": date, "scans": count} for date, count in sorted(scans_by_date_dict.items())]
-
-    # Scans by device
-    device_counts = {"mobile": 0, "tablet": 0, "desktop": 0, "unknown": 0}
-    for scan in scans:
-        device_type = scan.device_type or "unknown"
-        if device_type in device_counts:
-            device_counts[device_type] += 1
-        else:
-            device_counts["unknown"] += 1
-
-    scans_by_device = device_counts
-
-    # Scans by country
-    country_counts: Dict[str, int] = {}
-    for scan in scans:
-        if scan.country:
-            country_counts[scan.country] = country_counts.get(scan.country, 0) + 1
-
-    scans_by_country = {
-        "country_scans": dict(sorted(country_counts.items(), key=lambda x: x[1], reverse=True)[:10])  # Top 10 countries
-    }
-
-    # Conversion funnel
-    funnel = {
-        "scanned": total_scans,
-        "started": started,
-        "completed": completed,
-        "converted": leads,
-    }
-
-    return {
-        "summary": summary,
-        "scans_by_date": scans_by_date,
-        "scans_by_device": scans_by_device,
-        "scans_by_country": scans_by_country,
-        "funnel": funnel,
-    }
+    # Answered from the qr_scan_daily rollup (maintained by redirect/scan endpoints)
+    service = QRAnalyticsService(db)
+    return await service.get_analytics(qr_code, days=days)
 
 
 @router.post(
@@ -475,8 +440,8 @@ async def download_qr_code(
     """
     Download QR code image.
 
-    Regenerates QR code image on-the-fly with current style settings
-    and returns as downloadable PNG file.
+    Streams the stored QR code image as a downloadable PNG file. The image
+    is rendered with the current style settings only if it is not stored yet.
 
     Args:
         qr_code_id: QR code UUID
@@ -506,47 +471,18 @@ async def download_qr_code(
             detail=f"QR code {qr_code_id} not found",
         )
 
-    service = QRCodeService(db)
-
-    # Build full URL from QR code data
-    base_url = f"https://app.diagnoleads.com/assessments/{qr_code.assessment_id}"
-    utm_params = []
-
-    if qr_code.utm_source:
-        utm_params.append(f"utm_source={qr_code.utm_source}")
-    if qr_code.utm_medium:
-        utm_params.append(f"utm_medium={qr_code.utm_medium}")
-    if qr_code.utm_campaign:
-        utm_params.append(f"utm_campaign={qr_code.utm_campaign}")
-    if qr_code.utm_term:
-        utm_params.append(f"utm_term={qr_code.utm_term}")
-    if qr_code.utm_content:
-        utm_params.append(f"utm_content={qr_code.utm_content}")
-
-    utm_params.append(f"qr={qr_code.short_code}")
-    full_url = f"{base_url}?{'&'.join(utm_params)}"
-
-    # Get style from QR code
-    qr_color = qr_code.style.get("color", "#1E40AF")
-    qr_size = qr_code.style.get("size", 512)
-
-    # Generate QR code image
-    qr_img = service.generate_qr_image(
-        url=full_url,
-        color=qr_color,
-        size=qr_size,
-        error_correction="H",
-    )
-
-    # Convert to PNG bytes
-    png_bytes = service.qr_image_to_bytes(qr_img, format="PNG")
+    # Rendered once and served from storage afterwards
+    storage = get_storage()
+    stored = await QRCodeService(db).get_stored_image(qr_code)
 
     # Return image response with download header
     safe_filename = qr_code.name.replace(" ", "_").replace("/", "_")
-    return Response(
-        content=png_bytes,
+    return StreamingResponse(
+        storage.iter_range(stored.key, 0, stored.size - 1),
         media_type="image/png",
         headers={
             "Content-Disposition": f'attachment; filename="qr_code_{safe_filename}.png"',
+            "Content-Length": str(stored.size),
+            "ETag": stored.etag,
         },
     )
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.deps import get_db
 from app.models.lead import Lead
 from app.models.qr_code_scan import QRCodeScan
+from app.services.qr_analytics_service import QRAnalyticsService
 
 router = APIRouter(prefix="/scans", tags=["qr-scans"])
 
@@ -48,6 +49,7 @@ async def mark_assessment_started(
     # Update flag
     if not scan.assessment_started:
         scan.assessment_started = True
+        await QRAnalyticsService(db).record_funnel_progress(scan, started=True)
         await db.commit()
 
 
@@ -83,8 +85,10 @@ async def mark_assessment_completed(
     if not scan.assessment_completed:
         scan.assessment_completed = True
         # Auto-mark as started if not already
-        if not scan.assessment_started:
+        newly_started = not scan.assessment_started
+        if newly_started:
             scan.assessment_started = True
+        await QRAnalyticsService(db).record_funnel_progress(scan, started=newly_started, completed=True)
         await db.commit()
 
 
@@ -126,16 +130,28 @@ async def link_lead_to_scan(
     if not lead:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Lead {lead_id} not found")
 
+    # Funnel steps reached for the first time (counted once in the rollup)
+    newly_converted = not scan.lead_created
+    newly_completed = not scan.assessment_completed
+    newly_started = not scan.assessment_started
+
     # Update scan
     scan.lead_id = lead_id
     scan.lead_created = True
 
     # Auto-mark as completed if not already
-    if not scan.assessment_completed:
+    if newly_completed:
         scan.assessment_completed = True
-    if not scan.assessment_started:
+    if newly_started:
         scan.assessment_started = True
 
+    await QRAnalyticsService(db).record_funnel_progress(
+        scan,
+        started=newly_started,
+        completed=newly_completed,
+        lead=newly_converted,
+    )
+
     await db.commit()
 
 
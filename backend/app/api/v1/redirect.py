@@ -11,6 +11,7 @@ from user_agents import parse as parse_user_agent
 from app.core.deps import get_db
 from app.models.qr_code import QRCode
 from app.models.qr_code_scan import QRCodeScan
+from app.services.qr_analytics_service import QRAnalyticsService
 
 router = APIRouter(tags=["redirect"])
 
@@ -116,7 +117,7 @@ async def redirect_qr_code(
     This endpoint:
     1. Looks up QR code by short_code
     2. Creates scan tracking record
-    3. Increments scan counter
+    3. Increments scan counter and daily rollup
     4. Redirects to assessment URL
 
     Args:
@@ -175,9 +176,10 @@ async def redirect_qr_code(
 
     db.add(scan)
 
-    # 4. Increment scan counters
+    # 4. Increment scan counters (and the daily analytics rollup)
     qr_code.scan_count += 1
     qr_code.last_scanned_at = datetime.utcnow()
+    await QRAnalyticsService(db).record_scan(scan)
 
     # TODO: Implement unique scan counting logic
     # (e.g., based on session_id or IP+User-Agent fingerprint)
@@ -233,7 +233,7 @@ async def execute_report(
 
         generated_at = report.last_generated_at or datetime.now(timezone.utc)
 
-        return ReportResultsResponse(
+        report_results = ReportResultsResponse(
             report_id=report.id,
             report_name=report.name,
             generated_at=generated_at,
@@ -243,6 +243,9 @@ async def execute_report(
             total_records=results["total_records"],
         )
 
+        # Dumped to JSON in one pass instead of through the response_model round trip
+        return Response(content=report_results.model_dump_json(), media_type="application/json")
+
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -5,16 +5,16 @@ Public API for assessment responses (for embed widget).
 """
 
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi import Response as HTTPResponse
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db
-from app.models.answer import Answer
 from app.models.assessment import Assessment
 from app.models.lead import Lead
-from app.models.question import Question
 from app.models.response import Response
 from app.schemas.response import (
     PublicAssessmentResponse,
@@ -22,9 +22,17 @@ from app.schemas.response import (
     ResponseSubmit,
     ResponseWithLeadData,
 )
+from app.services.answer_buffer import AnswerBufferService
+from app.services.hot_lead_leaderboard import get_hot_lead_leaderboard
+from app.services.public_assessment_service import PublicAssessmentService
+from app.services.response_service import ResponseService
+from app.services.tenant_counter_service import TenantCounterService
 
 router = APIRouter()
 
+# Short freshness, then revalidate with the ETag (payload changes on publish/update)
+PUBLIC_ASSESSMENT_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
 
 @router.get(
     "/tenants/{tenant_id}/assessments/{assessment_id}/public",
@@ -34,6 +42,7 @@ router = APIRouter()
 async def get_public_assessment(
     tenant_id: UUID,
     assessment_id: UUID,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
     db: Session = Depends(get_db),
 ):
     """
@@ -41,55 +50,23 @@ async def get_public_assessment(
 
     **No authentication required** - this is a public endpoint.
 
-    Returns assessment with questions and options in a simplified format
-    for the embed widget.
+    Returns assessment with questions, options and the public GA4 config
+    in a simplified format for the embed widget. The payload is compiled
+    once and cached; clients and CDNs revalidate with `If-None-Match`.
     """
-    # Find assessment
-    assessment = (
-        db.query(Assessment)
-        .filter(
-            Assessment.id == assessment_id,
-            Assessment.tenant_id == tenant_id,
-            Assessment.status == "published",  # Only published assessments
-        )
-        .first()
-    )
+    compiled = PublicAssessmentService(db).get(tenant_id, assessment_id)
 
-    if not assessment:
+    if not compiled:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Assessment not found or not published",
         )
 
-    # Get questions with options
-    questions = db.query(Question).filter(Question.assessment_id == assessment_id).order_by(Question.order).all()
-
-    # Build simplified question structure for widget
-    questions_data = []
-    for question in questions:
-        question_dict = {
-            "id": str(question.id),
-            "text": question.text,
-            "type": question.type,
-            "order": question.order,
-            "options": [
-                {
-                    "id": str(opt.id),
-                    "text": opt.text,
-                    "points": opt.points,
-                    "order": opt.order,
-                }
-                for opt in question.options
-            ],
-        }
-        questions_data.append(question_dict)
-
-    return PublicAssessmentResponse(
-        id=assessment.id,
-        title=assessment.title,
-        description=assessment.description,
-        questions=questions_data,
-    )
+    headers = {"ETag": compiled.etag, "Cache-Control": PUBLIC_ASSESSMENT_CACHE_CONTROL}
+    if if_none_match and compiled.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return HTTPResponse(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return HTTPResponse(content=compiled.body, media_type="application/json", headers=headers)
 
 
 @router.post(
@@ -169,47 +146,15 @@ async def submit_answers(
             detail="Response already completed",
         )
 
-    # Save each answer
-    total_points = 0
-    for answer_data in data.answers:
-        # Check if answer already exists for this question
-        existing_answer = (
-            db.query(Answer)
-            .filter(
-                Answer.response_id == response_id,
-                Answer.question_id == answer_data.question_id,
-            )
-            .first()
-        )
-
-        if existing_answer:
-            # Update existing answer
-            existing_answer.answer_text = answer_data.answer_text
-            existing_answer.points_awarded = answer_data.points_awarded
-            existing_answer.answered_at = datetime.now(timezone.utc)
-        else:
-            # Create new answer
-            answer = Answer(
-                response_id=response_id,
-                question_id=answer_data.question_id,
-                answer_text=answer_data.answer_text,
-                points_awarded=answer_data.points_awarded,
-            )
-            db.add(answer)
-
-        total_points += answer_data.points_awarded
-
-    # Update response score and user info
-    response.total_score = total_points
+    # Buffer answers (write-behind); persisted on completion, when the buffer
+    # is full or by the idle sweeper
+    response_values = {}
     if data.email:
-        response.email = data.email
+        response_values["email"] = data.email
     if data.name:
-        response.name = data.name
+        response_values["name"] = data.name
 
-    db.commit()
-    db.refresh(response)
-
-    return response
+    return AnswerBufferService(db).submit(response, data.answers, response_values)
 
 
 @router.post(
@@ -230,8 +175,9 @@ async def complete_response(
     This finalizes the assessment and creates a lead record
     with the provided contact information.
     """
-    # Find response
-    response = db.query(Response).filter(Response.id == response_id).first()
+    # Find response (locked so buffered answers cannot be flushed concurrently)
+    buffer_service = AnswerBufferService(db)
+    response = buffer_service.lock_response(response_id)
     if not response:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -245,48 +191,21 @@ async def complete_response(
             detail="Response already completed",
         )
 
-    # Save any final answers
-    for answer_data in data.answers:
-        existing_answer = (
-            db.query(Answer)
-            .filter(
-                Answer.response_id == response_id,
-                Answer.question_id == answer_data.question_id,
-            )
-            .first()
-        )
-
-        if existing_answer:
-            existing_answer.answer_text = answer_data.answer_text
-            existing_answer.points_awarded = answer_data.points_awarded
-            existing_answer.answered_at = datetime.now(timezone.utc)
-        else:
-            answer = Answer(
-                response_id=response_id,
-                question_id=answer_data.question_id,
-                answer_text=answer_data.answer_text,
-                points_awarded=answer_data.points_awarded,
-            )
-            db.add(answer)
-
-    # Flush to ensure new answers are available in the session
-    db.flush()
-
-    # Calculate total score from ALL answers in database
-    all_answers = db.query(Answer).filter(Answer.response_id == response_id).all()
-    total_points = sum(ans.points_awarded for ans in all_answers)
-
-    # Update response
-    response.total_score = total_points
-    response.status = "completed"
-    response.completed_at = datetime.now(timezone.utc)
+    # Buffered answers first so the final submission wins per question
+    buffered = buffer_service.pending(response_id)
+    answers = [*buffered.answers.values(), *data.answers] if buffered else data.answers
 
+    # Save all answers, recompute the score and complete in a single statement
+    response_values = {**(buffered.response_values if buffered else {}), "status": "completed", "completed_at": datetime.now(timezone.utc)}
     if data.email:
-        response.email = data.email
+        response_values["email"] = data.email
     if data.name:
-        response.name = data.name
+        response_values["name"] = data.name
+
+    total_points = ResponseService(db).save_answers(response, answers, **response_values)
 
     # Create lead if email is provided
+    leaderboard_change = None
     if data.email and data.name:
         # Get assessment to find tenant
         assessment = db.query(Assessment).filter(Assessment.id == response.assessment_id).first()
@@ -302,9 +221,18 @@ async def complete_response(
                 .first()
             )
 
+            counters = TenantCounterService(db)
             if existing_lead:
                 # Update existing lead
+                old_score = existing_lead.score
                 existing_lead.score = max(existing_lead.score, total_points)
+                counters.lead_changed(assessment.tenant_id, old=(existing_lead.status, old_score), new=(existing_lead.status, existing_lead.score))
+                leaderboard_change = (
+                    assessment.tenant_id,
+                    existing_lead.id,
+                    (existing_lead.status, old_score),
+                    (existing_lead.status, existing_lead.score),
+                )
                 existing_lead.response_id = response_id
                 if data.company:
                     existing_lead.company = data.company
@@ -327,8 +255,15 @@ async def complete_response(
                     created_by=assessment.created_by,
                 )
                 db.add(lead)
+                db.flush()
+                counters.lead_changed(assessment.tenant_id, new=(lead.status, lead.score))
+                leaderboard_change = (assessment.tenant_id, lead.id, None, (lead.status, lead.score))
 
     db.commit()
+    # Only now that the answers are committed
+    buffer_service.discard(buffered)
     db.refresh(response)
+    if leaderboard_change:
+        get_hot_lead_leaderboard().lead_changed(*leaderboard_change)
 
     return response
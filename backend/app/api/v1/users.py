@@ -8,17 +8,22 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
+from app.services.principal_service import PrincipalService
 from app.services.user_service import UserService
+from app.utils.helpers import apply_keyset, next_page_cursor
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# Sort order of user lists, ending with id so keyset cursors are unambiguous
+USER_LIST_ORDER = (User.created_at, User.id)
+
 
 def check_admin_access(current_user: User, tenant_id: UUID):
     """Verify that user is admin for the requested tenant"""
@@ -38,25 +43,29 @@ def check_admin_access(current_user: User, tenant_id: UUID):
 
 @router.get("", response_model=List[UserResponse])
 async def list_users(
+    response: Response,
     tenant_id: Optional[UUID] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor of the next page (X-Next-Cursor header of the previous response)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List users (admin only)
+    """List users (admin only), newest first
 
     - System admin: Can see all users (tenant_id optional, shows all if not provided)
     - Tenant admin: Can only see users in their tenant
+
+    Full pages return the cursor of the next page in the X-Next-Cursor header.
     """
     # System admin can see all users or filter by tenant
     if current_user.role == "system_admin":
         if tenant_id:
             # Filter by specific tenant
-            users = db.query(User).filter(User.tenant_id == tenant_id).offset(skip).limit(limit).all()
+            query = db.query(User).filter(User.tenant_id == tenant_id)
         else:
             # Return all users from all tenants
-            users = db.query(User).offset(skip).limit(limit).all()
+            query = db.query(User)
     # Tenant admin can only see users in their tenant
     elif current_user.role == "tenant_admin":
         if tenant_id and tenant_id != current_user.tenant_id:
@@ -64,13 +73,25 @@ async def list_users(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Tenant admins can only view users in their own tenant",
             )
-        users = db.query(User).filter(User.tenant_id == current_user.tenant_id).offset(skip).limit(limit).all()
+        query = db.query(User).filter(User.tenant_id == current_user.tenant_id)
     else:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only administrators can manage users",
         )
 
+    try:
+        query = apply_keyset(query, USER_LIST_ORDER, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not cursor:
+        query = query.offset(skip)
+    users = query.limit(limit).all()
+
+    next_cursor = next_page_cursor(users, USER_LIST_ORDER, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
     # Build responses with tenant information
     responses = []
     for user in users:
@@ -180,6 +201,9 @@ async def update_user(
     db.commit()
     db.refresh(user)
 
+    # Name, email and role are served from the principal cache
+    PrincipalService(db).invalidate_user(user.id)
+
     return UserResponse.model_validate(user)
 
 
@@ -209,3 +233,5 @@ async def delete_user(
 
     db.delete(user)
     db.commit()
+
+    PrincipalService(db).invalidate_user(user_id)
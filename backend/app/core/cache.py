@@ -0,0 +1,139 @@
+"""
+Cache
+
+Key-value byte cache for hot read paths (e.g. compiled public assessments).
+Uses a bounded in-process LRU by default, or Redis when CACHE_BACKEND=redis
+so entries and invalidations are shared across workers.
+
+Cache failures never fail a request: Redis errors are logged and treated
+as misses.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Base class for cache backends."""
+
+    # Whether entries and invalidations are visible to every worker
+    shared = False
+
+    def __init__(self, key_prefix: str = ""):
+        self.key_prefix = key_prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached value, or None on miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Cache `value` for `ttl` seconds."""
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """Remove keys from the cache."""
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache with per-entry TTL (thread-safe)."""
+
+    def __init__(self, max_entries: int = 10000, key_prefix: str = ""):
+        super().__init__(key_prefix)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        key = self._key(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        key = self._key(key)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(self._key(key), None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache(CacheBackend):
+    """Redis-backed cache."""
+
+    shared = True
+
+    def __init__(self, client, key_prefix: str = ""):
+        super().__init__(key_prefix)
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "") -> "RedisCache":
+        import redis
+
+        client = redis.Redis.from_url(
+            url,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+        return cls(client, key_prefix=key_prefix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.client.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        try:
+            self.client.set(self._key(key), value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            self.client.delete(*(self._key(key) for key in keys))
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {', '.join(keys)}: {e}")
+
+
+@lru_cache()
+def get_cache() -> CacheBackend:
+    """Get the configured cache backend (cached)."""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCache.from_url(settings.REDIS_URL, key_prefix=settings.CACHE_KEY_PREFIX)
+
+    return MemoryCache(max_entries=settings.CACHE_MEMORY_MAX_ENTRIES, key_prefix=settings.CACHE_KEY_PREFIX)
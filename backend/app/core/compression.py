@@ -0,0 +1,202 @@
+"""
+Response Compression Middleware
+
+Pure ASGI middleware that compresses responses with brotli (when the
+optional `brotli` package is installed) or gzip, as negotiated from the
+request's Accept-Encoding header.
+
+- Only compressible media types (JSON, text, CSV, XML, SVG, JavaScript) are
+  compressed; PNG QR images, XLSX / PDF exports and other already-compressed
+  content pass through untouched.
+- Bodies are buffered up to the size threshold: smaller responses are sent
+  as they are. Larger ones are compressed in one pass (with Content-Length)
+  or, if the body is still streaming, chunk by chunk as it is produced.
+- Compression levels default to brotli quality 4 / gzip level 6, which
+  compress dashboard JSON 5-10x at a small fraction of the request's CPU
+  time (the highest levels cost many times more for a few percent).
+"""
+
+import zlib
+from typing import Callable, List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Brotli (optional dependency)
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Media types worth compressing; everything else (images, archives, office documents) passes through
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+    "image/svg+xml",
+)
+COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+
+
+def negotiate_encoding(accept_encoding: str, available: Sequence[str]) -> Optional[str]:
+    """
+    Pick the content coding of a response from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Accept-Encoding request header (e.g. "gzip, br;q=0.9")
+        available: Supported codings in order of server preference
+
+    Returns:
+        Highest-quality acceptable coding (server preference breaks ties), or None
+    """
+    qualities = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether a Content-Type is worth compressing"""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES or media_type.endswith(COMPRESSIBLE_SUFFIXES)
+
+
+class _Compressor:
+    """Streaming compressor of one response"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=brotli_quality)
+            self._compress: Callable[[bytes], bytes] = compressor.process
+            self._finish: Callable[[], bytes] = compressor.finish
+        else:
+            compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress = compressor.compress
+            self._finish = compressor.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data) if data else b""
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    """Negotiated brotli / gzip compression of compressible responses"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings: List[str] = ["br", "gzip"] if BROTLI_AVAILABLE else ["gzip"]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.gzip_level, self.brotli_quality)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """send() wrapper deciding per response whether and how to compress"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int, gzip_level: int, brotli_quality: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.start_message: Optional[Message] = None
+        self.buffer: List[bytes] = []
+        self.buffered = 0
+        self.passthrough = False
+        self.compressor: Optional[_Compressor] = None
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.start_message = message
+            self.passthrough = (
+                message["status"] in (204, 206, 304)
+                or "content-encoding" in headers
+                or "content-range" in headers
+                or not is_compressible(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self._send(message)
+            else:
+                # The response depends on Accept-Encoding even when it ends up below the threshold
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is not None:
+            data = self.compressor.compress(body)
+            if not more_body:
+                data += self.compressor.finish()
+            if data or not more_body:
+                await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        # Buffer until the threshold is reached or the body is complete
+        if body:
+            self.buffer.append(body)
+            self.buffered += len(body)
+        if more_body and self.buffered < self.minimum_size:
+            return
+
+        buffered = b"".join(self.buffer)
+        self.buffer = []
+        headers = MutableHeaders(raw=self.start_message["headers"])
+
+        if not more_body and len(buffered) < self.minimum_size:
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": buffered, "more_body": False})
+            return
+
+        self.compressor = _Compressor(self.encoding, self.gzip_level, self.brotli_quality)
+        data = self.compressor.compress(buffered)
+        headers["Content-Encoding"] = self.encoding
+        if more_body:
+            # Still streaming: the compressed length is not known yet
+            del headers["Content-Length"]
+        else:
+            data += self.compressor.finish()
+            headers["Content-Length"] = str(len(data))
+        await self._send(self.start_message)
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
@@ -40,6 +40,14 @@ class Settings(BaseSettings):
         "http://127.0.0.1:5173",
     ]
 
+    # ========================================================================
+    # Response Compression (brotli requires the brotli package)
+    # ========================================================================
+    COMPRESSION_ENABLED: bool = True  # Disable when a proxy in front of the API compresses responses
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # Bytes; smaller bodies are sent uncompressed
+    COMPRESSION_GZIP_LEVEL: int = 6  # 1 (fastest) - 9 (smallest)
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0 (fastest) - 11 (smallest); 4 beats gzip 6 on size and speed
+
     # ========================================================================
     # Database (Supabase PostgreSQL)
     # ========================================================================
@@ -56,6 +64,94 @@ class Settings(BaseSettings):
     REDIS_MAX_CONNECTIONS: int = 10
     REDIS_SOCKET_TIMEOUT: int = 5
 
+    # ========================================================================
+    # Cache
+    # ========================================================================
+    CACHE_BACKEND: Literal["memory", "redis"] = (
+        "memory"  # Use redis to share entries and invalidations across workers (principals are only cached in redis)
+    )
+    CACHE_KEY_PREFIX: str = "diagnoleads:"
+    CACHE_MEMORY_MAX_ENTRIES: int = 10000
+
+    # ========================================================================
+    # Hot Lead Leaderboard
+    # ========================================================================
+    HOT_LEAD_LEADERBOARD_BACKEND: Literal["memory", "redis"] = "memory"  # Hot leads are only served from redis leaderboards (shared across workers)
+    HOT_LEAD_LEADERBOARD_TTL: int = 300  # Seconds before a tenant's leaderboard is rebuilt from the database
+    HOT_LEAD_LEADERBOARD_MAX_TENANTS: int = 1000  # Memory backend: leaderboards kept per worker
+
+    # ========================================================================
+    # Widget Answer Buffer (write-behind for in-progress answers)
+    # ========================================================================
+    ANSWER_BUFFER_BACKEND: Literal["disabled", "memory", "redis"] = "disabled"  # memory requires a single worker
+    ANSWER_BUFFER_IDLE_TIMEOUT: int = 300  # Seconds without new answers before a buffer is persisted
+    ANSWER_BUFFER_MAX_ANSWERS: int = 50  # Persist once a buffer holds this many answers
+    ANSWER_BUFFER_SWEEP_INTERVAL: int = 60  # Seconds between idle buffer sweeps
+
+    # ========================================================================
+    # Outbox (reliable delivery of integration side effects)
+    # ========================================================================
+    OUTBOX_WORKER_ENABLED: bool = True  # Disable when the worker runs as a separate process
+    OUTBOX_BATCH_SIZE: int = 50
+    OUTBOX_DELIVERY_CONCURRENCY: int = 10  # Events of a batch delivered at once (one database session each)
+    OUTBOX_POLL_INTERVAL: int = 2  # Seconds between polls when the outbox is drained
+    OUTBOX_MAX_ATTEMPTS: int = 8  # Dead-letter an event after this many failed deliveries
+    OUTBOX_BACKOFF_BASE: int = 5  # Seconds before the first retry (doubles per attempt)
+    OUTBOX_BACKOFF_MAX: int = 3600
+    OUTBOX_LEASE_SECONDS: int = 120  # Claimed events are redelivered if not settled within this time
+
+    # ========================================================================
+    # Lead Change Feed
+    # ========================================================================
+    LEAD_TOMBSTONE_RETENTION_DAYS: int = 30  # Longest supported cursor age; older cursors are rejected and their tombstones purged
+    LEAD_TOMBSTONE_PURGER_ENABLED: bool = True  # Disable when the purger runs as a separate process
+    LEAD_TOMBSTONE_PURGE_INTERVAL: int = 86400  # Seconds between tombstone purges
+
+    # ========================================================================
+    # Background Jobs (lead import, lead bulk update, assessment rescore)
+    # ========================================================================
+    JOB_STALE_SECONDS: int = 1800  # Pending / running jobs without progress for this long are marked failed
+    JOB_RECOVERY_ENABLED: bool = True  # Disable when stale job recovery runs as a separate process
+    JOB_RECOVERY_INTERVAL: int = 300  # Seconds between stale job sweeps
+
+    # ========================================================================
+    # Lead Import (bulk CSV / NDJSON)
+    # ========================================================================
+    LEAD_IMPORT_CHUNK_SIZE: int = 5000  # Rows validated, copied and merged per transaction
+    LEAD_IMPORT_MAX_BYTES: int = 200 * 1024 * 1024  # 200MB upload limit
+    LEAD_IMPORT_MAX_ERRORS: int = 100  # Row errors kept on the job
+
+    # ========================================================================
+    # Lead Bulk Update (status / score / assignment)
+    # ========================================================================
+    LEAD_BULK_UPDATE_CHUNK_SIZE: int = 1000  # Leads updated per transaction; larger sets run in the background
+
+    # ========================================================================
+    # Assessment Rescoring
+    # ========================================================================
+    RESCORE_CHUNK_SIZE: int = 50000  # Responses rescored per transaction
+
+    # ========================================================================
+    # Tenant Counters (incrementally maintained lead / assessment counts)
+    # ========================================================================
+    TENANT_COUNTER_RECONCILER_ENABLED: bool = True  # Disable when the reconciler runs as a separate process
+    TENANT_COUNTER_RECONCILE_INTERVAL: int = 3600  # Seconds between passes over all tenants (one API process per deployment runs them)
+
+    # ========================================================================
+    # CRM Sync Queue (coalesced, delta-only lead syncs)
+    # ========================================================================
+    CRM_SYNC_WORKER_ENABLED: bool = True  # Disable when the worker runs as a separate process
+    CRM_SYNC_BATCH_SIZE: int = 200  # Queued leads claimed per poll
+    CRM_SYNC_POLL_INTERVAL: int = 5  # Seconds between polls when the queue is drained
+    CRM_SYNC_LEASE_SECONDS: int = 300  # Claimed leads not synced within this time (failed, crashed worker) are retried
+
+    # ========================================================================
+    # GA4 Measurement Protocol Batching
+    # ========================================================================
+    GA4_BATCH_MAX_EVENTS: int = 25  # Events per request (Measurement Protocol limit)
+    GA4_BATCH_MAX_WAIT_MS: int = 200  # Maximum time an event waits for its batch to fill
+    GA4_BATCH_MAX_PENDING: int = 10000  # Oldest events are dropped beyond this (the outbox retries them)
+
     # ========================================================================
     # JWT Authentication
     # ========================================================================
@@ -100,6 +196,14 @@ class Settings(BaseSettings):
     SALESFORCE_CLIENT_SECRET: str = ""
     HUBSPOT_API_KEY: str = ""
     SLACK_WEBHOOK_URL: str = ""
+    OAUTH_TOKEN_REFRESH_MARGIN: int = 300  # Refresh cached access tokens this many seconds before expiry
+    CRM_SYNC_CONCURRENCY: int = 4  # Concurrent batch requests per CRM integration in bulk syncs
+
+    # Outbound HTTP connection pools (per integration destination)
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 20
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 60.0  # seconds
+    HTTP_CLIENT_HTTP2: bool = True  # Requires the h2 package
 
     # ========================================================================
     # Microsoft Teams Integration
@@ -143,6 +247,19 @@ class Settings(BaseSettings):
                 raise ValueError("本番環境でデフォルトのENCRYPTION_KEYを使用しています。必ず強力なランダムキーに変更してください。")
         return v
 
+    # ========================================================================
+    # File Storage (QR images, export artifacts)
+    # ========================================================================
+    STORAGE_BACKEND: Literal["local", "s3"] = "local"
+    STORAGE_LOCAL_ROOT: str = "./storage"
+    STORAGE_PUBLIC_BASE_URL: str = "http://localhost:8000/api/v1/files"  # Base URL files are served from
+    STORAGE_S3_BUCKET: str = ""
+    STORAGE_S3_PREFIX: str = ""
+    STORAGE_S3_ENDPOINT_URL: str = ""  # S3-compatible endpoint (Cloudflare R2, MinIO); empty for AWS
+    STORAGE_S3_REGION: str = "auto"
+    STORAGE_S3_ACCESS_KEY_ID: str = ""
+    STORAGE_S3_SECRET_ACCESS_KEY: str = ""
+
     # ========================================================================
     # Rate Limiting
     # ========================================================================
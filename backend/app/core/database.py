@@ -4,8 +4,12 @@ Database Configuration
 SQLAlchemy setup for PostgreSQL with async support.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.core.config import settings
 
@@ -42,3 +46,78 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def scope_session_to_tenant(db: Session, tenant_id: UUID) -> None:
+    """
+    Scope every transaction of a session to a tenant (RLS).
+
+    For background work spanning several transactions: the tenant is set
+    transaction-local at the start of each one, so it never outlives the
+    session on its pooled connection.
+    """
+    statement = text("SELECT set_config('app.current_tenant_id', :tenant_id, true)")
+    params = {"tenant_id": str(tenant_id)}
+    event.listen(db, "after_begin", lambda session, transaction, connection: connection.execute(statement, params))
+    if db.in_transaction():
+        db.execute(statement, params)
+
+
+class LeaderLock:
+    """
+    PostgreSQL advisory lock electing one process of the deployment to run a periodic job.
+
+    Every API process starts the periodic workers; each pass first calls
+    `acquire`, and only the process holding the lock runs it. The lock is held
+    between passes on its own autocommit connection (no transaction stays
+    open), and is released when the process stops or its connection drops,
+    so another process takes over on its next pass.
+
+    Usage:
+        leader = LeaderLock("tenant_counter_reconciler")
+        if leader.acquire():
+            ...
+        leader.release()  # on shutdown
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.connection: Optional[Connection] = None
+
+    def acquire(self) -> bool:
+        """Take the lock unless another process holds it, or check that this process still does
+
+        Returns:
+            Whether this process holds the lock
+        """
+        if self.connection is not None:
+            try:
+                self.connection.execute(text("SELECT 1"))
+                return True
+            except Exception:
+                # Connection lost, and the lock with it
+                self.connection.invalidate()
+                self.connection.close()
+                self.connection = None
+
+        connection = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            acquired = connection.execute(text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": self.name}).scalar()
+        except Exception:
+            connection.close()
+            raise
+        if not acquired:
+            connection.close()
+            return False
+        self.connection = connection
+        return True
+
+    def release(self) -> None:
+        """Release the lock if held"""
+        if self.connection is None:
+            return
+        try:
+            self.connection.execute(text("SELECT pg_advisory_unlock(hashtext(:name))"), {"name": self.name})
+        finally:
+            self.connection.close()
+            self.connection = None
@@ -7,7 +7,7 @@ Provides database session, authentication, and authorization dependencies.
 from contextvars import ContextVar
 from typing import Generator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
@@ -16,6 +16,7 @@ from app.models.tenant import Tenant
 from app.models.user import User
 from app.services.ai_service import AIService
 from app.services.auth import AuthService
+from app.services.principal_service import PrincipalService
 
 security = HTTPBearer()
 
@@ -46,12 +47,16 @@ def get_db() -> Generator[Session, None, None]:
 
 
 def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
     """
     Get current authenticated user from JWT token
 
+    Reuses the payload TenantMiddleware already decoded, and serves the user
+    from the short-TTL principal cache.
+
     Raises:
         HTTPException: If token is invalid or user not found
     """
@@ -63,8 +68,12 @@ def get_current_user(
 
     token = credentials.credentials
 
-    # Decode token
-    token_data = AuthService.decode_access_token(token)
+    # Decode token (unless TenantMiddleware already did)
+    state = request.state
+    if getattr(state, "token", None) == token and getattr(state, "token_payload", None) is not None:
+        token_data = AuthService.token_data_from_payload(state.token_payload)
+    else:
+        token_data = AuthService.decode_access_token(token)
 
     if not token_data.user_id:
         raise HTTPException(
@@ -72,8 +81,8 @@ def get_current_user(
             detail="Invalid token: missing user_id",
         )
 
-    # Get user from database
-    user = AuthService.get_user_by_id(db, user_id=token_data.user_id)
+    # Get user from the principal cache or database
+    user = PrincipalService(db).get_user(token_data.user_id)
 
     if not user:
         raise HTTPException(
@@ -91,7 +100,7 @@ def get_current_tenant(current_user: User = Depends(get_current_user), db: Sessi
     Raises:
         HTTPException: If tenant not found
     """
-    tenant = db.query(Tenant).filter(Tenant.id == current_user.tenant_id).first()
+    tenant = PrincipalService(db).get_tenant(current_user.tenant_id)
 
     if not tenant:
         raise HTTPException(
@@ -0,0 +1,152 @@
+"""
+HTTP Clients
+
+Shared, pooled httpx clients for outbound integrations. Each destination gets
+its own long-lived client (keep-alive, connection limits and HTTP/2 when the
+optional `h2` package is installed), so integrations stop paying DNS, TCP and
+TLS setup per request.
+
+Async clients serve async integrations (GA4, Teams); sync clients serve the
+sync CRM clients, which run in worker threads (httpx.Client is thread-safe).
+The registry is closed by the app lifespan.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 (optional dependency)
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class ClientProfile:
+    """Connection settings of a destination"""
+
+    timeout: float = 30.0
+    http2: bool = True
+
+
+# Outbound destinations
+HTTP_CLIENT_PROFILES: Dict[str, ClientProfile] = {
+    "salesforce": ClientProfile(timeout=30.0),
+    "hubspot": ClientProfile(timeout=30.0),
+    "microsoft_graph": ClientProfile(timeout=30.0),  # Azure AD token endpoint and Graph API
+    "teams_webhook": ClientProfile(timeout=30.0),
+    "ga4": ClientProfile(timeout=10.0),
+}
+
+
+def _pool_stats(client: Union[httpx.Client, httpx.AsyncClient]) -> Dict[str, int]:
+    """Connection pool counters of a client (httpcore pool internals)"""
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return {
+        "connections": len(connections),
+        "idle": idle,
+        "active": len(connections) - idle,
+        "requests": len(getattr(pool, "_requests", [])),  # In flight or waiting for a connection
+    }
+
+
+class HTTPClientRegistry:
+    """Lazily created, shared clients per destination"""
+
+    def __init__(self, profiles: Optional[Dict[str, ClientProfile]] = None):
+        self.profiles = profiles or HTTP_CLIENT_PROFILES
+        self._async_clients: Dict[str, httpx.AsyncClient] = {}
+        self._sync_clients: Dict[str, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def _client_kwargs(self, name: str) -> Dict[str, Any]:
+        if name not in self.profiles:
+            raise ValueError(f"Unknown HTTP client: {name}")
+
+        profile = self.profiles[name]
+        return {
+            "timeout": profile.timeout,
+            "http2": profile.http2 and settings.HTTP_CLIENT_HTTP2 and HTTP2_AVAILABLE,
+            "limits": httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+        }
+
+    def async_client(self, name: str) -> httpx.AsyncClient:
+        """Get the shared async client of a destination"""
+        client = self._async_clients.get(name)
+        if client is None:
+            with self._lock:
+                client = self._async_clients.get(name)
+                if client is None:
+                    client = self._async_clients[name] = httpx.AsyncClient(**self._client_kwargs(name))
+        return client
+
+    def sync_client(self, name: str) -> httpx.Client:
+        """Get the shared sync client of a destination"""
+        client = self._sync_clients.get(name)
+        if client is None:
+            with self._lock:
+                client = self._sync_clients.get(name)
+                if client is None:
+                    client = self._sync_clients[name] = httpx.Client(**self._client_kwargs(name))
+        return client
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Pool statistics per destination and client kind"""
+        stats: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for name, client in self._async_clients.items():
+            stats.setdefault(name, {})["async"] = _pool_stats(client)
+        for name, client in self._sync_clients.items():
+            stats.setdefault(name, {})["sync"] = _pool_stats(client)
+        return stats
+
+    async def aclose(self) -> None:
+        """Close all clients"""
+        with self._lock:
+            async_clients, self._async_clients = self._async_clients, {}
+            sync_clients, self._sync_clients = self._sync_clients, {}
+
+        for name, client in async_clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP client {name}: {e}")
+        for client in sync_clients.values():
+            client.close()
+
+
+_registry: Optional[HTTPClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_http_clients() -> HTTPClientRegistry:
+    """Get the process-wide HTTP client registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = HTTPClientRegistry()
+    return _registry
+
+
+async def close_http_clients() -> None:
+    """Close the process-wide HTTP clients (app shutdown)"""
+    global _registry
+    registry, _registry = _registry, None
+    if registry is not None:
+        await registry.aclose()
@@ -4,58 +4,90 @@ Multi-Tenant Middleware
 Automatically applies tenant context to all requests.
 """
 
-from fastapi import Request
+from typing import FrozenSet, Iterable, Optional, Tuple
+
 from jose import JWTError, jwt
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.config import settings
 from app.core.deps import current_tenant_id
 
+# Endpoints reachable without a token
+PUBLIC_PATHS = (
+    "/health",
+    "/",
+    "/api/docs",
+    "/api/redoc",
+    "/api/openapi.json",
+    "/api/v1/auth/login",
+    "/api/v1/auth/login/json",
+    "/api/v1/auth/register",
+    "/api/v1/auth/refresh",
+    "/api/v1/auth/password-reset",
+    "/api/v1/auth/password-reset/confirm",
+)
+
+PUBLIC_PREFIXES = (
+    "/api/v1/responses",  # Embed widget submissions
+    "/api/v1/files/",  # Content-addressed stored files (QR code images)
+)
+
+
+class PublicRouteMatcher:
+    """Precompiled matcher of the endpoints that skip authentication.
+
+    Exact paths are a set lookup and prefixes a single str.startswith over a
+    tuple; public assessment endpoints of the embed widget match anywhere
+    below /assessments/ (e.g. /api/v1/assessments/{id}/public).
+    """
+
+    def __init__(self, paths: Iterable[str] = PUBLIC_PATHS, prefixes: Iterable[str] = PUBLIC_PREFIXES):
+        self.paths: FrozenSet[str] = frozenset(paths)
+        self.prefixes: Tuple[str, ...] = tuple(prefixes)
+
+    def __call__(self, path: str) -> bool:
+        if path in self.paths or path.startswith(self.prefixes):
+            return True
+        return "/assessments/" in path and "/public" in path
 
-class TenantMiddleware(BaseHTTPMiddleware):
+
+def _authorization_header(scope: Scope) -> Optional[str]:
+    """First Authorization header of a request, if any"""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            return value.decode("latin-1")
+    return None
+
+
+class TenantMiddleware:
     """
     Middleware to extract tenant_id from JWT and set tenant context.
 
     All database queries will automatically be scoped to the tenant.
+    Implemented as plain ASGI, so requests and streamed responses pass
+    through without the extra task and body stream of BaseHTTPMiddleware.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        # Handle CORS preflight requests (OPTIONS)
-        if request.method == "OPTIONS":
-            return await call_next(request)
-
-        # Skip authentication for public endpoints
-        public_paths = [
-            "/health",
-            "/",
-            "/api/docs",
-            "/api/redoc",
-            "/api/openapi.json",
-            "/api/v1/auth/login",
-            "/api/v1/auth/login/json",
-            "/api/v1/auth/register",
-            "/api/v1/auth/refresh",
-            "/api/v1/auth/password-reset",
-            "/api/v1/auth/password-reset/confirm",
-        ]
-
-        # Check exact path matches
-        if request.url.path in public_paths:
-            return await call_next(request)
-
-        # Check path patterns for public endpoints (embed widget)
-        path = request.url.path
-        if "/assessments/" in path and "/public" in path or path.startswith("/api/v1/responses"):
-            return await call_next(request)
+    def __init__(self, app: ASGIApp, is_public: Optional[PublicRouteMatcher] = None):
+        self.app = app
+        self.is_public = is_public or PublicRouteMatcher()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Handle CORS preflight requests (OPTIONS) and public endpoints
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or self.is_public(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
         # Extract JWT token from Authorization header
-        auth_header = request.headers.get("Authorization")
+        auth_header = _authorization_header(scope)
         if not auth_header or not auth_header.startswith("Bearer "):
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=401,
                 content={"detail": "Missing or invalid authorization header"},
             )
+            await response(scope, receive, send)
+            return
 
         token = auth_header.split(" ")[1]
 
@@ -66,27 +98,36 @@ class TenantMiddleware(BaseHTTPMiddleware):
                 settings.SECRET_KEY,
                 algorithms=[settings.ALGORITHM],
             )
-            tenant_id = payload.get("tenant_id")
-            user_id = payload.get("user_id")
-
-            if not tenant_id:
-                return JSONResponse(
-                    status_code=401,
-                    content={"detail": "Invalid token: missing tenant_id claim"},
-                )
-
-            # Attach tenant_id and user_id to request state
-            request.state.tenant_id = tenant_id
-            request.state.user_id = user_id
-
-            # Set context variable for RLS (database-level tenant isolation)
-            current_tenant_id.set(str(tenant_id))
-
         except JWTError:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=401,
                 content={"detail": "Invalid or expired token"},
             )
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
-        return response
+        tenant_id = payload.get("tenant_id")
+        user_id = payload.get("user_id")
+
+        if not tenant_id:
+            response = JSONResponse(
+                status_code=401,
+                content={"detail": "Invalid token: missing tenant_id claim"},
+            )
+            await response(scope, receive, send)
+            return
+
+        # Attach tenant_id and user_id to request state, with the decoded
+        # token so get_current_user does not decode it again
+        state = scope.setdefault("state", {})
+        state["tenant_id"] = tenant_id
+        state["user_id"] = user_id
+        state["token"] = token
+        state["token_payload"] = payload
+
+        # Set context variable for RLS (database-level tenant isolation)
+        token_reset = current_tenant_id.set(str(tenant_id))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_tenant_id.reset(token_reset)
@@ -0,0 +1,55 @@
+"""
+JSON Responses
+
+ORJSONResponse is the application's default response class: it renders
+UUIDs, datetimes, dates and enums natively in orjson instead of through
+`json.dumps`. Endpoints returning large payloads skip FastAPI's response
+model round trip (validate, serialize to Python objects, dump) and return
+`json_response()` with a precompiled TypeAdapter (see app/schemas), which
+validates and dumps straight to JSON bytes in pydantic-core.
+"""
+
+from decimal import Decimal
+from typing import Any, Mapping, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+from starlette.responses import Response
+
+# Keys of analytics dictionaries are not always strings (e.g. dates, scores)
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def json_default(value: Any) -> Any:
+    """Encode types orjson does not handle natively (same output as jsonable_encoder)"""
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return to_jsonable_python(value)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=json_default, option=ORJSON_OPTIONS)
+
+
+def json_response(adapter: TypeAdapter, content: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """
+    Serialize content to a JSON response with a precompiled TypeAdapter.
+
+    Args:
+        adapter: Adapter of the response type (e.g. LEAD_LIST_ADAPTER)
+        content: Response models, ORM entities or rows (read by attribute)
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        application/json response
+    """
+    body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=dict(headers or {}))
@@ -0,0 +1,327 @@
+"""
+File Storage
+
+Pluggable storage backends for generated files (QR code images, export
+artifacts). Files are content-addressed: the key is the SHA-256 of the content
+plus an extension, so identical content is stored once and stored files never
+change, which lets them be served with long-lived immutable cache headers.
+"""
+
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from app.core.config import settings
+
+try:
+    import boto3
+
+    BOTO3_AVAILABLE = True
+except ImportError:
+    BOTO3_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Chunk size used when streaming files
+CHUNK_SIZE = 64 * 1024
+
+# Cache-Control for content-addressed files (content never changes for a key)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# <sha256 hex>[.<ext>]
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}(\.[a-z0-9]{1,10})?$")
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(ValueError):
+    """Requested byte range cannot be served for the file."""
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """Metadata of a stored file."""
+
+    key: str
+    size: int
+    content_type: str
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag derived from the content hash."""
+        return f'"{self.key.split(".", 1)[0]}"'
+
+
+def make_key(data: bytes, extension: str = "") -> str:
+    """Build the content-addressed key for `data`.
+
+    Args:
+        data: File content
+        extension: File extension with or without the leading dot (e.g. ".png")
+
+    Returns:
+        Storage key (e.g. "9f86d08...0a08.png")
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    extension = extension.lower().lstrip(".")
+    return f"{digest}.{extension}" if extension else digest
+
+
+def is_valid_key(key: str) -> bool:
+    """Check that `key` is a well-formed content-addressed key."""
+    return bool(_KEY_PATTERN.match(key))
+
+
+def guess_content_type(key: str) -> str:
+    """Guess the MIME type of a key from its extension."""
+    content_type, _ = mimetypes.guess_type(key)
+    return content_type or "application/octet-stream"
+
+
+def parse_range_header(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-range HTTP Range header.
+
+    Multi-range and malformed headers are ignored (the full file is served),
+    as allowed by RFC 9110.
+
+    Args:
+        range_header: Value of the Range header (e.g. "bytes=0-1023")
+        size: Total file size in bytes
+
+    Returns:
+        Inclusive (start, end) byte positions, or None to serve the full file
+
+    Raises:
+        RangeNotSatisfiable: If the range starts beyond the end of the file
+    """
+    if not range_header:
+        return None
+
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+
+    start_str, end_str = match.groups()
+    if not start_str and not end_str:
+        return None
+
+    if not start_str:
+        # Suffix range: last N bytes
+        suffix = int(end_str)
+        if suffix == 0:
+            raise RangeNotSatisfiable(range_header)
+        return max(size - suffix, 0), size - 1
+
+    start = int(start_str)
+    end = int(end_str) if end_str else size - 1
+    if start >= size:
+        raise RangeNotSatisfiable(range_header)
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+class StorageBackend(ABC):
+    """Base class for file storage backends."""
+
+    def __init__(self, public_base_url: str):
+        self.public_base_url = public_base_url.rstrip("/")
+
+    def url_for(self, key: str) -> str:
+        """Public URL a stored file is served from."""
+        return f"{self.public_base_url}/{key}"
+
+    def key_from_url(self, url: Optional[str]) -> Optional[str]:
+        """Extract the storage key from a URL returned by `url_for`.
+
+        Returns:
+            Storage key, or None if the URL does not point to this storage
+        """
+        if not url or not url.startswith(f"{self.public_base_url}/"):
+            return None
+        key = url[len(self.public_base_url) + 1 :]
+        return key if is_valid_key(key) else None
+
+    def save(self, data: bytes, extension: str = "", content_type: Optional[str] = None) -> StoredFile:
+        """Store `data` under its content-addressed key.
+
+        Saving content that is already stored is a no-op.
+
+        Args:
+            data: File content
+            extension: File extension (e.g. ".png")
+            content_type: MIME type (guessed from the extension if omitted)
+
+        Returns:
+            Stored file metadata
+        """
+        key = make_key(data, extension)
+        content_type = content_type or guess_content_type(key)
+        if not self.exists(key):
+            self._write(key, data, content_type)
+        return StoredFile(key=key, size=len(data), content_type=content_type)
+
+    @abstractmethod
+    def _write(self, key: str, data: bytes, content_type: str) -> None:
+        """Write `data` under `key`."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Check whether `key` is stored."""
+
+    @abstractmethod
+    def stat(self, key: str) -> Optional[StoredFile]:
+        """Get metadata for `key`, or None if it is not stored."""
+
+    @abstractmethod
+    def iter_range(self, key: str, start: int, end: int, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield bytes `start`..`end` (inclusive) of `key` in chunks."""
+
+
+class LocalStorageBackend(StorageBackend):
+    """Local filesystem storage.
+
+    Files are sharded by hash prefix (`ab/cd/<key>`) and written atomically
+    (temporary file, fsync, rename) so readers never see partial files.
+    """
+
+    def __init__(self, root: str, public_base_url: str):
+        super().__init__(public_base_url)
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        if not is_valid_key(key):
+            raise ValueError(f"Invalid storage key: {key}")
+        return self.root / key[:2] / key[2:4] / key
+
+    def _write(self, key: str, data: bytes, content_type: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def exists(self, key: str) -> bool:
+        return is_valid_key(key) and self._path(key).is_file()
+
+    def stat(self, key: str) -> Optional[StoredFile]:
+        if not self.exists(key):
+            return None
+        return StoredFile(key=key, size=self._path(key).stat().st_size, content_type=guess_content_type(key))
+
+    def iter_range(self, key: str, start: int, end: int, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        remaining = end - start + 1
+        with open(self._path(key), "rb") as f:
+            f.seek(start)
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+class S3StorageBackend(StorageBackend):
+    """S3-compatible object storage (AWS S3, Cloudflare R2, MinIO)."""
+
+    def __init__(self, bucket: str, public_base_url: str, prefix: str = "", client=None):
+        super().__init__(public_base_url)
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.client = client or self._create_client()
+
+    @staticmethod
+    def _create_client():
+        if not BOTO3_AVAILABLE:
+            raise RuntimeError("boto3 is required for STORAGE_BACKEND=s3")
+        return boto3.client(
+            "s3",
+            endpoint_url=settings.STORAGE_S3_ENDPOINT_URL or None,
+            region_name=settings.STORAGE_S3_REGION or None,
+            aws_access_key_id=settings.STORAGE_S3_ACCESS_KEY_ID or None,
+            aws_secret_access_key=settings.STORAGE_S3_SECRET_ACCESS_KEY or None,
+        )
+
+    def _object_key(self, key: str) -> str:
+        if not is_valid_key(key):
+            raise ValueError(f"Invalid storage key: {key}")
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def _write(self, key: str, data: bytes, content_type: str) -> None:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Body=data,
+            ContentType=content_type,
+            CacheControl=IMMUTABLE_CACHE_CONTROL,
+        )
+
+    def _head(self, key: str) -> Optional[dict]:
+        if not is_valid_key(key):
+            return None
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+        except Exception as e:
+            # botocore raises ClientError (404) for missing objects
+            error_code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if error_code in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def exists(self, key: str) -> bool:
+        return self._head(key) is not None
+
+    def stat(self, key: str) -> Optional[StoredFile]:
+        head = self._head(key)
+        if head is None:
+            return None
+        return StoredFile(
+            key=key,
+            size=head["ContentLength"],
+            content_type=head.get("ContentType") or guess_content_type(key),
+        )
+
+    def iter_range(self, key: str, start: int, end: int, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        response = self.client.get_object(
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Range=f"bytes={start}-{end}",
+        )
+        body = response["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+
+@lru_cache()
+def get_storage() -> StorageBackend:
+    """Get the configured storage backend (cached)."""
+    if settings.STORAGE_BACKEND == "s3":
+        logger.info(f"Using S3 storage (bucket={settings.STORAGE_S3_BUCKET})")
+        return S3StorageBackend(
+            bucket=settings.STORAGE_S3_BUCKET,
+            public_base_url=settings.STORAGE_PUBLIC_BASE_URL,
+            prefix=settings.STORAGE_S3_PREFIX,
+        )
+
+    return LocalStorageBackend(root=settings.STORAGE_LOCAL_ROOT, public_base_url=settings.STORAGE_PUBLIC_BASE_URL)
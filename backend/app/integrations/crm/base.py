@@ -5,23 +5,33 @@ Abstract base class for CRM integrations (Salesforce, HubSpot).
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import httpx
+
+from app.core.http_clients import get_http_clients
+
 
 class CRMClient(ABC):
     """Base class for CRM integrations."""
 
-    def __init__(self, integration_id: UUID, config: Dict[str, Any]):
+    # Shared HTTP client of the CRM (see app.core.http_clients)
+    HTTP_CLIENT_NAME: str = ""
+
+    def __init__(self, integration_id: UUID, config: Dict[str, Any], http_client: Optional[httpx.Client] = None):
         """
         Initialize CRM client.
 
         Args:
             integration_id: CRM integration ID
             config: Configuration including access_token, instance_url, etc.
+            http_client: HTTP client (defaults to the shared pooled client of the CRM)
         """
         self.integration_id = integration_id
         self.config = config
+        self.http_client = http_client or get_http_clients().sync_client(self.HTTP_CLIENT_NAME)
 
     @abstractmethod
     def authenticate(self, code: str, redirect_uri: str) -> Dict[str, str]:
@@ -135,3 +145,74 @@ class CRMClient(ABC):
         """
         # Default implementation - should be overridden
         return data
+
+
+@dataclass
+class CRMBatchResult:
+    """Outcome of one record in a batch request (same order as the input)."""
+
+    success: bool
+    crm_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class AsyncCRMClient(ABC):
+    """Base class for async CRM clients using batch endpoints."""
+
+    # Shared HTTP client of the CRM (see app.core.http_clients)
+    HTTP_CLIENT_NAME: str = ""
+
+    # Maximum records per batch request
+    MAX_BATCH_SIZE: int = 100
+
+    def __init__(self, integration_id: UUID, config: Dict[str, Any], http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize async CRM client.
+
+        Args:
+            integration_id: CRM integration ID
+            config: Configuration including access_token, instance_url, field_mappings
+            http_client: HTTP client (defaults to the shared pooled client of the CRM)
+        """
+        self.integration_id = integration_id
+        self.config = config
+        self.http_client = http_client or get_http_clients().async_client(self.HTTP_CLIENT_NAME)
+
+    @property
+    def _auth_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.config['access_token']}",
+            "Content-Type": "application/json",
+        }
+
+    @abstractmethod
+    async def create_leads(self, leads: List[Dict[str, Any]]) -> List[CRMBatchResult]:
+        """
+        Create up to MAX_BATCH_SIZE leads in one request.
+
+        Args:
+            leads: Lead data with DiagnoLeads field names
+
+        Returns:
+            One result per lead, in input order
+
+        Raises:
+            httpx.HTTPStatusError: If the whole request fails
+        """
+        pass
+
+    @abstractmethod
+    async def update_leads(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[CRMBatchResult]:
+        """
+        Update up to MAX_BATCH_SIZE leads in one request.
+
+        Args:
+            updates: (CRM record ID, lead data) pairs
+
+        Returns:
+            One result per update, in input order
+
+        Raises:
+            httpx.HTTPStatusError: If the whole request fails
+        """
+        pass
@@ -5,19 +5,73 @@ Implements HubSpot v3 API integration for contact synchronization.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
-
-import httpx
+from typing import Any, Dict, List, Tuple
 
 from app.core.config import settings
-from app.integrations.crm.base import CRMClient
+from app.integrations.crm.base import AsyncCRMClient, CRMBatchResult, CRMClient
 from app.integrations.microsoft.retry_policy import with_retry
 
 
+def map_hubspot_contact(data: Dict[str, Any], custom_mappings: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Map DiagnoLeads fields to HubSpot Contact properties.
+
+    Default mapping:
+    - name → firstname + lastname (split by space)
+    - email → email
+    - company → company
+    - phone → phone
+    - score → hs_lead_score
+    - priority_level → lead_priority (custom property)
+
+    Custom mappings can be configured in the integration's field_mappings.
+
+    Args:
+        data: DiagnoLeads lead data
+        custom_mappings: DiagnoLeads field -> HubSpot property overrides
+
+    Returns:
+        HubSpot-formatted contact properties
+    """
+    # Default field mapping
+    default_mapping = {
+        "email": "email",
+        "company": "company",
+        "phone": "phone",
+        "score": "hs_lead_score",
+        "priority_level": "lead_priority",
+    }
+
+    properties = {}
+
+    # Handle name splitting (firstname + lastname)
+    if "name" in data and data["name"]:
+        parts = data["name"].strip().split(" ", 1)
+        properties["firstname"] = parts[0]
+        properties["lastname"] = parts[1] if len(parts) > 1 else ""
+
+    # Map other fields
+    for diagno_field, hubspot_prop in default_mapping.items():
+        if diagno_field in data and data[diagno_field] is not None:
+            # Apply custom mapping if exists
+            target_prop = custom_mappings.get(diagno_field, hubspot_prop)
+            # HubSpot properties must be strings
+            properties[target_prop] = str(data[diagno_field])
+
+    # Add detected challenges as JSON string (custom property)
+    if "detected_challenges" in data and data["detected_challenges"]:
+        import json
+
+        properties["detected_challenges"] = json.dumps(data["detected_challenges"])
+
+    return properties
+
+
 class HubSpotClient(CRMClient):
     """HubSpot integration client."""
 
     BASE_URL = "https://api.hubapi.com"
+    HTTP_CLIENT_NAME = "hubspot"
 
     def authenticate(self, code: str, redirect_uri: str) -> Dict[str, str]:
         """
@@ -49,25 +103,24 @@ class HubSpotClient(CRMClient):
             "redirect_uri": redirect_uri,
         }
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                token_url,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            response.raise_for_status()
+        response = self.http_client.post(
+            token_url,
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        response.raise_for_status()
 
-            result = response.json()
+        result = response.json()
 
-            # HubSpot returns expires_in (seconds)
-            expires_in = result.get("expires_in", 21600)  # Default 6 hours
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        # HubSpot returns expires_in (seconds)
+        expires_in = result.get("expires_in", 21600)  # Default 6 hours
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
 
-            return {
-                "access_token": result["access_token"],
-                "refresh_token": result["refresh_token"],
-                "expires_at": expires_at.isoformat(),
-            }
+        return {
+            "access_token": result["access_token"],
+            "refresh_token": result["refresh_token"],
+            "expires_at": expires_at.isoformat(),
+        }
 
     def refresh_access_token(self, refresh_token: str) -> Dict[str, str]:
         """
@@ -97,25 +150,24 @@ class HubSpotClient(CRMClient):
             "client_secret": settings.SALESFORCE_CLIENT_SECRET,  # Using generic client_secret
         }
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                token_url,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            response.raise_for_status()
+        response = self.http_client.post(
+            token_url,
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        response.raise_for_status()
 
-            result = response.json()
+        result = response.json()
 
-            # HubSpot returns expires_in (seconds)
-            expires_in = result.get("expires_in", 21600)  # Default 6 hours
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        # HubSpot returns expires_in (seconds)
+        expires_in = result.get("expires_in", 21600)  # Default 6 hours
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
 
-            return {
-                "access_token": result["access_token"],
-                "refresh_token": result["refresh_token"],
-                "expires_at": expires_at.isoformat(),
-            }
+        return {
+            "access_token": result["access_token"],
+            "refresh_token": result["refresh_token"],
+            "expires_at": expires_at.isoformat(),
+        }
 
     @with_retry(max_retries=3)
     def create_lead(self, lead_data: Dict[str, Any]) -> str:
@@ -138,19 +190,18 @@ class HubSpotClient(CRMClient):
         # Apply field mapping
         properties = self._apply_field_mapping(lead_data)
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                url,
-                json={"properties": properties},
-                headers={
-                    "Authorization": f"Bearer {self.config['access_token']}",
-                    "Content-Type": "application/json",
-                },
-            )
-            response.raise_for_status()
+        response = self.http_client.post(
+            url,
+            json={"properties": properties},
+            headers={
+                "Authorization": f"Bearer {self.config['access_token']}",
+                "Content-Type": "application/json",
+            },
+        )
+        response.raise_for_status()
 
-            result = response.json()
-            return result["id"]  # HubSpot Contact ID
+        result = response.json()
+        return result["id"]  # HubSpot Contact ID
 
     @with_retry(max_retries=3)
     def update_lead(self, crm_id: str, lead_data: Dict[str, Any]) -> bool:
@@ -172,18 +223,17 @@ class HubSpotClient(CRMClient):
         # Apply field mapping
         properties = self._apply_field_mapping(lead_data)
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.patch(
-                url,
-                json={"properties": properties},
-                headers={
-                    "Authorization": f"Bearer {self.config['access_token']}",
-                    "Content-Type": "application/json",
-                },
-            )
-            response.raise_for_status()
+        response = self.http_client.patch(
+            url,
+            json={"properties": properties},
+            headers={
+                "Authorization": f"Bearer {self.config['access_token']}",
+                "Content-Type": "application/json",
+            },
+        )
+        response.raise_for_status()
 
-            return response.status_code == 200
+        return response.status_code == 200
 
     @with_retry(max_retries=3)
     def get_lead(self, crm_id: str) -> Dict[str, Any]:
@@ -201,16 +251,15 @@ class HubSpotClient(CRMClient):
         """
         url = f"{self.BASE_URL}/crm/v3/objects/contacts/{crm_id}"
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(
-                url,
-                headers={
-                    "Authorization": f"Bearer {self.config['access_token']}",
-                },
-            )
-            response.raise_for_status()
+        response = self.http_client.get(
+            url,
+            headers={
+                "Authorization": f"Bearer {self.config['access_token']}",
+            },
+        )
+        response.raise_for_status()
 
-            return response.json()
+        return response.json()
 
     @with_retry(max_retries=3)
     def delete_lead(self, crm_id: str) -> bool:
@@ -228,69 +277,100 @@ class HubSpotClient(CRMClient):
         """
         url = f"{self.BASE_URL}/crm/v3/objects/contacts/{crm_id}"
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.delete(
-                url,
-                headers={
-                    "Authorization": f"Bearer {self.config['access_token']}",
-                },
-            )
-            response.raise_for_status()
+        response = self.http_client.delete(
+            url,
+            headers={
+                "Authorization": f"Bearer {self.config['access_token']}",
+            },
+        )
+        response.raise_for_status()
 
-            return response.status_code == 204
+        return response.status_code == 204
 
     def _apply_field_mapping(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Map DiagnoLeads fields to HubSpot Contact properties.
 
-        Default mapping:
-        - name → firstname + lastname (split by space)
-        - email → email
-        - company → company
-        - phone → phone
-        - score → hs_lead_score
-        - priority_level → lead_priority (custom property)
+        See map_hubspot_contact.
+        """
+        return map_hubspot_contact(data, self.config.get("field_mappings", {}))
 
-        Custom mappings can be configured in self.config["field_mappings"].
+
+class AsyncHubSpotClient(AsyncCRMClient):
+    """Async HubSpot client using the batch contact endpoints."""
+
+    BASE_URL = HubSpotClient.BASE_URL
+    HTTP_CLIENT_NAME = "hubspot"
+    MAX_BATCH_SIZE = 100  # Batch API limit
+
+    async def _batch(self, action: str, inputs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        response = await self.http_client.post(
+            f"{self.BASE_URL}/crm/v3/objects/contacts/batch/{action}",
+            json={"inputs": inputs},
+            headers=self._auth_headers,
+        )
+        # 207 Multi-Status: some inputs failed
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _error_messages(body: Dict[str, Any]) -> str:
+        return "; ".join(error.get("message", "") for error in body.get("errors", [])) or "Not returned by HubSpot"
+
+    @with_retry(max_retries=3)
+    async def create_leads(self, leads: List[Dict[str, Any]]) -> List[CRMBatchResult]:
+        """
+        Create up to 100 contacts in HubSpot in one request.
+
+        POST /crm/v3/objects/contacts/batch/create. Results are not returned
+        in input order, so they are matched back by email.
 
         Args:
-            data: DiagnoLeads lead data
+            leads: Lead data with DiagnoLeads field names
 
         Returns:
-            HubSpot-formatted contact properties
+            One result per lead, in input order
         """
-        # Get custom mappings if configured
-        custom_mappings = self.config.get("field_mappings", {})
-
-        # Default field mapping
-        default_mapping = {
-            "email": "email",
-            "company": "company",
-            "phone": "phone",
-            "score": "hs_lead_score",
-            "priority_level": "lead_priority",
-        }
+        if not leads:
+            return []
 
-        properties = {}
+        field_mappings = self.config.get("field_mappings", {})
+        inputs = [{"properties": map_hubspot_contact(lead, field_mappings)} for lead in leads]
+        body = await self._batch("create", inputs)
 
-        # Handle name splitting (firstname + lastname)
-        if "name" in data and data["name"]:
-            parts = data["name"].strip().split(" ", 1)
-            properties["firstname"] = parts[0]
-            properties["lastname"] = parts[1] if len(parts) > 1 else ""
+        email_property = field_mappings.get("email", "email")
+        created = {str(result.get("properties", {}).get(email_property, "")).lower(): result["id"] for result in body.get("results", [])}
+        errors = self._error_messages(body)
 
-        # Map other fields
-        for diagno_field, hubspot_prop in default_mapping.items():
-            if diagno_field in data and data[diagno_field] is not None:
-                # Apply custom mapping if exists
-                target_prop = custom_mappings.get(diagno_field, hubspot_prop)
-                # HubSpot properties must be strings
-                properties[target_prop] = str(data[diagno_field])
+        results = []
+        for item in inputs:
+            crm_id = created.get(str(item["properties"].get(email_property, "")).lower())
+            results.append(CRMBatchResult(success=True, crm_id=crm_id) if crm_id else CRMBatchResult(success=False, error=errors))
+        return results
 
-        # Add detected challenges as JSON string (custom property)
-        if "detected_challenges" in data and data["detected_challenges"]:
-            import json
+    @with_retry(max_retries=3)
+    async def update_leads(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[CRMBatchResult]:
+        """
+        Update up to 100 contacts in HubSpot in one request.
 
-            properties["detected_challenges"] = json.dumps(data["detected_challenges"])
+        POST /crm/v3/objects/contacts/batch/update
 
-        return properties
+        Args:
+            updates: (HubSpot Contact ID, lead data) pairs
+
+        Returns:
+            One result per update, in input order
+        """
+        if not updates:
+            return []
+
+        field_mappings = self.config.get("field_mappings", {})
+        inputs = [{"id": crm_id, "properties": map_hubspot_contact(lead, field_mappings)} for crm_id, lead in updates]
+        body = await self._batch("update", inputs)
+
+        updated = {str(result["id"]) for result in body.get("results", [])}
+        errors = self._error_messages(body)
+        return [
+            CRMBatchResult(success=True, crm_id=crm_id) if str(crm_id) in updated else CRMBatchResult(success=False, crm_id=crm_id, error=errors)
+            for crm_id, _ in updates
+        ]
@@ -5,19 +5,72 @@ Implements Salesforce REST API integration for lead synchronization.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
-
-import httpx
+from typing import Any, Dict, List, Tuple
 
 from app.core.config import settings
-from app.integrations.crm.base import CRMClient
+from app.integrations.crm.base import AsyncCRMClient, CRMBatchResult, CRMClient
 from app.integrations.microsoft.retry_policy import with_retry
 
 
+def map_salesforce_lead(data: Dict[str, Any], custom_mappings: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Map DiagnoLeads fields to Salesforce Lead fields.
+
+    Default mapping:
+    - name → FirstName + LastName (split by space)
+    - email → Email
+    - company → Company
+    - phone → Phone
+    - score → LeadScore__c (custom field)
+    - priority_level → Priority__c (custom field)
+
+    Custom mappings can be configured in the integration's field_mappings.
+
+    Args:
+        data: DiagnoLeads lead data
+        custom_mappings: DiagnoLeads field -> Salesforce field overrides
+
+    Returns:
+        Salesforce-formatted lead data
+    """
+    # Default field mapping
+    default_mapping = {
+        "email": "Email",
+        "company": "Company",
+        "phone": "Phone",
+        "score": "LeadScore__c",
+        "priority_level": "Priority__c",
+    }
+
+    mapped = {}
+
+    # Handle name splitting (FirstName + LastName)
+    if "name" in data and data["name"]:
+        parts = data["name"].strip().split(" ", 1)
+        mapped["FirstName"] = parts[0]
+        mapped["LastName"] = parts[1] if len(parts) > 1 else parts[0]
+
+    # Map other fields
+    for diagno_field, salesforce_field in default_mapping.items():
+        if diagno_field in data and data[diagno_field] is not None:
+            # Apply custom mapping if exists
+            target_field = custom_mappings.get(diagno_field, salesforce_field)
+            mapped[target_field] = data[diagno_field]
+
+    # Add detected challenges as JSON string (custom field)
+    if "detected_challenges" in data and data["detected_challenges"]:
+        import json
+
+        mapped["DetectedChallenges__c"] = json.dumps(data["detected_challenges"])
+
+    return mapped
+
+
 class SalesforceClient(CRMClient):
     """Salesforce integration client."""
 
     API_VERSION = "v57.0"
+    HTTP_CLIENT_NAME = "salesforce"
 
     def authenticate(self, code: str, redirect_uri: str) -> Dict[str, str]:
         """
@@ -50,21 +103,20 @@ class SalesforceClient(CRMClient):
             "redirect_uri": redirect_uri,
         }
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(token_url, data=data)
-            response.raise_for_status()
+        response = self.http_client.post(token_url, data=data)
+        response.raise_for_status()
 
-            result = response.json()
+        result = response.json()
 
-            # Salesforce tokens typically expire in 2 hours
-            expires_at = datetime.now(timezone.utc) + timedelta(hours=2)
+        # Salesforce tokens typically expire in 2 hours
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=2)
 
-            return {
-                "access_token": result["access_token"],
-                "refresh_token": result.get("refresh_token", ""),
-                "instance_url": result["instance_url"],
-                "expires_at": expires_at.isoformat(),
-            }
+        return {
+            "access_token": result["access_token"],
+            "refresh_token": result.get("refresh_token", ""),
+            "instance_url": result["instance_url"],
+            "expires_at": expires_at.isoformat(),
+        }
 
     def refresh_access_token(self, refresh_token: str) -> Dict[str, str]:
         """
@@ -94,20 +146,19 @@ class SalesforceClient(CRMClient):
             "client_secret": settings.SALESFORCE_CLIENT_SECRET,
         }
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(token_url, data=data)
-            response.raise_for_status()
+        response = self.http_client.post(token_url, data=data)
+        response.raise_for_status()
 
-            result = response.json()
+        result = response.json()
 
-            # Salesforce tokens typically expire in 2 hours
-            expires_at = datetime.now(timezone.utc) + timedelta(hours=2)
+        # Salesforce tokens typically expire in 2 hours
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=2)
 
-            return {
-                "access_token": result["access_token"],
-                "instance_url": result.get("instance_url", self.config.get("instance_url", "")),
-                "expires_at": expires_at.isoformat(),
-            }
+        return {
+            "access_token": result["access_token"],
+            "instance_url": result.get("instance_url", self.config.get("instance_url", "")),
+            "expires_at": expires_at.isoformat(),
+        }
 
     @with_retry(max_retries=3)
     def create_lead(self, lead_data: Dict[str, Any]) -> str:
@@ -128,19 +179,18 @@ class SalesforceClient(CRMClient):
         # Apply field mapping
         mapped_data = self._apply_field_mapping(lead_data)
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                url,
-                json=mapped_data,
-                headers={
-                    "Authorization": f"Bearer {self.config['access_token']}",
-                    "Content-Type": "application/json",
-                },
-            )
-            response.raise_for_status()
+        response = self.http_client.post(
+            url,
+            json=mapped_data,
+            headers={
+                "Authorization": f"Bearer {self.config['access_token']}",
+                "Content-Type": "application/json",
+            },
+        )
+        response.raise_for_status()
 
-            result = response.json()
-            return result["id"]  # Salesforce Lead ID
+        result = response.json()
+        return result["id"]  # Salesforce Lead ID
 
     @with_retry(max_retries=3)
     def update_lead(self, crm_id: str, lead_data: Dict[str, Any]) -> bool:
@@ -162,18 +212,17 @@ class SalesforceClient(CRMClient):
         # Apply field mapping
         mapped_data = self._apply_field_mapping(lead_data)
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.patch(
-                url,
-                json=mapped_data,
-                headers={
-                    "Authorization": f"Bearer {self.config['access_token']}",
-                    "Content-Type": "application/json",
-                },
-            )
-            response.raise_for_status()
+        response = self.http_client.patch(
+            url,
+            json=mapped_data,
+            headers={
+                "Authorization": f"Bearer {self.config['access_token']}",
+                "Content-Type": "application/json",
+            },
+        )
+        response.raise_for_status()
 
-            return response.status_code == 204
+        return response.status_code == 204
 
     @with_retry(max_retries=3)
     def get_lead(self, crm_id: str) -> Dict[str, Any]:
@@ -191,16 +240,15 @@ class SalesforceClient(CRMClient):
         """
         url = f"{self.config['instance_url']}/services/data/{self.API_VERSION}/sobjects/Lead/{crm_id}"
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(
-                url,
-                headers={
-                    "Authorization": f"Bearer {self.config['access_token']}",
-                },
-            )
-            response.raise_for_status()
+        response = self.http_client.get(
+            url,
+            headers={
+                "Authorization": f"Bearer {self.config['access_token']}",
+            },
+        )
+        response.raise_for_status()
 
-            return response.json()
+        return response.json()
 
     @with_retry(max_retries=3)
     def delete_lead(self, crm_id: str) -> bool:
@@ -218,68 +266,100 @@ class SalesforceClient(CRMClient):
         """
         url = f"{self.config['instance_url']}/services/data/{self.API_VERSION}/sobjects/Lead/{crm_id}"
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.delete(
-                url,
-                headers={
-                    "Authorization": f"Bearer {self.config['access_token']}",
-                },
-            )
-            response.raise_for_status()
+        response = self.http_client.delete(
+            url,
+            headers={
+                "Authorization": f"Bearer {self.config['access_token']}",
+            },
+        )
+        response.raise_for_status()
 
-            return response.status_code == 204
+        return response.status_code == 204
 
     def _apply_field_mapping(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Map DiagnoLeads fields to Salesforce Lead fields.
 
-        Default mapping:
-        - name → FirstName + LastName (split by space)
-        - email → Email
-        - company → Company
-        - phone → Phone
-        - score → LeadScore__c (custom field)
-        - priority_level → Priority__c (custom field)
+        See map_salesforce_lead.
+        """
+        return map_salesforce_lead(data, self.config.get("field_mappings", {}))
+
+
+class AsyncSalesforceClient(AsyncCRMClient):
+    """Async Salesforce client using sObject Collections (Composite API)."""
+
+    API_VERSION = SalesforceClient.API_VERSION
+    HTTP_CLIENT_NAME = "salesforce"
+    MAX_BATCH_SIZE = 200  # sObject Collections limit
 
-        Custom mappings can be configured in self.config["field_mappings"].
+    @property
+    def _collections_url(self) -> str:
+        return f"{self.config['instance_url']}/services/data/{self.API_VERSION}/composite/sobjects"
+
+    @staticmethod
+    def _parse_results(results: List[Dict[str, Any]]) -> List[CRMBatchResult]:
+        return [
+            CRMBatchResult(success=True, crm_id=result.get("id"))
+            if result.get("success")
+            else CRMBatchResult(
+                success=False,
+                crm_id=result.get("id"),
+                error="; ".join(error.get("message", "") for error in result.get("errors", [])) or "Unknown error",
+            )
+            for result in results
+        ]
+
+    @with_retry(max_retries=3)
+    async def create_leads(self, leads: List[Dict[str, Any]]) -> List[CRMBatchResult]:
+        """
+        Create up to 200 leads in Salesforce in one request.
+
+        POST /services/data/vXX.X/composite/sobjects (allOrNone=false, so one
+        invalid record does not fail the others)
 
         Args:
-            data: DiagnoLeads lead data
+            leads: Lead data with DiagnoLeads field names
 
         Returns:
-            Salesforce-formatted lead data
+            One result per lead, in input order
         """
-        # Get custom mappings if configured
-        custom_mappings = self.config.get("field_mappings", {})
-
-        # Default field mapping
-        default_mapping = {
-            "email": "Email",
-            "company": "Company",
-            "phone": "Phone",
-            "score": "LeadScore__c",
-            "priority_level": "Priority__c",
-        }
+        if not leads:
+            return []
 
-        mapped = {}
+        field_mappings = self.config.get("field_mappings", {})
+        records = [{"attributes": {"type": "Lead"}, **map_salesforce_lead(lead, field_mappings)} for lead in leads]
 
-        # Handle name splitting (FirstName + LastName)
-        if "name" in data and data["name"]:
-            parts = data["name"].strip().split(" ", 1)
-            mapped["FirstName"] = parts[0]
-            mapped["LastName"] = parts[1] if len(parts) > 1 else parts[0]
+        response = await self.http_client.post(
+            self._collections_url,
+            json={"allOrNone": False, "records": records},
+            headers=self._auth_headers,
+        )
+        response.raise_for_status()
+        return self._parse_results(response.json())
 
-        # Map other fields
-        for diagno_field, salesforce_field in default_mapping.items():
-            if diagno_field in data and data[diagno_field] is not None:
-                # Apply custom mapping if exists
-                target_field = custom_mappings.get(diagno_field, salesforce_field)
-                mapped[target_field] = data[diagno_field]
+    @with_retry(max_retries=3)
+    async def update_leads(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[CRMBatchResult]:
+        """
+        Update up to 200 leads in Salesforce in one request.
 
-        # Add detected challenges as JSON string (custom field)
-        if "detected_challenges" in data and data["detected_challenges"]:
-            import json
+        PATCH /services/data/vXX.X/composite/sobjects (allOrNone=false)
 
-            mapped["DetectedChallenges__c"] = json.dumps(data["detected_challenges"])
+        Args:
+            updates: (Salesforce Lead ID, lead data) pairs
 
-        return mapped
+        Returns:
+            One result per update, in input order
+        """
+        if not updates:
+            return []
+
+        field_mappings = self.config.get("field_mappings", {})
+        records = [{"attributes": {"type": "Lead"}, "id": crm_id, **map_salesforce_lead(lead, field_mappings)} for crm_id, lead in updates]
+
+        response = await self.http_client.patch(
+            self._collections_url,
+            json={"allOrNone": False, "records": records},
+            headers=self._auth_headers,
+        )
+        response.raise_for_status()
+        return self._parse_results(response.json())
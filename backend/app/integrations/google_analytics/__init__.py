@@ -3,6 +3,7 @@
 Provides GA4 Measurement Protocol client and utilities.
 """
 
+from .event_batcher import GA4EventBatcher, GA4Target
 from .measurement_protocol import GA4MeasurementProtocol
 
-__all__ = ["GA4MeasurementProtocol"]
+__all__ = ["GA4EventBatcher", "GA4MeasurementProtocol", "GA4Target"]
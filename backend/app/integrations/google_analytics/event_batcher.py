@@ -0,0 +1,184 @@
+"""GA4 Measurement Protocol Event Batcher
+
+Coalesces server-side events per (tenant, client_id) and sends them with
+`send_batch_events` over a shared, pooled HTTP client. A batch is sent once
+it holds `max_events` events (25 is the Measurement Protocol limit) or its
+oldest event has waited `max_wait_ms`.
+
+Memory is bounded: when `max_pending` events are waiting, the oldest pending
+event is dropped and reported as not delivered.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+import httpx
+
+from .measurement_protocol import GA4MeasurementProtocol
+
+logger = logging.getLogger(__name__)
+
+# Measurement Protocol accepts at most 25 events per request
+MAX_EVENTS_PER_REQUEST = 25
+
+
+@dataclass(frozen=True)
+class GA4Target:
+    """Measurement Protocol credentials of a tenant"""
+
+    measurement_id: str
+    api_secret: str
+
+
+# Resolves the target of a tenant, or None if server-side tracking is off
+GA4TargetLoader = Callable[[Hashable], Awaitable[Optional[GA4Target]]]
+
+
+@dataclass
+class _PendingEvent:
+    event: Dict
+    future: "asyncio.Future[bool]"
+
+
+class GA4EventBatcher:
+    """Per-tenant GA4 event aggregator
+
+    Each submitted event returns a future that resolves to True once its batch
+    was delivered (or the tenant has no server-side tracking), and False if the
+    batch failed or the event was dropped.
+    """
+
+    def __init__(
+        self,
+        target_loader: GA4TargetLoader,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_events: int = MAX_EVENTS_PER_REQUEST,
+        max_wait_ms: int = 200,
+        max_pending: int = 10000,
+    ):
+        """Initialize the batcher
+
+        Args:
+            target_loader: Async loader of a tenant's GA4 credentials
+            http_client: HTTP client (owned by the caller; defaults to the
+                shared pooled GA4 client)
+            max_events: Events per request (capped at 25)
+            max_wait_ms: Maximum time an event waits for its batch to fill
+            max_pending: Maximum events held in memory across all batches
+        """
+        self.target_loader = target_loader
+        self.http_client = http_client
+        self.max_events = min(max_events, MAX_EVENTS_PER_REQUEST)
+        self.max_wait = max_wait_ms / 1000
+        self.max_pending = max_pending
+
+        # Batches in order of their oldest event
+        self._batches: "OrderedDict[Tuple[Hashable, str], List[_PendingEvent]]" = OrderedDict()
+        self._timers: Dict[Tuple[Hashable, str], asyncio.TimerHandle] = {}
+        self._sending: Set[asyncio.Task] = set()
+
+        self.pending = 0
+        self.dropped = 0
+        self.sent_batches = 0
+        self.sent_events = 0
+
+    def submit(self, tenant_id: Hashable, client_id: str, event_name: str, event_params: Optional[Dict] = None) -> "asyncio.Future[bool]":
+        """Queue an event for its tenant's next batch
+
+        Args:
+            tenant_id: Tenant identifier
+            client_id: GA4 client ID (a request carries a single client ID)
+            event_name: GA4 event name
+            event_params: Event parameters
+
+        Returns:
+            Future resolving to the delivery result
+        """
+        loop = asyncio.get_running_loop()
+        if self.pending >= self.max_pending:
+            self._drop_oldest()
+
+        key = (tenant_id, client_id)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = []
+            self._timers[key] = loop.call_later(self.max_wait, self._flush_batch, key)
+
+        future = loop.create_future()
+        batch.append(_PendingEvent({"name": event_name, "params": event_params or {}}, future))
+        self.pending += 1
+
+        if len(batch) >= self.max_events:
+            self._flush_batch(key)
+        return future
+
+    async def flush(self) -> None:
+        """Send all pending batches and wait for in-flight requests"""
+        for key in list(self._batches):
+            self._flush_batch(key)
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring"""
+        return {
+            "pending": self.pending,
+            "batches_waiting": len(self._batches),
+            "in_flight": len(self._sending),
+            "dropped": self.dropped,
+            "sent_batches": self.sent_batches,
+            "sent_events": self.sent_events,
+        }
+
+    def _drop_oldest(self) -> None:
+        key, batch = next(iter(self._batches.items()))
+        dropped = batch.pop(0)
+        self.pending -= 1
+        self.dropped += 1
+        if not batch:
+            del self._batches[key]
+            self._timers.pop(key).cancel()
+
+        logger.warning(f"GA4 batcher full ({self.max_pending} events), dropped oldest event '{dropped.event['name']}'")
+        if not dropped.future.done():
+            dropped.future.set_result(False)
+
+    def _flush_batch(self, key: Tuple[Hashable, str]) -> None:
+        batch = self._batches.pop(key, None)
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        if not batch:
+            return
+
+        self.pending -= len(batch)
+        task = asyncio.get_running_loop().create_task(self._send(key, batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, key: Tuple[Hashable, str], batch: List[_PendingEvent]) -> None:
+        tenant_id, client_id = key
+        try:
+            target = await self.target_loader(tenant_id)
+            if target is None:
+                delivered = True
+            else:
+                client = GA4MeasurementProtocol(
+                    measurement_id=target.measurement_id,
+                    api_secret=target.api_secret,
+                    http_client=self.http_client,
+                )
+                delivered = await client.send_batch_events(client_id=client_id, events=[pending.event for pending in batch])
+                if delivered:
+                    self.sent_batches += 1
+                    self.sent_events += len(batch)
+        except Exception as e:
+            logger.error(f"GA4 batch for tenant {tenant_id} failed: {e}")
+            delivered = False
+
+        for pending in batch:
+            if not pending.future.done():
+                pending.future.set_result(delivered)
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional
 
 import httpx
 
+from app.core.http_clients import get_http_clients
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +35,7 @@ class GA4MeasurementProtocol:
         api_secret: str,
         debug: bool = False,
         timeout: float = 10.0,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize GA4 Measurement Protocol client
 
@@ -41,10 +44,12 @@ class GA4MeasurementProtocol:
             api_secret: Measurement Protocol API Secret
             debug: Use debug endpoint for testing (default: False)
             timeout: Request timeout in seconds (default: 10.0)
+            http_client: HTTP client (defaults to the shared pooled GA4 client)
         """
         self.measurement_id = measurement_id
         self.api_secret = api_secret
         self.timeout = timeout
+        self.http_client = http_client or get_http_clients().async_client("ga4")
 
         # Use debug endpoint if debug mode is enabled
         if debug:
@@ -52,6 +57,12 @@ class GA4MeasurementProtocol:
         else:
             self.endpoint = self.ENDPOINT
 
+    async def _post(self, url: str, payload: Dict) -> httpx.Response:
+        """POST a payload, raising on HTTP errors"""
+        response = await self.http_client.post(url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
     async def send_event(
         self,
         client_id: str,
@@ -91,12 +102,10 @@ class GA4MeasurementProtocol:
             payload["user_properties"] = user_properties
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
+            await self._post(url, payload)
 
-                logger.info(f"GA4 event sent successfully: {event_name}, client_id: {client_id[:8]}..., params: {event_params}")
-                return True
+            logger.info(f"GA4 event sent successfully: {event_name}, client_id: {client_id[:8]}..., params: {event_params}")
+            return True
 
         except httpx.HTTPStatusError as e:
             logger.error(f"GA4 HTTP error sending event '{event_name}': status={e.response.status_code}, response={e.response.text}")
@@ -149,13 +158,11 @@ class GA4MeasurementProtocol:
             payload["user_properties"] = user_properties
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
+            await self._post(url, payload)
 
-                event_names = [e.get("name", "unknown") for e in events]
-                logger.info(f"GA4 batch events sent successfully: {len(events)} events ({', '.join(event_names)}), client_id: {client_id[:8]}...")
-                return True
+            event_names = [e.get("name", "unknown") for e in events]
+            logger.info(f"GA4 batch events sent successfully: {len(events)} events ({', '.join(event_names)}), client_id: {client_id[:8]}...")
+            return True
 
         except httpx.HTTPStatusError as e:
             logger.error(f"GA4 HTTP error sending batch events: status={e.response.status_code}, response={e.response.text}")
@@ -191,10 +198,8 @@ class GA4MeasurementProtocol:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                return response.json()
+            response = await self._post(url, payload)
+            return response.json()
 
         except Exception as e:
             logger.error(f"GA4 validation error: {str(e)}")
@@ -9,6 +9,9 @@ from typing import Dict, List, Optional
 
 import httpx
 
+from app.core.http_clients import get_http_clients
+from app.integrations.token_manager import AccessToken, get_token_manager
+
 # Import retry policy
 try:
     from .retry_policy import with_retry
@@ -36,7 +39,13 @@ class TeamsClient:
     このプロトタイプでは基本構造のみを定義
     """
 
-    def __init__(self, tenant_id: str, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        tenant_id: str,
+        client_id: str,
+        client_secret: str,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Teams Client初期化
 
@@ -44,11 +53,13 @@ class TeamsClient:
             tenant_id: Azure AD Tenant ID
             client_id: Application (client) ID
             client_secret: Client Secret Value
+            http_client: HTTPクライアント（省略時は共有コネクションプール）
         """
         self.tenant_id = tenant_id
         self.client_id = client_id
         self.client_secret = client_secret
         self._access_token: Optional[str] = None
+        self.http_client = http_client or get_http_clients().async_client("microsoft_graph")
 
         # 本実装では以下を追加:
         # from msal import ConfidentialClientApplication
@@ -58,13 +69,32 @@ class TeamsClient:
         #     authority=f"https://login.microsoftonline.com/{tenant_id}"
         # )
 
+    @property
+    def token_key(self) -> str:
+        """トークンキャッシュのキー"""
+        return f"teams:{self.tenant_id}:{self.client_id}"
+
     async def authenticate(self) -> str:
         """
         Azure ADで認証してアクセストークンを取得
 
+        トークンは有効期限（expires_in）までキャッシュされ、期限前に
+        バックグラウンドで更新される
+
         Returns:
             Access token
         """
+        token = await get_token_manager().get_token(self.token_key, self._fetch_token)
+        self._access_token = token.access_token
+        return self._access_token
+
+    async def _fetch_token(self) -> AccessToken:
+        """
+        トークンエンドポイントから新しいアクセストークンを取得
+
+        Returns:
+            Access token with expiry
+        """
         # OAuth 2.0 Client Credentials Flow
         token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
 
@@ -76,13 +106,11 @@ class TeamsClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(token_url, data=data)
-                response.raise_for_status()
-                result = response.json()
-                self._access_token = result["access_token"]
-                print(f"✅ Authentication successful for tenant: {self.tenant_id}")
-                return self._access_token
+            response = await self.http_client.post(token_url, data=data)
+            response.raise_for_status()
+            result = response.json()
+            print(f"✅ Authentication successful for tenant: {self.tenant_id}")
+            return AccessToken.from_response(result)
         except httpx.HTTPStatusError as e:
             print(f"❌ Authentication failed: {e.response.status_code}")
             print(f"Response: {e.response.text}")
@@ -104,8 +132,7 @@ class TeamsClient:
         Returns:
             送信結果
         """
-        if not self._access_token:
-            await self.authenticate()
+        await self.authenticate()
 
         # Microsoft Graph API endpoint for posting messages to a channel
         graph_url = f"https://graph.microsoft.com/v1.0/teams/{team_id}/channels/{channel_id}/messages"
@@ -131,17 +158,16 @@ class TeamsClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(graph_url, headers=headers, json=message)
-                response.raise_for_status()
-                result = response.json()
-                print(f"✅ Adaptive Card sent successfully to channel {channel_id}")
-                return {
-                    "id": result.get("id"),
-                    "created_at": result.get("createdDateTime"),
-                    "web_url": result.get("webUrl"),
-                    "status": "sent",
-                }
+            response = await self.http_client.post(graph_url, headers=headers, json=message)
+            response.raise_for_status()
+            result = response.json()
+            print(f"✅ Adaptive Card sent successfully to channel {channel_id}")
+            return {
+                "id": result.get("id"),
+                "created_at": result.get("createdDateTime"),
+                "web_url": result.get("webUrl"),
+                "status": "sent",
+            }
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 403:
                 print("❌ Permission denied: ChannelMessage.Send permission required")
@@ -271,8 +297,7 @@ class TeamsClient:
         Returns:
             チームリスト
         """
-        if not self._access_token:
-            await self.authenticate()
+        await self.authenticate()
 
         graph_url = "https://graph.microsoft.com/v1.0/groups?$filter=resourceProvisioningOptions/Any(x:x eq 'Team')"
         headers = {
@@ -281,13 +306,12 @@ class TeamsClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(graph_url, headers=headers)
-                response.raise_for_status()
-                result = response.json()
-                teams = result.get("value", [])
-                print(f"✅ Found {len(teams)} teams")
-                return teams
+            response = await self.http_client.get(graph_url, headers=headers)
+            response.raise_for_status()
+            result = response.json()
+            teams = result.get("value", [])
+            print(f"✅ Found {len(teams)} teams")
+            return teams
         except httpx.HTTPStatusError as e:
             print(f"❌ Failed to get teams: {e.response.status_code}")
             print(f"Response: {e.response.text}")
@@ -307,8 +331,7 @@ class TeamsClient:
         Returns:
             チャネルリスト
         """
-        if not self._access_token:
-            await self.authenticate()
+        await self.authenticate()
 
         graph_url = f"https://graph.microsoft.com/v1.0/teams/{team_id}/channels"
         headers = {
@@ -317,13 +340,12 @@ class TeamsClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(graph_url, headers=headers)
-                response.raise_for_status()
-                result = response.json()
-                channels = result.get("value", [])
-                print(f"✅ Found {len(channels)} channels in team {team_id}")
-                return channels
+            response = await self.http_client.get(graph_url, headers=headers)
+            response.raise_for_status()
+            result = response.json()
+            channels = result.get("value", [])
+            print(f"✅ Found {len(channels)} channels in team {team_id}")
+            return channels
         except httpx.HTTPStatusError as e:
             print(f"❌ Failed to get channels: {e.response.status_code}")
             print(f"Response: {e.response.text}")
@@ -8,6 +8,8 @@ from typing import Dict, Optional
 
 import httpx
 
+from app.core.http_clients import get_http_clients
+
 
 class TeamsWebhookClient:
     """
@@ -24,19 +26,22 @@ class TeamsWebhookClient:
     - @メンションは制限あり
     """
 
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, http_client: Optional[httpx.AsyncClient] = None):
         """
         Teams Webhook Client初期化
 
         Args:
             webhook_url: Teams Incoming Webhook URL
                         (例: https://your-tenant.webhook.office.com/webhookb2/...)
+            http_client: HTTPクライアント（省略時は共有コネクションプール）
         """
         self.webhook_url = webhook_url
 
         if not webhook_url or not webhook_url.startswith("https://"):
             raise ValueError("Valid webhook URL is required")
 
+        self.http_client = http_client or get_http_clients().async_client("teams_webhook")
+
     async def send_adaptive_card(self, card: Dict) -> Dict:
         """
         Adaptive Cardを送信
@@ -60,16 +65,15 @@ class TeamsWebhookClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(self.webhook_url, json=message)
-                response.raise_for_status()
-
-                print("✅ Adaptive Card sent successfully via Webhook")
-                return {
-                    "status": "sent",
-                    "sent_at": datetime.now().isoformat(),
-                    "method": "webhook",
-                }
+            response = await self.http_client.post(self.webhook_url, json=message)
+            response.raise_for_status()
+
+            print("✅ Adaptive Card sent successfully via Webhook")
+            return {
+                "status": "sent",
+                "sent_at": datetime.now().isoformat(),
+                "method": "webhook",
+            }
 
         except httpx.HTTPStatusError as e:
             print(f"❌ Failed to send message: {e.response.status_code}")
@@ -107,16 +111,15 @@ class TeamsWebhookClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(self.webhook_url, json=message)
-                response.raise_for_status()
-
-                print("✅ Message sent successfully via Webhook")
-                return {
-                    "status": "sent",
-                    "sent_at": datetime.now().isoformat(),
-                    "method": "webhook",
-                }
+            response = await self.http_client.post(self.webhook_url, json=message)
+            response.raise_for_status()
+
+            print("✅ Message sent successfully via Webhook")
+            return {
+                "status": "sent",
+                "sent_at": datetime.now().isoformat(),
+                "method": "webhook",
+            }
 
         except Exception as e:
             print(f"❌ Error sending message: {str(e)}")
@@ -0,0 +1,186 @@
+"""
+OAuth Token Manager
+
+Caches OAuth access tokens per integration until shortly before they expire.
+Tokens entering the refresh margin are still served while a refresh runs in
+the background; expired or missing tokens are fetched inline. Concurrent
+refreshes of the same token are single-flighted.
+
+With the Redis cache backend, tokens are shared across workers (encrypted
+with ENCRYPTION_KEY), so a token fetched by one worker is reused by all.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from app.core.cache import CacheBackend, get_cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AccessToken:
+    """OAuth access token with its absolute expiry (Unix time)"""
+
+    access_token: str
+    expires_at: float
+    extra: Dict[str, Any] = field(default_factory=dict)  # e.g. Salesforce instance_url
+
+    @classmethod
+    def from_response(cls, payload: Dict[str, Any], default_expires_in: int = 3600) -> "AccessToken":
+        """Build from an OAuth token endpoint response"""
+        expires_in = int(payload.get("expires_in") or default_expires_in)
+        extra = {key: payload[key] for key in ("instance_url", "token_type", "scope") if payload.get(key)}
+        return cls(access_token=payload["access_token"], expires_at=time.time() + expires_in, extra=extra)
+
+    def expires_in(self) -> float:
+        """Seconds until expiry (negative once expired)"""
+        return self.expires_at - time.time()
+
+    def to_bytes(self) -> bytes:
+        return json.dumps({"access_token": self.access_token, "expires_at": self.expires_at, "extra": self.extra}).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> "AccessToken":
+        data = json.loads(value)
+        return cls(access_token=data["access_token"], expires_at=data["expires_at"], extra=data.get("extra") or {})
+
+
+# Fetches a new token from the OAuth token endpoint
+TokenFetcher = Callable[[], Awaitable[AccessToken]]
+
+
+class TokenManager:
+    """Per-integration access token cache with refresh-ahead"""
+
+    def __init__(
+        self,
+        shared_cache: Optional[CacheBackend] = None,
+        cipher: Optional[Fernet] = None,
+        refresh_margin: int = 300,
+        key_prefix: str = "oauth_token:",
+    ):
+        """Initialize the token manager
+
+        Args:
+            shared_cache: Cache shared across workers (None for process-local only)
+            cipher: Encrypts tokens stored in the shared cache
+            refresh_margin: Seconds before expiry at which tokens are refreshed
+            key_prefix: Shared cache key prefix
+        """
+        self.shared_cache = shared_cache
+        self.cipher = cipher
+        self.refresh_margin = refresh_margin
+        self.key_prefix = key_prefix
+        self._tokens: Dict[str, AccessToken] = {}
+        self._inflight: Dict[str, "asyncio.Task[AccessToken]"] = {}
+
+    async def get_token(self, key: str, fetch: TokenFetcher, seed: Optional[AccessToken] = None) -> AccessToken:
+        """Get a valid access token, fetching or refreshing it as needed
+
+        Args:
+            key: Integration key (e.g. "teams:<tenant>:<client>")
+            fetch: Fetches a new token from the token endpoint
+            seed: Known token (e.g. stored in the database) to use if nothing is cached
+
+        Returns:
+            Access token that is not expired
+
+        Raises:
+            Whatever `fetch` raises if no valid token is available
+        """
+        token = self._tokens.get(key)
+        if token is None or token.expires_in() <= self.refresh_margin:
+            # Another worker may have refreshed it already
+            shared = self._load_shared(key)
+            if shared is not None and (token is None or shared.expires_at > token.expires_at):
+                token = self._tokens[key] = shared
+
+        if token is None and seed is not None and seed.expires_in() > 0:
+            token = seed
+            self._store(key, seed)
+
+        if token is not None:
+            remaining = token.expires_in()
+            if remaining > self.refresh_margin:
+                return token
+            if remaining > 0:
+                self._refresh_in_background(key, fetch)
+                return token
+
+        return await asyncio.shield(self._refresh(key, fetch))
+
+    def invalidate(self, key: str) -> None:
+        """Forget a token (e.g. after the API rejected it)"""
+        self._tokens.pop(key, None)
+        if self.shared_cache is not None:
+            self.shared_cache.delete(self.key_prefix + key)
+
+    def _refresh(self, key: str, fetch: TokenFetcher) -> "asyncio.Task[AccessToken]":
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._fetch_and_store(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight.pop(key) if self._inflight.get(key) is done else None)
+        return task
+
+    def _refresh_in_background(self, key: str, fetch: TokenFetcher) -> None:
+        def log_failure(task: "asyncio.Task[AccessToken]") -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(f"Background refresh of OAuth token {key} failed: {task.exception()}")
+
+        self._refresh(key, fetch).add_done_callback(log_failure)
+
+    async def _fetch_and_store(self, key: str, fetch: TokenFetcher) -> AccessToken:
+        token = await fetch()
+        self._store(key, token)
+        return token
+
+    def _store(self, key: str, token: AccessToken) -> None:
+        self._tokens[key] = token
+        ttl = int(token.expires_in())
+        if self.shared_cache is not None and ttl > 0:
+            value = token.to_bytes()
+            if self.cipher is not None:
+                value = self.cipher.encrypt(value)
+            self.shared_cache.set(self.key_prefix + key, value, ttl)
+
+    def _load_shared(self, key: str) -> Optional[AccessToken]:
+        if self.shared_cache is None:
+            return None
+
+        value = self.shared_cache.get(self.key_prefix + key)
+        if value is None:
+            return None
+        try:
+            if self.cipher is not None:
+                value = self.cipher.decrypt(value)
+            return AccessToken.from_bytes(value)
+        except (InvalidToken, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable shared OAuth token {key}: {e}")
+            return None
+
+
+_token_manager: Optional[TokenManager] = None
+
+
+def get_token_manager() -> TokenManager:
+    """Get the process-wide token manager (shared across workers with the Redis cache)"""
+    global _token_manager
+    if _token_manager is None:
+        if settings.CACHE_BACKEND == "redis":
+            _token_manager = TokenManager(
+                shared_cache=get_cache(),
+                cipher=Fernet(settings.ENCRYPTION_KEY.encode()),
+                refresh_margin=settings.OAUTH_TOKEN_REFRESH_MARGIN,
+            )
+        else:
+            _token_manager = TokenManager(refresh_margin=settings.OAUTH_TOKEN_REFRESH_MARGIN)
+    return _token_manager
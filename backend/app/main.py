@@ -4,8 +4,10 @@ DiagnoLeads FastAPI Application
 Multi-tenant B2B assessment platform with AI capabilities.
 """
 
+import asyncio
 import logging
 import traceback
+from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI, Request, status
@@ -15,16 +17,61 @@ from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.v1 import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
 from app.core.database import SessionLocal
+from app.core.http_clients import close_http_clients, get_http_clients
 from app.core.middleware import TenantMiddleware
+from app.core.responses import ORJSONResponse
 from app.models.error_log import ErrorSeverity, ErrorType
+from app.services.answer_buffer import flush_idle_buffers, run_answer_buffer_sweeper
+from app.services.assessment_rescore_service import AssessmentRescoreService
+from app.services.crm_sync_worker import run_crm_sync_worker
 from app.services.error_log_service import ErrorLogService
+from app.services.job_runner import run_job_recovery
+from app.services.lead_bulk_update_service import LeadBulkUpdateService
+from app.services.lead_import_service import LeadImportService
+from app.services.lead_tombstone_purger import run_tombstone_purger
+from app.services.outbox_worker import run_outbox_worker
+from app.services.tenant_counter_service import run_counter_reconciler
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background workers and flush write-behind buffers on shutdown"""
+    stop_event = asyncio.Event()
+    workers = [asyncio.create_task(run_answer_buffer_sweeper(stop_event))]
+    if settings.OUTBOX_WORKER_ENABLED:
+        workers.append(asyncio.create_task(run_outbox_worker(stop_event)))
+    if settings.CRM_SYNC_WORKER_ENABLED:
+        workers.append(asyncio.create_task(run_crm_sync_worker(stop_event)))
+    if settings.TENANT_COUNTER_RECONCILER_ENABLED:
+        workers.append(asyncio.create_task(run_counter_reconciler(stop_event)))
+    if settings.LEAD_TOMBSTONE_PURGER_ENABLED:
+        workers.append(asyncio.create_task(run_tombstone_purger(stop_event)))
+    if settings.JOB_RECOVERY_ENABLED:
+        workers.append(asyncio.create_task(run_job_recovery(stop_event, (LeadImportService, LeadBulkUpdateService, AssessmentRescoreService))))
+
+    yield
+
+    stop_event.set()
+    await asyncio.gather(*workers)
+
+    # Persist all buffered widget answers before the process exits
+    try:
+        flush_idle_buffers(idle_timeout=0)
+    except Exception as e:
+        logger.error(f"Failed to flush answer buffers on shutdown: {e}")
+
+    await close_http_clients()
+
+
 # Create FastAPI application
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title=settings.PROJECT_NAME,
     version="0.1.0",
     description="Multi-tenant B2B assessment platform with AI",
@@ -41,6 +88,15 @@ app = FastAPI(
 # NOTE: This must be added AFTER CORS middleware so CORS headers are set first
 app.add_middleware(TenantMiddleware)
 
+# Response compression (negotiated brotli / gzip of JSON, text and CSV bodies)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 # CORS Middleware - MUST be added last so it wraps everything
 app.add_middleware(
     CORSMiddleware,
@@ -48,6 +104,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Rescore-Job-Id"],
 )
 
 # Include API router
@@ -66,6 +123,12 @@ async def health_check():
     )
 
 
+@app.get("/health/http-clients", tags=["Health"])
+async def http_client_stats():
+    """Connection pool statistics of outbound integration clients"""
+    return JSONResponse(content=get_http_clients().stats())
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint"""
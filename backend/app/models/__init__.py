@@ -3,37 +3,56 @@
 from app.models.ai_usage import AIUsageLog
 from app.models.answer import Answer
 from app.models.assessment import Assessment
+from app.models.assessment_rescore_job import AssessmentRescoreJob
 from app.models.audit_log import AuditLog
+from app.models.crm_integration import CRMIntegration, CRMSyncLog, CRMSyncQueueItem, CRMSyncState
 from app.models.error_log import ErrorLog
 from app.models.google_analytics_integration import GoogleAnalyticsIntegration
 from app.models.industry import Industry
 from app.models.lead import Lead
+from app.models.lead_bulk_update_job import LeadBulkUpdateJob
+from app.models.lead_import_job import LeadImportJob
+from app.models.lead_tombstone import LeadTombstone
+from app.models.outbox_event import OutboxEvent
 from app.models.qr_code import QRCode
 from app.models.qr_code_scan import QRCodeScan
+from app.models.qr_scan_daily import QRScanDaily
 from app.models.question import Question
 from app.models.question_option import QuestionOption
 from app.models.report import Report
 from app.models.response import Response
 from app.models.tenant import Tenant
+from app.models.tenant_counter import TenantCounter
 from app.models.topic import Topic
 from app.models.user import User
 
 __all__ = [
     "Tenant",
+    "TenantCounter",
     "User",
     "Assessment",
+    "AssessmentRescoreJob",
     "Question",
     "QuestionOption",
     "Response",
     "Answer",
     "Lead",
+    "LeadBulkUpdateJob",
+    "LeadImportJob",
+    "LeadTombstone",
+    "OutboxEvent",
     "Report",
     "AIUsageLog",
     "ErrorLog",
     "Topic",
     "Industry",
     "GoogleAnalyticsIntegration",
+    "CRMIntegration",
+    "CRMSyncLog",
+    "CRMSyncState",
+    "CRMSyncQueueItem",
     "AuditLog",
     "QRCode",
     "QRCodeScan",
+    "QRScanDaily",
 ]
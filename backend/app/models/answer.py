@@ -6,7 +6,7 @@ Represents individual question answers within a response session.
 
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -44,9 +44,10 @@ class Answer(Base):
 
     # Indexes for performance
     __table_args__ = (
+        # One answer per question per response (target of the answer upsert)
+        UniqueConstraint("response_id", "question_id", name="uq_answers_response_question"),
         Index("idx_answers_response_id", "response_id"),
         Index("idx_answers_question_id", "question_id"),
-        Index("idx_answers_response_question", "response_id", "question_id"),
     )
 
     def __repr__(self):
@@ -60,6 +60,7 @@ class Assessment(Base):
     __table_args__ = (
         Index("idx_assessments_tenant_status", "tenant_id", "status"),
         Index("idx_assessments_created_by", "created_by"),
+        Index("idx_assessments_tenant_created_at_id", "tenant_id", "created_at", "id"),  # List pages
     )
 
     def __repr__(self):
@@ -0,0 +1,52 @@
+"""
+Assessment Rescore Job Model
+
+Recomputes the scores of an assessment's completed responses (and of the
+leads created from them) after its scoring logic changed. Responses are
+rescored in chunks; the job records progress.
+"""
+
+import uuid
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class AssessmentRescoreStatus:
+    """Assessment rescore job status values"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"  # Aborted; chunks rescored before the failure are kept
+
+
+class AssessmentRescoreJob(Base):
+    """Assessment rescore job"""
+
+    __tablename__ = "assessment_rescore_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    assessment_id = Column(UUID(as_uuid=True), ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+
+    status = Column(String(20), nullable=False, default=AssessmentRescoreStatus.PENDING)
+    total_responses = Column(Integer, nullable=False, default=0)  # Completed responses when the job was created
+    processed_responses = Column(Integer, nullable=False, default=0)
+    updated_responses = Column(Integer, nullable=False, default=0)  # Responses whose total score changed
+    updated_leads = Column(Integer, nullable=False, default=0)
+    error_message = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)  # Last progress
+
+    __table_args__ = (Index("idx_assessment_rescore_jobs_tenant_created_at", "tenant_id", "created_at"),)
+
+    def __repr__(self):
+        return f"<AssessmentRescoreJob(id={self.id}, assessment_id={self.assessment_id}, status={self.status})>"
@@ -7,7 +7,7 @@ Records all changes to master data for audit trail and compliance.
 import enum
 import uuid
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -30,6 +30,7 @@ class AuditLogEntity(str, enum.Enum):
     USER = "USER"
     TOPIC = "TOPIC"
     INDUSTRY = "INDUSTRY"
+    LEAD = "LEAD"
 
 
 class AuditLog(Base):
@@ -42,7 +43,7 @@ class AuditLog(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     # What changed
-    entity_type = Column(String(50), nullable=False)  # TENANT, USER, TOPIC, INDUSTRY
+    entity_type = Column(String(50), nullable=False)  # TENANT, USER, TOPIC, INDUSTRY, LEAD
     entity_id = Column(UUID(as_uuid=True), nullable=False)
     action = Column(String(20), nullable=False)  # CREATE, UPDATE, DELETE
 
@@ -62,5 +63,7 @@ class AuditLog(Base):
     tenant = relationship("Tenant")
     user = relationship("User")
 
+    __table_args__ = (Index("idx_audit_logs_tenant_created_at_id", "tenant_id", "created_at", "id"),)  # List pages
+
     def __repr__(self):
         return f"<AuditLog(id={self.id}, entity_type={self.entity_type}, action={self.action})>"
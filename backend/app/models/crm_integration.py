@@ -8,12 +8,12 @@ import uuid
 from datetime import datetime, timezone
 
 from cryptography.fernet import Fernet
-from sqlalchemy import JSON, Boolean, Column, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import JSON, Boolean, Column, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 from sqlalchemy.orm import relationship
 
 from app.core.config import settings
-from app.models.base import Base
+from app.core.database import Base
 
 
 class CRMIntegration(Base):
@@ -45,8 +45,8 @@ class CRMIntegration(Base):
 
     # Sync Status
     last_sync_at = Column(TIMESTAMP(timezone=True), nullable=True)
-    total_synced = Column(String(50), default="0")  # Total records synced
-    failed_syncs = Column(String(50), default="0")  # Failed sync count
+    total_synced = Column(Integer, nullable=False, default=0)  # Total records synced (increment in SQL)
+    failed_syncs = Column(Integer, nullable=False, default=0)  # Failed sync count (increment in SQL)
 
     # Timestamps
     created_at = Column(TIMESTAMP(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
@@ -174,3 +174,44 @@ class CRMSyncLog(Base):
     # Relationships
     integration = relationship("CRMIntegration", back_populates="sync_logs")
     lead = relationship("Lead")
+
+    __table_args__ = (Index("idx_crm_sync_logs_integration_created_at_id", "integration_id", "created_at", "id"),)  # List pages
+
+
+class CRMSyncState(Base):
+    """
+    Last synced state of a lead in the CRM.
+
+    Stores the CRM record ID and a hash per synced field, so unchanged leads
+    are skipped and updates only send the fields that changed.
+    """
+
+    __tablename__ = "crm_sync_states"
+
+    integration_id = Column(UUID(as_uuid=True), ForeignKey("crm_integrations.id", ondelete="CASCADE"), primary_key=True)
+    lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id", ondelete="CASCADE"), primary_key=True)
+
+    crm_record_id = Column(String(255), nullable=False)
+    field_hashes = Column(JSON, nullable=False, default=dict)  # {field: hash of the last synced value}
+
+    synced_at = Column(TIMESTAMP(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+
+class CRMSyncQueueItem(Base):
+    """
+    Lead waiting to be synchronized to CRM.
+
+    One row per (integration, lead): repeated changes to a lead before it is
+    synced coalesce into a single sync. Rows stay queued while a worker
+    syncs them (until `claimed_until`) and are removed once the sync succeeds.
+    """
+
+    __tablename__ = "crm_sync_queue"
+
+    integration_id = Column(UUID(as_uuid=True), ForeignKey("crm_integrations.id", ondelete="CASCADE"), primary_key=True)
+    lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id", ondelete="CASCADE"), primary_key=True)
+
+    enqueued_at = Column(TIMESTAMP(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    claimed_until = Column(TIMESTAMP(timezone=True), nullable=True)  # Lease of the worker syncing the lead
+
+    __table_args__ = (Index("idx_crm_sync_queue_enqueued_at", "enqueued_at"),)
@@ -7,7 +7,7 @@ Records all application errors, API failures, and exceptions for debugging and m
 import enum
 import uuid
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -101,5 +101,7 @@ class ErrorLog(Base):
     tenant = relationship("Tenant")
     user = relationship("User")
 
+    __table_args__ = (Index("idx_error_logs_tenant_created_at_id", "tenant_id", "created_at", "id"),)  # List pages
+
     def __repr__(self):
         return f"<ErrorLog(id={self.id}, type={self.error_type}, message={self.error_message[:50]})>"
@@ -17,12 +17,15 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
 
+# Filterable JSON document: JSONB on PostgreSQL, plain JSON elsewhere (SQLite tests)
+JSONDocument = JSONB().with_variant(JSON(), "sqlite")
+
 
 class Lead(Base):
     """Lead model with tenant association and scoring"""
@@ -54,8 +57,8 @@ class Lead(Base):
 
     # Additional Info
     notes = Column(Text, nullable=True)
-    tags = Column(JSON, default=list, nullable=False)
-    custom_fields = Column(JSON, default=dict, nullable=False)
+    tags = Column(JSONDocument, default=list, nullable=False)
+    custom_fields = Column(JSONDocument, default=dict, nullable=False)
 
     # Metadata
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -75,10 +78,17 @@ class Lead(Base):
     qr_code_scans = relationship("QRCodeScan", back_populates="lead")
 
     # Indexes for performance
+    # (the pg_trgm search index idx_leads_search_trgm is created by migration only, as it needs the extension)
     __table_args__ = (
         Index("idx_leads_tenant_status", "tenant_id", "status"),
         Index("idx_leads_tenant_score", "tenant_id", "score"),
         Index("idx_leads_assigned_to", "assigned_to"),
+        Index("idx_leads_tenant_updated_at_id", "tenant_id", "updated_at", "id"),  # Change feed
+        Index("idx_leads_tenant_score_created_at_id", "tenant_id", "score", "created_at", "id"),  # List pages
+        Index("idx_leads_response_id", "response_id"),  # Rescoring
+        # Tag / custom field filters (containment)
+        Index("idx_leads_tags", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+        Index("idx_leads_custom_fields", "custom_fields", postgresql_using="gin", postgresql_ops={"custom_fields": "jsonb_path_ops"}),
         UniqueConstraint("tenant_id", "email", name="uq_leads_tenant_email"),
     )
 
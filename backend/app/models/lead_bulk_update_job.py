@@ -0,0 +1,53 @@
+"""
+Lead Bulk Update Job Model
+
+Status, score or assignment change applied to a set of leads (an ID list
+or a filter). The set is updated in chunks; the job records progress.
+"""
+
+import uuid
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class LeadBulkUpdateStatus:
+    """Lead bulk update job status values"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"  # Aborted; chunks updated before the failure are kept
+
+
+class LeadBulkUpdateJob(Base):
+    """Bulk lead update job"""
+
+    __tablename__ = "lead_bulk_update_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+
+    # {"lead_ids": [...]} or {"filter": {...}}, and the fields to set
+    selection = Column(JSON, nullable=False)
+    changes = Column(JSON, nullable=False)
+    reason = Column(String(255), nullable=True)  # Recorded in the audit log
+
+    status = Column(String(20), nullable=False, default=LeadBulkUpdateStatus.PENDING)
+    total_rows = Column(Integer, nullable=False, default=0)  # Leads matched when the job was created
+    updated_rows = Column(Integer, nullable=False, default=0)
+    error_message = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)  # Last progress
+
+    __table_args__ = (Index("idx_lead_bulk_update_jobs_tenant_created_at", "tenant_id", "created_at"),)
+
+    def __repr__(self):
+        return f"<LeadBulkUpdateJob(id={self.id}, tenant_id={self.tenant_id}, status={self.status}, updated_rows={self.updated_rows})>"
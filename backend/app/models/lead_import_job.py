@@ -0,0 +1,56 @@
+"""
+Lead Import Job Model
+
+Bulk lead import (CSV / NDJSON). The upload is processed in chunks in the
+background; the job records progress, row counts and row errors.
+"""
+
+import uuid
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class LeadImportStatus:
+    """Lead import job status values"""
+
+    PENDING = "pending"  # Uploaded, waiting to be processed
+    RUNNING = "running"
+    COMPLETED = "completed"  # All rows processed (some may have failed validation)
+    FAILED = "failed"  # Aborted; chunks merged before the failure are kept
+
+
+class LeadImportJob(Base):
+    """Bulk lead import job"""
+
+    __tablename__ = "lead_import_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+
+    format = Column(String(10), nullable=False)  # csv, ndjson
+    on_conflict = Column(String(10), nullable=False, default="skip")  # skip or update existing leads (same email)
+    status = Column(String(20), nullable=False, default=LeadImportStatus.PENDING)
+
+    # Progress
+    processed_rows = Column(Integer, nullable=False, default=0)
+    inserted_rows = Column(Integer, nullable=False, default=0)
+    updated_rows = Column(Integer, nullable=False, default=0)
+    skipped_rows = Column(Integer, nullable=False, default=0)  # Existing leads / duplicates in the file
+    failed_rows = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON, nullable=False, default=list)  # [{"row": n, "error": "..."}], first LEAD_IMPORT_MAX_ERRORS
+    error_message = Column(Text, nullable=True)  # Why a failed job was aborted
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)  # Last progress
+
+    __table_args__ = (Index("idx_lead_import_jobs_tenant_created_at", "tenant_id", "created_at"),)
+
+    def __repr__(self):
+        return f"<LeadImportJob(id={self.id}, tenant_id={self.tenant_id}, status={self.status}, processed_rows={self.processed_rows})>"
@@ -0,0 +1,29 @@
+"""
+Lead Tombstone Model
+
+Leads are physically deleted (GDPR). A tombstone keeps only the ID and
+deletion time of a deleted lead, so the lead change feed can report
+deletions to incremental consumers.
+"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class LeadTombstone(Base):
+    """Deleted lead marker for the change feed"""
+
+    __tablename__ = "lead_tombstones"
+
+    lead_id = Column(UUID(as_uuid=True), primary_key=True)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Change feed reads: tenant_id = ? AND (deleted_at, lead_id) > cursor ORDER BY deleted_at, lead_id
+    __table_args__ = (Index("idx_lead_tombstones_tenant_deleted_at", "tenant_id", "deleted_at", "lead_id"),)
+
+    def __repr__(self):
+        return f"<LeadTombstone(lead_id={self.lead_id}, tenant_id={self.tenant_id}, deleted_at={self.deleted_at})>"
@@ -0,0 +1,57 @@
+"""
+Outbox Event Model
+
+Transactional outbox for side effects of business changes (GA4 events,
+Teams notifications). Rows are written in the same transaction as the
+change and delivered asynchronously by the outbox worker.
+"""
+
+import uuid
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class OutboxEventType:
+    """Outbox event types (each has a handler in the outbox worker)"""
+
+    GA4_EVENT = "ga4.event"  # GA4 Measurement Protocol event
+    TEAMS_HOT_LEAD = "teams.hot_lead"  # Teams hot lead notification
+    TEAMS_HOT_LEADS_SUMMARY = "teams.hot_leads_summary"  # One Teams message for leads that became hot in bulk
+
+
+class OutboxEventStatus:
+    """Outbox event status values"""
+
+    PENDING = "pending"  # Waiting for (re)delivery
+    DEAD = "dead"  # Gave up after max attempts (dead letter)
+
+
+class OutboxEvent(Base):
+    """Pending side effect to be delivered by the outbox worker"""
+
+    __tablename__ = "outbox_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+
+    # Delivery target and data
+    event_type = Column(String(100), nullable=False)  # OutboxEventType
+    payload = Column(JSON, default=dict, nullable=False)
+
+    # Delivery state. next_attempt_at doubles as the lease of a claimed event:
+    # a worker that dies mid-delivery leaves it to be retried once it passes.
+    status = Column(String(20), default=OutboxEventStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (Index("idx_outbox_events_status_next_attempt", "status", "next_attempt_at"),)
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, event_type={self.event_type}, status={self.status}, attempts={self.attempts})>"
@@ -110,6 +110,7 @@ class QRCode(Base):
         Index("idx_qr_codes_tenant_id", "tenant_id"),
         Index("idx_qr_codes_assessment_id", "assessment_id"),
         Index("idx_qr_codes_enabled", "enabled"),
+        Index("idx_qr_codes_tenant_created_at_id", "tenant_id", "created_at", "id"),  # List pages
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,56 @@
+"""QRScanDaily model for pre-aggregated QR code scan analytics."""
+
+from __future__ import annotations
+
+from datetime import date
+from uuid import uuid4
+
+from sqlalchemy import Date, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class QRScanDaily(Base):
+    """Daily QR code scan rollup.
+
+    One row per (qr_code_id, day, device_type, country) bucket holding the
+    scan count and funnel counters. Maintained incrementally by the redirect
+    and scan tracking endpoints so analytics never scan raw `qr_code_scans`.
+    """
+
+    __tablename__ = "qr_scan_daily"
+
+    # Primary Key
+    id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    # Bucket dimensions
+    qr_code_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("qr_codes.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False, comment="Scan date (UTC)")
+    device_type: Mapped[str] = mapped_column(String(50), nullable=False, default="unknown", comment="Device type: mobile, tablet, desktop")
+    country: Mapped[str] = mapped_column(
+        String(2),
+        nullable=False,
+        default="",
+        comment="ISO 3166-1 alpha-2 country code ('' when unknown)",
+    )
+
+    # Counters
+    scans: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="Number of scans")
+    started: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="Scans that started the assessment")
+    completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="Scans that completed the assessment")
+    leads: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="Scans that became a lead")
+
+    # Table indexes
+    __table_args__ = (
+        UniqueConstraint("qr_code_id", "day", "device_type", "country", name="uq_qr_scan_daily_bucket"),
+        Index("idx_qr_scan_daily_qr_code_day", "qr_code_id", "day"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<QRScanDaily(qr_code_id={self.qr_code_id}, day={self.day}, device={self.device_type}, scans={self.scans})>"
@@ -63,6 +63,7 @@ class Response(Base):
         Index("idx_responses_session_id", "session_id"),
         Index("idx_responses_assessment_id", "assessment_id"),
         Index("idx_responses_status", "status"),
+        Index("idx_responses_assessment_status_id", "assessment_id", "status", "id"),  # Rescoring chunks
     )
 
     def __repr__(self):
@@ -45,6 +45,12 @@ class Tenant(Base):
         cascade="all, delete-orphan",
     )
     ai_usage_logs = relationship("AIUsageLog", back_populates="tenant", cascade="all, delete-orphan")
+    crm_integration = relationship(
+        "CRMIntegration",
+        back_populates="tenant",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
 
     def __repr__(self):
         return f"<Tenant(id={self.id}, name={self.name}, plan={self.plan})>"
@@ -0,0 +1,27 @@
+"""
+Tenant Counter Model
+
+Per-tenant counts of leads (total, by status, by temperature) and
+assessments (total, by status), one row per counter. Rows are adjusted by
+delta upserts in the transaction of each mutation, so count lookups read one
+row instead of scanning the tenant's rows; TenantCounterService.reconcile
+repairs drift.
+"""
+
+from sqlalchemy import BigInteger, Column, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class TenantCounter(Base):
+    """One counter of a tenant (e.g. "leads.status.new")"""
+
+    __tablename__ = "tenant_counters"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), primary_key=True)
+    counter = Column(String(64), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<TenantCounter(tenant_id={self.tenant_id}, counter={self.counter}, value={self.value})>"
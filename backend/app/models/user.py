@@ -50,6 +50,7 @@ class User(Base):
     __table_args__ = (
         Index("idx_users_tenant_email", "tenant_id", "email"),
         Index("idx_users_password_reset_token", "password_reset_token"),
+        Index("idx_users_tenant_created_at_id", "tenant_id", "created_at", "id"),  # List pages
     )
 
     def __repr__(self):
@@ -5,10 +5,10 @@ Pydantic models for Assessment API request/response validation.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class AssessmentBase(BaseModel):
@@ -52,3 +52,26 @@ class AssessmentResponse(AssessmentBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Precompiled serializer of assessment lists (see app.core.responses.json_response)
+ASSESSMENT_LIST_ADAPTER = TypeAdapter(List[AssessmentResponse])
+
+
+class AssessmentRescoreJobResponse(BaseModel):
+    """Status of an assessment rescore"""
+
+    id: UUID
+    tenant_id: UUID
+    assessment_id: UUID
+    status: Literal["pending", "running", "completed", "failed"]
+    total_responses: int
+    processed_responses: int
+    updated_responses: int
+    updated_leads: int
+    error_message: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class AuditLogResponse(BaseModel):
@@ -31,10 +31,15 @@ class AuditLogResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Precompiled serializer of audit log lists (see app.core.responses.json_response)
+AUDIT_LOG_LIST_ADAPTER = TypeAdapter(list[AuditLogResponse])
+
+
 class AuditLogsListResponse(BaseModel):
     """List of audit logs with pagination"""
 
-    total: int
+    total: Optional[int]  # None with total=none
     skip: int
     limit: int
     items: list[AuditLogResponse]
+    next_cursor: Optional[str] = None  # None on the last page
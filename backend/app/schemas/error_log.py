@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class ErrorLogCreate(BaseModel):
@@ -58,13 +58,18 @@ class ErrorLogResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Precompiled serializer of error log lists (see app.core.responses.json_response)
+ERROR_LOG_LIST_ADAPTER = TypeAdapter(List[ErrorLogResponse])
+
+
 class ErrorLogListResponse(BaseModel):
     """List of error logs with pagination"""
 
-    total: int
+    total: Optional[int]  # None with total=none
     skip: int
     limit: int
     items: List[ErrorLogResponse]
+    next_cursor: Optional[str] = None  # None on the last page
 
 
 class ErrorSummaryResponse(BaseModel):
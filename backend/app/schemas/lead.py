@@ -4,11 +4,12 @@ Lead Schemas
 Pydantic models for Lead API request/response validation.
 """
 
+import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter, field_validator, model_validator
 
 
 class LeadBase(BaseModel):
@@ -62,6 +63,8 @@ class LeadScoreUpdate(BaseModel):
 class LeadResponse(LeadBase):
     """Schema for lead response"""
 
+    # Validated on write; re-validating EmailStr dominated the serialization of lead lists
+    email: str = Field(..., json_schema_extra={"format": "email"})
     id: UUID
     tenant_id: UUID
     score: int
@@ -74,3 +77,141 @@ class LeadResponse(LeadBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Precompiled serializer of lead lists (see app.core.responses.json_response)
+LEAD_LIST_ADAPTER = TypeAdapter(List[LeadResponse])
+
+
+class LeadHotRankResponse(BaseModel):
+    """Rank of a lead among its tenant's hot leads"""
+
+    lead_id: UUID
+    score: int
+    rank: int = Field(..., description="1-based rank by score; 0 if the lead is not an open hot lead")
+
+
+class LeadChange(BaseModel):
+    """Single entry of the lead change feed"""
+
+    op: Literal["upsert", "delete"]
+    lead_id: UUID
+    changed_at: datetime
+    lead: Optional[LeadResponse] = None  # Current lead for upserts
+
+
+class LeadChangesResponse(BaseModel):
+    """Page of the lead change feed"""
+
+    changes: List[LeadChange]
+    next_cursor: Optional[str] = Field(None, description="Pass as `since` to resume after this page")
+    has_more: bool
+
+
+class LeadImportRow(LeadBase):
+    """One row of a bulk lead import (CSV columns or NDJSON object keys)"""
+
+    @field_validator("company", "job_title", "phone", "notes", mode="before")
+    @classmethod
+    def empty_to_none(cls, v: Any) -> Any:
+        """Empty CSV cells are missing values"""
+        return None if v == "" else v
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def default_status(cls, v: Any) -> Any:
+        return v or "new"
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def split_tags(cls, v: Any) -> Any:
+        """CSV tags are separated by semicolons"""
+        if isinstance(v, str):
+            return [tag.strip() for tag in v.split(";") if tag.strip()]
+        return v or []
+
+    @field_validator("custom_fields", mode="before")
+    @classmethod
+    def parse_custom_fields(cls, v: Any) -> Any:
+        """CSV custom fields are a JSON object"""
+        if isinstance(v, str):
+            return json.loads(v) if v.strip() else {}
+        return v or {}
+
+
+class LeadImportJobResponse(BaseModel):
+    """Status of a bulk lead import"""
+
+    id: UUID
+    tenant_id: UUID
+    format: Literal["csv", "ndjson"]
+    on_conflict: Literal["skip", "update"]
+    status: Literal["pending", "running", "completed", "failed"]
+    processed_rows: int
+    inserted_rows: int
+    updated_rows: int
+    skipped_rows: int
+    failed_rows: int
+    errors: List[Dict[str, Any]] = Field(description="Row errors ({row, error}), up to LEAD_IMPORT_MAX_ERRORS")
+    error_message: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LeadBulkFilter(BaseModel):
+    """Leads selected by the list filters"""
+
+    status: Optional[str] = None
+    min_score: Optional[int] = Field(None, ge=0, le=100)
+    max_score: Optional[int] = Field(None, ge=0, le=100)
+    assigned_to: Optional[UUID] = None
+
+
+class LeadBulkUpdate(BaseModel):
+    """Status, score and/or assignment change for many leads
+
+    Select leads with either `lead_ids` or `filter`. Pass `assigned_to: null`
+    to unassign.
+    """
+
+    lead_ids: Optional[List[UUID]] = Field(None, min_length=1, max_length=100_000)
+    filter: Optional[LeadBulkFilter] = None
+    status: Optional[str] = Field(None, pattern="^(new|contacted|qualified|converted|disqualified)$")
+    score: Optional[int] = Field(None, ge=0, le=100)
+    assigned_to: Optional[UUID] = None
+    reason: Optional[str] = Field(None, max_length=255)
+
+    @model_validator(mode="after")
+    def check_selection_and_changes(self) -> "LeadBulkUpdate":
+        if (self.lead_ids is None) == (self.filter is None):
+            raise ValueError("Specify exactly one of lead_ids or filter")
+        if not self.changes():
+            raise ValueError("Specify at least one of status, score or assigned_to")
+        for field in ("status", "score"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+    def changes(self) -> Dict[str, Any]:
+        """Fields to set (assigned_to only if given, so null unassigns)"""
+        return {field: getattr(self, field) for field in ("status", "score", "assigned_to") if field in self.model_fields_set}
+
+
+class LeadBulkUpdateJobResponse(BaseModel):
+    """Status of a bulk lead update"""
+
+    id: UUID
+    tenant_id: UUID
+    changes: Dict[str, Any]
+    status: Literal["pending", "running", "completed", "failed"]
+    total_rows: int
+    updated_rows: int
+    error_message: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -134,10 +134,11 @@ class QRCodeListResponse(BaseModel):
     """Schema for QR code list response with pagination."""
 
     qr_codes: list[QRCodeResponse]
-    total: int
+    total: Optional[int]  # None with total=none
     page: int
     limit: int
-    pages: int
+    pages: Optional[int]
+    next_cursor: Optional[str] = None  # None on the last page
 
 
 # QR Code Scan Schemas
@@ -27,6 +27,8 @@ class ReportConfig(BaseModel):
                 "date_range": {"start": "2024-01-01", "end": "2024-12-31"},
                 "status": ["new", "qualified"],
                 "score_range": {"min": 60, "max": 100},
+                "tags": ["enterprise"],
+                "custom_fields": {"industry": ["SaaS", "Fintech"]},
             }
         ],
     )
@@ -107,3 +107,4 @@ class PublicAssessmentResponse(BaseModel):
     title: str
     description: Optional[str]
     questions: List[dict]  # Simplified question structure for frontend
+    google_analytics: Optional[dict] = None  # Public GA4 config (measurement_id, enabled, track_embed_widget)
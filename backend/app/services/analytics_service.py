@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 from app.core.constants import LeadScoreThreshold
 from app.models.assessment import Assessment
 from app.models.lead import Lead
+from app.services.tenant_counter_service import ASSESSMENTS_TOTAL, LEADS_TOTAL, TenantCounterService
 from app.utils.helpers import (
     calculate_average_score,
     calculate_conversion_rate,
@@ -49,6 +50,31 @@ class AnalyticsService:
             "generated_at": datetime.utcnow().isoformat(),
         }
 
+    def get_counts(self, tenant_id: UUID) -> Dict[str, Any]:
+        """
+        Get lead and assessment counts for dashboard badges
+
+        Reads the tenant's maintained counters, so the cost does not grow
+        with the number of leads.
+        """
+        counters = TenantCounterService(self.db).get_all(tenant_id)
+
+        def group(prefix: str) -> Dict[str, int]:
+            return {name[len(prefix) :]: value for name, value in counters.items() if name.startswith(prefix) and value}
+
+        return {
+            "tenant_id": str(tenant_id),
+            "leads": {
+                "total": counters.get(LEADS_TOTAL, 0),
+                "by_status": group("leads.status."),
+                "by_temperature": {bucket: counters.get(f"leads.temperature.{bucket}", 0) for bucket in ("hot", "warm", "cold")},
+            },
+            "assessments": {
+                "total": counters.get(ASSESSMENTS_TOTAL, 0),
+                "by_status": group("assessments.status."),
+            },
+        }
+
     def get_lead_analytics(self, tenant_id: UUID) -> Dict[str, Any]:
         """
         Get detailed lead analytics
@@ -0,0 +1,470 @@
+"""
+Answer Buffer
+
+Write-behind buffer for in-progress embed widget answers. Partial answer
+submissions are kept per response (in-process or in Redis) instead of being
+committed one request at a time. Buffers are persisted:
+
+- when the response is completed,
+- when a buffer reaches ANSWER_BUFFER_MAX_ANSWERS answers,
+- by the sweeper, once a buffer has been idle for ANSWER_BUFFER_IDLE_TIMEOUT
+  seconds (abandoned sessions and buffers orphaned by a crashed worker).
+
+A buffer is only discarded after its answers are committed, so a failed
+write leaves it for the next flush; if the store itself fails, answers are
+written through. Buffers record their response's tenant: flushes look the
+response up under that tenant (RLS), so a buffer is only dropped once its
+response is confirmed deleted.
+
+The in-process store is only safe with a single worker; use the Redis store
+when requests for one response can reach different workers.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.constants import CacheTTL
+from app.core.database import SessionLocal
+from app.models.response import Response
+from app.schemas.response import AnswerCreate, AnswerResponse, ResponseResponse
+from app.services.response_service import ResponseService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BufferedAnswer:
+    """Answer waiting to be persisted."""
+
+    id: UUID
+    question_id: UUID
+    answer_text: Optional[str]
+    points_awarded: int
+    answered_at: datetime
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "id": str(self.id),
+                "question_id": str(self.question_id),
+                "answer_text": self.answer_text,
+                "points_awarded": self.points_awarded,
+                "answered_at": self.answered_at.isoformat(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, value) -> "BufferedAnswer":
+        data = json.loads(value)
+        return cls(
+            id=UUID(data["id"]),
+            question_id=UUID(data["question_id"]),
+            answer_text=data["answer_text"],
+            points_awarded=data["points_awarded"],
+            answered_at=datetime.fromisoformat(data["answered_at"]),
+        )
+
+
+@dataclass
+class AnswerBufferEntry:
+    """Buffered answers and contact fields of one response."""
+
+    response_id: UUID
+    answers: Dict[UUID, BufferedAnswer] = field(default_factory=dict)
+    response_values: Dict[str, str] = field(default_factory=dict)
+    tenant_id: Optional[UUID] = None  # Tenant of the response's assessment (None: buffered before it was recorded)
+
+    def copy(self) -> "AnswerBufferEntry":
+        return AnswerBufferEntry(self.response_id, dict(self.answers), dict(self.response_values), self.tenant_id)
+
+    def merge(self, answers: Iterable[AnswerCreate], response_values: Dict[str, str]) -> None:
+        """Add answers (last answer per question wins) and contact fields."""
+        answered_at = datetime.now(timezone.utc)
+        for answer in answers:
+            existing = self.answers.get(answer.question_id)
+            self.answers[answer.question_id] = BufferedAnswer(
+                id=existing.id if existing else uuid4(),
+                question_id=answer.question_id,
+                answer_text=answer.answer_text,
+                points_awarded=answer.points_awarded,
+                answered_at=answered_at,
+            )
+        self.response_values.update(response_values)
+
+
+class AnswerBufferStore(ABC):
+    """Base class for answer buffer stores."""
+
+    @abstractmethod
+    def add(self, response_id: UUID, tenant_id: UUID, answers: Iterable[AnswerCreate], response_values: Dict[str, str]) -> AnswerBufferEntry:
+        """Merge answers into the buffer of a response and return the buffer."""
+
+    @abstractmethod
+    def get(self, response_id: UUID) -> Optional[AnswerBufferEntry]:
+        """Get the buffer of a response without removing it."""
+
+    @abstractmethod
+    def discard(self, entry: AnswerBufferEntry) -> None:
+        """Remove persisted answers and contact fields from the buffer of a response.
+
+        Values changed since `entry` was read are kept for the next flush.
+        """
+
+    @abstractmethod
+    def idle_response_ids(self, idle_since: float) -> List[UUID]:
+        """Responses whose buffer was last updated before `idle_since` (epoch seconds)."""
+
+
+class MemoryAnswerBufferStore(AnswerBufferStore):
+    """In-process answer buffer store (single worker only)."""
+
+    def __init__(self):
+        self._entries: Dict[UUID, AnswerBufferEntry] = {}
+        self._updated_at: Dict[UUID, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, response_id: UUID, tenant_id: UUID, answers: Iterable[AnswerCreate], response_values: Dict[str, str]) -> AnswerBufferEntry:
+        with self._lock:
+            entry = self._entries.setdefault(response_id, AnswerBufferEntry(response_id=response_id))
+            entry.tenant_id = tenant_id
+            entry.merge(answers, response_values)
+            self._updated_at[response_id] = time.time()
+            return entry.copy()
+
+    def get(self, response_id: UUID) -> Optional[AnswerBufferEntry]:
+        with self._lock:
+            entry = self._entries.get(response_id)
+            return entry.copy() if entry else None
+
+    def discard(self, entry: AnswerBufferEntry) -> None:
+        response_id = entry.response_id
+        with self._lock:
+            current = self._entries.get(response_id)
+            if current is None:
+                return
+            for question_id, answer in entry.answers.items():
+                if current.answers.get(question_id) == answer:
+                    del current.answers[question_id]
+            for name, value in entry.response_values.items():
+                if current.response_values.get(name) == value:
+                    del current.response_values[name]
+            if not current.answers and not current.response_values:
+                del self._entries[response_id]
+                self._updated_at.pop(response_id, None)
+
+    def idle_response_ids(self, idle_since: float) -> List[UUID]:
+        with self._lock:
+            return [response_id for response_id, updated_at in self._updated_at.items() if updated_at < idle_since]
+
+
+class RedisAnswerBufferStore(AnswerBufferStore):
+    """Redis answer buffer store (shared by all workers, survives restarts).
+
+    Each buffer is a hash (`answer_buffer:<response_id>`) with one field per
+    question plus contact fields and the tenant; a sorted set indexes buffers
+    by last update for the sweeper.
+    """
+
+    INDEX_KEY = "answer_buffer:index"
+    ANSWER_PREFIX = "a:"
+    VALUE_PREFIX = "v:"
+    TENANT_FIELD = "t"
+
+    # KEYS: buffer hash, index; ARGV: response id, tenant field, then
+    # field/value pairs. Deletes the fields still holding the persisted value
+    # and deletes and unindexes the buffer once only its tenant is left,
+    # atomically with concurrent adds.
+    DISCARD_SCRIPT = """
+    for i = 3, #ARGV, 2 do
+        if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+            redis.call('HDEL', KEYS[1], ARGV[i])
+        end
+    end
+    if redis.call('HLEN', KEYS[1]) - redis.call('HEXISTS', KEYS[1], ARGV[2]) == 0 then
+        redis.call('DEL', KEYS[1])
+        redis.call('ZREM', KEYS[2], ARGV[1])
+    end
+    return 1
+    """
+
+    def __init__(self, client, key_prefix: str = "", ttl: int = CacheTTL.DAY):
+        self.client = client
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+        self._discard = client.register_script(self.DISCARD_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "") -> "RedisAnswerBufferStore":
+        import redis
+
+        client = redis.Redis.from_url(
+            url,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+        return cls(client, key_prefix=key_prefix)
+
+    def _key(self, response_id: UUID) -> str:
+        return f"{self.key_prefix}answer_buffer:{response_id}"
+
+    def _index_key(self) -> str:
+        return f"{self.key_prefix}{self.INDEX_KEY}"
+
+    def _decode(self, response_id: UUID, fields: Dict) -> Optional[AnswerBufferEntry]:
+        if not fields:
+            return None
+        entry = AnswerBufferEntry(response_id=response_id)
+        for name, value in fields.items():
+            name = name.decode() if isinstance(name, bytes) else name
+            if name == self.TENANT_FIELD:
+                entry.tenant_id = UUID(value.decode() if isinstance(value, bytes) else value)
+            elif name.startswith(self.ANSWER_PREFIX):
+                answer = BufferedAnswer.from_json(value)
+                entry.answers[answer.question_id] = answer
+            elif name.startswith(self.VALUE_PREFIX):
+                entry.response_values[name[len(self.VALUE_PREFIX) :]] = value.decode() if isinstance(value, bytes) else value
+        return entry
+
+    def _fields(self, entry: AnswerBufferEntry) -> Dict[str, str]:
+        fields = {f"{self.ANSWER_PREFIX}{question_id}": answer.to_json() for question_id, answer in entry.answers.items()}
+        fields.update({f"{self.VALUE_PREFIX}{name}": value for name, value in entry.response_values.items()})
+        return fields
+
+    def add(self, response_id: UUID, tenant_id: UUID, answers: Iterable[AnswerCreate], response_values: Dict[str, str]) -> AnswerBufferEntry:
+        key = self._key(response_id)
+
+        # Keep answer ids stable across partial submissions
+        entry = self.get(response_id) or AnswerBufferEntry(response_id=response_id)
+        entry.tenant_id = tenant_id
+        entry.merge(answers, response_values)
+
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hset(key, mapping={**self._fields(entry), self.TENANT_FIELD: str(tenant_id)})
+        pipe.expire(key, self.ttl)
+        pipe.zadd(self._index_key(), {str(response_id): time.time()})
+        pipe.execute()
+
+        return entry
+
+    def get(self, response_id: UUID) -> Optional[AnswerBufferEntry]:
+        return self._decode(response_id, self.client.hgetall(self._key(response_id)))
+
+    def discard(self, entry: AnswerBufferEntry) -> None:
+        args = [str(entry.response_id), self.TENANT_FIELD]
+        for name, value in self._fields(entry).items():
+            args.extend((name, value))
+        self._discard(keys=[self._key(entry.response_id), self._index_key()], args=args)
+
+    def idle_response_ids(self, idle_since: float) -> List[UUID]:
+        members = self.client.zrangebyscore(self._index_key(), "-inf", f"({idle_since}")
+        return [UUID(member.decode() if isinstance(member, bytes) else member) for member in members]
+
+
+@lru_cache()
+def get_answer_buffer() -> Optional[AnswerBufferStore]:
+    """Get the configured answer buffer store (None when buffering is disabled)."""
+    if settings.ANSWER_BUFFER_BACKEND == "redis":
+        return RedisAnswerBufferStore.from_url(settings.REDIS_URL, key_prefix=settings.CACHE_KEY_PREFIX)
+    if settings.ANSWER_BUFFER_BACKEND == "memory":
+        return MemoryAnswerBufferStore()
+    return None
+
+
+def build_buffered_view(response: Response, entry: Optional[AnswerBufferEntry]) -> ResponseResponse:
+    """Build the API view of a response with its buffered answers applied.
+
+    Args:
+        response: Persisted response
+        entry: Buffered answers (None if nothing is buffered)
+
+    Returns:
+        Response schema including persisted and buffered answers
+    """
+    view = ResponseResponse.model_validate(response)
+    if not entry:
+        return view
+
+    answers = {answer.question_id: answer for answer in view.answers}
+    for question_id, buffered in entry.answers.items():
+        persisted = answers.get(question_id)
+        answers[question_id] = AnswerResponse(
+            id=persisted.id if persisted else buffered.id,
+            response_id=response.id,
+            question_id=question_id,
+            answer_text=buffered.answer_text,
+            points_awarded=buffered.points_awarded,
+            answered_at=buffered.answered_at,
+        )
+
+    return view.model_copy(
+        update={
+            "answers": list(answers.values()),
+            "total_score": sum(answer.points_awarded for answer in answers.values()),
+            **entry.response_values,
+        }
+    )
+
+
+class AnswerBufferService:
+    """Buffers in-progress answers and persists them in bulk."""
+
+    def __init__(self, db: Session, store: Optional[AnswerBufferStore] = None):
+        self.db = db
+        self.store = store or get_answer_buffer()
+
+    def lock_response(self, response_id: UUID) -> Optional[Response]:
+        """Load a response with a row lock.
+
+        Flushing and completion read the buffer while holding this lock so
+        a buffer is never persisted concurrently with completion.
+        """
+        return self.db.query(Response).filter(Response.id == response_id).with_for_update().first()
+
+    def set_tenant(self, tenant_id: UUID) -> None:
+        """Scope the current transaction to a tenant (RLS on responses and answers)."""
+        self.db.execute(text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"), {"tenant_id": str(tenant_id)})
+
+    def pending(self, response_id: UUID) -> Optional[AnswerBufferEntry]:
+        """Get the buffer of a response (call with the row locked)."""
+        return self.store.get(response_id) if self.store else None
+
+    def discard(self, entry: Optional[AnswerBufferEntry]) -> None:
+        """Remove a buffer from the store once its answers are committed.
+
+        A failure only leaves already persisted answers to be upserted again.
+        """
+        if not entry or not self.store:
+            return
+        try:
+            self.store.discard(entry)
+        except Exception as e:
+            logger.warning(f"Failed to discard answer buffer of response {entry.response_id}: {e}")
+
+    def flush(self, response_id: UUID) -> bool:
+        """Persist the buffer of a response and commit.
+
+        The buffer is kept if persisting fails, so it is retried by the next
+        flush.
+
+        Returns:
+            True if buffered answers were persisted
+        """
+        buffered = self.pending(response_id)
+        if not buffered:
+            return False
+        if buffered.tenant_id is None:
+            # Without its tenant a missing response cannot be told from one hidden by RLS
+            logger.warning(f"Answer buffer of response {response_id} has no tenant, keeping it")
+            return False
+
+        self.set_tenant(buffered.tenant_id)
+        response = self.lock_response(response_id)
+        entry = self.pending(response_id)
+        if not entry:
+            self.db.rollback()
+            return False
+
+        if response is None:
+            # Looked up under the buffer's tenant: the response was deleted
+            logger.warning(f"Dropping answer buffer of deleted response {response_id}")
+            self.db.rollback()
+            self.discard(entry)
+            return False
+
+        if response.status == "completed":
+            # Orphaned by a completion on another worker: keep the answers, but
+            # leave contact fields and status as completed set them
+            ResponseService(self.db).save_answers(response, entry.answers.values())
+        else:
+            ResponseService(self.db).save_answers(response, entry.answers.values(), **entry.response_values)
+        self.db.commit()
+        self.discard(entry)
+        return True
+
+    def submit(self, response: Response, answers: Iterable[AnswerCreate], response_values: Dict[str, str]) -> ResponseResponse:
+        """Buffer a partial answer submission.
+
+        Falls back to writing through when buffering is disabled or the
+        store is unavailable, and flushes once the buffer reaches
+        ANSWER_BUFFER_MAX_ANSWERS answers.
+
+        Returns:
+            Response view including buffered answers
+        """
+        if self.store is None:
+            return self._write_through(response, answers, response_values)
+
+        try:
+            entry = self.store.add(response.id, response.assessment.tenant_id, answers, response_values)
+        except Exception as e:
+            logger.warning(f"Answer buffer unavailable, writing answers of response {response.id} through: {e}")
+            return self._write_through(response, answers, response_values)
+
+        if len(entry.answers) >= settings.ANSWER_BUFFER_MAX_ANSWERS:
+            self.flush(response.id)
+            self.db.refresh(response)
+            return ResponseResponse.model_validate(response)
+
+        return build_buffered_view(response, entry)
+
+    def _write_through(self, response: Response, answers: Iterable[AnswerCreate], response_values: Dict[str, str]) -> ResponseResponse:
+        ResponseService(self.db).save_answers(response, answers, **response_values)
+        self.db.commit()
+        self.db.refresh(response)
+        return ResponseResponse.model_validate(response)
+
+
+def flush_idle_buffers(idle_timeout: Optional[int] = None) -> int:
+    """Persist buffers idle for longer than `idle_timeout` seconds.
+
+    Returns:
+        Number of buffers persisted
+    """
+    store = get_answer_buffer()
+    if store is None:
+        return 0
+
+    idle_timeout = settings.ANSWER_BUFFER_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+    flushed = 0
+    for response_id in store.idle_response_ids(time.time() - idle_timeout):
+        db = SessionLocal()
+        try:
+            if AnswerBufferService(db, store).flush(response_id):
+                flushed += 1
+        except Exception as e:
+            # The buffer stays in the store and is retried by the next sweep
+            db.rollback()
+            logger.error(f"Failed to flush answer buffer of response {response_id}: {e}")
+        finally:
+            db.close()
+    return flushed
+
+
+async def run_answer_buffer_sweeper(stop_event: asyncio.Event) -> None:
+    """Periodically persist idle buffers until `stop_event` is set."""
+    while not stop_event.is_set():
+        try:
+            flushed = await run_in_threadpool(flush_idle_buffers)
+            if flushed:
+                logger.info(f"Persisted {flushed} idle answer buffers")
+        except Exception as e:
+            logger.error(f"Answer buffer sweep failed: {e}")
+
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.ANSWER_BUFFER_SWEEP_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
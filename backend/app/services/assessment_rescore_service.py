@@ -0,0 +1,257 @@
+"""
+Assessment Rescore Service
+
+Recomputes the scores of an assessment's completed responses, and of the
+leads created from them, after its scoring changed. Answer points are
+derived from the current option points instead of the client-supplied
+`points_awarded`, which is only kept for answers that match no option
+(text and slider questions).
+
+Responses are walked in ID order, in chunks. For each chunk one query loads
+every answer as integer indexes (response, question, matched option) plus
+the stored points into a NumPy array; the new scores of the whole chunk are
+computed in one vectorized pass (np.bincount over the answer points) and
+written back with one set-based statement that updates changed responses
+and leads; the rescored leads it returns are queued for CRM sync. Each chunk
+commits with the job's progress (see JobService).
+
+Supported `Assessment.scoring_logic` keys:
+    question_weights: {question_id: multiplier} (default 1)
+    max_score: raw score mapped to a lead score of 100; lead scores are
+        otherwise the raw score clipped to 0-100
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import func, select, text
+
+from app.core.config import settings
+from app.models.assessment import Assessment
+from app.models.assessment_rescore_job import AssessmentRescoreJob, AssessmentRescoreStatus
+from app.models.outbox_event import OutboxEventType
+from app.models.question import Question
+from app.models.question_option import QuestionOption
+from app.models.response import Response
+from app.services.crm_sync_queue import CRMSyncQueue
+from app.services.job_runner import JobService, run_job
+from app.services.outbox_service import OutboxService
+
+logger = logging.getLogger(__name__)
+
+# One row per answer of the chunk, as indexes into the chunk's response list
+# and the assessment's question / option lists (-1: no matching option)
+LOAD_ANSWERS_SQL = text(
+    """
+    SELECT chunk.ord - 1 AS response_idx,
+           coalesce(array_position(CAST(:question_ids AS uuid[]), answers.question_id), 0) - 1 AS question_idx,
+           coalesce(array_position(CAST(:option_ids AS uuid[]), matched.id), 0) - 1 AS option_idx,
+           answers.points_awarded
+    FROM unnest(CAST(:response_ids AS uuid[])) WITH ORDINALITY AS chunk(id, ord)
+    JOIN answers ON answers.response_id = chunk.id
+    LEFT JOIN LATERAL (
+        SELECT question_options.id FROM question_options
+        WHERE question_options.question_id = answers.question_id AND question_options.text = answers.answer_text
+        ORDER BY question_options."order"
+        LIMIT 1
+    ) AS matched ON true
+    """
+)
+
+# Writes the chunk's scores; only rows whose score changed are touched
+WRITE_SCORES_SQL = text(
+    """
+    WITH scores AS (
+        SELECT * FROM unnest(CAST(:response_ids AS uuid[]), CAST(:total_scores AS integer[]), CAST(:lead_scores AS integer[]))
+            AS s(response_id, total_score, lead_score)
+    ), rescored_responses AS (
+        UPDATE responses SET total_score = scores.total_score
+        FROM scores
+        WHERE responses.id = scores.response_id AND responses.total_score <> scores.total_score
+        RETURNING responses.id
+    ), rescored_leads AS (
+        UPDATE leads SET score = scores.lead_score, updated_at = now()
+        FROM scores
+        WHERE leads.response_id = scores.response_id AND leads.tenant_id = :tenant_id AND leads.score <> scores.lead_score
+        RETURNING leads.id
+    )
+    SELECT (SELECT count(*) FROM rescored_responses) AS responses, ARRAY(SELECT id FROM rescored_leads) AS lead_ids
+    """
+)
+
+
+def compute_scores(
+    answers: np.ndarray,
+    n_responses: int,
+    weights: np.ndarray,
+    option_points: np.ndarray,
+    max_score: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score a chunk of responses in one vectorized pass.
+
+    Args:
+        answers: int array of shape (n_answers, 4): response index, question
+            index, option index (-1: none) and stored points
+        n_responses: Responses in the chunk (responses without answers score 0)
+        weights: Weight per question index
+        option_points: Points per option index
+        max_score: Raw score mapped to a lead score of 100 (optional)
+
+    Returns:
+        (total scores, lead scores) per response index
+    """
+    response_idx, question_idx, option_idx, awarded = answers.T
+    # Index -1 (unknown question / no option) selects the appended default
+    points = np.where(option_idx >= 0, np.append(option_points, 0)[option_idx], awarded)
+    weighted = points * np.append(weights, 1.0)[question_idx]
+
+    totals = np.rint(np.bincount(response_idx, weights=weighted, minlength=n_responses)).astype(np.int64)
+    lead_scores = np.rint(totals * (100.0 / max_score)) if max_score else totals
+    return totals, np.clip(lead_scores, 0, 100).astype(np.int64)
+
+
+class AssessmentRescoreService(JobService[AssessmentRescoreJob]):
+    """Service for assessment rescore jobs."""
+
+    job_model = AssessmentRescoreJob
+    statuses = AssessmentRescoreStatus
+    label = "Assessment rescore"
+    bulk_lead_writes = True
+
+    def create_job(self, tenant_id: UUID, assessment_id: UUID, created_by: UUID) -> AssessmentRescoreJob:
+        """Create a pending rescore job (commits)
+
+        Args:
+            tenant_id: Tenant UUID
+            assessment_id: Assessment whose responses are rescored
+            created_by: Requesting user
+
+        Returns:
+            Pending job
+        """
+        total = self.db.query(func.count(Response.id)).filter(Response.assessment_id == assessment_id, Response.status == "completed").scalar() or 0
+        return self._add_job(
+            AssessmentRescoreJob(
+                tenant_id=tenant_id,
+                assessment_id=assessment_id,
+                created_by=created_by,
+                status=AssessmentRescoreStatus.PENDING,
+                total_responses=total,
+            )
+        )
+
+    def run(self, job: AssessmentRescoreJob, chunk_size: Optional[int] = None) -> AssessmentRescoreJob:
+        """
+        Rescore the assessment's completed responses chunk by chunk.
+
+        Args:
+            job: Pending job
+            chunk_size: Responses per chunk (default RESCORE_CHUNK_SIZE)
+
+        Returns:
+            Completed or failed job
+        """
+        return super().run(job, chunk_size or settings.RESCORE_CHUNK_SIZE)
+
+    def _process(self, job: AssessmentRescoreJob, chunk_size: int) -> None:
+        model = self._load_scoring_model(job)
+        after: Optional[UUID] = None
+        while True:
+            response_ids = self._next_chunk(job.assessment_id, after, chunk_size)
+            if not response_ids:
+                break
+            self._rescore_chunk(job, response_ids, model)
+            after = response_ids[-1]
+            if len(response_ids) < chunk_size:
+                break
+
+    def _on_completed(self, job: AssessmentRescoreJob) -> None:
+        # One summary event instead of per-lead score events
+        OutboxService(self.db).enqueue(
+            tenant_id=job.tenant_id,
+            event_type=OutboxEventType.GA4_EVENT,
+            payload={
+                "event_name": "leads_rescored",
+                "event_params": {
+                    "assessment_id": str(job.assessment_id),
+                    "responses": job.processed_responses,
+                    "updated_responses": job.updated_responses,
+                    "updated_leads": job.updated_leads,
+                },
+            },
+        )
+
+    def _summary(self, job: AssessmentRescoreJob) -> str:
+        return f"{job.updated_responses} of {job.processed_responses} responses, {job.updated_leads} leads updated"
+
+    def _load_scoring_model(self, job: AssessmentRescoreJob) -> Dict[str, Any]:
+        """Question weights and option points of the assessment, as arrays indexed like the ID lists"""
+        assessment = self.db.query(Assessment).filter(Assessment.id == job.assessment_id, Assessment.tenant_id == job.tenant_id).first()
+        if assessment is None:
+            raise ValueError("Assessment not found")
+
+        scoring_logic = assessment.scoring_logic or {}
+        question_weights = {str(question_id): float(weight) for question_id, weight in (scoring_logic.get("question_weights") or {}).items()}
+        question_ids = list(self.db.execute(select(Question.id).where(Question.assessment_id == assessment.id).order_by(Question.id)).scalars())
+        options = self.db.execute(
+            select(QuestionOption.id, QuestionOption.points)
+            .join(Question, Question.id == QuestionOption.question_id)
+            .where(Question.assessment_id == assessment.id)
+            .order_by(QuestionOption.id)
+        ).all()
+
+        return {
+            "question_ids": [str(question_id) for question_id in question_ids],
+            "weights": np.array([question_weights.get(str(question_id), 1.0) for question_id in question_ids], dtype=np.float64),
+            "option_ids": [str(option.id) for option in options],
+            "option_points": np.array([option.points for option in options], dtype=np.float64),
+            "max_score": float(scoring_logic["max_score"]) if scoring_logic.get("max_score") else None,
+        }
+
+    def _next_chunk(self, assessment_id: UUID, after: Optional[UUID], limit: int) -> List[UUID]:
+        """IDs of the next `limit` completed responses after `after`"""
+        query = select(Response.id).where(Response.assessment_id == assessment_id, Response.status == "completed")
+        if after is not None:
+            query = query.where(Response.id > after)
+        return list(self.db.execute(query.order_by(Response.id).limit(limit)).scalars())
+
+    def _load_answers(self, response_ids: Sequence[UUID], model: Dict[str, Any]) -> np.ndarray:
+        """Answers of the chunk as an int array (see compute_scores)"""
+        rows = self.db.execute(
+            LOAD_ANSWERS_SQL,
+            {
+                "response_ids": [str(response_id) for response_id in response_ids],
+                "question_ids": model["question_ids"],
+                "option_ids": model["option_ids"],
+            },
+        ).all()
+        return np.array(rows, dtype=np.int64).reshape(-1, 4)
+
+    def _rescore_chunk(self, job: AssessmentRescoreJob, response_ids: Sequence[UUID], model: Dict[str, Any]) -> None:
+        """Score a chunk, write the changed scores, queue the rescored leads for CRM sync and commit the progress"""
+        answers = self._load_answers(response_ids, model)
+        totals, lead_scores = compute_scores(answers, len(response_ids), model["weights"], model["option_points"], model["max_score"])
+
+        result = self.db.execute(
+            WRITE_SCORES_SQL,
+            {
+                "tenant_id": job.tenant_id,
+                "response_ids": [str(response_id) for response_id in response_ids],
+                "total_scores": totals.tolist(),
+                "lead_scores": lead_scores.tolist(),
+            },
+        ).one()
+        CRMSyncQueue(self.db).enqueue_many(job.tenant_id, result.lead_ids)
+
+        job.processed_responses += len(response_ids)
+        job.updated_responses += result.responses
+        job.updated_leads += len(result.lead_ids)
+        self.db.commit()
+
+
+def run_assessment_rescore(job_id: UUID, tenant_id: UUID) -> None:
+    """Run a rescore job in its own session (background task)"""
+    run_job(AssessmentRescoreService, job_id, tenant_id)
@@ -4,14 +4,21 @@ Assessment Service
 Business logic for assessment management with multi-tenant support.
 """
 
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, desc
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from app.models.assessment import Assessment
 from app.schemas.assessment import AssessmentCreate, AssessmentUpdate
+from app.services.public_assessment_service import PublicAssessmentService
+from app.services.tenant_counter_service import ASSESSMENTS_TOTAL, TenantCounterService
+from app.utils.helpers import apply_keyset
+from app.utils.projection import project
+
+# Sort order of assessment lists, ending with id so keyset cursors are unambiguous
+ASSESSMENT_LIST_ORDER = (Assessment.created_at, Assessment.id)
 
 
 class AssessmentService:
@@ -30,18 +37,25 @@ class AssessmentService:
         skip: int = 0,
         limit: int = 100,
         status: Optional[str] = None,
-    ) -> List[Assessment]:
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
         """
         List all assessments for a specific tenant
 
         Args:
             tenant_id: Tenant ID (REQUIRED for isolation)
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored with a cursor)
             limit: Maximum number of records to return
             status: Filter by status (optional)
+            cursor: Keyset cursor of the next page (optional)
+            fields: Return rows of only these columns (plus the sort columns) instead of entities
 
         Returns:
-            List of assessments
+            List of assessments (rows with `fields`)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         query = self.db.query(Assessment).filter(
             Assessment.tenant_id == tenant_id  # REQUIRED: Tenant filtering
@@ -51,8 +65,14 @@ class AssessmentService:
         if status:
             query = query.filter(Assessment.status == status)
 
+        if fields is not None:
+            query = project(query, Assessment, fields, ASSESSMENT_LIST_ORDER)
+
         # Sort by creation date (newest first) and paginate
-        assessments = query.order_by(desc(Assessment.created_at)).offset(skip).limit(limit).all()
+        query = apply_keyset(query, ASSESSMENT_LIST_ORDER, cursor)
+        if not cursor:
+            query = query.offset(skip)
+        assessments = query.limit(limit).all()
 
         return assessments
 
@@ -99,9 +119,13 @@ class AssessmentService:
         )
 
         self.db.add(assessment)
+        TenantCounterService(self.db).assessment_changed(tenant_id, new_status=assessment.status)
         self.db.commit()
         self.db.refresh(assessment)
 
+        # Compile the embed widget payload when created as published
+        PublicAssessmentService(self.db).refresh(assessment)
+
         return assessment
 
     def update(self, assessment_id: UUID, data: AssessmentUpdate, tenant_id: UUID) -> Optional[Assessment]:
@@ -122,14 +146,21 @@ class AssessmentService:
         if not assessment:
             return None
 
+        old_status = assessment.status
+
         # Update fields
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(assessment, field, value)
 
+        if assessment.status != old_status:
+            TenantCounterService(self.db).assessment_changed(tenant_id, old_status, assessment.status)
         self.db.commit()
         self.db.refresh(assessment)
 
+        # Recompile (or evict when unpublished) the embed widget payload
+        PublicAssessmentService(self.db).refresh(assessment)
+
         return assessment
 
     def delete(self, assessment_id: UUID, tenant_id: UUID) -> bool:
@@ -150,8 +181,11 @@ class AssessmentService:
             return False
 
         self.db.delete(assessment)
+        TenantCounterService(self.db).assessment_changed(tenant_id, old_status=assessment.status)
         self.db.commit()
 
+        PublicAssessmentService(self.db).invalidate(tenant_id, assessment_id)
+
         return True
 
     def count_by_tenant(self, tenant_id: UUID, status: Optional[str] = None) -> int:
@@ -163,16 +197,9 @@ class AssessmentService:
             status: Filter by status (optional)
 
         Returns:
-            Number of assessments
+            Number of assessments (from the tenant's maintained counter)
         """
-        query = self.db.query(Assessment).filter(
-            Assessment.tenant_id == tenant_id  # REQUIRED: Tenant filtering
-        )
-
-        if status:
-            query = query.filter(Assessment.status == status)
-
-        return query.count()
+        return TenantCounterService(self.db).get(tenant_id, f"assessments.status.{status}" if status else ASSESSMENTS_TOTAL)
 
     def search_by_title(self, tenant_id: UUID, title_query: str, limit: int = 10) -> List[Assessment]:
         """
@@ -5,13 +5,15 @@ Handles audit log creation and retrieval.
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import desc
 from sqlalchemy.orm import Session
 
 from app.models.audit_log import AuditLog
+from app.utils.helpers import Page, TotalMode, paginate_query
+from app.utils.projection import project
 
 
 class AuditService:
@@ -65,8 +67,14 @@ class AuditService:
         end_date: Optional[datetime] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[List[AuditLog], int]:
-        """Get audit logs with optional filtering"""
+        cursor: Optional[str] = None,
+        total: TotalMode = "exact",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[AuditLog]:
+        """Get audit logs with optional filtering, newest first (offset or keyset cursor pages)
+
+        With `fields`, page items are rows of only these columns (plus the sort columns).
+        """
 
         query = db.query(AuditLog).filter(AuditLog.tenant_id == tenant_id)
 
@@ -86,13 +94,10 @@ class AuditService:
         if end_date:
             query = query.filter(AuditLog.created_at <= end_date)
 
-        # Get total count
-        total_count = query.count()
-
-        # Order by created_at descending (newest first)
-        logs = query.order_by(desc(AuditLog.created_at)).offset(skip).limit(limit).all()
-
-        return logs, total_count
+        order_by = (AuditLog.created_at, AuditLog.id)
+        if fields is not None:
+            query = project(query, AuditLog, fields, order_by)
+        return paginate_query(query, order_by, limit=limit, cursor=cursor, offset=skip, total=total, max_limit=1000)
 
     @staticmethod
     def get_user_activity(
@@ -54,26 +54,31 @@ class AuthService:
         """Decode and validate a JWT token"""
         try:
             payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            user_id: Optional[str] = payload.get("sub")
-            tenant_id: Optional[str] = payload.get("tenant_id")
-            email: Optional[str] = payload.get("email")
-
-            if user_id is None:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Could not validate credentials",
-                )
-
-            return TokenData(
-                user_id=UUID(user_id) if user_id else None,
-                tenant_id=UUID(tenant_id) if tenant_id else None,
-                email=email,
-            )
         except JWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
             )
+        return AuthService.token_data_from_payload(payload)
+
+    @staticmethod
+    def token_data_from_payload(payload: dict) -> TokenData:
+        """Extract the token data of an already decoded JWT payload"""
+        user_id: Optional[str] = payload.get("sub")
+        tenant_id: Optional[str] = payload.get("tenant_id")
+        email: Optional[str] = payload.get("email")
+
+        if user_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+            )
+
+        return TokenData(
+            user_id=UUID(user_id) if user_id else None,
+            tenant_id=UUID(tenant_id) if tenant_id else None,
+            email=email,
+        )
 
     @staticmethod
     def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
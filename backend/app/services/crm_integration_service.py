@@ -4,16 +4,92 @@ CRM Integration Service
 Manages CRM integrations and lead synchronization.
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import httpx
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-
-from app.integrations.crm.hubspot_client import HubSpotClient
-from app.integrations.crm.salesforce_client import SalesforceClient
-from app.models.crm_integration import CRMIntegration, CRMSyncLog
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.integrations.crm.base import AsyncCRMClient, CRMBatchResult
+from app.integrations.crm.hubspot_client import AsyncHubSpotClient, HubSpotClient
+from app.integrations.crm.salesforce_client import AsyncSalesforceClient, SalesforceClient
+from app.integrations.token_manager import AccessToken, get_token_manager
+from app.models.crm_integration import CRMIntegration, CRMSyncLog, CRMSyncState
 from app.models.lead import Lead
+from app.utils.helpers import Page, TotalMode, paginate_query
+
+logger = logging.getLogger(__name__)
+
+# (lead ID, CRM record ID or None for creates, fields to send, hashes of all fields)
+_SyncItem = Tuple[UUID, Optional[str], Dict[str, Any], Dict[str, str]]
+
+
+def hash_lead_fields(lead_data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Hash each field of the lead data sent to CRM.
+
+    Args:
+        lead_data: Lead data with DiagnoLeads field names
+
+    Returns:
+        Short SHA-256 digest per field
+    """
+    return {field: hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()[:16] for field, value in lead_data.items()}
+
+
+def refresh_crm_token(integration_id: UUID) -> AccessToken:
+    """
+    Refresh a CRM access token and persist the new tokens.
+
+    Runs in its own session: token refreshes may run in the background after
+    the requesting session is closed.
+
+    Args:
+        integration_id: CRMIntegration UUID
+
+    Returns:
+        New access token
+
+    Raises:
+        ValueError: If the integration no longer exists
+        httpx.HTTPStatusError: If the token endpoint rejects the refresh
+    """
+    db = SessionLocal()
+    try:
+        integration = db.query(CRMIntegration).filter(CRMIntegration.id == integration_id).first()
+        if not integration:
+            raise ValueError(f"CRM integration {integration_id} not found")
+
+        client = CRMIntegrationService(db)._get_crm_client(integration)
+        result = client.refresh_access_token(integration.decrypt_refresh_token())
+        expires_at = datetime.fromisoformat(result["expires_at"])
+
+        integration.encrypt_access_token(result["access_token"])
+        if result.get("refresh_token"):
+            # HubSpot rotates refresh tokens
+            integration.encrypt_refresh_token(result["refresh_token"])
+        if result.get("instance_url"):
+            integration.instance_url = result["instance_url"]
+        integration.expires_at = expires_at
+        db.commit()
+
+        return AccessToken(
+            access_token=result["access_token"],
+            expires_at=expires_at.timestamp(),
+            extra={"instance_url": integration.instance_url} if integration.instance_url else {},
+        )
+    finally:
+        db.close()
 
 
 class CRMIntegrationService:
@@ -131,16 +207,15 @@ class CRMIntegrationService:
                 # TODO: Add crm_external_id field to Lead model
                 # lead.crm_external_id = crm_id
 
-            elif sync_type == "update":
-                # TODO: Get crm_external_id from lead
-                crm_id = "placeholder"  # lead.crm_external_id
-                client.update_lead(crm_id, lead_data)
-                sync_log.crm_record_id = crm_id
-
-            elif sync_type == "delete":
-                # TODO: Get crm_external_id from lead
-                crm_id = "placeholder"  # lead.crm_external_id
-                client.delete_lead(crm_id)
+            elif sync_type in ("update", "delete"):
+                state = self._get_sync_states(integration.id, [lead_id]).get(lead_id)
+                if state is None:
+                    raise ValueError(f"Lead {lead_id} has not been synced to CRM")
+                crm_id = state[0]
+                if sync_type == "update":
+                    client.update_lead(crm_id, lead_data)
+                else:
+                    client.delete_lead(crm_id)
                 sync_log.crm_record_id = crm_id
 
             else:
@@ -152,14 +227,13 @@ class CRMIntegrationService:
             sync_log.fields_synced = list(lead_data.keys())
 
             # Update integration stats
-            integration.last_sync_at = datetime.now(timezone.utc)
-            integration.total_synced = str(int(integration.total_synced) + 1)
+            self._increment_sync_counters(integration.id, succeeded=1, failed=0)
 
         except Exception as e:
             # Mark as failed
             sync_log.status = "failed"
             sync_log.error_message = str(e)
-            integration.failed_syncs = str(int(integration.failed_syncs) + 1)
+            self._increment_sync_counters(integration.id, succeeded=0, failed=1)
 
             # TODO: Schedule retry with Trigger.dev
             raise
@@ -171,12 +245,331 @@ class CRMIntegrationService:
 
         return sync_log
 
-    def _get_crm_client(self, integration: CRMIntegration):
+    async def sync_leads_bulk(
+        self,
+        tenant_id: UUID,
+        lead_ids: Optional[List[UUID]] = None,
+        chunk_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        failed_lead_ids: Optional[List[UUID]] = None,
+    ) -> Dict[str, int]:
+        """
+        Synchronize many leads to CRM using the CRM batch endpoints.
+
+        Leads never synced are created with all fields. Synced leads are
+        compared with the field hashes of their last sync: unchanged leads
+        are skipped and changed leads are updated with the changed fields
+        only. Leads are read in pages, split into chunks of at most the CRM
+        batch limit (Salesforce 200, HubSpot 100) and the chunks of a page
+        are sent with bounded concurrency. Sync logs and sync states are
+        written in bulk and the integration counters incremented once per page.
+
+        Database work runs in the threadpool, so the sync does not block the
+        event loop it is awaited on (e.g. the API's, for the CRM sync worker).
+
+        Args:
+            tenant_id: Tenant UUID
+            lead_ids: Leads to sync (all leads of the tenant if None)
+            chunk_size: Records per batch request (capped at the CRM limit)
+            concurrency: Concurrent batch requests (default CRM_SYNC_CONCURRENCY)
+            failed_lead_ids: List the IDs of leads that failed to sync are appended to
+
+        Returns:
+            Counts of created, updated, skipped and failed leads
+
+        Raises:
+            ValueError: If CRM integration not configured or disabled
+        """
+        integration = await run_in_threadpool(self.get_integration, tenant_id)
+        if not integration or not integration.enabled:
+            raise ValueError("CRM integration not configured or disabled")
+
+        client = self._get_async_crm_client(integration, await self.get_access_token(integration))
+        chunk_size = min(chunk_size or client.MAX_BATCH_SIZE, client.MAX_BATCH_SIZE)
+        concurrency = concurrency or settings.CRM_SYNC_CONCURRENCY
+        semaphore = asyncio.Semaphore(concurrency)
+        integration_id = integration.id
+        token_key = self.token_key(integration)
+        page_size = chunk_size * concurrency
+        summary = {"created": 0, "updated": 0, "skipped": 0, "failed": 0}
+
+        last_id = None
+        while True:
+            page_count, last_id, creates, updates, skipped = await run_in_threadpool(
+                self._plan_page, integration_id, tenant_id, lead_ids, last_id, page_size
+            )
+            if not page_count:
+                break
+            summary["skipped"] += skipped
+
+            chunks = [("create", creates[i : i + chunk_size]) for i in range(0, len(creates), chunk_size)]
+            chunks += [("update", updates[i : i + chunk_size]) for i in range(0, len(updates), chunk_size)]
+            outcomes = await asyncio.gather(*(self._sync_chunk(client, semaphore, token_key, sync_type, chunk) for sync_type, chunk in chunks))
+
+            now = datetime.now(timezone.utc)
+            logs = []
+            synced_states = []
+            succeeded = failed = 0
+            for (sync_type, chunk), results in zip(chunks, outcomes):
+                for (lead_id, crm_id, payload, hashes), result in zip(chunk, results):
+                    logs.append(
+                        {
+                            "integration_id": integration_id,
+                            "lead_id": lead_id,
+                            "sync_type": sync_type,
+                            "direction": "to_crm",
+                            "status": "success" if result.success else "failed",
+                            "crm_record_id": result.crm_id or crm_id,
+                            "fields_synced": list(payload.keys()) if result.success else None,
+                            "error_message": result.error,
+                            "synced_at": now if result.success else None,
+                        }
+                    )
+                    if result.success:
+                        succeeded += 1
+                        summary["created" if sync_type == "create" else "updated"] += 1
+                        synced_states.append(
+                            {
+                                "integration_id": integration_id,
+                                "lead_id": lead_id,
+                                "crm_record_id": result.crm_id or crm_id,
+                                "field_hashes": hashes,
+                                "synced_at": now,
+                            }
+                        )
+                    else:
+                        failed += 1
+                        summary["failed"] += 1
+                        if failed_lead_ids is not None:
+                            failed_lead_ids.append(lead_id)
+
+            await run_in_threadpool(self._record_page, integration_id, logs, synced_states, succeeded, failed)
+
+            if page_count < page_size:
+                break
+
+        logger.info(f"Bulk CRM sync for tenant {tenant_id}: {summary}")
+        return summary
+
+    def _plan_page(
+        self,
+        integration_id: UUID,
+        tenant_id: UUID,
+        lead_ids: Optional[List[UUID]],
+        after_id: Optional[UUID],
+        limit: int,
+    ) -> Tuple[int, Optional[UUID], List[_SyncItem], List[_SyncItem], int]:
+        """
+        Read the next page of leads and split it into creates, updates and unchanged leads.
+
+        Returns:
+            (leads read, last lead ID, creates, updates, skipped count)
+        """
+        leads = self._get_lead_page(tenant_id, lead_ids, after_id, limit)
+        if not leads:
+            return 0, after_id, [], [], 0
+
+        states = self._get_sync_states(integration_id, [lead.id for lead in leads])
+        creates: List[_SyncItem] = []
+        updates: List[_SyncItem] = []
+        skipped = 0
+        for lead in leads:
+            lead_data = self._prepare_lead_data(lead)
+            hashes = hash_lead_fields(lead_data)
+            state = states.get(lead.id)
+            if state is None:
+                creates.append((lead.id, None, lead_data, hashes))
+                continue
+
+            crm_id, synced_hashes = state
+            changed = {field: value for field, value in lead_data.items() if synced_hashes.get(field) != hashes[field]}
+            if changed:
+                updates.append((lead.id, crm_id, changed, hashes))
+            else:
+                skipped += 1
+        return len(leads), leads[-1].id, creates, updates, skipped
+
+    def _record_page(
+        self,
+        integration_id: UUID,
+        logs: List[Dict[str, Any]],
+        synced_states: List[Dict[str, Any]],
+        succeeded: int,
+        failed: int,
+    ) -> None:
+        """Write the sync logs, sync states and counters of a page and commit."""
+        if logs:
+            self.db.execute(insert(CRMSyncLog), logs)
+        if synced_states:
+            self._save_sync_states(synced_states)
+        if succeeded or failed:
+            self._increment_sync_counters(integration_id, succeeded, failed)
+        self.db.commit()
+
+    async def _sync_chunk(
+        self,
+        client: AsyncCRMClient,
+        semaphore: asyncio.Semaphore,
+        token_key: str,
+        sync_type: str,
+        chunk: List[_SyncItem],
+    ) -> List[CRMBatchResult]:
+        """Send one batch request; a failed request fails every record of the chunk."""
+        async with semaphore:
+            try:
+                if sync_type == "create":
+                    return await client.create_leads([payload for _, _, payload, _ in chunk])
+                return await client.update_leads([(crm_id, payload) for _, crm_id, payload, _ in chunk])
+            except Exception as e:
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 401:
+                    # Revoked or rotated token: fetch a new one next time
+                    get_token_manager().invalidate(token_key)
+                logger.error(f"CRM batch {sync_type} of {len(chunk)} leads failed: {e}")
+                return [CRMBatchResult(success=False, error=str(e)) for _ in chunk]
+
+    def _increment_sync_counters(self, integration_id: UUID, succeeded: int, failed: int) -> None:
+        """
+        Increment the integration sync counters in SQL (safe under concurrent syncs).
+
+        Args:
+            integration_id: CRMIntegration UUID
+            succeeded: Successfully synced records
+            failed: Failed records
+        """
+        values: Dict[str, Any] = {
+            "total_synced": CRMIntegration.total_synced + succeeded,
+            "failed_syncs": CRMIntegration.failed_syncs + failed,
+        }
+        if succeeded:
+            values["last_sync_at"] = datetime.now(timezone.utc)
+        self.db.execute(
+            update(CRMIntegration).where(CRMIntegration.id == integration_id).values(**values).execution_options(synchronize_session=False)
+        )
+
+    def _get_sync_states(self, integration_id: UUID, lead_ids: List[UUID]) -> Dict[UUID, Tuple[str, Dict[str, str]]]:
+        """
+        Get the last synced state of leads.
+
+        Leads synced before sync states were recorded fall back to the CRM
+        record ID of their sync logs (with no field hashes, so all fields
+        are sent once).
+
+        Args:
+            integration_id: CRMIntegration UUID
+            lead_ids: Lead UUIDs
+
+        Returns:
+            (CRM record ID, field hashes) per lead (leads never synced are missing)
+        """
+        rows = (
+            self.db.query(CRMSyncState.lead_id, CRMSyncState.crm_record_id, CRMSyncState.field_hashes)
+            .filter(CRMSyncState.integration_id == integration_id, CRMSyncState.lead_id.in_(lead_ids))
+            .all()
+        )
+        states = {lead_id: (crm_record_id, field_hashes or {}) for lead_id, crm_record_id, field_hashes in rows}
+
+        missing = [lead_id for lead_id in lead_ids if lead_id not in states]
+        if missing:
+            for lead_id, crm_record_id in self._get_crm_record_ids(integration_id, missing).items():
+                states[lead_id] = (crm_record_id, {})
+        return states
+
+    def _save_sync_states(self, states: List[Dict[str, Any]]) -> None:
+        """Upsert sync states in one statement (does not commit)."""
+        stmt = pg_insert(CRMSyncState).values(states)
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[CRMSyncState.integration_id, CRMSyncState.lead_id],
+                set_={
+                    "crm_record_id": stmt.excluded.crm_record_id,
+                    "field_hashes": stmt.excluded.field_hashes,
+                    "synced_at": stmt.excluded.synced_at,
+                },
+            )
+        )
+
+    def _get_lead_page(self, tenant_id: UUID, lead_ids: Optional[List[UUID]], after_id: Optional[UUID], limit: int) -> List[Lead]:
+        """Next page of leads ordered by ID (keyset pagination keeps pages cheap on large tenants)."""
+        query = self.db.query(Lead).filter(Lead.tenant_id == tenant_id)
+        if lead_ids is not None:
+            query = query.filter(Lead.id.in_(lead_ids))
+        if after_id is not None:
+            query = query.filter(Lead.id > after_id)
+        return query.order_by(Lead.id).limit(limit).all()
+
+    def _get_crm_record_ids(self, integration_id: UUID, lead_ids: List[UUID]) -> Dict[UUID, str]:
+        """
+        Get the CRM record IDs of leads from their latest successful syncs.
+
+        Args:
+            integration_id: CRMIntegration UUID
+            lead_ids: Lead UUIDs
+
+        Returns:
+            CRM record ID per lead (leads never synced or deleted are missing)
+        """
+        rows = (
+            self.db.query(CRMSyncLog.lead_id, CRMSyncLog.crm_record_id, CRMSyncLog.sync_type)
+            .filter(
+                CRMSyncLog.integration_id == integration_id,
+                CRMSyncLog.lead_id.in_(lead_ids),
+                CRMSyncLog.direction == "to_crm",
+                CRMSyncLog.status == "success",
+                CRMSyncLog.crm_record_id.isnot(None),
+            )
+            .order_by(CRMSyncLog.created_at)
+            .all()
+        )
+
+        crm_ids: Dict[UUID, str] = {}
+        for lead_id, crm_record_id, sync_type in rows:
+            if sync_type == "delete":
+                crm_ids.pop(lead_id, None)
+            else:
+                crm_ids[lead_id] = crm_record_id
+        return crm_ids
+
+    @staticmethod
+    def token_key(integration: CRMIntegration) -> str:
+        """Token manager key of an integration."""
+        return f"crm:{integration.id}"
+
+    async def get_access_token(self, integration: CRMIntegration) -> str:
+        """
+        Get a valid access token for an integration.
+
+        Tokens are cached until shortly before expiry and refreshed ahead of
+        time in the background (see app.integrations.token_manager); the
+        stored token is used while it is still valid.
+
+        Args:
+            integration: CRMIntegration instance
+
+        Returns:
+            OAuth access token
+        """
+        seed = None
+        if integration.access_token_encrypted and integration.expires_at:
+            seed = AccessToken(
+                access_token=integration.decrypt_access_token(),
+                expires_at=integration.expires_at.timestamp(),
+            )
+
+        integration_id = integration.id
+        token = await get_token_manager().get_token(
+            self.token_key(integration),
+            lambda: run_in_threadpool(refresh_crm_token, integration_id),
+            seed=seed,
+        )
+        return token.access_token
+
+    def _get_crm_client(self, integration: CRMIntegration, access_token: Optional[str] = None):
         """
         Get CRM client based on integration type.
 
         Args:
             integration: CRMIntegration instance
+            access_token: Access token to use instead of the stored one
 
         Returns:
             SalesforceClient or HubSpotClient
@@ -185,7 +578,7 @@ class CRMIntegrationService:
             ValueError: If CRM type is not supported
         """
         config = {
-            "access_token": integration.decrypt_access_token(),
+            "access_token": access_token or integration.decrypt_access_token(),
             "refresh_token": integration.decrypt_refresh_token(),
             "instance_url": integration.instance_url,
             "field_mappings": integration.field_mappings or {},
@@ -198,6 +591,33 @@ class CRMIntegrationService:
         else:
             raise ValueError(f"Unsupported CRM type: {integration.crm_type}")
 
+    def _get_async_crm_client(self, integration: CRMIntegration, access_token: str) -> AsyncCRMClient:
+        """
+        Get async (batch) CRM client based on integration type.
+
+        Args:
+            integration: CRMIntegration instance
+            access_token: Valid access token
+
+        Returns:
+            AsyncSalesforceClient or AsyncHubSpotClient
+
+        Raises:
+            ValueError: If CRM type is not supported
+        """
+        config = {
+            "access_token": access_token,
+            "instance_url": integration.instance_url,
+            "field_mappings": integration.field_mappings or {},
+        }
+
+        if integration.crm_type == "salesforce":
+            return AsyncSalesforceClient(integration.id, config)
+        elif integration.crm_type == "hubspot":
+            return AsyncHubSpotClient(integration.id, config)
+        else:
+            raise ValueError(f"Unsupported CRM type: {integration.crm_type}")
+
     def _prepare_lead_data(self, lead: Lead) -> Dict[str, Any]:
         """
         Prepare lead data for CRM sync.
@@ -225,23 +645,30 @@ class CRMIntegrationService:
         limit: int = 100,
         offset: int = 0,
         status: Optional[str] = None,
-    ) -> tuple[list[CRMSyncLog], int]:
+        cursor: Optional[str] = None,
+        total: TotalMode = "exact",
+    ) -> Page[CRMSyncLog]:
         """
-        Get sync logs for a tenant.
+        Get sync logs for a tenant, newest first.
 
         Args:
             tenant_id: Tenant UUID
             limit: Maximum number of logs to return
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored with a cursor)
             status: Filter by status ('success', 'failed', 'pending')
+            cursor: Keyset cursor from a previous page
+            total: Total count mode ("exact", "estimated" or "none")
 
         Returns:
-            Tuple of (logs, total_count)
+            Page of logs
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         # Get integration
         integration = self.get_integration(tenant_id)
         if not integration:
-            return [], 0
+            return Page(items=[], total=0)
 
         # Build query
         query = self.db.query(CRMSyncLog).filter(CRMSyncLog.integration_id == integration.id)
@@ -249,10 +676,4 @@ class CRMIntegrationService:
         if status:
             query = query.filter(CRMSyncLog.status == status)
 
-        # Get total count
-        total = query.count()
-
-        # Get logs
-        logs = query.order_by(CRMSyncLog.created_at.desc()).limit(limit).offset(offset).all()
-
-        return list(logs), total
+        return paginate_query(query, (CRMSyncLog.created_at, CRMSyncLog.id), limit=limit, cursor=cursor, offset=offset, total=total, max_limit=1000)
@@ -0,0 +1,149 @@
+"""
+CRM Sync Queue
+
+Leads to synchronize to CRM are queued in the same transaction as the lead
+change. The queue holds one row per (integration, lead), so repeated changes
+to a lead before the next sync coalesce into one CRM request. The CRM sync
+worker claims queued leads in batches and syncs them with the CRM batch APIs.
+
+Claims are leases: a lead leaves the queue only once its sync succeeded, so
+leads of a failed sync or a crashed worker are retried after
+CRM_SYNC_LEASE_SECONDS.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.crm_integration import CRMIntegration, CRMSyncQueueItem
+from app.models.lead import Lead
+
+
+def _insert_coalesced(rows):
+    """INSERT ... SELECT of queue rows, coalescing with leads already queued.
+
+    A lead that is queued and unclaimed is left as is. A claimed lead gets a
+    new enqueued_at, so the running sync does not remove it and the new
+    change is synced too.
+    """
+    stmt = insert(CRMSyncQueueItem).from_select(["integration_id", "lead_id", "enqueued_at"], rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["integration_id", "lead_id"],
+        set_={"enqueued_at": stmt.excluded.enqueued_at},
+        where=CRMSyncQueueItem.claimed_until.is_not(None),
+    )
+
+
+class CRMSyncQueue:
+    """Service for queueing and claiming lead syncs."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, tenant_id: UUID, lead_id: UUID) -> None:
+        """Queue a lead for sync if the tenant has an enabled CRM integration (does not commit).
+
+        A single INSERT ... SELECT: no integration lookup round trip, and a
+        lead that is already queued is not queued twice.
+
+        Args:
+            tenant_id: Tenant UUID
+            lead_id: Lead UUID
+        """
+        integrations = select(CRMIntegration.id, literal(lead_id, CRMSyncQueueItem.lead_id.type), func.now()).where(
+            CRMIntegration.tenant_id == tenant_id,
+            CRMIntegration.enabled.is_(True),
+        )
+        self.db.execute(_insert_coalesced(integrations))
+
+    def enqueue_many(self, tenant_id: UUID, lead_ids: List[UUID]) -> None:
+        """Queue several leads of a tenant for sync (does not commit)
+
+        Args:
+            tenant_id: Tenant UUID
+            lead_ids: Lead UUIDs
+        """
+        if not lead_ids:
+            return
+
+        pairs = (
+            select(CRMIntegration.id, Lead.id, func.now())
+            .join(Lead, Lead.tenant_id == CRMIntegration.tenant_id)
+            .where(
+                CRMIntegration.tenant_id == tenant_id,
+                CRMIntegration.enabled.is_(True),
+                Lead.id.in_(lead_ids),
+            )
+        )
+        self.db.execute(_insert_coalesced(pairs))
+
+    def claim_batch(self, limit: int) -> Dict[UUID, Dict[UUID, datetime]]:
+        """Lease the oldest unclaimed queued leads and commit the claim.
+
+        Concurrent workers skip rows claimed by others (FOR UPDATE SKIP
+        LOCKED, and the lease). Settle the claim with `settle` once synced.
+
+        Args:
+            limit: Maximum number of leads to claim
+
+        Returns:
+            enqueued_at per claimed lead ID, per integration ID
+        """
+        now = datetime.now(timezone.utc)
+        oldest = (
+            select(CRMSyncQueueItem.integration_id, CRMSyncQueueItem.lead_id)
+            .where(or_(CRMSyncQueueItem.claimed_until.is_(None), CRMSyncQueueItem.claimed_until <= now))
+            .order_by(CRMSyncQueueItem.enqueued_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = self.db.execute(
+            update(CRMSyncQueueItem)
+            .where(tuple_(CRMSyncQueueItem.integration_id, CRMSyncQueueItem.lead_id).in_(oldest))
+            .values(claimed_until=now + timedelta(seconds=settings.CRM_SYNC_LEASE_SECONDS))
+            .returning(CRMSyncQueueItem.integration_id, CRMSyncQueueItem.lead_id, CRMSyncQueueItem.enqueued_at)
+            .execution_options(synchronize_session=False)
+        ).all()
+        self.db.commit()
+
+        batches: Dict[UUID, Dict[UUID, datetime]] = defaultdict(dict)
+        for integration_id, lead_id, enqueued_at in claimed:
+            batches[integration_id][lead_id] = enqueued_at
+        return dict(batches)
+
+    def settle(self, integration_id: UUID, claimed: Dict[UUID, datetime], failed_lead_ids: Iterable[UUID] = ()) -> None:
+        """Remove synced leads from the queue and commit.
+
+        Synced leads changed again during the sync (newer enqueued_at) are
+        released for the next sync instead. Failed leads keep their lease
+        and are retried once it expires.
+
+        Args:
+            integration_id: CRM integration UUID
+            claimed: enqueued_at per lead ID, as returned by `claim_batch`
+            failed_lead_ids: Leads whose sync failed
+        """
+        failed = set(failed_lead_ids)
+        synced = {lead_id: enqueued_at for lead_id, enqueued_at in claimed.items() if lead_id not in failed}
+        if synced:
+            self.db.execute(
+                delete(CRMSyncQueueItem)
+                .where(
+                    CRMSyncQueueItem.integration_id == integration_id,
+                    tuple_(CRMSyncQueueItem.lead_id, CRMSyncQueueItem.enqueued_at).in_(list(synced.items())),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            self.db.execute(
+                update(CRMSyncQueueItem)
+                .where(CRMSyncQueueItem.integration_id == integration_id, CRMSyncQueueItem.lead_id.in_(list(synced)))
+                .values(claimed_until=None)
+                .execution_options(synchronize_session=False)
+            )
+        self.db.commit()
@@ -0,0 +1,122 @@
+"""
+CRM Sync Worker
+
+Syncs queued leads (see CRMSyncQueue) to CRM with the batch APIs. Runs inside
+the API process (started from the app lifespan) or as a separate process:
+
+    python -m app.services.crm_sync_worker
+
+Several workers may run concurrently: claims use FOR UPDATE SKIP LOCKED and
+a lease, so each queued lead is synced by one worker at a time. Leads leave
+the queue once synced; failed leads are retried when their lease expires.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal, scope_session_to_tenant
+from app.core.http_clients import close_http_clients
+from app.models.crm_integration import CRMIntegration
+from app.services.crm_integration_service import CRMIntegrationService
+from app.services.crm_sync_queue import CRMSyncQueue
+
+logger = logging.getLogger(__name__)
+
+
+def _load_integration(db: Session, integration_id: UUID) -> Optional[CRMIntegration]:
+    """Load an enabled integration and scope the session to its tenant"""
+    integration = db.query(CRMIntegration).filter(CRMIntegration.id == integration_id).first()
+    if not integration or not integration.enabled:
+        return None
+
+    # RLS: leads are read across the sync's transactions
+    scope_session_to_tenant(db, integration.tenant_id)
+    return integration
+
+
+async def _sync_integration(integration_id: UUID, claimed: Dict[UUID, datetime]) -> None:
+    """Sync the claimed leads of one integration in its own session and settle the claim"""
+    lead_ids = list(claimed)
+    db = SessionLocal()
+    try:
+        integration = await run_in_threadpool(_load_integration, db, integration_id)
+        failed_lead_ids: List[UUID] = []
+        if integration is not None:
+            await CRMIntegrationService(db).sync_leads_bulk(integration.tenant_id, lead_ids=lead_ids, failed_lead_ids=failed_lead_ids)
+            if failed_lead_ids:
+                logger.warning(f"CRM sync of integration {integration_id}: {len(failed_lead_ids)} of {len(lead_ids)} leads failed")
+
+        # Leads of disabled integrations are dropped, as they would not be synced
+        await run_in_threadpool(CRMSyncQueue(db).settle, integration_id, claimed, failed_lead_ids)
+    except Exception as e:
+        # The claimed leads stay queued and are retried when their lease expires
+        db.rollback()
+        logger.error(f"CRM sync of integration {integration_id} failed: {e}")
+    finally:
+        db.close()
+
+
+async def process_crm_sync_batch(batch_size: Optional[int] = None) -> int:
+    """Claim one batch of queued leads and sync them.
+
+    Integrations of a batch are synced concurrently (each with its own
+    session and bounded request concurrency).
+
+    Args:
+        batch_size: Maximum leads to claim (defaults to CRM_SYNC_BATCH_SIZE)
+
+    Returns:
+        Number of leads claimed
+    """
+    db = SessionLocal()
+    try:
+        batches = await run_in_threadpool(CRMSyncQueue(db).claim_batch, batch_size or settings.CRM_SYNC_BATCH_SIZE)
+    finally:
+        db.close()
+
+    await asyncio.gather(*(_sync_integration(integration_id, claimed) for integration_id, claimed in batches.items()))
+    return sum(len(claimed) for claimed in batches.values())
+
+
+async def run_crm_sync_worker(stop_event: asyncio.Event) -> None:
+    """Sync queued leads until `stop_event` is set.
+
+    Polls again immediately while batches come back full, otherwise waits
+    CRM_SYNC_POLL_INTERVAL seconds.
+    """
+    while not stop_event.is_set():
+        claimed = 0
+        try:
+            claimed = await process_crm_sync_batch()
+        except Exception as e:
+            logger.error(f"CRM sync batch failed: {e}")
+
+        if claimed >= settings.CRM_SYNC_BATCH_SIZE:
+            continue
+
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.CRM_SYNC_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=settings.LOG_LEVEL)
+
+    async def main() -> None:
+        try:
+            await run_crm_sync_worker(asyncio.Event())
+        finally:
+            await close_http_clients()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -6,13 +6,15 @@ Handles error logging, retrieval, and analysis.
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import desc, func
 from sqlalchemy.orm import Session
 
 from app.models.error_log import Environment, ErrorLog, ErrorSeverity
+from app.utils.helpers import Page, TotalMode, paginate_query
+from app.utils.projection import project
 
 logger = logging.getLogger(__name__)
 
@@ -136,7 +138,10 @@ class ErrorLogService:
         workflow_name: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[List[ErrorLog], int]:
+        cursor: Optional[str] = None,
+        total: TotalMode = "exact",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[ErrorLog]:
         """
         Get error logs with optional filtering
 
@@ -151,11 +156,17 @@ class ErrorLogService:
             end_date: Filter by end date
             correlation_id: Filter by correlation ID
             workflow_name: Filter by workflow name
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored with a cursor)
             limit: Maximum number of records to return
+            cursor: Keyset cursor from a previous page
+            total: Total count mode ("exact", "estimated" or "none")
+            fields: Return rows of only these columns (plus the sort columns) instead of entities
 
         Returns:
-            tuple: (List of error logs, total count)
+            Page of error logs (newest first)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         query = db.query(ErrorLog)
 
@@ -187,13 +198,10 @@ class ErrorLogService:
         if workflow_name:
             query = query.filter(ErrorLog.workflow_name == workflow_name)
 
-        # Get total count
-        total_count = query.count()
-
-        # Order by created_at descending (newest first)
-        logs = query.order_by(desc(ErrorLog.created_at)).offset(skip).limit(limit).all()
-
-        return logs, total_count
+        order_by = (ErrorLog.created_at, ErrorLog.id)
+        if fields is not None:
+            query = project(query, ErrorLog, fields, order_by)
+        return paginate_query(query, order_by, limit=limit, cursor=cursor, offset=skip, total=total, max_limit=1000)
 
     @staticmethod
     def get_error_summary(
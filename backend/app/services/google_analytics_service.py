@@ -8,10 +8,16 @@ import uuid
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.integrations.google_analytics import GA4MeasurementProtocol
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.http_clients import get_http_clients
+from app.integrations.google_analytics import GA4EventBatcher, GA4MeasurementProtocol, GA4Target
+from app.models.assessment import Assessment
 from app.models.google_analytics_integration import GoogleAnalyticsIntegration
 from app.schemas.google_analytics import (
     GoogleAnalyticsIntegrationCreate,
@@ -105,6 +111,28 @@ class GoogleAnalyticsService:
         """
         return self.db.query(GoogleAnalyticsIntegration).filter(GoogleAnalyticsIntegration.tenant_id == tenant_id).first()
 
+    def get_server_target(self, tenant_id: UUID) -> Optional[GA4Target]:
+        """Get Measurement Protocol credentials for server-side events
+
+        Args:
+            tenant_id: Tenant UUID
+
+        Returns:
+            GA4Target, or None if server-side tracking is not enabled and configured
+        """
+        integration = self.get_by_tenant(tenant_id)
+        if not integration or not integration.enabled or not integration.track_server_events:
+            return None
+
+        if not integration.measurement_protocol_api_secret:
+            logger.warning(f"GA4 Measurement Protocol API Secret not configured for tenant {tenant_id}")
+            return None
+
+        return GA4Target(
+            measurement_id=integration.measurement_id,
+            api_secret=integration.measurement_protocol_api_secret,
+        )
+
     def get_by_id(self, integration_id: UUID) -> Optional[GoogleAnalyticsIntegration]:
         """Get GA4 integration by ID
 
@@ -191,24 +219,55 @@ class GoogleAnalyticsService:
             Public GA4 configuration (measurement_id, enabled, track_embed_widget)
             or None if not found
         """
-        # TODO: Implement assessment -> tenant lookup
-        # For now, this is a placeholder
-        # In production, fetch tenant_id from assessment table, then get GA4 config
-
-        # Example implementation:
-        # assessment = self.db.query(Assessment).filter(Assessment.id == assessment_id).first()
-        # if not assessment:
-        #     return None
-        #
-        # integration = self.get_by_tenant(assessment.tenant_id)
-        # if not integration or not integration.enabled:
-        #     return None
-        #
-        # return {
-        #     "measurement_id": integration.measurement_id,
-        #     "enabled": integration.enabled,
-        #     "track_embed_widget": integration.track_embed_widget
-        # }
-
-        logger.warning("get_public_config not fully implemented - requires Assessment model")
-        return None
+        tenant_id = self.db.query(Assessment.tenant_id).filter(Assessment.id == assessment_id).scalar()
+        if not tenant_id:
+            return None
+
+        integration = self.get_by_tenant(tenant_id)
+        if not integration or not integration.enabled:
+            return None
+
+        return {
+            "measurement_id": integration.measurement_id,
+            "enabled": integration.enabled,
+            "track_embed_widget": integration.track_embed_widget,
+        }
+
+
+def load_ga4_target(tenant_id: UUID) -> Optional[GA4Target]:
+    """Load a tenant's server-side GA4 target in a short-lived session"""
+    db = SessionLocal()
+    try:
+        # RLS: google_analytics_integrations is tenant-scoped
+        db.execute(
+            text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"),
+            {"tenant_id": str(tenant_id)},
+        )
+        return GoogleAnalyticsService(db).get_server_target(tenant_id)
+    finally:
+        db.close()
+
+
+_ga4_batcher: Optional[GA4EventBatcher] = None
+
+
+def get_ga4_batcher() -> GA4EventBatcher:
+    """Get the process-wide GA4 event batcher (created on first use)"""
+    global _ga4_batcher
+    if _ga4_batcher is None:
+        _ga4_batcher = GA4EventBatcher(
+            target_loader=lambda tenant_id: run_in_threadpool(load_ga4_target, tenant_id),
+            http_client=get_http_clients().async_client("ga4"),
+            max_events=settings.GA4_BATCH_MAX_EVENTS,
+            max_wait_ms=settings.GA4_BATCH_MAX_WAIT_MS,
+            max_pending=settings.GA4_BATCH_MAX_PENDING,
+        )
+    return _ga4_batcher
+
+
+async def close_ga4_batcher() -> None:
+    """Send pending GA4 events"""
+    global _ga4_batcher
+    batcher, _ga4_batcher = _ga4_batcher, None
+    if batcher is not None:
+        await batcher.flush()
@@ -0,0 +1,317 @@
+"""
+Hot Lead Leaderboard
+
+Per-tenant ranking of open leads with a hot score (score >= HOT_MIN and
+status new / contacted / qualified), ordered by score, then lead ID (both
+descending). Serves top-N pages and the rank of a lead in O(log n) instead
+of sorting every hot lead of the tenant per request.
+
+A tenant's leaderboard is loaded from the database on first use and kept in
+sync by LeadService after each committed score or status change. Bulk jobs
+invalidate it, and every leaderboard is rebuilt after
+HOT_LEAD_LEADERBOARD_TTL seconds, which bounds the staleness left by writes
+that bypass the services.
+
+Uses a Redis sorted set when HOT_LEAD_LEADERBOARD_BACKEND=redis. Redis
+errors are logged and reported as a missing leaderboard, so callers fall
+back to the database. The in-process backend (the default) keeps one copy
+per worker, which only sees the changes made on its own worker, so it is
+never served: without a shared backend hot leads are queried from the
+database.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sortedcontainers import SortedList
+
+from app.core.config import settings
+from app.core.constants import LeadScoreThreshold
+from app.utils.helpers import decode_cursor
+
+logger = logging.getLogger(__name__)
+
+HOT_LEAD_STATUSES = ("new", "contacted", "qualified")
+
+# (score, lead ID) of a ranked lead
+Entry = Tuple[int, UUID]
+# (lead ID, entry before, entry after) of a lead change; None = not ranked
+Change = Tuple[UUID, Optional[Entry], Optional[Entry]]
+
+
+def ranked_entry(lead_id: UUID, status: str, score: int) -> Optional[Entry]:
+    """Leaderboard entry of a lead, or None if the lead is not an open hot lead"""
+    if status in HOT_LEAD_STATUSES and score >= LeadScoreThreshold.HOT_MIN:
+        return (score, lead_id)
+    return None
+
+
+def decode_leaderboard_cursor(cursor: str) -> Entry:
+    """
+    Decode a hot lead page cursor (see cursor_for with HOT_LEAD_ORDER).
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    values = decode_cursor(cursor).get("k")
+    if not isinstance(values, list) or len(values) != 2:
+        raise ValueError("Invalid cursor")
+    try:
+        return (int(values[0]), UUID(values[1]))
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+class HotLeadLeaderboard(ABC):
+    """Base class for leaderboard backends.
+
+    Reads return None when the tenant's leaderboard is not loaded (or the
+    backend failed); callers then load it or query the database.
+    """
+
+    # Whether all workers see the same leaderboards (only shared ones are served)
+    shared: bool = False
+
+    @abstractmethod
+    def load(self, tenant_id: UUID, entries: Iterable[Entry]) -> None:
+        """Replace a tenant's leaderboard with `entries`"""
+
+    @abstractmethod
+    def apply(self, tenant_id: UUID, changes: Iterable[Change]) -> None:
+        """Apply lead changes to a loaded leaderboard (no-op if not loaded)"""
+
+    @abstractmethod
+    def top(self, tenant_id: UUID, limit: Optional[int] = None, min_score: int = 0, after: Optional[Entry] = None) -> Optional[List[Entry]]:
+        """Highest entries with score >= `min_score`, starting after `after`"""
+
+    @abstractmethod
+    def rank(self, tenant_id: UUID, entry: Entry) -> Optional[int]:
+        """1-based rank of an entry (0 if not on the leaderboard)"""
+
+    @abstractmethod
+    def invalidate(self, tenant_id: UUID) -> None:
+        """Drop a tenant's leaderboard (rebuilt on next use)"""
+
+    def lead_changed(self, tenant_id: UUID, lead_id: UUID, old: Optional[Tuple[str, int]] = None, new: Optional[Tuple[str, int]] = None) -> None:
+        """Apply a lead created (old=None), changed or deleted (new=None)
+
+        Args:
+            tenant_id: Tenant UUID
+            lead_id: Lead UUID
+            old: (status, score) before the committed mutation
+            new: (status, score) after the committed mutation
+        """
+        old_entry = ranked_entry(lead_id, *old) if old else None
+        new_entry = ranked_entry(lead_id, *new) if new else None
+        if old_entry != new_entry:
+            self.apply(tenant_id, [(lead_id, old_entry, new_entry)])
+
+
+class MemoryHotLeadLeaderboard(HotLeadLeaderboard):
+    """In-process leaderboards (thread-safe), least recently used tenants evicted."""
+
+    def __init__(self, ttl: int = 300, max_tenants: int = 1000):
+        self.ttl = ttl
+        self.max_tenants = max_tenants
+        self._boards: "OrderedDict[UUID, Tuple[float, SortedList]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _board(self, tenant_id: UUID) -> Optional[SortedList]:
+        """Loaded, unexpired leaderboard of a tenant (call with the lock held)"""
+        loaded = self._boards.get(tenant_id)
+        if loaded is None:
+            return None
+        expires_at, board = loaded
+        if expires_at <= time.monotonic():
+            del self._boards[tenant_id]
+            return None
+        self._boards.move_to_end(tenant_id)
+        return board
+
+    def load(self, tenant_id: UUID, entries: Iterable[Entry]) -> None:
+        board = SortedList(entries)
+        with self._lock:
+            self._boards[tenant_id] = (time.monotonic() + self.ttl, board)
+            self._boards.move_to_end(tenant_id)
+            while len(self._boards) > self.max_tenants:
+                self._boards.popitem(last=False)
+
+    def apply(self, tenant_id: UUID, changes: Iterable[Change]) -> None:
+        with self._lock:
+            board = self._board(tenant_id)
+            if board is None:
+                return
+            for _, old, new in changes:
+                if old is not None:
+                    board.discard(old)
+                if new is not None:
+                    board.add(new)
+
+    def top(self, tenant_id: UUID, limit: Optional[int] = None, min_score: int = 0, after: Optional[Entry] = None) -> Optional[List[Entry]]:
+        with self._lock:
+            board = self._board(tenant_id)
+            if board is None:
+                return None
+            stop = board.bisect_left(after) if after is not None else len(board)
+            start = board.bisect_left((min_score,))
+            if limit is not None:
+                start = max(start, stop - limit)
+            return list(board.islice(start, stop, reverse=True))
+
+    def rank(self, tenant_id: UUID, entry: Entry) -> Optional[int]:
+        with self._lock:
+            board = self._board(tenant_id)
+            if board is None:
+                return None
+            index = board.bisect_left(entry)
+            if index == len(board) or board[index] != entry:
+                return 0
+            return len(board) - index
+
+    def invalidate(self, tenant_id: UUID) -> None:
+        with self._lock:
+            self._boards.pop(tenant_id, None)
+
+    def clear(self) -> None:
+        """Drop all leaderboards."""
+        with self._lock:
+            self._boards.clear()
+
+
+class RedisHotLeadLeaderboard(HotLeadLeaderboard):
+    """Redis leaderboards (shared by all workers).
+
+    Each tenant is one sorted set (`hot_leads:<tenant_id>`) whose members all
+    have score 0 and are ordered lexicographically as `<score:03d>:<lead_id>`,
+    so pages continue after the exact (score, lead ID) of a cursor. An empty
+    member marks the set as loaded even when the tenant has no hot leads.
+    """
+
+    LOADED_MARKER = ""
+    shared = True
+
+    # Changes only apply to loaded sets: a partial set would hide hot leads until expiry
+    APPLY_SCRIPT = """
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return 0
+    end
+    local removed = tonumber(ARGV[1])
+    for i = 2, removed + 1 do
+        redis.call('ZREM', KEYS[1], ARGV[i])
+    end
+    for i = removed + 2, #ARGV do
+        redis.call('ZADD', KEYS[1], 0, ARGV[i])
+    end
+    return 1
+    """
+
+    def __init__(self, client, key_prefix: str = "", ttl: int = 300):
+        self.client = client
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+        self._apply_script = client.register_script(self.APPLY_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "", ttl: int = 300) -> "RedisHotLeadLeaderboard":
+        import redis
+
+        client = redis.Redis.from_url(
+            url,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+        return cls(client, key_prefix=key_prefix, ttl=ttl)
+
+    def _key(self, tenant_id: UUID) -> str:
+        return f"{self.key_prefix}hot_leads:{tenant_id}"
+
+    @staticmethod
+    def _member(entry: Entry) -> str:
+        score, lead_id = entry
+        return f"{score:03d}:{lead_id}"
+
+    @staticmethod
+    def _entry(member) -> Entry:
+        member = member.decode() if isinstance(member, bytes) else member
+        score, lead_id = member.split(":", 1)
+        return (int(score), UUID(lead_id))
+
+    def load(self, tenant_id: UUID, entries: Iterable[Entry]) -> None:
+        key = self._key(tenant_id)
+        members = {self.LOADED_MARKER: 0, **{self._member(entry): 0 for entry in entries}}
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.delete(key)
+            pipe.zadd(key, members)
+            pipe.expire(key, self.ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Hot lead leaderboard load failed for tenant {tenant_id}: {e}")
+
+    def apply(self, tenant_id: UUID, changes: Iterable[Change]) -> None:
+        removed, added = [], []
+        for _, old, new in changes:
+            if old is not None:
+                removed.append(self._member(old))
+            if new is not None:
+                added.append(self._member(new))
+        if not removed and not added:
+            return
+        try:
+            self._apply_script(keys=[self._key(tenant_id)], args=[len(removed), *removed, *added])
+        except Exception as e:
+            logger.warning(f"Hot lead leaderboard update failed for tenant {tenant_id}: {e}")
+            self.invalidate(tenant_id)
+
+    def top(self, tenant_id: UUID, limit: Optional[int] = None, min_score: int = 0, after: Optional[Entry] = None) -> Optional[List[Entry]]:
+        key = self._key(tenant_id)
+        upper = f"({self._member(after)}" if after is not None else "+"
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.exists(key)
+            if limit is not None:
+                pipe.zrevrangebylex(key, upper, f"[{min_score:03d}:", start=0, num=limit)
+            else:
+                pipe.zrevrangebylex(key, upper, f"[{min_score:03d}:")
+            exists, members = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Hot lead leaderboard read failed for tenant {tenant_id}: {e}")
+            return None
+        if not exists:
+            return None
+        return [self._entry(member) for member in members]
+
+    def rank(self, tenant_id: UUID, entry: Entry) -> Optional[int]:
+        key = self._key(tenant_id)
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.exists(key)
+            pipe.zrevrank(key, self._member(entry))
+            exists, index = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Hot lead leaderboard read failed for tenant {tenant_id}: {e}")
+            return None
+        if not exists:
+            return None
+        return 0 if index is None else index + 1
+
+    def invalidate(self, tenant_id: UUID) -> None:
+        try:
+            self.client.delete(self._key(tenant_id))
+        except Exception as e:
+            logger.warning(f"Hot lead leaderboard invalidation failed for tenant {tenant_id}: {e}")
+
+
+@lru_cache()
+def get_hot_lead_leaderboard() -> HotLeadLeaderboard:
+    """Get the configured leaderboard backend (cached)."""
+    if settings.HOT_LEAD_LEADERBOARD_BACKEND == "redis":
+        return RedisHotLeadLeaderboard.from_url(settings.REDIS_URL, key_prefix=settings.CACHE_KEY_PREFIX, ttl=settings.HOT_LEAD_LEADERBOARD_TTL)
+
+    return MemoryHotLeadLeaderboard(ttl=settings.HOT_LEAD_LEADERBOARD_TTL, max_tenants=settings.HOT_LEAD_LEADERBOARD_MAX_TENANTS)
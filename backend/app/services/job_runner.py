@@ -0,0 +1,221 @@
+"""
+Background Job Runner
+
+Skeleton shared by the chunked background jobs (lead import, lead bulk
+update, assessment rescore). A job row records status and progress; `run`
+marks it running, processes it chunk by chunk (each chunk commits its
+progress, which also bumps the job's updated_at) and marks it completed or
+failed. Chunks committed before a failure are kept.
+
+Jobs run as background tasks of the API process that accepted them, so a
+restart loses the ones in flight. The recovery worker marks pending and
+running jobs that recorded no progress for JOB_STALE_SECONDS as failed,
+with the same repairs as any other failed job. It runs periodically inside
+the API processes (started from the app lifespan); one process per
+deployment, elected with a LeaderLock, runs the sweeps.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Generic, Optional, Sequence, Type, TypeVar
+from uuid import UUID
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import LeaderLock, SessionLocal, scope_session_to_tenant
+from app.models.tenant import Tenant
+from app.services.hot_lead_leaderboard import get_hot_lead_leaderboard
+from app.services.tenant_counter_service import TenantCounterService
+
+logger = logging.getLogger(__name__)
+
+JobT = TypeVar("JobT")
+
+# Recorded on jobs found without progress
+STALE_JOB_ERROR = "Interrupted: the job stopped making progress (server restarted?)"
+
+
+class JobService(Generic[JobT]):
+    """Base of services running a chunked job recorded in a job table.
+
+    Subclasses set the class attributes and implement `_process` (and
+    optionally `_on_completed` / `_summary`).
+    """
+
+    job_model: Type[JobT]
+    statuses: Type  # PENDING / RUNNING / COMPLETED / FAILED values of the job model
+    label: str  # Job kind in log messages
+    # Chunks write leads in bulk, bypassing the per-lead counter deltas and
+    # leaderboard updates: counters are recounted and the tenant's leaderboard
+    # rebuilt once the job ends, whether it completed or failed
+    bulk_lead_writes: bool = False
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_job(self, job_id: UUID, tenant_id: UUID) -> Optional[JobT]:
+        """Get a job with tenant isolation"""
+        model = self.job_model
+        return self.db.query(model).filter(model.id == job_id, model.tenant_id == tenant_id).first()
+
+    def _add_job(self, job: JobT) -> JobT:
+        """Store a new pending job (commits)"""
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    def run(self, job: JobT, *args: Any, **kwargs: Any) -> JobT:
+        """
+        Run a pending job; arguments are passed on to `_process`.
+
+        Returns:
+            Completed or failed job
+        """
+        job.status = self.statuses.RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        self.db.commit()
+
+        try:
+            self._process(job, *args, **kwargs)
+        except Exception as e:
+            logger.exception(f"{self.label} {job.id} failed")
+            self.db.rollback()
+            job.status = self.statuses.FAILED
+            job.error_message = str(e)
+            job.finished_at = datetime.now(timezone.utc)
+            self.db.commit()
+            if self.bulk_lead_writes:
+                # Chunks committed before the failure changed leads too
+                self._repair_leads(job.tenant_id)
+            return job
+
+        job.status = self.statuses.COMPLETED
+        job.finished_at = datetime.now(timezone.utc)
+        if self.bulk_lead_writes:
+            TenantCounterService(self.db).reconcile(job.tenant_id)
+        self._on_completed(job)
+        self.db.commit()
+        if self.bulk_lead_writes:
+            get_hot_lead_leaderboard().invalidate(job.tenant_id)
+        logger.info(f"{self.label} {job.id}: {self._summary(job)}")
+        return job
+
+    def fail_stale_jobs(self, tenant_id: UUID) -> int:
+        """Mark a tenant's jobs without progress for JOB_STALE_SECONDS failed (commits)
+
+        Returns:
+            Number of jobs marked failed
+        """
+        model = self.job_model
+        failed = self.db.execute(
+            update(model)
+            .where(
+                model.tenant_id == tenant_id,
+                model.status.in_([self.statuses.PENDING, self.statuses.RUNNING]),
+                model.updated_at < func.now() - timedelta(seconds=settings.JOB_STALE_SECONDS),
+            )
+            .values(status=self.statuses.FAILED, error_message=STALE_JOB_ERROR, finished_at=func.now())
+        ).rowcount
+        repair = bool(failed) and self.bulk_lead_writes
+        if repair:
+            # Chunks committed before the interruption changed leads too
+            TenantCounterService(self.db).reconcile(tenant_id)
+        self.db.commit()
+        if repair:
+            get_hot_lead_leaderboard().invalidate(tenant_id)
+        return failed
+
+    def _process(self, job: JobT, *args: Any, **kwargs: Any) -> None:
+        """Process the job chunk by chunk, committing each chunk with the job's progress"""
+        raise NotImplementedError
+
+    def _on_completed(self, job: JobT) -> None:
+        """Writes committed with the completed status (summary events)"""
+
+    def _summary(self, job: JobT) -> str:
+        """Outcome of a completed job for the log"""
+        return "completed"
+
+    def _repair_leads(self, tenant_id: UUID) -> None:
+        """Recount the tenant's counters and drop its leaderboard after a failed bulk write"""
+        try:
+            TenantCounterService(self.db).reconcile(tenant_id)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Counter reconciliation of tenant {tenant_id} after a failed {self.label.lower()} failed: {e}")
+        get_hot_lead_leaderboard().invalidate(tenant_id)
+
+
+def run_job(service_class: Type[JobService], job_id: UUID, tenant_id: UUID, *args: Any) -> None:
+    """Run a job in its own session (background task); arguments are passed on to `run`"""
+    db = SessionLocal()
+    try:
+        # RLS: the job spans several transactions
+        scope_session_to_tenant(db, tenant_id)
+        service = service_class(db)
+        job = service.get_job(job_id, tenant_id)
+        if job is None:
+            logger.error(f"{service.label} job {job_id} not found")
+            return
+        service.run(job, *args)
+    finally:
+        db.close()
+
+
+def recover_stale_jobs(service_classes: Sequence[Type[JobService]]) -> int:
+    """Fail the stale jobs of every tenant, one transaction per tenant and job kind
+
+    Returns:
+        Number of jobs marked failed
+    """
+    db = SessionLocal()
+    try:
+        tenant_ids = list(db.execute(select(Tenant.id)).scalars())
+        db.rollback()
+
+        recovered = 0
+        for tenant_id in tenant_ids:
+            for service_class in service_classes:
+                try:
+                    # RLS: jobs are tenant scoped
+                    db.execute(text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"), {"tenant_id": str(tenant_id)})
+                    failed = service_class(db).fail_stale_jobs(tenant_id)
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Stale {service_class.label.lower()} recovery of tenant {tenant_id} failed: {e}")
+                    continue
+                if failed:
+                    recovered += failed
+                    logger.warning(f"Marked {failed} stale {service_class.label.lower()} jobs of tenant {tenant_id} failed")
+        return recovered
+    finally:
+        db.close()
+
+
+async def run_job_recovery(stop_event: asyncio.Event, service_classes: Sequence[Type[JobService]]) -> None:
+    """Recover stale jobs every JOB_RECOVERY_INTERVAL seconds until `stop_event` is set
+
+    Only the process holding the recovery's leader lock runs the sweeps.
+    """
+    leader = LeaderLock("stale_job_recovery")
+    try:
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=settings.JOB_RECOVERY_INTERVAL)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                if await run_in_threadpool(leader.acquire):
+                    await run_in_threadpool(recover_stale_jobs, service_classes)
+            except Exception as e:
+                logger.error(f"Stale job recovery failed: {e}")
+    finally:
+        await run_in_threadpool(leader.release)
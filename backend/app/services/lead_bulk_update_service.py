@@ -0,0 +1,256 @@
+"""
+Lead Bulk Update Service
+
+Applies a status, score and/or assignment change to a set of leads, selected
+by ID list or by the list filters. The set is walked in lead ID order; each
+chunk is locked and updated by a single UPDATE ... RETURNING, and the
+returned old/new values feed one bulk audit log insert, one aggregated GA4
+event, at most one Teams summary of leads that became hot, one CRM sync
+enqueue and one tenant counter delta. Everything a chunk writes, including the job's progress, commits
+together, so a chunk is applied entirely or not at all; the committed chunk
+is then applied to the tenant's hot lead leaderboard.
+
+Leads whose fields already hold the requested values are not selected, and a
+status change never moves a lead out of "converted" (as in
+LeadService.update_status).
+"""
+
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, case, func, insert, or_, select, update
+from sqlalchemy.engine import Row
+
+from app.core.config import settings
+from app.models.audit_log import AuditAction, AuditLog, AuditLogEntity
+from app.models.lead import Lead
+from app.models.lead_bulk_update_job import LeadBulkUpdateJob, LeadBulkUpdateStatus
+from app.models.outbox_event import OutboxEventType
+from app.schemas.lead import LeadBulkUpdate
+from app.services.crm_sync_queue import CRMSyncQueue
+from app.services.hot_lead_leaderboard import get_hot_lead_leaderboard, ranked_entry
+from app.services.job_runner import JobService, run_job
+from app.services.outbox_service import OutboxService
+from app.services.tenant_counter_service import TenantCounterService, counter_deltas, lead_counters
+
+logger = logging.getLogger(__name__)
+
+# Score at which a lead counts as hot (Teams notification threshold)
+HOT_LEAD_SCORE = 80
+
+CHANGE_COLUMNS = {"status": Lead.status, "score": Lead.score, "assigned_to": Lead.assigned_to}
+
+
+def _json_value(value: Any) -> Any:
+    return str(value) if isinstance(value, UUID) else value
+
+
+class LeadBulkUpdateService(JobService[LeadBulkUpdateJob]):
+    """Service for bulk lead update jobs."""
+
+    job_model = LeadBulkUpdateJob
+    statuses = LeadBulkUpdateStatus
+    label = "Lead bulk update"
+
+    def create_job(self, tenant_id: UUID, created_by: UUID, data: LeadBulkUpdate) -> LeadBulkUpdateJob:
+        """Create a pending job and count the leads it matches (commits)
+
+        Args:
+            tenant_id: Tenant UUID
+            created_by: Requesting user (recorded as updated_by and in the audit log)
+            data: Selection and changes
+
+        Returns:
+            Pending job
+        """
+        if data.lead_ids is not None:
+            selection = {"lead_ids": [str(lead_id) for lead_id in data.lead_ids]}
+        else:
+            selection = {"filter": data.filter.model_dump(mode="json", exclude_none=True)}
+        job = LeadBulkUpdateJob(
+            tenant_id=tenant_id,
+            created_by=created_by,
+            selection=selection,
+            changes={field: _json_value(value) for field, value in data.changes().items()},
+            reason=data.reason,
+            status=LeadBulkUpdateStatus.PENDING,
+        )
+        job.total_rows = self.db.query(func.count(Lead.id)).filter(*self._conditions(job)).scalar() or 0
+        return self._add_job(job)
+
+    def run(self, job: LeadBulkUpdateJob, chunk_size: Optional[int] = None) -> LeadBulkUpdateJob:
+        """
+        Apply the job's changes chunk by chunk.
+
+        Args:
+            job: Pending job
+            chunk_size: Leads per chunk (default LEAD_BULK_UPDATE_CHUNK_SIZE)
+
+        Returns:
+            Completed or failed job
+        """
+        return super().run(job, chunk_size or settings.LEAD_BULK_UPDATE_CHUNK_SIZE)
+
+    def _process(self, job: LeadBulkUpdateJob, chunk_size: int) -> None:
+        after: Optional[UUID] = None
+        while True:
+            rows = self._update_chunk(job, after, chunk_size)
+            if rows:
+                self._record_chunk(job, rows)
+                after = max(row.id for row in rows)
+            job.updated_rows += len(rows)
+            self.db.commit()
+            self._update_leaderboard(job, rows)
+            if len(rows) < chunk_size:
+                break
+
+    def _summary(self, job: LeadBulkUpdateJob) -> str:
+        return f"{job.updated_rows} of {job.total_rows} leads updated"
+
+    def _conditions(self, job: LeadBulkUpdateJob) -> List[Any]:
+        """WHERE conditions selecting the leads the job still has to change"""
+        conditions = [Lead.tenant_id == job.tenant_id]  # REQUIRED: Tenant filtering
+
+        if "lead_ids" in job.selection:
+            conditions.append(Lead.id.in_([UUID(lead_id) for lead_id in job.selection["lead_ids"]]))
+        else:
+            filters = job.selection["filter"]
+            if "status" in filters:
+                conditions.append(Lead.status == filters["status"])
+            if "min_score" in filters:
+                conditions.append(Lead.score >= filters["min_score"])
+            if "max_score" in filters:
+                conditions.append(Lead.score <= filters["max_score"])
+            if "assigned_to" in filters:
+                conditions.append(Lead.assigned_to == UUID(filters["assigned_to"]))
+
+        changes = self._change_values(job)
+        # Skip leads that already hold the requested values
+        conditions.append(or_(*(CHANGE_COLUMNS[field].is_distinct_from(value) for field, value in changes.items())))
+        if changes.get("status", "converted") != "converted":
+            conditions.append(Lead.status != "converted")
+        return conditions
+
+    @staticmethod
+    def _change_values(job: LeadBulkUpdateJob) -> Dict[str, Any]:
+        changes = dict(job.changes)
+        if changes.get("assigned_to") is not None:
+            changes["assigned_to"] = UUID(changes["assigned_to"])
+        return changes
+
+    def _chunk_update_statement(self, job: LeadBulkUpdateJob, after: Optional[UUID], limit: int):
+        """UPDATE ... RETURNING of the next `limit` matching leads after `after` in ID order"""
+        conditions = self._conditions(job)
+        if after is not None:
+            conditions.append(Lead.id > after)
+        chunk = (
+            select(Lead.id, Lead.status.label("old_status"), Lead.score.label("old_score"), Lead.assigned_to.label("old_assigned_to"))
+            .where(and_(*conditions))
+            .order_by(Lead.id)
+            .limit(limit)
+            .with_for_update()
+            .cte("chunk")
+        )
+
+        changes = self._change_values(job)
+        values: Dict[str, Any] = {
+            **changes,
+            "updated_by": job.created_by,
+            "updated_at": func.now(),
+            "last_activity_at": func.now(),
+        }
+        if changes.get("status") == "contacted":
+            # SET expressions see the old row
+            values["last_contacted_at"] = case((Lead.status == "new", func.now()), else_=Lead.last_contacted_at)
+
+        return (
+            update(Lead)
+            .where(Lead.id == chunk.c.id)
+            .values(**values)
+            .returning(
+                Lead.id,
+                Lead.name,
+                Lead.status,
+                Lead.score,
+                Lead.assigned_to,
+                chunk.c.old_status,
+                chunk.c.old_score,
+                chunk.c.old_assigned_to,
+            )
+        )
+
+    def _update_chunk(self, job: LeadBulkUpdateJob, after: Optional[UUID], limit: int) -> Sequence[Row]:
+        """Lock and update the next chunk (does not commit)
+
+        Returns:
+            Updated leads with their old and new values
+        """
+        return self.db.execute(self._chunk_update_statement(job, after, limit)).all()
+
+    def _record_chunk(self, job: LeadBulkUpdateJob, rows: Sequence[Row]) -> None:
+        """Write the audit entries and side-effect events of an updated chunk (does not commit)"""
+        fields = list(job.changes)
+        self.db.execute(
+            insert(AuditLog),
+            [
+                {
+                    "tenant_id": job.tenant_id,
+                    "user_id": job.created_by,
+                    "entity_type": AuditLogEntity.LEAD.value,
+                    "entity_id": row.id,
+                    "action": AuditAction.UPDATE.value,
+                    "entity_name": row.name,
+                    "old_values": {field: _json_value(getattr(row, f"old_{field}")) for field in fields},
+                    "new_values": {field: _json_value(getattr(row, field)) for field in fields},
+                    "reason": job.reason,
+                }
+                for row in rows
+            ],
+        )
+
+        deltas: Counter = Counter()
+        for row in rows:
+            deltas.update(counter_deltas(lead_counters(row.old_status, row.old_score), lead_counters(row.status, row.score)))
+        TenantCounterService(self.db).apply(job.tenant_id, deltas)
+
+        status_changed = sum(row.status != row.old_status for row in rows)
+        converted = sum(row.status == "converted" and row.old_status != "converted" for row in rows)
+        hot = [row.id for row in rows if row.old_score < HOT_LEAD_SCORE <= row.score]
+        rescored = [row.id for row in rows if row.score != row.old_score]
+
+        outbox = OutboxService(self.db)
+        # One event per chunk instead of per-lead lead_status_changed / hot_lead_generated events
+        outbox.enqueue(
+            tenant_id=job.tenant_id,
+            event_type=OutboxEventType.GA4_EVENT,
+            payload={
+                "event_name": "leads_bulk_updated",
+                "event_params": {
+                    "bulk_update_id": str(job.id),
+                    "updated": len(rows),
+                    "status_changed": status_changed,
+                    "converted": converted,
+                    "became_hot": len(hot),
+                },
+            },
+        )
+        if hot:
+            outbox.enqueue(
+                tenant_id=job.tenant_id,
+                event_type=OutboxEventType.TEAMS_HOT_LEADS_SUMMARY,
+                payload={"lead_ids": [str(lead_id) for lead_id in hot]},
+            )
+        if rescored:
+            CRMSyncQueue(self.db).enqueue_many(job.tenant_id, rescored)
+
+    def _update_leaderboard(self, job: LeadBulkUpdateJob, rows: Sequence[Row]) -> None:
+        """Apply a committed chunk to the tenant's hot lead leaderboard"""
+        changes = [(row.id, ranked_entry(row.id, row.old_status, row.old_score), ranked_entry(row.id, row.status, row.score)) for row in rows]
+        get_hot_lead_leaderboard().apply(job.tenant_id, [change for change in changes if change[1] != change[2]])
+
+
+def run_lead_bulk_update(job_id: UUID, tenant_id: UUID) -> None:
+    """Run a bulk update job in its own session (background task)"""
+    run_job(LeadBulkUpdateService, job_id, tenant_id)
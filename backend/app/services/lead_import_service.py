@@ -0,0 +1,279 @@
+"""
+Lead Import Service
+
+Bulk lead import from CSV or NDJSON. Rows are validated in chunks; each
+chunk of valid rows is loaded with COPY into a temporary staging table and
+merged into leads with a single INSERT ... ON CONFLICT (tenant_id, email);
+the merged leads it returns are queued for CRM sync. Per-lead side effects
+(GA4 events, Teams notifications) are replaced by one summary GA4 event
+when the import finishes.
+
+Each chunk commits on its own, so the job's progress is visible while the
+import runs and a failed import keeps the chunks merged before the failure
+(see JobService). The upload is spooled to a local file that does not
+survive a restart, so an interrupted import is failed by the stale job
+recovery rather than resumed.
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+import uuid
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.models.lead_import_job import LeadImportJob, LeadImportStatus
+from app.models.outbox_event import OutboxEventType
+from app.schemas.lead import LeadImportRow
+from app.services.crm_sync_queue import CRMSyncQueue
+from app.services.job_runner import JobService, run_job
+from app.services.outbox_service import OutboxService
+
+logger = logging.getLogger(__name__)
+
+# Staging columns, in COPY order
+STAGING_COLUMNS = ("row_number", "id", "name", "email", "company", "job_title", "phone", "status", "notes", "tags", "custom_fields")
+
+# Dropped at the end of the session's connection; emptied by every commit
+CREATE_STAGING_TABLE = text(
+    """
+    CREATE TEMP TABLE IF NOT EXISTS lead_import_staging (
+        row_number integer NOT NULL,
+        id uuid NOT NULL,
+        name varchar(255) NOT NULL,
+        email varchar(255) NOT NULL,
+        company varchar(255),
+        job_title varchar(100),
+        phone varchar(20),
+        status varchar(50) NOT NULL,
+        notes text,
+        tags jsonb NOT NULL,
+        custom_fields jsonb NOT NULL
+    ) ON COMMIT DELETE ROWS
+    """
+)
+
+# Set-based merge of the staged chunk. The last row wins for emails repeated
+# in the chunk; (xmax = 0) tells inserted from updated rows.
+MERGE_SQL = """
+WITH staged AS (
+    SELECT DISTINCT ON (email) * FROM lead_import_staging ORDER BY email, row_number DESC
+), merged AS (
+    INSERT INTO leads (
+        id, tenant_id, name, email, company, job_title, phone, status, notes, tags, custom_fields,
+        score, created_by, last_activity_at, created_at, updated_at
+    )
+    SELECT id, :tenant_id, name, email, company, job_title, phone, status, notes, tags, custom_fields,
+           0, :user_id, now(), now(), now()
+    FROM staged
+    ON CONFLICT ON CONSTRAINT uq_leads_tenant_email {on_conflict}
+    RETURNING leads.id, (xmax = 0) AS inserted
+)
+SELECT id, inserted FROM merged
+"""
+
+ON_CONFLICT_ACTIONS = {
+    "skip": "DO NOTHING",
+    # Blank cells keep the existing value; score and assignment are never imported
+    "update": """DO UPDATE SET
+        name = EXCLUDED.name,
+        company = coalesce(EXCLUDED.company, leads.company),
+        job_title = coalesce(EXCLUDED.job_title, leads.job_title),
+        phone = coalesce(EXCLUDED.phone, leads.phone),
+        notes = coalesce(EXCLUDED.notes, leads.notes),
+        tags = EXCLUDED.tags,
+        custom_fields = EXCLUDED.custom_fields,
+        updated_by = EXCLUDED.created_by,
+        updated_at = now()""",
+}
+
+
+def iter_rows(source: BinaryIO, format: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Read raw rows from an upload.
+
+    Args:
+        source: Binary file (UTF-8; a BOM is ignored)
+        format: "csv" (header row with field names) or "ndjson" (one object per line)
+
+    Yields:
+        (row number, row data or None, parse error or None); row numbers
+        count data rows from 1
+    """
+    reader = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+    if format == "csv":
+        for number, row in enumerate(csv.DictReader(reader), start=1):
+            yield number, {key.strip(): value for key, value in row.items() if key}, None
+        return
+
+    number = 0
+    for line in reader:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield number, None, f"Invalid JSON: {e}"
+            continue
+        if isinstance(data, dict):
+            yield number, data, None
+        else:
+            yield number, None, "Expected a JSON object"
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}" for detail in error.errors())
+
+
+class LeadImportService(JobService[LeadImportJob]):
+    """Service for bulk lead import jobs."""
+
+    job_model = LeadImportJob
+    statuses = LeadImportStatus
+    label = "Lead import"
+    bulk_lead_writes = True
+
+    def create_job(self, tenant_id: UUID, created_by: UUID, format: str, on_conflict: str = "skip") -> LeadImportJob:
+        """Create a pending import job (commits)
+
+        Args:
+            tenant_id: Tenant UUID
+            created_by: Importing user (recorded as created_by / updated_by of the leads)
+            format: "csv" or "ndjson"
+            on_conflict: "skip" or "update" leads whose email already exists
+
+        Returns:
+            Pending job
+        """
+        return self._add_job(
+            LeadImportJob(
+                tenant_id=tenant_id, created_by=created_by, format=format, on_conflict=on_conflict, status=LeadImportStatus.PENDING, errors=[]
+            )
+        )
+
+    def run(self, job: LeadImportJob, source: BinaryIO, chunk_size: Optional[int] = None) -> LeadImportJob:
+        """
+        Process an upload: validate, stage and merge it chunk by chunk.
+
+        Args:
+            job: Pending job
+            source: Uploaded file
+            chunk_size: Rows per chunk (default LEAD_IMPORT_CHUNK_SIZE)
+
+        Returns:
+            Completed or failed job
+        """
+        return super().run(job, source, chunk_size or settings.LEAD_IMPORT_CHUNK_SIZE)
+
+    def _process(self, job: LeadImportJob, source: BinaryIO, chunk_size: int) -> None:
+        chunk: List[Tuple[int, Optional[Dict[str, Any]], Optional[str]]] = []
+        for row in iter_rows(source, job.format):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                self._process_chunk(job, chunk)
+                chunk = []
+        if chunk:
+            self._process_chunk(job, chunk)
+
+    def _on_completed(self, job: LeadImportJob) -> None:
+        # One summary event instead of per-lead notifications
+        OutboxService(self.db).enqueue(
+            tenant_id=job.tenant_id,
+            event_type=OutboxEventType.GA4_EVENT,
+            payload={
+                "event_name": "leads_imported",
+                "event_params": {
+                    "import_id": str(job.id),
+                    "inserted": job.inserted_rows,
+                    "updated": job.updated_rows,
+                    "failed": job.failed_rows,
+                },
+            },
+        )
+
+    def _summary(self, job: LeadImportJob) -> str:
+        return f"{job.inserted_rows} inserted, {job.updated_rows} updated, {job.failed_rows} failed"
+
+    def _process_chunk(self, job: LeadImportJob, chunk: List[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]) -> None:
+        """Validate a chunk, merge its valid rows and commit the progress"""
+        valid: List[Tuple[int, LeadImportRow]] = []
+        errors: List[Dict[str, Any]] = []
+        for number, data, error in chunk:
+            if error is None:
+                try:
+                    valid.append((number, LeadImportRow.model_validate(data)))
+                    continue
+                except ValidationError as e:
+                    error = _validation_message(e)
+            errors.append({"row": number, "error": error})
+
+        inserted, updated = self._merge(job, valid) if valid else (0, 0)
+
+        job.processed_rows += len(chunk)
+        job.inserted_rows += inserted
+        job.updated_rows += updated
+        job.skipped_rows += len(valid) - inserted - updated
+        job.failed_rows += len(errors)
+        room = settings.LEAD_IMPORT_MAX_ERRORS - len(job.errors)
+        if errors and room > 0:
+            job.errors = job.errors + errors[:room]  # New list so the JSON column is marked dirty
+        self.db.commit()
+
+    def _merge(self, job: LeadImportJob, rows: List[Tuple[int, LeadImportRow]]) -> Tuple[int, int]:
+        """COPY rows into the staging table, merge them into leads and queue them for CRM sync (does not commit)
+
+        Returns:
+            (inserted, updated) lead counts
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for number, row in rows:
+            writer.writerow(
+                [
+                    number,
+                    uuid.uuid4(),
+                    row.name,
+                    row.email,
+                    row.company,
+                    row.job_title,
+                    row.phone,
+                    row.status,
+                    row.notes,
+                    json.dumps(row.tags, ensure_ascii=False),
+                    json.dumps(row.custom_fields, ensure_ascii=False),
+                ]
+            )
+        buffer.seek(0)
+
+        self.db.execute(CREATE_STAGING_TABLE)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            # Empty cells are NULL; empty strings were normalized to None by validation
+            cursor.copy_expert(f"COPY lead_import_staging ({', '.join(STAGING_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        finally:
+            cursor.close()
+
+        merged = self.db.execute(
+            text(MERGE_SQL.format(on_conflict=ON_CONFLICT_ACTIONS[job.on_conflict])),
+            {"tenant_id": job.tenant_id, "user_id": job.created_by},
+        ).all()
+        CRMSyncQueue(self.db).enqueue_many(job.tenant_id, [row.id for row in merged])
+
+        inserted = sum(1 for row in merged if row.inserted)
+        return inserted, len(merged) - inserted
+
+
+def run_lead_import(job_id: UUID, tenant_id: UUID, path: str) -> None:
+    """Run an import job in its own session and delete the uploaded file (background task)"""
+    try:
+        with open(path, "rb") as source:
+            run_job(LeadImportService, job_id, tenant_id, source)
+    finally:
+        os.unlink(path)
@@ -4,24 +4,31 @@ Lead Service
 Business logic for lead management with multi-tenant support.
 """
 
-import asyncio
 import os
-import uuid as uuid_lib
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, desc, or_
+from sqlalchemy import and_, literal, select, text, tuple_, union_all
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.integrations.google_analytics.measurement_protocol import (
-    GA4MeasurementProtocol,
-)
-from app.models.google_analytics_integration import GoogleAnalyticsIntegration
+from app.core.config import settings
 from app.models.lead import Lead
+from app.models.lead_tombstone import LeadTombstone
+from app.models.outbox_event import OutboxEventType
 from app.models.tenant import Tenant
 from app.schemas.lead import LeadCreate, LeadScoreUpdate, LeadStatusUpdate, LeadUpdate
+from app.services.crm_sync_queue import CRMSyncQueue
+from app.services.google_analytics_service import get_ga4_batcher
+from app.services.hot_lead_leaderboard import get_hot_lead_leaderboard
+from app.services.leads.lead_scoring import LeadScoringService
+from app.services.leads.lead_search import LeadSearchService, attribute_filters
+from app.services.outbox_service import OutboxService
+from app.services.tenant_counter_service import LEADS_TOTAL, TenantCounterService
+from app.utils.helpers import apply_keyset, decode_cursor, encode_cursor
+from app.utils.projection import project
 
 # Teams integration
 try:
@@ -32,6 +39,24 @@ except ImportError:
     TEAMS_INTEGRATION_AVAILABLE = False
     print("⚠️  Teams integration not available")
 
+# Sort order of lead lists, ending with id so keyset cursors are unambiguous
+LEAD_LIST_ORDER = (Lead.score, Lead.created_at, Lead.id)
+
+# Change feed horizon: start of the oldest open transaction of the database
+# (ours included). updated_at / deleted_at are transaction start times, so
+# every change stamped before it is committed or rolled back. Sessions of
+# other database roles are only visible with pg_read_all_stats.
+CHANGE_HORIZON_SQL = text(
+    """
+    SELECT coalesce(min(xact_start), now())
+    FROM pg_stat_activity
+    WHERE datname = current_database() AND backend_type = 'client backend'
+    """
+)
+
+# Lead ID of cursors positioned at a horizon (before every change stamped with it)
+HORIZON_CURSOR_ID = UUID(int=0)
+
 
 class LeadService:
     """
@@ -44,84 +69,31 @@ class LeadService:
         self.db = db
         self._teams_notification_enabled = TEAMS_INTEGRATION_AVAILABLE
 
-    async def _send_ga4_event(
-        self,
-        tenant_id: UUID,
-        event_name: str,
-        event_params: dict,
-        client_id: Optional[str] = None,
-    ) -> None:
+    async def _send_teams_notification(self, lead: Lead, tenant: Tenant) -> bool:
         """
-        Send GA4 event via Measurement Protocol (async, non-blocking)
-
-        Args:
-            tenant_id: Tenant UUID
-            event_name: GA4 event name
-            event_params: Event parameters
-            client_id: Optional client ID (generates if not provided)
-        """
-        try:
-            # Get GA4 integration config for tenant
-            ga_integration = self.db.query(GoogleAnalyticsIntegration).filter(GoogleAnalyticsIntegration.tenant_id == tenant_id).first()
-
-            # Check if GA4 is enabled and configured for server-side tracking
-            if not ga_integration or not ga_integration.enabled:
-                return
-
-            if not ga_integration.track_server_events:
-                return
-
-            if not ga_integration.measurement_protocol_api_secret:
-                print(f"⚠️  GA4 Measurement Protocol API Secret not configured for tenant {tenant_id}")
-                return
-
-            # Create GA4 client
-            client = GA4MeasurementProtocol(
-                measurement_id=ga_integration.measurement_id,
-                api_secret=ga_integration.measurement_protocol_api_secret,
-                debug=False,
-            )
-
-            # Generate client_id if not provided
-            if not client_id:
-                client_id = f"server-{uuid_lib.uuid4()}"
-
-            # Add tenant_id to event params
-            event_params["tenant_id"] = str(tenant_id)
-
-            # Send event
-            success = await client.send_event(client_id=client_id, event_name=event_name, event_params=event_params)
-
-            if success:
-                print(f"✅ GA4 event sent: {event_name} for tenant {tenant_id}")
-            else:
-                print(f"⚠️  GA4 event failed: {event_name} for tenant {tenant_id}")
-
-        except Exception as e:
-            # Log error but don't fail lead operations
-            print(f"⚠️  Failed to send GA4 event {event_name}: {str(e)}")
-
-    async def _send_teams_notification(self, lead: Lead, tenant: Tenant) -> None:
-        """
-        Send Teams notification for hot lead (async)
+        Send Teams notification for hot lead
 
         Args:
             lead: Lead object
             tenant: Tenant object
+
+        Returns:
+            False if delivery failed and should be retried, True otherwise
+            (sent, or no notification applies)
         """
         if not self._teams_notification_enabled:
-            return
+            return True
 
         # Get webhook URL from tenant settings or environment
         webhook_url = tenant.settings.get("teams_webhook_url") or os.getenv("TEAMS_WEBHOOK_URL")
 
         if not webhook_url:
             print(f"⚠️  No Teams webhook URL configured for tenant {tenant.name}")
-            return
+            return True
 
         # Check if lead is hot (score >= 80)
         if lead.score < 80:
-            return
+            return True
 
         try:
             teams_client = TeamsWebhookClient(webhook_url)
@@ -144,10 +116,138 @@ class LeadService:
             await teams_client.send_hot_lead_notification(lead_data=lead_data, dashboard_url=dashboard_url)
 
             print(f"✅ Teams notification sent for lead {lead.id} (score: {lead.score})")
+            return True
 
         except Exception as e:
             # Log error but don't fail lead creation
             print(f"⚠️  Failed to send Teams notification: {str(e)}")
+            return False
+
+    async def deliver_ga4_event(self, tenant_id: UUID, payload: dict) -> bool:
+        """
+        Deliver a GA4 outbox event through the shared event batcher
+
+        Events without a client ID share a per-tenant server client ID, so
+        concurrent events of a tenant coalesce into one Measurement Protocol
+        request.
+
+        Args:
+            tenant_id: Tenant UUID
+            payload: {"event_name", "event_params", "client_id"?}
+
+        Returns:
+            False if delivery failed and should be retried
+        """
+        event_params = dict(payload.get("event_params") or {})
+        event_params["tenant_id"] = str(tenant_id)
+
+        return await get_ga4_batcher().submit(
+            tenant_id=tenant_id,
+            client_id=payload.get("client_id") or f"server-{tenant_id}",
+            event_name=payload["event_name"],
+            event_params=event_params,
+        )
+
+    async def deliver_teams_notification(self, tenant_id: UUID, payload: dict) -> bool:
+        """
+        Deliver a hot lead Teams outbox event
+
+        The lead is loaded at delivery time (in the threadpool, off the event
+        loop), so the notification shows its current data. Deleted leads are
+        skipped.
+
+        Args:
+            tenant_id: Tenant UUID
+            payload: {"lead_id"}
+
+        Returns:
+            False if delivery failed and should be retried
+        """
+        lead, tenant = await run_in_threadpool(self._load_hot_lead, UUID(payload["lead_id"]), tenant_id)
+        if not lead or not tenant:
+            return True
+
+        return await self._send_teams_notification(lead, tenant)
+
+    async def deliver_teams_summary(self, tenant_id: UUID, payload: dict) -> bool:
+        """
+        Deliver a Teams summary of leads that became hot in a bulk update
+
+        One message lists the leads (highest score first) instead of a card
+        per lead. Leads deleted or cooled down since are left out.
+
+        Args:
+            tenant_id: Tenant UUID
+            payload: {"lead_ids"}
+
+        Returns:
+            False if delivery failed and should be retried
+        """
+        if not self._teams_notification_enabled:
+            return True
+
+        tenant, leads = await run_in_threadpool(self._load_hot_leads, [UUID(lead_id) for lead_id in payload["lead_ids"]], tenant_id)
+        if not tenant or not leads:
+            return True
+
+        webhook_url = tenant.settings.get("teams_webhook_url") or os.getenv("TEAMS_WEBHOOK_URL")
+        if not webhook_url:
+            return True
+
+        lines = [f"- {lead.name} ({lead.company or 'N/A'}) — スコア {lead.score}" for lead in leads[:20]]
+        if len(leads) > 20:
+            lines.append(f"- ほか {len(leads) - 20} 件")
+
+        try:
+            await TeamsWebhookClient(webhook_url).send_simple_message(
+                text="\n".join(lines),
+                title=f"🔥 一括更新で {len(leads)} 件のホットリード",
+            )
+            return True
+        except Exception as e:
+            print(f"⚠️  Failed to send Teams summary: {str(e)}")
+            return False
+
+    def _load_hot_lead(self, lead_id: UUID, tenant_id: UUID) -> tuple[Optional[Lead], Optional[Tenant]]:
+        """Load a lead and its tenant for a Teams notification"""
+        lead = self.get_by_id(lead_id=lead_id, tenant_id=tenant_id)
+        tenant = self.db.query(Tenant).filter(Tenant.id == tenant_id).first()
+        return lead, tenant
+
+    def _load_hot_leads(self, lead_ids: List[UUID], tenant_id: UUID) -> tuple[Optional[Tenant], List[Lead]]:
+        """Load a tenant and those of the leads still hot, highest score first"""
+        tenant = self.db.query(Tenant).filter(Tenant.id == tenant_id).first()
+        leads = (
+            self.db.query(Lead)
+            .filter(
+                Lead.tenant_id == tenant_id,  # REQUIRED: Tenant filtering
+                Lead.id.in_(lead_ids),
+                Lead.score >= 80,
+            )
+            .order_by(Lead.score.desc())
+            .all()
+        )
+        return tenant, leads
+
+    def _enqueue_ga4_event(self, tenant_id: UUID, event_name: str, event_params: dict) -> None:
+        """Enqueue a GA4 event in the current transaction"""
+        OutboxService(self.db).enqueue(
+            tenant_id=tenant_id,
+            event_type=OutboxEventType.GA4_EVENT,
+            payload={"event_name": event_name, "event_params": event_params},
+        )
+
+    def _enqueue_crm_sync(self, lead: Lead) -> None:
+        """Queue the lead for CRM sync in the current transaction (coalesces with a pending sync)"""
+        CRMSyncQueue(self.db).enqueue(tenant_id=lead.tenant_id, lead_id=lead.id)
+
+    def _enqueue_teams_notification(self, lead: Lead) -> None:
+        """Enqueue a hot lead Teams notification in the current transaction"""
+        OutboxService(self.db).enqueue(
+            tenant_id=lead.tenant_id,
+            event_type=OutboxEventType.TEAMS_HOT_LEAD,
+            payload={"lead_id": str(lead.id)},
+        )
 
     def list_by_tenant(
         self,
@@ -158,9 +258,22 @@ class LeadService:
         min_score: Optional[int] = None,
         max_score: Optional[int] = None,
         assigned_to: Optional[UUID] = None,
-    ) -> List[Lead]:
+        cursor: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        custom_fields: Optional[Dict[str, List[Any]]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
         """
         List all leads for a specific tenant with optional filters
+
+        Pages start after `cursor` (see next_page_cursor) or, without one, at `skip`.
+        `tags` keeps leads carrying every tag; `custom_fields` keeps leads whose
+        field equals one of the given values (see attribute_filters). With
+        `fields`, rows of only these columns (plus the sort columns) are
+        returned instead of Lead entities.
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         query = self.db.query(Lead).filter(
             Lead.tenant_id == tenant_id  # REQUIRED: Tenant filtering
@@ -179,8 +292,17 @@ class LeadService:
         if assigned_to:
             query = query.filter(Lead.assigned_to == assigned_to)
 
-        # Sort by score (highest first), then creation date
-        leads = query.order_by(desc(Lead.score), desc(Lead.created_at)).offset(skip).limit(limit).all()
+        # Tag / custom field filters (GIN-indexed containment)
+        query = query.filter(*attribute_filters(tags, custom_fields))
+
+        if fields is not None:
+            query = project(query, Lead, fields, LEAD_LIST_ORDER)
+
+        # Sort by score (highest first), then creation date; id keeps the order unique for cursors
+        query = apply_keyset(query, LEAD_LIST_ORDER, cursor)
+        if not cursor:
+            query = query.offset(skip)
+        leads = query.limit(limit).all()
 
         return leads
 
@@ -242,60 +364,40 @@ class LeadService:
         )
 
         self.db.add(lead)
-        self.db.commit()
-        self.db.refresh(lead)
-
-        is_hot_lead = lead.score >= 80
+        self.db.flush()
+        TenantCounterService(self.db).lead_changed(tenant_id, new=(lead.status, lead.score))
+
+        # Integration side effects commit atomically with the lead and are
+        # delivered by the outbox worker
+        self._enqueue_ga4_event(
+            tenant_id,
+            "lead_generated",
+            {
+                "lead_id": str(lead.id),
+                "lead_score": lead.score,
+                "lead_status": lead.status,
+                "company": lead.company or "unknown",
+            },
+        )
 
-        # Send GA4 events (async, non-blocking)
-        try:
-            # Check if event loop is available first
-            asyncio.get_running_loop()
-
-            # Send lead_generated event
-            asyncio.create_task(
-                self._send_ga4_event(
-                    tenant_id=tenant_id,
-                    event_name="lead_generated",
-                    event_params={
-                        "lead_id": str(lead.id),
-                        "lead_score": lead.score,
-                        "lead_status": lead.status,
-                        "company": lead.company or "unknown",
-                    },
-                )
+        if lead.score >= 80:
+            self._enqueue_ga4_event(
+                tenant_id,
+                "hot_lead_generated",
+                {
+                    "lead_id": str(lead.id),
+                    "lead_score": lead.score,
+                    "company": lead.company or "unknown",
+                    "value": lead.score,  # Use score as conversion value
+                },
             )
+            self._enqueue_teams_notification(lead)
 
-            # Send hot_lead_generated conversion event if applicable
-            if is_hot_lead:
-                asyncio.create_task(
-                    self._send_ga4_event(
-                        tenant_id=tenant_id,
-                        event_name="hot_lead_generated",
-                        event_params={
-                            "lead_id": str(lead.id),
-                            "lead_score": lead.score,
-                            "company": lead.company or "unknown",
-                            "value": lead.score,  # Use score as conversion value
-                        },
-                    )
-                )
-        except RuntimeError:
-            # No event loop running, skip GA4 events silently
-            pass
-
-        # Send Teams notification if hot lead (async, non-blocking)
-        if is_hot_lead:
-            tenant = self.db.query(Tenant).filter(Tenant.id == tenant_id).first()
-            if tenant:
-                try:
-                    # Check if event loop is available first
-                    asyncio.get_running_loop()
-                    # Run async notification in background
-                    asyncio.create_task(self._send_teams_notification(lead, tenant))
-                except RuntimeError:
-                    # No event loop running, skip notification silently
-                    pass
+        self._enqueue_crm_sync(lead)
+
+        self.db.commit()
+        self.db.refresh(lead)
+        get_hot_lead_leaderboard().lead_changed(tenant_id, lead.id, new=(lead.status, lead.score))
 
         return lead
 
@@ -319,6 +421,8 @@ class LeadService:
                     detail=f"Lead with email {update_data['email']} already exists in this tenant",
                 )
 
+        old_status = lead.status
+
         # Update fields
         for field, value in update_data.items():
             setattr(lead, field, value)
@@ -326,8 +430,12 @@ class LeadService:
         lead.updated_by = updated_by
         lead.last_activity_at = datetime.utcnow()
 
+        TenantCounterService(self.db).lead_changed(tenant_id, old=(old_status, lead.score), new=(lead.status, lead.score))
+        self._enqueue_crm_sync(lead)
+
         self.db.commit()
         self.db.refresh(lead)
+        get_hot_lead_leaderboard().lead_changed(tenant_id, lead.id, old=(old_status, lead.score), new=(lead.status, lead.score))
 
         return lead
 
@@ -359,46 +467,35 @@ class LeadService:
         if new_status == "contacted" and old_status == "new":
             lead.last_contacted_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(lead)
-
-        # Send GA4 event for status change (async, non-blocking)
         if old_status != new_status:
-            try:
-                # Check if event loop is available first
-                asyncio.get_running_loop()
-
-                # Send status change event
-                asyncio.create_task(
-                    self._send_ga4_event(
-                        tenant_id=tenant_id,
-                        event_name="lead_status_changed",
-                        event_params={
-                            "lead_id": str(lead.id),
-                            "old_status": old_status,
-                            "new_status": new_status,
-                            "lead_score": lead.score,
-                        },
-                    )
+            TenantCounterService(self.db).lead_changed(tenant_id, old=(old_status, lead.score), new=(new_status, lead.score))
+            self._enqueue_ga4_event(
+                tenant_id,
+                "lead_status_changed",
+                {
+                    "lead_id": str(lead.id),
+                    "old_status": old_status,
+                    "new_status": new_status,
+                    "lead_score": lead.score,
+                },
+            )
+
+            # Conversion event if status changed to 'converted'
+            if new_status == "converted":
+                self._enqueue_ga4_event(
+                    tenant_id,
+                    "lead_converted",
+                    {
+                        "lead_id": str(lead.id),
+                        "lead_score": lead.score,
+                        "company": lead.company or "unknown",
+                        "value": 100,  # Conversion value
+                    },
                 )
 
-                # Send conversion event if status changed to 'converted'
-                if new_status == "converted":
-                    asyncio.create_task(
-                        self._send_ga4_event(
-                            tenant_id=tenant_id,
-                            event_name="lead_converted",
-                            event_params={
-                                "lead_id": str(lead.id),
-                                "lead_score": lead.score,
-                                "company": lead.company or "unknown",
-                                "value": 100,  # Conversion value
-                            },
-                        )
-                    )
-            except RuntimeError:
-                # No event loop running, skip GA4 events silently
-                pass
+        self.db.commit()
+        self.db.refresh(lead)
+        get_hot_lead_leaderboard().lead_changed(tenant_id, lead.id, old=(old_status, lead.score), new=(new_status, lead.score))
 
         return lead
 
@@ -417,43 +514,28 @@ class LeadService:
         lead.score = new_score
         lead.last_activity_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(lead)
-
-        # Send GA4 events if lead becomes hot (score crosses threshold)
+        # Lead becomes hot (score crosses threshold)
         if old_score < 80 and new_score >= 80:
-            try:
-                # Check if event loop is available first
-                asyncio.get_running_loop()
-                asyncio.create_task(
-                    self._send_ga4_event(
-                        tenant_id=tenant_id,
-                        event_name="hot_lead_generated",
-                        event_params={
-                            "lead_id": str(lead.id),
-                            "lead_score": new_score,
-                            "old_score": old_score,
-                            "company": lead.company or "unknown",
-                            "value": new_score,  # Use score as conversion value
-                        },
-                    )
-                )
-            except RuntimeError:
-                # No event loop running, skip GA4 events silently
-                pass
+            self._enqueue_ga4_event(
+                tenant_id,
+                "hot_lead_generated",
+                {
+                    "lead_id": str(lead.id),
+                    "lead_score": new_score,
+                    "old_score": old_score,
+                    "company": lead.company or "unknown",
+                    "value": new_score,  # Use score as conversion value
+                },
+            )
+            self._enqueue_teams_notification(lead)
 
-        # Send Teams notification if lead becomes hot (score crosses threshold)
-        if old_score < 80 and new_score >= 80:
-            tenant = self.db.query(Tenant).filter(Tenant.id == tenant_id).first()
-            if tenant:
-                try:
-                    # Check if event loop is available first
-                    asyncio.get_running_loop()
-                    # Run async notification in background
-                    asyncio.create_task(self._send_teams_notification(lead, tenant))
-                except RuntimeError:
-                    # No event loop running, skip notification silently
-                    pass
+        if new_score != old_score:
+            TenantCounterService(self.db).lead_changed(tenant_id, old=(lead.status, old_score), new=(lead.status, new_score))
+            self._enqueue_crm_sync(lead)
+
+        self.db.commit()
+        self.db.refresh(lead)
+        get_hot_lead_leaderboard().lead_changed(tenant_id, lead.id, old=(lead.status, old_score), new=(lead.status, new_score))
 
         return lead
 
@@ -466,63 +548,125 @@ class LeadService:
         if not lead:
             return False
 
+        old = (lead.status, lead.score)
         self.db.delete(lead)
+        TenantCounterService(self.db).lead_changed(tenant_id, old=old)
+        # Keep the deletion visible to change feed consumers
+        self.db.add(LeadTombstone(lead_id=lead_id, tenant_id=tenant_id))
         self.db.commit()
+        get_hot_lead_leaderboard().lead_changed(tenant_id, lead_id, old=old)
 
         return True
 
-    def count_by_tenant(self, tenant_id: UUID, status: Optional[str] = None) -> int:
+    def list_changes(self, tenant_id: UUID, since: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
         """
-        Count leads for a tenant
+        List leads changed or deleted after a change feed cursor
+
+        Changes are ordered by (changed_at, lead_id), so a consumer resuming
+        from `next_cursor` sees every change exactly once per write. Each read
+        is an index range scan over idx_leads_tenant_updated_at_id and
+        idx_lead_tombstones_tenant_deleted_at, so it costs O(changes).
+        Only changes before the horizon (see CHANGE_HORIZON_SQL) are served:
+        updated_at is the transaction start time, so a transaction still in
+        flight could otherwise land behind a cursor already handed out. Once
+        a read reaches the horizon, `next_cursor` moves up to it, so cursors
+        of caught-up consumers keep advancing while nothing changes.
+        Tombstones are purged after LEAD_TOMBSTONE_RETENTION_DAYS, so older
+        cursors are rejected: their consumer must resync from the start.
+
+        Args:
+            tenant_id: Tenant UUID
+            since: Cursor from a previous page (None to read from the start)
+            limit: Maximum changes to return
+
+        Returns:
+            Dict with changes, next_cursor and has_more
+
+        Raises:
+            ValueError: If the cursor is malformed or expired
         """
-        query = self.db.query(Lead).filter(
-            Lead.tenant_id == tenant_id  # REQUIRED: Tenant filtering
+        horizon = self.db.execute(CHANGE_HORIZON_SQL).scalar()
+        upserts = select(Lead.id.label("lead_id"), Lead.updated_at.label("changed_at"), literal("upsert").label("op")).where(
+            Lead.tenant_id == tenant_id,
+            Lead.updated_at < horizon,
+        )
+        deletes = select(LeadTombstone.lead_id, LeadTombstone.deleted_at, literal("delete")).where(
+            LeadTombstone.tenant_id == tenant_id,
+            LeadTombstone.deleted_at < horizon,
         )
 
-        if status:
-            query = query.filter(Lead.status == status)
+        if since:
+            position = decode_cursor(since)
+            try:
+                after = (datetime.fromisoformat(position["t"]), UUID(position["id"]))
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError("Invalid cursor") from e
+            if after[0].tzinfo is None:
+                raise ValueError("Invalid cursor")
+            if after[0] < datetime.now(timezone.utc) - timedelta(days=settings.LEAD_TOMBSTONE_RETENTION_DAYS):
+                raise ValueError("Cursor expired, resync from the start")
+            upserts = upserts.where(tuple_(Lead.updated_at, Lead.id) > after)
+            deletes = deletes.where(tuple_(LeadTombstone.deleted_at, LeadTombstone.lead_id) > after)
+
+        changes = union_all(upserts, deletes).subquery()
+        rows = self.db.execute(select(changes).order_by(changes.c.changed_at, changes.c.lead_id).limit(limit + 1)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        upsert_ids = [row.lead_id for row in rows if row.op == "upsert"]
+        leads = {lead.id: lead for lead in self.db.query(Lead).filter(Lead.id.in_(upsert_ids)).all()} if upsert_ids else {}
+
+        # A lead deleted since the read above is skipped; its tombstone follows
+        entries = [
+            {"op": row.op, "lead_id": row.lead_id, "changed_at": row.changed_at, "lead": leads.get(row.lead_id)}
+            for row in rows
+            if row.op == "delete" or row.lead_id in leads
+        ]
+
+        next_cursor = since
+        if not has_more and (not since or horizon > after[0]):
+            # Every change before the horizon has been read
+            next_cursor = encode_cursor({"t": horizon.isoformat(), "id": str(HORIZON_CURSOR_ID)})
+        elif rows:
+            next_cursor = encode_cursor({"t": rows[-1].changed_at.isoformat(), "id": str(rows[-1].lead_id)})
+
+        return {"changes": entries, "next_cursor": next_cursor, "has_more": has_more}
+
+    def count_by_tenant(self, tenant_id: UUID, status: Optional[str] = None) -> int:
+        """
+        Count leads for a tenant
 
-        return query.count()
+        Reads the tenant's maintained counter (see TenantCounterService)
+        instead of counting rows.
+        """
+        return TenantCounterService(self.db).get(tenant_id, f"leads.status.{status}" if status else LEADS_TOTAL)
 
-    def search(self, tenant_id: UUID, query: str, limit: int = 10) -> List[Lead]:
+    def search(
+        self,
+        tenant_id: UUID,
+        query: str,
+        limit: int = 10,
+        tags: Optional[List[str]] = None,
+        custom_fields: Optional[Dict[str, List[Any]]] = None,
+    ) -> List[Lead]:
         """
-        Search leads by name, email, or company
+        Search leads by name, email, or company, most relevant first
         """
-        search_pattern = f"%{query}%"
+        return LeadSearchService(self.db).search(tenant_id, query, limit, tags=tags, custom_fields=custom_fields)
 
-        leads = (
-            self.db.query(Lead)
-            .filter(
-                and_(
-                    Lead.tenant_id == tenant_id,  # REQUIRED: Tenant filtering
-                    or_(
-                        Lead.name.ilike(search_pattern),
-                        Lead.email.ilike(search_pattern),
-                        Lead.company.ilike(search_pattern),
-                    ),
-                )
-            )
-            .limit(limit)
-            .all()
-        )
+    def get_hot_leads(self, tenant_id: UUID, threshold: int = 61, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[Lead]:
+        """
+        Get hot leads (score >= threshold) for a tenant, highest score first
 
-        return leads
+        Pages start after `cursor` (see next_page_cursor with HOT_LEAD_ORDER).
 
-    def get_hot_leads(self, tenant_id: UUID, threshold: int = 61) -> List[Lead]:
-        """
-        Get hot leads (score >= threshold) for a tenant
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        leads = (
-            self.db.query(Lead)
-            .filter(
-                and_(
-                    Lead.tenant_id == tenant_id,  # REQUIRED: Tenant filtering
-                    Lead.score >= threshold,
-                    Lead.status.in_(["new", "contacted", "qualified"]),
-                )
-            )
-            .order_by(desc(Lead.score))
-            .all()
-        )
+        return LeadScoringService(self.db).get_hot_leads(tenant_id, threshold=threshold, limit=limit, cursor=cursor)
 
-        return leads
+    def get_hot_lead_rank(self, lead: Lead) -> int:
+        """
+        Rank of a lead among its tenant's hot leads (1-based, 0 if it is not an open hot lead)
+        """
+        return LeadScoringService(self.db).get_hot_lead_rank(lead)
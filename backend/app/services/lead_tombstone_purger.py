@@ -0,0 +1,97 @@
+"""
+Lead Tombstone Purger
+
+Tombstones (see LeadTombstone) only matter to change feed consumers whose
+cursor is older than the deletion. Cursors are supported for
+LEAD_TOMBSTONE_RETENTION_DAYS (older ones are rejected by
+LeadService.list_changes, and the consumer resyncs from the start), so
+tombstones past that age are deleted. The purger runs periodically inside
+the API processes (started from the app lifespan); one process per
+deployment, elected with a LeaderLock, runs the passes. A single pass can
+also be run from cron:
+
+    python -m app.services.lead_tombstone_purger
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import LeaderLock, SessionLocal
+from app.models.lead_tombstone import LeadTombstone
+from app.models.tenant import Tenant
+
+logger = logging.getLogger(__name__)
+
+
+def purge_tenant_tombstones(db: Session, tenant_id: UUID) -> int:
+    """Delete a tenant's tombstones older than the retention (does not commit)
+
+    Returns:
+        Number of tombstones deleted
+    """
+    cutoff = func.now() - timedelta(days=settings.LEAD_TOMBSTONE_RETENTION_DAYS)
+    return db.query(LeadTombstone).filter(LeadTombstone.tenant_id == tenant_id, LeadTombstone.deleted_at < cutoff).delete(synchronize_session=False)
+
+
+def purge_expired_tombstones() -> int:
+    """Purge expired tombstones of every tenant, one transaction per tenant
+
+    Returns:
+        Number of tombstones deleted
+    """
+    db = SessionLocal()
+    try:
+        tenant_ids = list(db.execute(select(Tenant.id)).scalars())
+        db.rollback()
+
+        purged = 0
+        for tenant_id in tenant_ids:
+            try:
+                # RLS: tombstones are tenant scoped
+                db.execute(text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"), {"tenant_id": str(tenant_id)})
+                purged += purge_tenant_tombstones(db, tenant_id)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Tombstone purge of tenant {tenant_id} failed: {e}")
+        return purged
+    finally:
+        db.close()
+
+
+async def run_tombstone_purger(stop_event: asyncio.Event) -> None:
+    """Purge expired tombstones every LEAD_TOMBSTONE_PURGE_INTERVAL seconds until `stop_event` is set
+
+    Only the process holding the purger's leader lock runs the passes.
+    """
+    leader = LeaderLock("lead_tombstone_purger")
+    try:
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=settings.LEAD_TOMBSTONE_PURGE_INTERVAL)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                if not await run_in_threadpool(leader.acquire):
+                    continue
+                purged = await run_in_threadpool(purge_expired_tombstones)
+                if purged:
+                    logger.info(f"Purged {purged} expired lead tombstones")
+            except Exception as e:
+                logger.error(f"Tombstone purge failed: {e}")
+    finally:
+        await run_in_threadpool(leader.release)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    logger.info(f"Purged {purge_expired_tombstones()} expired lead tombstones")
@@ -4,13 +4,28 @@ Lead Scoring Service
 リードスコアリング機能を提供します。
 """
 
-from typing import List
+from typing import Callable, List, Optional, TypeVar
 from uuid import UUID
 
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, func, select, tuple_
 from sqlalchemy.orm import Session
 
+from app.core.constants import LeadScoreThreshold
 from app.models.lead import Lead
+from app.services.hot_lead_leaderboard import (
+    HOT_LEAD_STATUSES,
+    Entry,
+    HotLeadLeaderboard,
+    decode_leaderboard_cursor,
+    get_hot_lead_leaderboard,
+    ranked_entry,
+)
+from app.utils.helpers import apply_keyset
+
+# Hot lead page order (descending); cursors come from next_page_cursor(leads, HOT_LEAD_ORDER, limit)
+HOT_LEAD_ORDER = (Lead.score, Lead.id)
+
+T = TypeVar("T")
 
 
 class LeadScoringService:
@@ -19,28 +34,119 @@ class LeadScoringService:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_hot_leads(self, tenant_id: UUID, threshold: int = 61) -> List[Lead]:
+    def get_hot_leads(self, tenant_id: UUID, threshold: int = 61, limit: Optional[int] = None, cursor: Optional[str] = None) -> List[Lead]:
         """
         Get hot leads (score >= threshold) for a tenant
 
+        Thresholds of at least HOT_MIN are served from the tenant's hot lead
+        leaderboard if it is shared; otherwise the leads table is queried.
+
         Args:
             tenant_id: テナントID
             threshold: ホットリードのスコア閾値（デフォルト: 61）
+            limit: Page size (None = all hot leads)
+            cursor: Cursor of the next page (see HOT_LEAD_ORDER)
 
         Returns:
             ホットリードのリスト（スコアの高い順）
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        leads = (
-            self.db.query(Lead)
-            .filter(
-                and_(
-                    Lead.tenant_id == tenant_id,  # REQUIRED: Tenant filtering
-                    Lead.score >= threshold,
-                    Lead.status.in_(["new", "contacted", "qualified"]),
-                )
+        after = decode_leaderboard_cursor(cursor) if cursor else None
+        if threshold >= LeadScoreThreshold.HOT_MIN:
+            entries = self._read_leaderboard(tenant_id, lambda board: board.top(tenant_id, limit=limit, min_score=threshold, after=after))
+            if entries is not None:
+                leads = self._leads_for(tenant_id, entries)
+                if leads is not None:
+                    return leads
+
+        query = self.db.query(Lead).filter(
+            and_(
+                Lead.tenant_id == tenant_id,  # REQUIRED: Tenant filtering
+                Lead.score >= threshold,
+                Lead.status.in_(HOT_LEAD_STATUSES),
             )
-            .order_by(desc(Lead.score))
-            .all()
         )
+        query = apply_keyset(query, HOT_LEAD_ORDER, cursor)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def get_hot_lead_rank(self, lead: Lead) -> int:
+        """
+        Rank of a lead among its tenant's hot leads
+
+        Args:
+            lead: Lead
+
+        Returns:
+            1-based rank (highest score first), 0 if the lead is not an open hot lead
+        """
+        entry = ranked_entry(lead.id, lead.status, lead.score)
+        if entry is None:
+            return 0
+
+        rank = self._read_leaderboard(lead.tenant_id, lambda board: board.rank(lead.tenant_id, entry))
+        if rank:
+            return rank
+        if rank == 0:
+            # The leaderboard missed a change to this lead
+            get_hot_lead_leaderboard().invalidate(lead.tenant_id)
 
-        return leads
+        ahead = self.db.execute(
+            select(func.count()).where(
+                Lead.tenant_id == lead.tenant_id,  # REQUIRED: Tenant filtering
+                Lead.status.in_(HOT_LEAD_STATUSES),
+                tuple_(*HOT_LEAD_ORDER) > tuple_(lead.score, lead.id),
+            )
+        ).scalar()
+        return (ahead or 0) + 1
+
+    def _read_leaderboard(self, tenant_id: UUID, read: Callable[[HotLeadLeaderboard], Optional[T]]) -> Optional[T]:
+        """Read the tenant's leaderboard, loading it from the database first if needed
+
+        Returns:
+            Result of `read`, or None if the leaderboard is unavailable or per-worker
+        """
+        board = get_hot_lead_leaderboard()
+        if not board.shared:
+            return None
+        result = read(board)
+        if result is None:
+            board.load(tenant_id, self._hot_entries(tenant_id))
+            result = read(board)
+        return result
+
+    def _hot_entries(self, tenant_id: UUID) -> List[Entry]:
+        """(score, id) of every open hot lead of a tenant"""
+        rows = self.db.execute(
+            select(Lead.score, Lead.id).where(
+                Lead.tenant_id == tenant_id,  # REQUIRED: Tenant filtering
+                Lead.score >= LeadScoreThreshold.HOT_MIN,
+                Lead.status.in_(HOT_LEAD_STATUSES),
+            )
+        ).all()
+        return [(row.score, row.id) for row in rows]
+
+    def _leads_for(self, tenant_id: UUID, entries: List[Entry]) -> Optional[List[Lead]]:
+        """Leads of leaderboard entries in leaderboard order
+
+        Returns:
+            Leads, or None (and the leaderboard is dropped) if an entry no
+            longer matches its lead
+        """
+        if not entries:
+            return []
+        leads = {
+            lead.id: lead
+            for lead in self.db.query(Lead).filter(
+                Lead.tenant_id == tenant_id,  # REQUIRED: Tenant filtering
+                Lead.id.in_([lead_id for _, lead_id in entries]),
+            )
+        }
+        ordered = [leads.get(lead_id) for _, lead_id in entries]
+        if any(lead is None or ranked_entry(lead.id, lead.status, lead.score) != entry for lead, entry in zip(ordered, entries)):
+            get_hot_lead_leaderboard().invalidate(tenant_id)
+            return None
+        return ordered
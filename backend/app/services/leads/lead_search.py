@@ -2,16 +2,107 @@
 Lead Search Service
 
 検索・フィルタリング機能を提供します。
+
+PostgreSQL では name / email / company を連結した検索文書に pg_trgm の GIN
+インデックス (idx_leads_search_trgm) を張り、部分一致とあいまい一致を
+インデックスで絞り込んだうえで類似度順に返します。pg_trgm が無い環境
+(SQLite のテストなど) では従来の ILIKE 検索にフォールバックします。
+
+タグ・カスタムフィールドの絞り込みは JSONB の包含演算子 (@>) で SQL に
+押し込み、GIN インデックス (idx_leads_tags / idx_leads_custom_fields) で
+解決します。一覧・検索・レポートで共通の述語を使います。
 """
 
-from typing import List
+import json
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, desc, func, or_, text
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.models.lead import Lead
 
+# Indexed by idx_leads_search_trgm; must stay identical to the migration's index expression
+SEARCH_DOCUMENT = (Lead.name + " " + Lead.email + " " + func.coalesce(Lead.company, "")).self_group()
+
+# pg_trgm availability per database URL (checked once per process)
+_trigram_available: Dict[str, bool] = {}
+
+
+def trigram_search_available(db: Session) -> bool:
+    """pg_trgm が使えるか (PostgreSQL かつ拡張がインストール済み)"""
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+
+    key = str(bind.url)
+    if key not in _trigram_available:
+        _trigram_available[key] = bool(db.execute(text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")).scalar())
+    return _trigram_available[key]
+
+
+def tags_filter(tags: Sequence[str]) -> ColumnElement:
+    """Leads carrying every tag (tags @> '["a", "b"]')"""
+    return Lead.tags.contains(list(tags))
+
+
+def custom_field_filter(name: str, values: Sequence[Any]) -> ColumnElement:
+    """Leads whose custom field equals any of the values (one custom_fields @> '{"name": value}' per value)"""
+    return or_(*(Lead.custom_fields.contains({name: value}) for value in values))
+
+
+def attribute_filters(tags: Optional[Sequence[str]] = None, custom_fields: Optional[Dict[str, Sequence[Any]]] = None) -> List[ColumnElement]:
+    """
+    WHERE conditions of tag and custom field filters
+
+    Args:
+        tags: Tags every lead must carry
+        custom_fields: Custom field name -> accepted values
+
+    Returns:
+        Conditions (empty without filters)
+    """
+    conditions = []
+    if tags:
+        conditions.append(tags_filter(tags))
+    for name, values in (custom_fields or {}).items():
+        if values:
+            conditions.append(custom_field_filter(name, values))
+    return conditions
+
+
+def _reject_constant(name: str) -> Any:
+    """NaN / Infinity are not JSON values"""
+    raise ValueError(name)
+
+
+def parse_custom_field_filters(params: Sequence[str]) -> Dict[str, List[Any]]:
+    """
+    Parse `name:value` query parameters into custom field filters
+
+    A repeated name matches any of its values. Values match string fields;
+    values that are also JSON numbers or booleans (e.g. `employees:50`)
+    match the typed value too.
+
+    Raises:
+        ValueError: If a parameter has no name
+    """
+    filters: Dict[str, List[Any]] = {}
+    for param in params:
+        name, separator, value = param.partition(":")
+        if not separator or not name:
+            raise ValueError(f"Invalid custom field filter '{param}' (expected name:value)")
+        values = filters.setdefault(name, [])
+        values.append(value)
+        try:
+            typed = json.loads(value, parse_constant=_reject_constant)
+        except ValueError:
+            continue
+        if isinstance(typed, (bool, int, float)):
+            values.append(typed)
+    return filters
+
 
 class LeadSearchService:
     """リード検索サービス"""
@@ -19,32 +110,65 @@ class LeadSearchService:
     def __init__(self, db: Session):
         self.db = db
 
-    def search(self, tenant_id: UUID, query: str, limit: int = 10) -> List[Lead]:
+    def search(
+        self,
+        tenant_id: UUID,
+        query: str,
+        limit: int = 10,
+        tags: Optional[Sequence[str]] = None,
+        custom_fields: Optional[Dict[str, Sequence[Any]]] = None,
+    ) -> List[Lead]:
         """
         Search leads by name, email, or company
 
+        部分一致に加えて綴りの近いリード (pg_trgm の word similarity) も返し、
+        関連度の高い順 (同点はスコア順) に並べます。
+
         Args:
             tenant_id: テナントID
             query: 検索クエリ
             limit: 最大結果数
+            tags: 全て付いているべきタグ
+            custom_fields: カスタムフィールド名 -> 許容値
 
         Returns:
             マッチしたリードのリスト
         """
         search_pattern = f"%{query}%"
 
+        if not trigram_search_available(self.db):
+            return (
+                self.db.query(Lead)
+                .filter(
+                    and_(
+                        Lead.tenant_id == tenant_id,  # REQUIRED: Tenant filtering
+                        or_(
+                            Lead.name.ilike(search_pattern),
+                            Lead.email.ilike(search_pattern),
+                            Lead.company.ilike(search_pattern),
+                        ),
+                        *attribute_filters(tags, custom_fields),
+                    )
+                )
+                .limit(limit)
+                .all()
+            )
+
+        # Both conditions are answered by the trigram index; "%>" is word_similarity(query, document) >= threshold
+        relevance = func.word_similarity(query, SEARCH_DOCUMENT)
         leads = (
             self.db.query(Lead)
             .filter(
                 and_(
                     Lead.tenant_id == tenant_id,  # REQUIRED: Tenant filtering
                     or_(
-                        Lead.name.ilike(search_pattern),
-                        Lead.email.ilike(search_pattern),
-                        Lead.company.ilike(search_pattern),
+                        SEARCH_DOCUMENT.ilike(search_pattern),
+                        SEARCH_DOCUMENT.op("%>")(query),
                     ),
+                    *attribute_filters(tags, custom_fields),
                 )
             )
+            .order_by(desc(relevance), desc(Lead.score), Lead.id)
             .limit(limit)
             .all()
         )
@@ -0,0 +1,118 @@
+"""
+Outbox Service
+
+Transactional outbox: side effects are enqueued in the same transaction as
+the business change, then claimed in batches and delivered by the outbox
+worker with retries, exponential backoff and dead-lettering.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.outbox_event import OutboxEvent, OutboxEventStatus
+
+
+def compute_backoff(attempts: int) -> float:
+    """Delay in seconds before retrying an event that failed `attempts` times.
+
+    Exponential (OUTBOX_BACKOFF_BASE * 2^(attempts-1)) capped at
+    OUTBOX_BACKOFF_MAX, with +/-20% jitter to spread retries.
+    """
+    delay = min(settings.OUTBOX_BACKOFF_BASE * (2 ** max(attempts - 1, 0)), settings.OUTBOX_BACKOFF_MAX)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class OutboxService:
+    """Service for enqueueing and claiming outbox events."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, tenant_id: UUID, event_type: str, payload: Dict[str, Any]) -> OutboxEvent:
+        """Add an event to the current transaction (does not commit).
+
+        Args:
+            tenant_id: Tenant UUID
+            event_type: Registered outbox event type
+            payload: JSON-serializable event data
+
+        Returns:
+            Pending outbox event
+        """
+        event = OutboxEvent(
+            tenant_id=tenant_id,
+            event_type=event_type,
+            payload=payload,
+            status=OutboxEventStatus.PENDING,
+            attempts=0,
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+        self.db.add(event)
+        return event
+
+    def claim_batch(self, limit: int) -> List[Any]:
+        """Claim due events for delivery and commit the claim.
+
+        Claimed events get their attempt counted and `next_attempt_at` pushed
+        out by OUTBOX_LEASE_SECONDS, so concurrent workers skip them and
+        events of a crashed worker are redelivered after the lease.
+
+        Args:
+            limit: Maximum number of events to claim
+
+        Returns:
+            Claimed event rows (id, tenant_id, event_type, payload, attempts,
+            created_at), oldest first
+        """
+        now = datetime.now(timezone.utc)
+        due = (
+            select(OutboxEvent.id)
+            .where(
+                OutboxEvent.status == OutboxEventStatus.PENDING,
+                OutboxEvent.next_attempt_at <= now,
+            )
+            .order_by(OutboxEvent.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = self.db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(due.scalar_subquery()))
+            .values(
+                attempts=OutboxEvent.attempts + 1,
+                next_attempt_at=now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS),
+            )
+            .returning(
+                OutboxEvent.id,
+                OutboxEvent.tenant_id,
+                OutboxEvent.event_type,
+                OutboxEvent.payload,
+                OutboxEvent.attempts,
+                OutboxEvent.created_at,
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+        self.db.commit()
+        return sorted(claimed, key=lambda event: event.created_at)
+
+    def mark_delivered(self, event_ids: List[UUID]) -> None:
+        """Remove delivered events (does not commit)."""
+        if event_ids:
+            self.db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(event_ids)))
+
+    def mark_failed(self, event: Any, error: str) -> None:
+        """Schedule a retry, or dead-letter the event after OUTBOX_MAX_ATTEMPTS (does not commit)."""
+        if event.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            values = {"status": OutboxEventStatus.DEAD, "last_error": error}
+        else:
+            values = {
+                "next_attempt_at": datetime.now(timezone.utc) + timedelta(seconds=compute_backoff(event.attempts)),
+                "last_error": error,
+            }
+        self.db.execute(update(OutboxEvent).where(OutboxEvent.id == event.id).values(**values).execution_options(synchronize_session=False))
@@ -0,0 +1,151 @@
+"""
+Outbox Worker
+
+Delivers transactional outbox events (see OutboxService). Runs inside the API
+process (started from the app lifespan) or as a separate process:
+
+    python -m app.services.outbox_worker
+
+Several workers may run concurrently: claims use FOR UPDATE SKIP LOCKED, so
+each event is delivered by one worker at a time.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.http_clients import close_http_clients
+from app.models.outbox_event import OutboxEventType
+from app.services.google_analytics_service import close_ga4_batcher
+from app.services.lead_service import LeadService
+from app.services.outbox_service import OutboxService
+
+logger = logging.getLogger(__name__)
+
+# Handler: (db, tenant_id, payload) -> delivered. False or an exception
+# schedules a retry. Handlers of a batch run concurrently (so e.g. GA4 events
+# coalesce in the batcher), each with its own session scoped to the event's
+# tenant; they run on the event loop, so their session work goes through
+# run_in_threadpool.
+OutboxHandler = Callable[[Session, UUID, dict], Awaitable[bool]]
+
+OUTBOX_HANDLERS: Dict[str, OutboxHandler] = {
+    OutboxEventType.GA4_EVENT: lambda db, tenant_id, payload: LeadService(db).deliver_ga4_event(tenant_id, payload),
+    OutboxEventType.TEAMS_HOT_LEAD: lambda db, tenant_id, payload: LeadService(db).deliver_teams_notification(tenant_id, payload),
+    OutboxEventType.TEAMS_HOT_LEADS_SUMMARY: lambda db, tenant_id, payload: LeadService(db).deliver_teams_summary(tenant_id, payload),
+}
+
+
+async def _deliver(event: Any, slots: asyncio.Semaphore) -> Optional[str]:
+    """Run the handler of an event in a session of its own
+
+    Returns:
+        None if delivered, otherwise the error to record
+    """
+    handler = OUTBOX_HANDLERS.get(event.event_type)
+    if handler is None:
+        return f"No handler for outbox event type {event.event_type}"
+
+    async with slots:
+        db = SessionLocal()
+        try:
+            # RLS: handlers read tenant data
+            await run_in_threadpool(
+                db.execute,
+                text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"),
+                {"tenant_id": str(event.tenant_id)},
+            )
+            if await handler(db, event.tenant_id, event.payload):
+                return None
+            return "Delivery failed"
+        except Exception as e:
+            await run_in_threadpool(db.rollback)
+            return f"{type(e).__name__}: {e}"
+        finally:
+            db.close()
+
+
+async def process_outbox_batch(db: Session, batch_size: Optional[int] = None) -> int:
+    """Claim and deliver one batch of due outbox events.
+
+    Args:
+        db: Database session claiming and settling the events
+        batch_size: Maximum events to claim (defaults to OUTBOX_BATCH_SIZE)
+
+    Returns:
+        Number of events claimed
+    """
+    outbox = OutboxService(db)
+    events = await run_in_threadpool(outbox.claim_batch, batch_size or settings.OUTBOX_BATCH_SIZE)
+
+    # Each delivery holds a pooled connection while it runs
+    slots = asyncio.Semaphore(settings.OUTBOX_DELIVERY_CONCURRENCY)
+    errors = await asyncio.gather(*(_deliver(event, slots) for event in events))
+
+    await run_in_threadpool(_settle, db, outbox, events, errors)
+    return len(events)
+
+
+def _settle(db: Session, outbox: OutboxService, events: List[Any], errors: List[Optional[str]]) -> None:
+    """Mark delivered events done and schedule retries of the others (commits)"""
+    delivered = []
+    for event, error in zip(events, errors):
+        if error is None:
+            delivered.append(event.id)
+            continue
+
+        logger.warning(f"Outbox event {event.id} ({event.event_type}) failed on attempt {event.attempts}: {error}")
+        outbox.mark_failed(event, error)
+
+    outbox.mark_delivered(delivered)
+    db.commit()
+
+
+async def run_outbox_worker(stop_event: asyncio.Event) -> None:
+    """Deliver outbox events until `stop_event` is set.
+
+    Polls again immediately while batches come back full, otherwise waits
+    OUTBOX_POLL_INTERVAL seconds.
+    """
+    while not stop_event.is_set():
+        claimed = 0
+        db = SessionLocal()
+        try:
+            claimed = await process_outbox_batch(db)
+        except Exception as e:
+            await run_in_threadpool(db.rollback)
+            logger.error(f"Outbox batch failed: {e}")
+        finally:
+            db.close()
+
+        if claimed >= settings.OUTBOX_BATCH_SIZE:
+            continue
+
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.OUTBOX_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+    await close_ga4_batcher()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=settings.LOG_LEVEL)
+
+    async def main() -> None:
+        try:
+            await run_outbox_worker(asyncio.Event())
+        finally:
+            await close_http_clients()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,118 @@
+"""
+Principal Service
+
+Resolves the authenticated user and their tenant for every dashboard
+request. With a shared cache (CACHE_BACKEND=redis) both records are cached
+across requests for a short TTL as snapshots of their identity columns, and
+attached to the request's session without a query; any other attribute
+(password hash, lockout state, tenant settings, ...) is loaded from the
+database on first access.
+
+Call invalidate_user / invalidate_tenant after committing a change to the
+cached columns (name, email, role, plan, ...) or deleting the record. A
+per-worker cache could only be invalidated on the worker handling the
+change, leaving a demoted or deleted user their cached role on the others,
+so without a shared cache every request reads the records from the database.
+"""
+
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+from uuid import UUID
+
+import orjson
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+from app.core.cache import get_cache
+from app.core.constants import CacheTTL
+from app.models.tenant import Tenant
+from app.models.user import User
+
+# Columns cached per record (authorization reads id, tenant_id and role)
+USER_FIELDS: Tuple[str, ...] = ("id", "tenant_id", "email", "name", "role")
+TENANT_FIELDS: Tuple[str, ...] = ("id", "name", "slug", "plan")
+UUID_FIELDS = frozenset({"id", "tenant_id"})
+
+ModelT = TypeVar("ModelT", User, Tenant)
+
+
+class PrincipalService:
+    """Short-TTL cache of the users and tenants behind access tokens (shared cache only)."""
+
+    CACHE_TTL = CacheTTL.SHORT
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.cache = get_cache()
+
+    @staticmethod
+    def user_cache_key(user_id: UUID) -> str:
+        return f"principal_user:{user_id}"
+
+    @staticmethod
+    def tenant_cache_key(tenant_id: UUID) -> str:
+        return f"principal_tenant:{tenant_id}"
+
+    def get_user(self, user_id: UUID) -> Optional[User]:
+        """Get a user, from the cache when possible.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            User attached to this service's session, or None if not found
+        """
+        return self._get(User, USER_FIELDS, self.user_cache_key(user_id), user_id)
+
+    def get_tenant(self, tenant_id: UUID) -> Optional[Tenant]:
+        """Get a tenant, from the cache when possible.
+
+        Args:
+            tenant_id: Tenant UUID
+
+        Returns:
+            Tenant attached to this service's session, or None if not found
+        """
+        return self._get(Tenant, TENANT_FIELDS, self.tenant_cache_key(tenant_id), tenant_id)
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Evict a cached user (call after updating or deleting it)."""
+        self.cache.delete(self.user_cache_key(user_id))
+
+    def invalidate_tenant(self, tenant_id: UUID) -> None:
+        """Evict a cached tenant (call after updating or deleting it)."""
+        self.cache.delete(self.tenant_cache_key(tenant_id))
+
+    def _get(self, model: Type[ModelT], fields: Tuple[str, ...], key: str, record_id: UUID) -> Optional[ModelT]:
+        if not self.cache.shared:
+            return self.db.query(model).filter(model.id == record_id).first()
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._attach(model, _loads(cached))
+
+        record = self.db.query(model).filter(model.id == record_id).first()
+        if record is not None:
+            self.cache.set(key, _dumps(record, fields), self.CACHE_TTL)
+        return record
+
+    def _attach(self, model: Type[ModelT], values: Dict[str, Any]) -> ModelT:
+        """Add a cached snapshot to the session as a clean persistent instance (no query)."""
+        instance = self.db.identity_map.get(identity_key(model, values["id"]))
+        if instance is not None:
+            return instance
+
+        instance = model(**values)
+        make_transient_to_detached(instance)
+        return self.db.merge(instance, load=False)
+
+
+def _dumps(record: Any, fields: Tuple[str, ...]) -> bytes:
+    return orjson.dumps({field: getattr(record, field) for field in fields})
+
+
+def _loads(value: bytes) -> Dict[str, Any]:
+    values = orjson.loads(value)
+    for field in UUID_FIELDS.intersection(values):
+        if values[field] is not None:
+            values[field] = UUID(values[field])
+    return values
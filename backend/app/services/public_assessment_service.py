@@ -0,0 +1,187 @@
+"""
+Public Assessment Service
+
+Compiles published assessments into immutable JSON payloads for the embed
+widget and serves them from the cache. A compiled payload bundles the
+questions, their options and the public GA4 config so the widget boots with
+a single request.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.cache import get_cache
+from app.core.constants import AssessmentStatus, CacheTTL
+from app.models.assessment import Assessment
+from app.models.question import Question
+from app.services.google_analytics_service import GoogleAnalyticsService
+
+
+@dataclass(frozen=True)
+class CompiledAssessment:
+    """Serialized public assessment payload."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "CompiledAssessment":
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+    def to_cache_value(self) -> bytes:
+        return self.etag.encode("ascii") + b"\n" + self.body
+
+    @classmethod
+    def from_cache_value(cls, value: bytes) -> "CompiledAssessment":
+        etag, body = value.split(b"\n", 1)
+        return cls(body=body, etag=etag.decode("ascii"))
+
+
+def build_public_payload(
+    assessment: Assessment,
+    questions: Iterable[Question],
+    google_analytics: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build the public payload for the embed widget.
+
+    Args:
+        assessment: Published assessment
+        questions: Questions ordered by display order, with options loaded
+        google_analytics: Public GA4 config (None if not configured)
+
+    Returns:
+        JSON-serializable payload (PublicAssessmentResponse shape)
+    """
+    return {
+        "id": str(assessment.id),
+        "title": assessment.title,
+        "description": assessment.description,
+        "questions": [
+            {
+                "id": str(question.id),
+                "text": question.text,
+                "type": question.type,
+                "order": question.order,
+                "options": [
+                    {
+                        "id": str(opt.id),
+                        "text": opt.text,
+                        "points": opt.points,
+                        "order": opt.order,
+                    }
+                    for opt in question.options
+                ],
+            }
+            for question in questions
+        ],
+        "google_analytics": google_analytics,
+    }
+
+
+class PublicAssessmentService:
+    """Compiled, cached public assessment payloads."""
+
+    CACHE_TTL = CacheTTL.LONG
+    # A per-worker cache only sees its own invalidations, so other workers
+    # would keep serving an edited or unpublished assessment until expiry
+    LOCAL_CACHE_TTL = CacheTTL.SHORT
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.cache = get_cache()
+        self.cache_ttl = self.CACHE_TTL if self.cache.shared else self.LOCAL_CACHE_TTL
+
+    @staticmethod
+    def cache_key(tenant_id: UUID, assessment_id: UUID) -> str:
+        return f"public_assessment:{tenant_id}:{assessment_id}"
+
+    def compile(self, tenant_id: UUID, assessment_id: UUID) -> Optional[CompiledAssessment]:
+        """Compile a published assessment (options are loaded in one batch).
+
+        Args:
+            tenant_id: Tenant UUID
+            assessment_id: Assessment UUID
+
+        Returns:
+            Compiled payload, or None if the assessment is not published
+        """
+        assessment = (
+            self.db.query(Assessment)
+            .filter(
+                Assessment.id == assessment_id,
+                Assessment.tenant_id == tenant_id,
+                Assessment.status == AssessmentStatus.PUBLISHED.value,
+            )
+            .first()
+        )
+        if not assessment:
+            return None
+
+        questions: List[Question] = (
+            self.db.query(Question)
+            .options(selectinload(Question.options))
+            .filter(Question.assessment_id == assessment_id)
+            .order_by(Question.order)
+            .all()
+        )
+        google_analytics = GoogleAnalyticsService(self.db).get_public_config(assessment_id)
+
+        return CompiledAssessment.from_payload(build_public_payload(assessment, questions, google_analytics))
+
+    def get(self, tenant_id: UUID, assessment_id: UUID) -> Optional[CompiledAssessment]:
+        """Get the compiled payload, compiling and caching it on a miss.
+
+        Args:
+            tenant_id: Tenant UUID
+            assessment_id: Assessment UUID
+
+        Returns:
+            Compiled payload, or None if the assessment is not published
+        """
+        key = self.cache_key(tenant_id, assessment_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return CompiledAssessment.from_cache_value(cached)
+
+        compiled = self.compile(tenant_id, assessment_id)
+        if compiled is not None:
+            self.cache.set(key, compiled.to_cache_value(), self.cache_ttl)
+        return compiled
+
+    def refresh(self, assessment: Assessment) -> None:
+        """Recompile a published assessment, or evict it if not published.
+
+        Call after an assessment (or its questions) has been committed.
+        """
+        key = self.cache_key(assessment.tenant_id, assessment.id)
+        if assessment.status != AssessmentStatus.PUBLISHED.value:
+            self.cache.delete(key)
+            return
+
+        compiled = self.compile(assessment.tenant_id, assessment.id)
+        if compiled is None:
+            self.cache.delete(key)
+        else:
+            self.cache.set(key, compiled.to_cache_value(), self.cache_ttl)
+
+    def invalidate(self, tenant_id: UUID, assessment_id: UUID) -> None:
+        """Evict a compiled assessment."""
+        self.cache.delete(self.cache_key(tenant_id, assessment_id))
+
+    def invalidate_tenant(self, tenant_id: UUID) -> None:
+        """Evict all published assessments of a tenant (e.g. GA4 config changed)."""
+        assessment_ids = [
+            row.id
+            for row in self.db.query(Assessment.id).filter(
+                Assessment.tenant_id == tenant_id,
+                Assessment.status == AssessmentStatus.PUBLISHED.value,
+            )
+        ]
+        if assessment_ids:
+            self.cache.delete(*(self.cache_key(tenant_id, assessment_id) for assessment_id in assessment_ids))
@@ -0,0 +1,235 @@
+"""QR Code Analytics Service
+
+Maintains the `qr_scan_daily` rollup and answers QR analytics queries from it.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.qr_code import QRCode
+from app.models.qr_code_scan import QRCodeScan
+from app.models.qr_scan_daily import QRScanDaily
+
+# Device buckets reported by the analytics endpoint (anything else is "unknown")
+DEVICE_TYPES = ("mobile", "tablet", "desktop", "unknown")
+
+# Number of countries included in scans_by_country
+TOP_COUNTRIES_LIMIT = 10
+
+# Rollup counters that can be incremented
+ROLLUP_COUNTERS = ("scans", "started", "completed", "leads")
+
+
+def build_qr_analytics(rows: Iterable[Any], unique_scans: int) -> Dict[str, Any]:
+    """Build the QR analytics response from rollup rows.
+
+    Args:
+        rows: Rollup rows exposing day, device_type, country, scans,
+            started, completed and leads attributes
+        unique_scans: Unique scan count stored on the QR code
+
+    Returns:
+        Analytics dict with summary, scans_by_date, scans_by_device,
+        scans_by_country and funnel keys
+    """
+    total_scans = started = completed = leads = 0
+    scans_by_date_dict: Dict[str, int] = {}
+    device_counts = {device: 0 for device in DEVICE_TYPES}
+    country_counts: Dict[str, int] = {}
+
+    for row in rows:
+        total_scans += row.scans
+        started += row.started
+        completed += row.completed
+        leads += row.leads
+
+        if row.scans:
+            date_str = row.day.strftime("%Y-%m-%d")
+            scans_by_date_dict[date_str] = scans_by_date_dict.get(date_str, 0) + row.scans
+
+        device_type = row.device_type if row.device_type in device_counts else "unknown"
+        device_counts[device_type] += row.scans
+
+        if row.country and row.scans:
+            country_counts[row.country] = country_counts.get(row.country, 0) + row.scans
+
+    conversion_rate = (completed / total_scans * 100) if total_scans > 0 else 0.0
+
+    top_countries = sorted(country_counts.items(), key=lambda x: (-x[1], x[0]))[:TOP_COUNTRIES_LIMIT]
+
+    return {
+        "summary": {
+            "total_scans": total_scans,
+            "unique_scans": unique_scans,
+            "assessment_started": started,
+            "assessment_completed": completed,
+            "leads_created": leads,
+            "conversion_rate": round(conversion_rate, 2),
+        },
+        "scans_by_date": [{"date": date, "scans": count} for date, count in sorted(scans_by_date_dict.items())],
+        "scans_by_device": device_counts,
+        "scans_by_country": {"country_scans": dict(top_countries)},
+        "funnel": {
+            "scanned": total_scans,
+            "started": started,
+            "completed": completed,
+            "converted": leads,
+        },
+    }
+
+
+class QRAnalyticsService:
+    """Service for QR code scan rollups and analytics."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ========================================================================
+    # Rollup Maintenance
+    # ========================================================================
+
+    @staticmethod
+    def build_increment_statement(
+        qr_code_id: UUID,
+        scanned_at: datetime,
+        device_type: Optional[str],
+        country: Optional[str],
+        increments: Dict[str, int],
+    ):
+        """Build an upsert that adds `increments` to a rollup bucket.
+
+        Args:
+            qr_code_id: QR code UUID
+            scanned_at: Scan timestamp (UTC) - determines the bucket day
+            device_type: Device type of the scan
+            country: Country code of the scan (None when unknown)
+            increments: Counter name to delta mapping (see ROLLUP_COUNTERS)
+
+        Returns:
+            INSERT ... ON CONFLICT DO UPDATE statement
+        """
+        unknown = set(increments) - set(ROLLUP_COUNTERS)
+        if unknown:
+            raise ValueError(f"Unknown rollup counters: {', '.join(sorted(unknown))}")
+
+        values = {counter: increments.get(counter, 0) for counter in ROLLUP_COUNTERS}
+        stmt = pg_insert(QRScanDaily).values(
+            id=uuid4(),
+            qr_code_id=qr_code_id,
+            day=scanned_at.date(),
+            device_type=device_type or "unknown",
+            country=country or "",
+            **values,
+        )
+
+        table = QRScanDaily.__table__
+        return stmt.on_conflict_do_update(
+            index_elements=["qr_code_id", "day", "device_type", "country"],
+            set_={counter: table.c[counter] + stmt.excluded[counter] for counter in increments},
+        )
+
+    async def _increment(self, scan: QRCodeScan, increments: Dict[str, int]) -> None:
+        """Apply counter increments to the bucket of a scan (no commit)."""
+        if not increments:
+            return
+
+        stmt = self.build_increment_statement(
+            qr_code_id=scan.qr_code_id,
+            scanned_at=scan.scanned_at or datetime.utcnow(),
+            device_type=scan.device_type,
+            country=scan.country,
+            increments=increments,
+        )
+        await self.db.execute(stmt)
+
+    async def record_scan(self, scan: QRCodeScan) -> None:
+        """Count a new scan in the daily rollup.
+
+        Must be called in the same transaction that inserts the scan.
+
+        Args:
+            scan: Newly created scan
+        """
+        await self._increment(scan, {"scans": 1})
+
+    async def record_funnel_progress(
+        self,
+        scan: QRCodeScan,
+        started: bool = False,
+        completed: bool = False,
+        lead: bool = False,
+    ) -> None:
+        """Count funnel transitions of a scan in the daily rollup.
+
+        Callers pass only the flags that flipped from False to True so each
+        scan is counted at most once per funnel step. Funnel steps are
+        attributed to the day the scan happened.
+
+        Args:
+            scan: Scan whose funnel state changed
+            started: Assessment was started
+            completed: Assessment was completed
+            lead: A lead was created
+        """
+        increments = {}
+        if started:
+            increments["started"] = 1
+        if completed:
+            increments["completed"] = 1
+        if lead:
+            increments["leads"] = 1
+
+        await self._increment(scan, increments)
+
+    # ========================================================================
+    # Analytics Queries
+    # ========================================================================
+
+    async def get_rollup_rows(self, qr_code_id: UUID, start_date: datetime) -> Sequence[Any]:
+        """Get rollup rows for a QR code from `start_date` (inclusive, by day).
+
+        Args:
+            qr_code_id: QR code UUID
+            start_date: Start of the analytics window
+
+        Returns:
+            Rollup rows ordered by day
+        """
+        result = await self.db.execute(
+            select(
+                QRScanDaily.day,
+                QRScanDaily.device_type,
+                QRScanDaily.country,
+                QRScanDaily.scans,
+                QRScanDaily.started,
+                QRScanDaily.completed,
+                QRScanDaily.leads,
+            )
+            .where(
+                QRScanDaily.qr_code_id == qr_code_id,
+                QRScanDaily.day >= start_date.date(),
+            )
+            .order_by(QRScanDaily.day)
+        )
+        return result.all()
+
+    async def get_analytics(self, qr_code: QRCode, days: int = 30) -> Dict[str, Any]:
+        """Get analytics for a QR code over the last `days` days.
+
+        The window is day-aligned: the first day is included in full.
+
+        Args:
+            qr_code: QR code (already tenant-checked)
+            days: Number of days to analyze
+
+        Returns:
+            Analytics dict (see build_qr_analytics)
+        """
+        start_date = datetime.utcnow() - timedelta(days=days)
+        rows: List[Any] = list(await self.get_rollup_rows(qr_code.id, start_date))
+        return build_qr_analytics(rows, unique_scans=qr_code.unique_scan_count)
@@ -1,9 +1,10 @@
 """QR Code Service
 
-Handles QR code generation, short URL creation, and cloud storage uploads.
+Handles QR code generation, short URL creation, and image storage.
 """
 
 import io
+import os
 import secrets
 import string
 from typing import Optional
@@ -13,7 +14,9 @@ import qrcode
 from PIL import Image
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
+from app.core.storage import StoredFile, get_storage
 from app.models.assessment import Assessment
 from app.models.qr_code import QRCode
 from app.models.tenant import Tenant
@@ -210,43 +213,89 @@ class QRCodeService:
         img_byte_arr.seek(0)
         return img_byte_arr.getvalue()
 
+    def render_qr_png(self, qr_code: QRCode) -> bytes:
+        """Render the PNG image of an existing QR code with its current style.
+
+        Args:
+            qr_code: QR code instance
+
+        Returns:
+            PNG image bytes
+        """
+        base_url = f"https://app.diagnoleads.com/assessments/{qr_code.assessment_id}"
+        utm_params = []
+
+        if qr_code.utm_source:
+            utm_params.append(f"utm_source={qr_code.utm_source}")
+        if qr_code.utm_medium:
+            utm_params.append(f"utm_medium={qr_code.utm_medium}")
+        if qr_code.utm_campaign:
+            utm_params.append(f"utm_campaign={qr_code.utm_campaign}")
+        if qr_code.utm_term:
+            utm_params.append(f"utm_term={qr_code.utm_term}")
+        if qr_code.utm_content:
+            utm_params.append(f"utm_content={qr_code.utm_content}")
+
+        utm_params.append(f"qr={qr_code.short_code}")
+        full_url = f"{base_url}?{'&'.join(utm_params)}"
+
+        style = qr_code.style or {}
+        qr_img = self.generate_qr_image(
+            url=full_url,
+            color=style.get("color", "#1E40AF"),
+            size=style.get("size", 512),
+            error_correction="H",
+        )
+        return self.qr_image_to_bytes(qr_img, format="PNG")
+
     # ========================================================================
-    # Cloud Storage Upload (Placeholder)
+    # File Storage
     # ========================================================================
 
     async def upload_to_storage(self, file_data: bytes, filename: str, content_type: str = "image/png") -> str:
-        """Upload file to cloud storage (S3, R2, etc.).
+        """Upload file to the configured storage backend (local or S3).
 
-        NOTE: This is a placeholder implementation. In production, integrate with:
-        - AWS S3
-        - Cloudflare R2
-        - Google Cloud Storage
-        - Azure Blob Storage
+        Files are content-addressed, so `filename` only determines the
+        extension and uploading identical content is a no-op.
 
         Args:
             file_data: File content as bytes
-            filename: Target filename
+            filename: Original filename (used for the extension)
             content_type: MIME type
 
         Returns:
             Public URL of uploaded file
         """
-        # TODO: Implement actual cloud storage integration
-        # For now, return a placeholder URL
-
-        # Example implementation with boto3 (AWS S3):
-        # import boto3
-        # s3_client = boto3.client('s3')
-        # s3_client.put_object(
-        #     Bucket='diagnoleads-qr-codes',
-        #     Key=filename,
-        #     Body=file_data,
-        #     ContentType=content_type
-        # )
-        # return f"https://diagnoleads-qr-codes.s3.amazonaws.com/{filename}"
-
-        # Placeholder URL
-        return f"https://storage.diagnoleads.com/qr-codes/{filename}"
+        storage = get_storage()
+        stored = await run_in_threadpool(storage.save, file_data, os.path.splitext(filename)[1], content_type)
+        return storage.url_for(stored.key)
+
+    async def get_stored_image(self, qr_code: QRCode) -> StoredFile:
+        """Get the stored PNG image of a QR code, rendering it only if missing.
+
+        QR codes created before storage was configured (or whose file was
+        lost) are rendered once, stored and their image URL updated.
+
+        Args:
+            qr_code: QR code instance
+
+        Returns:
+            Stored file metadata
+        """
+        storage = get_storage()
+        key = storage.key_from_url(qr_code.qr_code_image_url)
+        if key:
+            stored = await run_in_threadpool(storage.stat, key)
+            if stored is not None:
+                return stored
+
+        png_bytes = await run_in_threadpool(self.render_qr_png, qr_code)
+        stored = await run_in_threadpool(storage.save, png_bytes, ".png", "image/png")
+
+        qr_code.qr_code_image_url = storage.url_for(stored.key)
+        await self.db.commit()
+
+        return stored
 
     # ========================================================================
     # Complete QR Code Creation Flow
@@ -376,32 +425,10 @@ class QRCodeService:
         if not qr_code:
             raise ValueError(f"QR code {qr_code_id} not found")
 
-        # Build full URL
-        base_url = f"https://app.diagnoleads.com/assessments/{qr_code.assessment_id}"
-        utm_params = []
-
-        if qr_code.utm_source:
-            utm_params.append(f"utm_source={qr_code.utm_source}")
-        if qr_code.utm_medium:
-            utm_params.append(f"utm_medium={qr_code.utm_medium}")
-        if qr_code.utm_campaign:
-            utm_params.append(f"utm_campaign={qr_code.utm_campaign}")
-        if qr_code.utm_term:
-            utm_params.append(f"utm_term={qr_code.utm_term}")
-        if qr_code.utm_content:
-            utm_params.append(f"utm_content={qr_code.utm_content}")
-
-        utm_params.append(f"qr={qr_code.short_code}")
-        full_url = f"{base_url}?{'&'.join(utm_params)}"
-
         # Generate new image with current style
-        qr_color = qr_code.style.get("color", "#1E40AF")
-        qr_size = qr_code.style.get("size", 512)
-
-        qr_img = self.generate_qr_image(url=full_url, color=qr_color, size=qr_size, error_correction="H")
+        png_bytes = self.render_qr_png(qr_code)
 
         # Upload
-        png_bytes = self.qr_image_to_bytes(qr_img, format="PNG")
         filename_png = f"qr_{qr_code.short_code}_v2.png"
         image_url = await self.upload_to_storage(file_data=png_bytes, filename=filename_png, content_type="image/png")
 
@@ -15,6 +15,7 @@ from app.models.assessment import Assessment
 from app.models.lead import Lead
 from app.models.report import Report
 from app.schemas.report import ReportCreate, ReportUpdate
+from app.services.leads.lead_search import attribute_filters
 
 
 class ReportService:
@@ -261,6 +262,10 @@ class ReportService:
             if "max" in score_range:
                 query = query.filter(Lead.score <= score_range["max"])
 
+        # Tag filter (leads carrying every tag) and custom field filter (field equals a value or one of a list)
+        custom_fields = {name: value if isinstance(value, list) else [value] for name, value in (filters.get("custom_fields") or {}).items()}
+        query = query.filter(*attribute_filters(filters.get("tags"), custom_fields))
+
         return query
 
     def _apply_assessment_filters(self, query, filters: Dict[str, Any]):
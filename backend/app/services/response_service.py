@@ -0,0 +1,122 @@
+"""
+Response Service
+
+Persists embed widget answers for response sessions.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.answer import Answer
+from app.models.response import Response
+
+
+def build_answer_upsert_statement(
+    response_id: UUID,
+    answers: Iterable[Any],
+    response_values: Optional[Dict[str, Any]] = None,
+):
+    """Build one statement that upserts answers and recomputes the score.
+
+    Renders as::
+
+        WITH upserted AS (
+            INSERT INTO answers ... ON CONFLICT (response_id, question_id) DO UPDATE ...
+            RETURNING question_id, points_awarded
+        )
+        UPDATE responses SET total_score = <upserted points> + <other answers' points>, ...
+        WHERE id = :response_id RETURNING total_score
+
+    The UPDATE sees the answers table as it was before the INSERT, so the
+    score adds the upserted points to the points of answers not touched by
+    this submission. If a question is answered more than once in a single
+    submission, the last answer wins.
+
+    Args:
+        response_id: Response UUID
+        answers: Answers to upsert (AnswerCreate, or buffered answers that
+            also carry `id` and `answered_at`)
+        response_values: Extra Response columns to set (email, status, ...)
+
+    Returns:
+        UPDATE ... RETURNING total_score statement
+    """
+    answered_at = datetime.now(timezone.utc)
+    rows = {
+        answer.question_id: {
+            "id": getattr(answer, "id", None) or uuid4(),
+            "response_id": response_id,
+            "question_id": answer.question_id,
+            "answer_text": answer.answer_text,
+            "points_awarded": answer.points_awarded,
+            "answered_at": getattr(answer, "answered_at", None) or answered_at,
+        }
+        for answer in answers
+    }
+
+    other_answers = select(func.coalesce(func.sum(Answer.points_awarded), 0)).where(Answer.response_id == response_id)
+
+    if rows:
+        insert_stmt = pg_insert(Answer).values(list(rows.values()))
+        upserted = (
+            insert_stmt.on_conflict_do_update(
+                index_elements=[Answer.response_id, Answer.question_id],
+                set_={
+                    "answer_text": insert_stmt.excluded.answer_text,
+                    "points_awarded": insert_stmt.excluded.points_awarded,
+                    "answered_at": insert_stmt.excluded.answered_at,
+                },
+            )
+            .returning(Answer.question_id, Answer.points_awarded)
+            .cte("upserted")
+        )
+        upserted_points = select(func.coalesce(func.sum(upserted.c.points_awarded), 0)).scalar_subquery()
+        other_answers = other_answers.where(Answer.question_id.not_in(select(upserted.c.question_id)))
+        total_score = upserted_points + other_answers.scalar_subquery()
+    else:
+        upserted = None
+        total_score = other_answers.scalar_subquery()
+
+    stmt = (
+        update(Response)
+        .where(Response.id == response_id)
+        .values(total_score=total_score, **(response_values or {}))
+        .returning(Response.total_score)
+        .execution_options(synchronize_session=False)
+    )
+    if upserted is not None:
+        stmt = stmt.add_cte(upserted)
+    return stmt
+
+
+class ResponseService:
+    """Service for response sessions and their answers."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save_answers(self, response: Response, answers: Iterable[Any], **response_values: Any) -> int:
+        """Upsert answers and update the response score in one round trip.
+
+        Does not commit.
+
+        Args:
+            response: Response being answered
+            answers: Answers to upsert
+            **response_values: Extra Response columns to set (email, status, ...)
+
+        Returns:
+            New total score of the response
+        """
+        stmt = build_answer_upsert_statement(response.id, answers, response_values)
+        total_score = self.db.execute(stmt).scalar_one()
+
+        # The statement bypasses the identity map
+        self.db.expire(response)
+
+        return total_score
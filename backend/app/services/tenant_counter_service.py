@@ -0,0 +1,229 @@
+"""
+Tenant Counter Service
+
+Incrementally maintained per-tenant counts (see TenantCounter). Mutations
+apply +1/-1 deltas with one upsert in their own transaction, so the counts
+commit atomically with the rows they describe; count lookups read counter
+rows instead of running COUNT(*) over the tenant's leads or assessments.
+
+Writes that bypass the services (bulk SQL, manual fixes) are repaired by
+`reconcile`, which recounts a tenant from its rows. The reconciler worker
+runs it for every tenant periodically inside the API processes (started
+from the app lifespan); one process per deployment, elected with a
+LeaderLock, runs the passes. A single pass can also be run from cron:
+
+    python -m app.services.tenant_counter_service
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.constants import LeadScoreThreshold
+from app.core.database import LeaderLock, SessionLocal
+from app.models.assessment import Assessment
+from app.models.lead import Lead
+from app.models.tenant import Tenant
+from app.models.tenant_counter import TenantCounter
+
+logger = logging.getLogger(__name__)
+
+LEADS_TOTAL = "leads.total"
+ASSESSMENTS_TOTAL = "assessments.total"
+
+
+def lead_temperature(score: int) -> str:
+    """Temperature bucket of a lead score (hot / warm / cold)"""
+    if score >= LeadScoreThreshold.HOT_MIN:
+        return "hot"
+    if score >= LeadScoreThreshold.WARM_MIN:
+        return "warm"
+    return "cold"
+
+
+def lead_counters(status: str, score: int) -> List[str]:
+    """Counters a lead with this status and score is counted in"""
+    return [LEADS_TOTAL, f"leads.status.{status}", f"leads.temperature.{lead_temperature(score)}"]
+
+
+def assessment_counters(status: str) -> List[str]:
+    """Counters an assessment with this status is counted in"""
+    return [ASSESSMENTS_TOTAL, f"assessments.status.{status}"]
+
+
+def counter_deltas(old: Iterable[str] = (), new: Iterable[str] = ()) -> Dict[str, int]:
+    """Deltas turning the counters of `old` into those of `new` (unchanged counters are left out)"""
+    deltas = Counter(new)
+    deltas.subtract(old)
+    return {counter: delta for counter, delta in deltas.items() if delta}
+
+
+class TenantCounterService:
+    """Service for per-tenant counters."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(self, tenant_id: UUID, deltas: Dict[str, int]) -> None:
+        """Add deltas to a tenant's counters (does not commit)
+
+        Counter rows are upserted in name order, so concurrent mutations
+        lock them in the same order.
+
+        Args:
+            tenant_id: Tenant UUID
+            deltas: Counter name -> delta
+        """
+        rows = [{"tenant_id": tenant_id, "counter": counter, "value": delta} for counter, delta in sorted(deltas.items()) if delta]
+        if not rows:
+            return
+
+        stmt = insert(TenantCounter).values(rows)
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[TenantCounter.tenant_id, TenantCounter.counter],
+                set_={"value": TenantCounter.value + stmt.excluded.value},
+            )
+        )
+
+    def lead_changed(self, tenant_id: UUID, old: Optional[Tuple[str, int]] = None, new: Optional[Tuple[str, int]] = None) -> None:
+        """Count a lead created (old=None), changed or deleted (new=None) (does not commit)
+
+        Args:
+            tenant_id: Tenant UUID
+            old: (status, score) before the mutation
+            new: (status, score) after the mutation
+        """
+        self.apply(tenant_id, counter_deltas(lead_counters(*old) if old else (), lead_counters(*new) if new else ()))
+
+    def assessment_changed(self, tenant_id: UUID, old_status: Optional[str] = None, new_status: Optional[str] = None) -> None:
+        """Count an assessment created (old_status=None), changed or deleted (new_status=None) (does not commit)"""
+        self.apply(
+            tenant_id,
+            counter_deltas(assessment_counters(old_status) if old_status else (), assessment_counters(new_status) if new_status else ()),
+        )
+
+    def get(self, tenant_id: UUID, counter: str) -> int:
+        """Value of one counter (0 if the tenant never had a row for it)"""
+        value = self.db.execute(select(TenantCounter.value).where(TenantCounter.tenant_id == tenant_id, TenantCounter.counter == counter)).scalar()
+        return value or 0
+
+    def get_all(self, tenant_id: UUID) -> Dict[str, int]:
+        """All counters of a tenant"""
+        rows = self.db.execute(select(TenantCounter.counter, TenantCounter.value).where(TenantCounter.tenant_id == tenant_id)).all()
+        return {row.counter: row.value for row in rows}
+
+    def count_rows(self, tenant_id: UUID) -> Dict[str, int]:
+        """Counters recomputed from the tenant's leads and assessments (one grouped scan each)"""
+        temperature = case(
+            (Lead.score >= LeadScoreThreshold.HOT_MIN, "hot"),
+            (Lead.score >= LeadScoreThreshold.WARM_MIN, "warm"),
+            else_="cold",
+        )
+        counts: Counter = Counter()
+        lead_groups = self.db.execute(
+            select(Lead.status, temperature, func.count()).where(Lead.tenant_id == tenant_id).group_by(Lead.status, temperature)
+        ).all()
+        for status, bucket, count in lead_groups:
+            counts[LEADS_TOTAL] += count
+            counts[f"leads.status.{status}"] += count
+            counts[f"leads.temperature.{bucket}"] += count
+
+        assessment_groups = self.db.execute(
+            select(Assessment.status, func.count()).where(Assessment.tenant_id == tenant_id).group_by(Assessment.status)
+        ).all()
+        for status, count in assessment_groups:
+            counts[ASSESSMENTS_TOTAL] += count
+            counts[f"assessments.status.{status}"] += count
+        return dict(counts)
+
+    def reconcile(self, tenant_id: UUID) -> Dict[str, int]:
+        """Repair a tenant's counters from its rows (does not commit)
+
+        The tenant's counter rows are locked first: mutations that already
+        applied deltas commit before the recount reads the rows, and later
+        ones wait and apply their deltas on top of the repaired values.
+
+        Returns:
+            Corrections applied (counter -> actual - stored)
+        """
+        stored = dict(
+            self.db.execute(
+                select(TenantCounter.counter, TenantCounter.value)
+                .where(TenantCounter.tenant_id == tenant_id)
+                .order_by(TenantCounter.counter)
+                .with_for_update()
+            ).all()
+        )
+        actual = self.count_rows(tenant_id)
+
+        drift = {counter: actual.get(counter, 0) - stored.get(counter, 0) for counter in stored.keys() | actual.keys()}
+        drift = {counter: delta for counter, delta in drift.items() if delta}
+        self.apply(tenant_id, drift)
+        return drift
+
+
+def reconcile_all_tenants() -> int:
+    """Reconcile the counters of every tenant, one transaction per tenant
+
+    Returns:
+        Number of tenants whose counters had drifted
+    """
+    db = SessionLocal()
+    try:
+        tenant_ids = list(db.execute(select(Tenant.id)).scalars())
+        db.rollback()
+
+        drifted = 0
+        for tenant_id in tenant_ids:
+            try:
+                # RLS: counters and counted rows are tenant scoped
+                db.execute(text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"), {"tenant_id": str(tenant_id)})
+                drift = TenantCounterService(db).reconcile(tenant_id)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Counter reconciliation of tenant {tenant_id} failed: {e}")
+                continue
+            if drift:
+                drifted += 1
+                logger.warning(f"Repaired counter drift of tenant {tenant_id}: {drift}")
+        return drifted
+    finally:
+        db.close()
+
+
+async def run_counter_reconciler(stop_event: asyncio.Event) -> None:
+    """Reconcile all tenants every TENANT_COUNTER_RECONCILE_INTERVAL seconds until `stop_event` is set
+
+    Only the process holding the reconciler's leader lock runs the passes.
+    """
+    leader = LeaderLock("tenant_counter_reconciler")
+    try:
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=settings.TENANT_COUNTER_RECONCILE_INTERVAL)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                if await run_in_threadpool(leader.acquire):
+                    await run_in_threadpool(reconcile_all_tenants)
+            except Exception as e:
+                logger.error(f"Counter reconciliation failed: {e}")
+    finally:
+        await run_in_threadpool(leader.release)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    logger.info(f"Counters of {reconcile_all_tenants()} tenants repaired")
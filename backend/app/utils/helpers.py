@@ -4,9 +4,15 @@ Utility Helper Functions
 Common helper functions used across services.
 """
 
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Literal, Optional, Sequence, TypeVar
 
+from sqlalchemy import DateTime, Select, TextClause, Uuid, func, literal, select, text, tuple_
 from sqlalchemy.orm import Query
 
 from app.core.constants import LeadScoreThreshold, TimeInterval
@@ -189,30 +195,230 @@ def calculate_conversion_rate(converted: int, total: int) -> float:
     return round((converted / total) * 100, 2)
 
 
-def paginate_query(query: Query, page: int = 1, page_size: int = 20, max_page_size: int = 100) -> tuple[List[T], int]:
+def encode_cursor(values: Dict[str, Any]) -> str:
     """
-    Paginate a SQLAlchemy query.
+    Encode pagination state as an opaque, URL-safe cursor.
 
     Args:
-        query: SQLAlchemy query
-        page: Page number (1-indexed)
-        page_size: Number of items per page
-        max_page_size: Maximum allowed page size
+        values: JSON-serializable position (e.g. last sort key and ID)
+
+    Returns:
+        Cursor string
+    """
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Position values
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, dict):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+# Total count of a paginated query: exact COUNT(*), the planner's row estimate
+# (PostgreSQL EXPLAIN, falls back to exact elsewhere), or none
+TotalMode = Literal["exact", "estimated", "none"]
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a paginated query"""
+
+    items: List[T]
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None  # None on the last page
+
+
+def _cursor_value(column: Any, value: Any) -> Any:
+    """Convert a decoded cursor value back to the column's Python type"""
+    if value is None:
+        return None
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, Uuid):
+        return uuid.UUID(value)
+    return value
+
+
+def cursor_for(item: Any, order_by: Sequence[Any]) -> str:
+    """
+    Build the keyset cursor pointing after an item.
+
+    Args:
+        item: Last item of a page
+        order_by: Sort columns, ending with a unique column (e.g. id)
 
     Returns:
-        Tuple of (items, total_count)
+        Cursor string
     """
-    # Validate and limit page size
-    page_size = min(page_size, max_page_size)
+    return encode_cursor({"k": [getattr(item, column.key) for column in order_by]})
+
+
+def next_page_cursor(items: Sequence[Any], order_by: Sequence[Any], limit: int) -> Optional[str]:
+    """
+    Cursor of the next page for callers that fetched exactly `limit` items.
+
+    A full page may be the last one; the next request then returns no items.
+
+    Args:
+        items: Items of the current page
+        order_by: Sort columns, ending with a unique column
+        limit: Requested page size
+
+    Returns:
+        Cursor string, or None if the page is not full
+    """
+    if not items or len(items) < limit:
+        return None
+    return cursor_for(items[-1], order_by)
+
+
+def apply_keyset(query: Any, order_by: Sequence[Any], cursor: Optional[str] = None, descending: bool = True) -> Any:
+    """
+    Order a query by (sort keys, id) and start it after a cursor.
+
+    Works on ORM queries and select() statements. The cursor condition is a
+    row comparison, so with an index on the sort columns deep pages cost the
+    same as the first one (unlike OFFSET).
 
-    # Get total count
-    total_count = query.count()
+    Args:
+        query: SQLAlchemy query or select()
+        order_by: Sort columns, ending with a unique column (e.g. id)
+        cursor: Cursor from cursor_for (None for the first page)
+        descending: Sort direction (all columns)
+
+    Returns:
+        Ordered and filtered query (not limited)
+
+    Raises:
+        ValueError: If the cursor is malformed or from another sort order
+    """
+    if cursor:
+        values = decode_cursor(cursor).get("k")
+        if not isinstance(values, list) or len(values) != len(order_by):
+            raise ValueError("Invalid cursor")
+        try:
+            position = tuple_(*[literal(_cursor_value(column, value), column.type) for column, value in zip(order_by, values)])
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        keys = tuple_(*order_by)
+        query = query.where(keys < position if descending else keys > position)
+
+    return query.order_by(*[column.desc() if descending else column.asc() for column in order_by])
+
+
+def count_statement(statement: Select) -> Select:
+    """COUNT(*) of a select() statement's rows"""
+    return select(func.count()).select_from(statement.order_by(None).subquery())
+
+
+def explain_statement(statement: Select, dialect: Any) -> Optional[TextClause]:
+    """
+    EXPLAIN statement returning the planner's row estimate (PostgreSQL only).
+
+    Args:
+        statement: select() statement
+        dialect: Dialect of the session's bind
+
+    Returns:
+        EXPLAIN (FORMAT JSON) statement, or None if the dialect has no
+        supported estimate
+    """
+    if dialect.name != "postgresql":
+        return None
+    sql = str(statement.order_by(None).compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    # Colons in literals (e.g. timestamps) must not be read as bind parameters
+    return text("EXPLAIN (FORMAT JSON) " + sql.replace(":", "\\:"))
+
+
+def plan_row_estimate(plan: Any) -> int:
+    """Top-level row estimate of an EXPLAIN (FORMAT JSON) result"""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_query(query: Query, mode: TotalMode = "exact") -> Optional[int]:
+    """
+    Count the rows of an ORM query.
+
+    Args:
+        query: SQLAlchemy query (filters applied, not paginated)
+        mode: "exact", "estimated" or "none"
+
+    Returns:
+        Row count, or None for mode "none"
+    """
+    if mode == "none":
+        return None
+    if mode == "estimated":
+        explain = explain_statement(query.statement, query.session.get_bind().dialect)
+        if explain is not None:
+            return plan_row_estimate(query.session.execute(explain).scalar())
+    return query.order_by(None).count()
+
+
+def paginate_query(
+    query: Query,
+    order_by: Sequence[Any],
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    descending: bool = True,
+    total: TotalMode = "exact",
+    max_limit: int = 100,
+) -> Page:
+    """
+    Paginate an ORM query by keyset, with offset mode for older clients.
+
+    With a cursor, the page starts after the cursor position (keyset);
+    otherwise it starts at `offset`. Either way the page is ordered by
+    `order_by` and carries the cursor of the next page, so offset clients
+    can switch to cursors at any point.
+
+    Args:
+        query: SQLAlchemy query (filters applied, unordered)
+        order_by: Sort columns, ending with a unique column (e.g. id)
+        limit: Page size
+        cursor: Cursor from a previous page
+        offset: Rows to skip (ignored with a cursor)
+        descending: Sort direction (all columns)
+        total: Total count mode ("exact", "estimated" or "none")
+        max_limit: Maximum allowed page size
+
+    Returns:
+        Page with items, total and next_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    limit = min(limit, max_limit)
+    total_count = count_query(query, total)
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    items = query.limit(page_size).offset(offset).all()
+    paged = apply_keyset(query, order_by, cursor, descending)
+    if not cursor and offset:
+        paged = paged.offset(offset)
+    items = paged.limit(limit + 1).all()
 
-    return items, total_count
+    next_cursor = cursor_for(items[limit - 1], order_by) if len(items) > limit else None
+    return Page(items=items[:limit], total=total_count, next_cursor=next_cursor)
 
 
 def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
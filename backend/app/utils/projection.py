@@ -0,0 +1,135 @@
+"""
+Row Projections
+
+Column projections for list endpoints. A projected query selects only the
+columns of the response schema's fields (or of a sparse fieldset requested
+with `?fields=id,name,score`) and returns tuple-backed rows instead of ORM
+entities: the rows bypass the session's identity map, and columns a response
+does not ask for (notes, JSON documents, stack traces) are never loaded.
+
+Pages are serialized straight to JSON bytes by the (reduced) response
+schema, so the endpoint returns a ready Response instead of having FastAPI
+validate ORM objects against the full response_model.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+from app.core.responses import json_response
+
+Fieldset = Tuple[str, ...]
+
+FIELDS_DESCRIPTION = "Comma-separated response fields to return (sparse fieldset), e.g. id,name,score; default all fields"
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Fieldset:
+    """
+    Parse a sparse fieldset parameter against a response schema.
+
+    Args:
+        fields: Comma-separated field names (None or empty = all fields)
+        schema: Response schema of one item
+
+    Returns:
+        Field names in request order (schema order for all fields)
+
+    Raises:
+        ValueError: If a field is not part of the schema
+    """
+    if not fields:
+        return tuple(schema.model_fields)
+
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in schema.model_fields]
+    if unknown or not names:
+        raise ValueError(f"Unknown fields: {', '.join(unknown) or fields}. Available: {', '.join(schema.model_fields)}")
+    return names
+
+
+def project(query: Any, model: Any, fields: Sequence[str], extra: Iterable[Any] = ()) -> Any:
+    """
+    Select only the columns of `fields` (plus `extra` columns) as rows.
+
+    Args:
+        query: ORM query or select() of `model`
+        model: Mapped class whose attributes are named like the fields
+        fields: Field names (see parse_fields)
+        extra: Columns the caller needs besides the fields (e.g. keyset sort columns)
+
+    Returns:
+        Query / select() returning rows with one attribute per column
+    """
+    names = dict.fromkeys([*fields, *(column.key for column in extra)])
+    columns = [getattr(model, name).label(name) for name in names]
+    if hasattr(query, "with_entities"):
+        return query.with_entities(*columns)
+    return query.with_only_columns(*columns)
+
+
+@lru_cache(maxsize=256)
+def fieldset_schema(schema: Type[BaseModel], fields: Fieldset) -> Type[BaseModel]:
+    """Response schema reduced to a fieldset, read from row attributes (cached per fieldset)"""
+    if fields == tuple(schema.model_fields):
+        return schema
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields},
+    )
+
+
+@lru_cache(maxsize=256)
+def _list_adapter(schema: Type[BaseModel], fields: Fieldset) -> TypeAdapter:
+    return TypeAdapter(List[fieldset_schema(schema, fields)])
+
+
+@lru_cache(maxsize=256)
+def _page_schema(page_schema: Type[BaseModel], items_field: str, schema: Type[BaseModel], fields: Fieldset) -> Type[BaseModel]:
+    if fields == tuple(schema.model_fields):
+        return page_schema
+    return create_model(
+        f"{page_schema.__name__}Fields",
+        __base__=page_schema,
+        **{items_field: (List[fieldset_schema(schema, fields)], ...)},
+    )
+
+
+def projected_list_response(rows: Sequence[Any], schema: Type[BaseModel], fields: Fieldset, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """
+    JSON array response of projected rows.
+
+    Args:
+        rows: Rows from a projected query
+        schema: Response schema of one item
+        fields: Fieldset of the rows
+        headers: Extra response headers
+
+    Returns:
+        application/json response
+    """
+    return json_response(_list_adapter(schema, fields), rows, headers=headers)
+
+
+def projected_page_response(
+    page_schema: Type[BaseModel], items_field: str, rows: Sequence[Any], schema: Type[BaseModel], fields: Fieldset, **values: Any
+) -> Response:
+    """
+    JSON response of a page envelope (total, cursor, ...) around projected rows.
+
+    Args:
+        page_schema: Envelope schema (e.g. AuditLogsListResponse)
+        items_field: Envelope field holding the items
+        rows: Rows from a projected query
+        schema: Response schema of one item
+        fields: Fieldset of the rows
+        **values: Other envelope fields
+
+    Returns:
+        application/json response
+    """
+    data: Dict[str, Any] = {**values, items_field: rows}
+    page = _page_schema(page_schema, items_field, schema, fields).model_validate(data, from_attributes=True)
+    return Response(content=page.model_dump_json(), media_type="application/json")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON response rendering: FastAPI's default path vs. orjson / TypeAdapters
+
+Renders the body of GET /leads?limit=100 and GET /analytics/trends?period=90d
+from synthetic in-memory data, once the way FastAPI did before (response
+model validation, including EmailStr, and serialization to Python objects,
+or jsonable_encoder, then json.dumps in JSONResponse) and once the way the
+endpoints do now (json_response with a precompiled TypeAdapter,
+ORJSONResponse). No database required; both bodies are checked to decode to
+the same JSON.
+
+Usage:
+    python scripts/benchmark_json_responses.py [--leads 100] [--runs 2000]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+# Add parent directory to path to import app
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import EmailStr, create_model
+
+from app.core.responses import ORJSONResponse
+from app.schemas.lead import LeadResponse
+from app.utils.helpers import group_by_date
+from app.utils.projection import projected_list_response
+
+
+def make_leads(count: int) -> list:
+    """Lead-like rows with every LeadResponse column filled in"""
+    now = datetime.now(timezone.utc)
+    tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            tenant_id=tenant_id,
+            name=f"Taro Yamada {i}",
+            email=f"lead{i}@example.com",
+            company=f"Example Co {i % 50}",
+            job_title="CTO",
+            phone="03-1234-5678",
+            status="qualified",
+            notes="Met at the product webinar; follow up on pricing." * 3,
+            tags=["webinar", "enterprise", f"segment-{i % 7}"],
+            custom_fields={"industry": "SaaS", "employees": 50 + i, "region": "apac"},
+            score=i % 101,
+            last_contacted_at=now - timedelta(days=i % 30),
+            last_activity_at=now - timedelta(hours=i),
+            created_by=user_id,
+            updated_by=user_id,
+            assigned_to=user_id,
+            created_at=now - timedelta(days=i),
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def make_trends() -> dict:
+    """Response of AnalyticsService.get_trends for 90 days"""
+    end_date = datetime.now(timezone.utc)
+    start_date = end_date - timedelta(days=90)
+    leads = [SimpleNamespace(created_at=start_date + timedelta(hours=7 * i)) for i in range(300)]
+    return {
+        "period": "91d",
+        "metric": "leads",
+        "data_points": group_by_date(leads, "created_at", start_date, end_date),
+        "summary": {"total": len(leads), "average_per_day": round(len(leads) / 91, 2)},
+    }
+
+
+def run_sync(coroutine):
+    """Run a coroutine that never suspends (serialize_response of a coroutine endpoint)"""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("coroutine suspended")
+
+
+def time_us(fn, runs: int) -> float:
+    """Median wall time of `fn` in microseconds"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--leads", type=int, default=100, help="Leads per page")
+    parser.add_argument("--runs", type=int, default=2000, help="Runs per variant")
+    args = parser.parse_args()
+
+    leads = make_leads(args.leads)
+    fieldset = tuple(LeadResponse.model_fields)
+    # The lead response schema as it was, re-validating emails on the way out
+    previous_lead_response = create_model("PreviousLeadResponse", __base__=LeadResponse, email=(EmailStr, ...))
+    lead_field = create_model_field(name="Response_listLeads", type_=List[previous_lead_response], mode="serialization")
+    trends = make_trends()
+
+    def leads_before():
+        return JSONResponse(run_sync(serialize_response(field=lead_field, response_content=leads))).body
+
+    def leads_after():
+        return projected_list_response(leads, LeadResponse, fieldset).body
+
+    def trends_before():
+        return JSONResponse(jsonable_encoder(trends)).body
+
+    def trends_after():
+        return ORJSONResponse(trends).body
+
+    print(f"{'endpoint':<28}{'before (us)':>12}{'after (us)':>12}{'speedup':>9}{'bytes':>9}")
+    for name, before, after in [
+        (f"/leads?limit={args.leads}", leads_before, leads_after),
+        ("/analytics/trends?period=90d", trends_before, trends_after),
+    ]:
+        assert json.loads(before()) == json.loads(after()), f"{name}: bodies differ"
+        before_us = time_us(before, args.runs)
+        after_us = time_us(after, args.runs)
+        print(f"{name:<28}{before_us:>12.1f}{after_us:>12.1f}{before_us / after_us:>8.1f}x{len(after()):>9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark lead search: ILIKE on each column vs. the pg_trgm search index
+
+Inserts synthetic leads (1M by default) for a throwaway tenant, times the
+previous ILIKE query and LeadSearchService.search for a few dashboard-style
+queries, and rolls everything back. Requires a migrated PostgreSQL database
+(alembic upgrade head).
+
+Usage:
+    python scripts/benchmark_lead_search.py [--leads 1000000] [--runs 20]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add parent directory to path to import app
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import and_, or_, text
+
+from app.core.database import SessionLocal
+from app.models.lead import Lead
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services.leads.lead_search import LeadSearchService, trigram_search_available
+
+QUERIES = ["yamada", "yamda", "example-co-42", "taro", "zz"]
+
+
+def seed(db, tenant_id: uuid.UUID, user_id: uuid.UUID, count: int) -> None:
+    """Insert the tenant, a user and `count` leads with generate_series"""
+    db.add(Tenant(id=tenant_id, name="Benchmark", slug=f"benchmark-{tenant_id.hex[:8]}"))
+    db.flush()
+    db.add(User(id=user_id, tenant_id=tenant_id, email=f"benchmark-{user_id.hex[:8]}@example.com", password_hash="x", name="Benchmark"))
+    db.flush()
+    db.execute(text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"), {"tenant_id": str(tenant_id)})
+    db.execute(
+        text(
+            """
+            INSERT INTO leads (id, tenant_id, name, email, company, status, score, tags, custom_fields, created_by)
+            SELECT gen_random_uuid(), :tenant_id,
+                   (ARRAY['Taro', 'Hanako', 'Ken', 'Yuki', 'Sora'])[1 + i % 5] || ' ' ||
+                   (ARRAY['Yamada', 'Suzuki', 'Tanaka', 'Sato', 'Ito', 'Kato'])[1 + i % 6] || ' ' || i,
+                   'lead' || i || '@example' || (i % 1000) || '.com',
+                   'Example Co ' || (i % 5000),
+                   'new', i % 101, '[]', '{}', :user_id
+            FROM generate_series(1, :count) AS i
+            """
+        ),
+        {"tenant_id": tenant_id, "user_id": user_id, "count": count},
+    )
+    db.execute(text("ANALYZE leads"))
+
+
+def ilike_search(db, tenant_id: uuid.UUID, query: str, limit: int = 10):
+    """The search as it was before the trigram index"""
+    pattern = f"%{query}%"
+    return (
+        db.query(Lead)
+        .filter(and_(Lead.tenant_id == tenant_id, or_(Lead.name.ilike(pattern), Lead.email.ilike(pattern), Lead.company.ilike(pattern))))
+        .limit(limit)
+        .all()
+    )
+
+
+def time_ms(fn, runs: int) -> float:
+    """Median wall time of `fn` in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--leads", type=int, default=1_000_000, help="Number of synthetic leads")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per query")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if not trigram_search_available(db):
+            sys.exit("pg_trgm is not installed; run `alembic upgrade head` against a PostgreSQL database first")
+
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+        started = time.perf_counter()
+        seed(db, tenant_id, user_id, args.leads)
+        print(f"Seeded {args.leads:,} leads in {time.perf_counter() - started:.1f}s\n")
+
+        service = LeadSearchService(db)
+        print(f"{'query':<16}{'ILIKE (ms)':>12}{'trigram (ms)':>14}{'hits':>6}  top result")
+        for query in QUERIES:
+            baseline = time_ms(lambda: ilike_search(db, tenant_id, query), args.runs)
+            trigram = time_ms(lambda: service.search(tenant_id, query), args.runs)
+            results = service.search(tenant_id, query)
+            top = results[0].name if results else "-"
+            print(f"{query:<16}{baseline:>12.1f}{trigram:>14.1f}{len(results):>6}  {top}")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
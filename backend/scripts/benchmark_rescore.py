@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark assessment rescoring: vectorized scoring and the full rescore job
+
+Times compute_scores on synthetic in-memory answers, then (unless
+--compute-only) inserts an assessment with completed responses and leads
+(1M responses by default) for a throwaway tenant, runs the rescore job
+and rolls everything back. The job part requires a migrated PostgreSQL
+database (alembic upgrade head).
+
+Usage:
+    python scripts/benchmark_rescore.py [--responses 1000000] [--questions 10] [--compute-only]
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path to import app
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+from app.models.assessment import Assessment
+from app.models.assessment_rescore_job import AssessmentRescoreJob
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services.assessment_rescore_service import AssessmentRescoreService, compute_scores
+
+OPTIONS_PER_QUESTION = 4
+
+
+def benchmark_compute(responses: int, questions: int) -> None:
+    """Time one vectorized pass over `responses` x `questions` answers"""
+    rng = np.random.default_rng(0)
+    n_options = questions * OPTIONS_PER_QUESTION
+    answers = np.column_stack(
+        [
+            np.repeat(np.arange(responses), questions),
+            np.tile(np.arange(questions), responses),
+            rng.integers(-1, n_options, responses * questions),
+            rng.integers(0, 10, responses * questions),
+        ]
+    )
+    started = time.perf_counter()
+    compute_scores(answers, responses, np.ones(questions), rng.integers(0, 10, n_options).astype(np.float64), max_score=questions * 10)
+    print(f"compute_scores: {responses:,} responses x {questions} answers in {time.perf_counter() - started:.2f}s")
+
+
+def seed(db, tenant_id: uuid.UUID, user_id: uuid.UUID, responses: int, questions: int) -> uuid.UUID:
+    """Insert the tenant, a user, an assessment with options, and completed responses with answers and leads"""
+    db.add(Tenant(id=tenant_id, name="Benchmark", slug=f"benchmark-{tenant_id.hex[:8]}"))
+    db.flush()
+    db.add(User(id=user_id, tenant_id=tenant_id, email=f"benchmark-{user_id.hex[:8]}@example.com", password_hash="x", name="Benchmark"))
+    db.flush()
+    db.execute(text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"), {"tenant_id": str(tenant_id)})
+    assessment = Assessment(
+        tenant_id=tenant_id, title="Benchmark", status="published", created_by=user_id, scoring_logic={"max_score": questions * 10}
+    )
+    db.add(assessment)
+    db.flush()
+
+    params = {"tenant_id": tenant_id, "user_id": user_id, "assessment_id": assessment.id, "responses": responses, "questions": questions}
+    statements = [
+        """
+        INSERT INTO questions (id, assessment_id, text, type, "order", points)
+        SELECT gen_random_uuid(), :assessment_id, 'Question ' || q, 'single_choice', q, 10 FROM generate_series(1, :questions) AS q
+        """,
+        f"""
+        INSERT INTO question_options (id, question_id, text, points, "order")
+        SELECT gen_random_uuid(), questions.id, 'Option ' || o, o * 3, o
+        FROM questions CROSS JOIN generate_series(1, {OPTIONS_PER_QUESTION}) AS o
+        WHERE questions.assessment_id = :assessment_id
+        """,
+        """
+        INSERT INTO responses (id, assessment_id, session_id, status, total_score, completed_at)
+        SELECT gen_random_uuid(), :assessment_id, 'benchmark-' || :assessment_id || '-' || i, 'completed', 0, now()
+        FROM generate_series(1, :responses) AS i
+        """,
+        f"""
+        INSERT INTO answers (id, response_id, question_id, answer_text, points_awarded)
+        SELECT gen_random_uuid(), responses.id, questions.id, 'Option ' || (1 + floor(random() * {OPTIONS_PER_QUESTION})::int), 0
+        FROM responses JOIN questions ON questions.assessment_id = responses.assessment_id
+        WHERE responses.assessment_id = :assessment_id
+        """,
+        """
+        INSERT INTO leads (id, tenant_id, response_id, name, email, status, score, tags, custom_fields, created_by)
+        SELECT gen_random_uuid(), :tenant_id, responses.id, 'Lead', responses.session_id || '@example.com', 'new', 0, '[]', '{}', :user_id
+        FROM responses WHERE responses.assessment_id = :assessment_id
+        """,
+    ]
+    for statement in statements:
+        db.execute(text(statement), params)
+    db.execute(text("ANALYZE responses; ANALYZE answers; ANALYZE leads"))
+    return assessment.id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--responses", type=int, default=1_000_000, help="Number of completed responses")
+    parser.add_argument("--questions", type=int, default=10, help="Questions (answers) per response")
+    parser.add_argument("--compute-only", action="store_true", help="Only time the in-memory vectorized pass")
+    args = parser.parse_args()
+
+    benchmark_compute(args.responses, args.questions)
+    if args.compute_only:
+        return
+
+    db = SessionLocal()
+    try:
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+        started = time.perf_counter()
+        assessment_id = seed(db, tenant_id, user_id, args.responses, args.questions)
+        print(f"Seeded {args.responses:,} responses in {time.perf_counter() - started:.1f}s")
+
+        # The job commits per chunk; keep everything in one transaction so it can be rolled back
+        db.commit = db.flush
+        service = AssessmentRescoreService(db)
+        job = AssessmentRescoreJob(tenant_id=tenant_id, assessment_id=assessment_id, created_by=user_id, total_responses=args.responses)
+        db.add(job)
+        db.flush()
+
+        started = time.perf_counter()
+        service.run(job)
+        elapsed = time.perf_counter() - started
+        print(f"Rescore job: {job.status}, {job.updated_responses:,} responses and {job.updated_leads:,} leads updated in {elapsed:.1f}s")
+        if job.error_message:
+            print(f"Error: {job.error_message}")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
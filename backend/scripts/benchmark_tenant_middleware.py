@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark TenantMiddleware: BaseHTTPMiddleware vs. pure ASGI
+
+Sends authenticated requests to a trivial FastAPI endpoint through the
+previous BaseHTTPMiddleware implementation and the current pure ASGI
+TenantMiddleware, calling the ASGI app in-process (no server or network), and
+reports requests/sec for each. No database required.
+
+Usage:
+    python scripts/benchmark_tenant_middleware.py [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import app
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, Request
+from jose import JWTError, jwt
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.deps import current_tenant_id
+from app.core.middleware import TenantMiddleware
+
+
+class BaseHTTPTenantMiddleware(BaseHTTPMiddleware):
+    """TenantMiddleware as it was (public paths rebuilt per request)"""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method == "OPTIONS":
+            return await call_next(request)
+
+        public_paths = [
+            "/health",
+            "/",
+            "/api/docs",
+            "/api/redoc",
+            "/api/openapi.json",
+            "/api/v1/auth/login",
+            "/api/v1/auth/login/json",
+            "/api/v1/auth/register",
+            "/api/v1/auth/refresh",
+            "/api/v1/auth/password-reset",
+            "/api/v1/auth/password-reset/confirm",
+        ]
+        if request.url.path in public_paths:
+            return await call_next(request)
+
+        path = request.url.path
+        if "/assessments/" in path and "/public" in path or path.startswith("/api/v1/responses"):
+            return await call_next(request)
+        if path.startswith("/api/v1/files/"):
+            return await call_next(request)
+
+        auth_header = request.headers.get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return JSONResponse(status_code=401, content={"detail": "Missing or invalid authorization header"})
+
+        try:
+            payload = jwt.decode(auth_header.split(" ")[1], settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            tenant_id = payload.get("tenant_id")
+            if not tenant_id:
+                return JSONResponse(status_code=401, content={"detail": "Invalid token: missing tenant_id claim"})
+            request.state.tenant_id = tenant_id
+            request.state.user_id = payload.get("user_id")
+            current_tenant_id.set(str(tenant_id))
+        except JWTError:
+            return JSONResponse(status_code=401, content={"detail": "Invalid or expired token"})
+
+        return await call_next(request)
+
+
+def make_app(middleware_class) -> FastAPI:
+    """Trivial authenticated endpoint behind `middleware_class`"""
+    app = FastAPI()
+
+    @app.get("/api/v1/tenants/{tenant_id}/ping")
+    async def ping(tenant_id: str, request: Request):
+        return {"tenant_id": request.state.tenant_id}
+
+    app.add_middleware(middleware_class)
+    return app
+
+
+async def requests_per_second(app: FastAPI, count: int, token: str) -> float:
+    """Requests/sec of `count` sequential in-process GET requests"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/tenants/t1/ping",
+        "raw_path": b"/api/v1/tenants/t1/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"benchmark"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"Unexpected status {message['status']}")
+
+    # Warm up routing and pydantic caches
+    for _ in range(100):
+        await app(dict(scope), receive, send)
+
+    started = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), receive, send)
+    return count / (time.perf_counter() - started)
+
+
+async def run(count: int) -> None:
+    token = jwt.encode({"tenant_id": "t1", "user_id": "u1"}, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    before = await requests_per_second(make_app(BaseHTTPTenantMiddleware), count, token)
+    after = await requests_per_second(make_app(TenantMiddleware), count, token)
+    print(f"{'middleware':<22}{'requests/sec':>14}")
+    print(f"{'BaseHTTPMiddleware':<22}{before:>14,.0f}")
+    print(f"{'pure ASGI':<22}{after:>14,.0f}")
+    print(f"speedup: {after / before:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per implementation")
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
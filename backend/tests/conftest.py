@@ -3,10 +3,12 @@ Pytest configuration and fixtures for DiagnoLeads tests
 """
 
 import os
+from types import SimpleNamespace
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import Uuid, create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.database import Base, get_db
@@ -119,6 +121,27 @@ def test_user(db_session, test_tenant):
     return user
 
 
+@pytest.fixture
+def make_job():
+    """Factory of in-memory job rows for job service tests (no database required)
+
+    Every column of the job model gets its Python-side default, or a fresh
+    UUID for the other UUID columns; keyword arguments override them.
+    """
+
+    def make(model, **values):
+        fields = {}
+        for column in model.__table__.columns:
+            if column.default is not None:
+                fields[column.key] = column.default.arg(None) if column.default.is_callable else column.default.arg
+            else:
+                fields[column.key] = uuid4() if isinstance(column.type, Uuid) else None
+        fields.update(values)
+        return SimpleNamespace(**fields)
+
+    return make
+
+
 @pytest.fixture(scope="function")
 def client(db_session):
     """Create a test client with overridden database session"""
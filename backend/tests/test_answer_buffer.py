@@ -0,0 +1,335 @@
+"""
+Tests for Answer Buffer
+
+Write-behind buffering of in-progress widget answers (no database required).
+"""
+
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.response import AnswerCreate
+from app.services.answer_buffer import (
+    AnswerBufferEntry,
+    AnswerBufferService,
+    BufferedAnswer,
+    MemoryAnswerBufferStore,
+    RedisAnswerBufferStore,
+    build_buffered_view,
+    flush_idle_buffers,
+)
+
+TENANT_ID = uuid4()
+
+
+def make_response(status="in_progress", answers=()):
+    return SimpleNamespace(
+        id=uuid4(),
+        assessment_id=uuid4(),
+        assessment=SimpleNamespace(tenant_id=TENANT_ID),
+        session_id="session",
+        status=status,
+        total_score=0,
+        email=None,
+        name=None,
+        ip_address=None,
+        user_agent=None,
+        started_at=datetime.now(timezone.utc),
+        completed_at=None,
+        answers=list(answers),
+    )
+
+
+def locked_db(response):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.with_for_update.return_value.first.return_value = response
+    return db
+
+
+class TestMemoryAnswerBufferStore:
+    """Tests for MemoryAnswerBufferStore"""
+
+    def test_add_merges_per_question(self):
+        """Later answers replace earlier ones for the same question but keep their id"""
+        store = MemoryAnswerBufferStore()
+        response_id, q1, q2 = uuid4(), uuid4(), uuid4()
+
+        first = store.add(response_id, TENANT_ID, [AnswerCreate(question_id=q1, points_awarded=10)], {})
+        entry = store.add(
+            response_id,
+            TENANT_ID,
+            [AnswerCreate(question_id=q1, points_awarded=30), AnswerCreate(question_id=q2, points_awarded=5)],
+            {"email": "user@example.com"},
+        )
+
+        assert len(entry.answers) == 2
+        assert entry.answers[q1].points_awarded == 30
+        assert entry.answers[q1].id == first.answers[q1].id
+        assert entry.response_values == {"email": "user@example.com"}
+
+    def test_discard_removes_buffer(self):
+        """discard removes the persisted buffer"""
+        store = MemoryAnswerBufferStore()
+        response_id = uuid4()
+        entry = store.add(response_id, TENANT_ID, [AnswerCreate(question_id=uuid4())], {"name": "Taro"})
+
+        store.discard(entry)
+
+        assert store.get(response_id) is None
+        assert store.idle_response_ids(idle_since=time.time() + 1) == []
+
+    def test_discard_keeps_newer_answers(self):
+        """Answers and contact fields changed after the read stay buffered"""
+        store = MemoryAnswerBufferStore()
+        response_id, q1, q2 = uuid4(), uuid4(), uuid4()
+        entry = store.add(response_id, TENANT_ID, [AnswerCreate(question_id=q1, points_awarded=1), AnswerCreate(question_id=q2)], {"name": "Taro"})
+        store.add(response_id, TENANT_ID, [AnswerCreate(question_id=q1, points_awarded=9)], {"name": "Jiro"})
+
+        store.discard(entry)
+
+        remaining = store.get(response_id)
+        assert list(remaining.answers) == [q1]
+        assert remaining.answers[q1].points_awarded == 9
+        assert remaining.response_values == {"name": "Jiro"}
+
+    def test_idle_response_ids(self):
+        """Only buffers idle since the cutoff are reported"""
+        store = MemoryAnswerBufferStore()
+        idle, active = uuid4(), uuid4()
+
+        with patch("app.services.answer_buffer.time.time", return_value=100.0):
+            store.add(idle, TENANT_ID, [AnswerCreate(question_id=uuid4())], {})
+        with patch("app.services.answer_buffer.time.time", return_value=500.0):
+            store.add(active, TENANT_ID, [AnswerCreate(question_id=uuid4())], {})
+
+        assert store.idle_response_ids(idle_since=300.0) == [idle]
+
+
+class TestRedisAnswerBufferStore:
+    """Tests for RedisAnswerBufferStore with a mocked client"""
+
+    def test_get_decodes_buffer(self):
+        """get decodes answers and contact fields of the hash"""
+        response_id, question_id = uuid4(), uuid4()
+        answer = BufferedAnswer(uuid4(), question_id, "A", 10, datetime.now(timezone.utc))
+        client = MagicMock()
+        client.hgetall.return_value = {
+            f"a:{question_id}".encode(): answer.to_json().encode(),
+            b"v:name": b"Taro",
+            b"t": str(TENANT_ID).encode(),
+        }
+        store = RedisAnswerBufferStore(client, key_prefix="app:")
+
+        entry = store.get(response_id)
+
+        client.hgetall.assert_called_once_with(f"app:answer_buffer:{response_id}")
+        assert entry.answers[question_id] == answer
+        assert entry.response_values == {"name": "Taro"}
+        assert entry.tenant_id == TENANT_ID
+
+    def test_discard_compares_persisted_values(self):
+        """discard passes the persisted field values to the atomic script"""
+        response_id, question_id = uuid4(), uuid4()
+        answer = BufferedAnswer(uuid4(), question_id, "A", 10, datetime.now(timezone.utc))
+        client = MagicMock()
+        store = RedisAnswerBufferStore(client, key_prefix="app:")
+        entry = AnswerBufferEntry(response_id, {question_id: answer}, {"name": "Taro"})
+
+        store.discard(entry)
+
+        client.register_script.return_value.assert_called_once_with(
+            keys=[f"app:answer_buffer:{response_id}", "app:answer_buffer:index"],
+            args=[str(response_id), "t", f"a:{question_id}", answer.to_json(), "v:name", "Taro"],
+        )
+
+    def test_add_indexes_buffer(self):
+        """add writes the hash, refreshes its TTL and updates the idle index"""
+        response_id = uuid4()
+        client = MagicMock()
+        client.hgetall.return_value = {}
+        store = RedisAnswerBufferStore(client, ttl=600)
+
+        entry = store.add(response_id, TENANT_ID, [AnswerCreate(question_id=uuid4(), points_awarded=3)], {})
+
+        pipe = client.pipeline.return_value
+        pipe.hset.assert_called_once()
+        pipe.expire.assert_called_once_with(f"answer_buffer:{response_id}", 600)
+        pipe.zadd.assert_called_once()
+        assert len(entry.answers) == 1
+
+
+class TestBuildBufferedView:
+    """Tests for build_buffered_view"""
+
+    def test_buffered_answers_override_persisted(self):
+        """Buffered answers replace persisted ones and update the score"""
+        question_id, other_id = uuid4(), uuid4()
+        response = make_response()
+        persisted = SimpleNamespace(
+            id=uuid4(),
+            response_id=response.id,
+            question_id=question_id,
+            answer_text="old",
+            points_awarded=10,
+            answered_at=datetime.now(timezone.utc),
+        )
+        response.answers = [persisted]
+        entry = AnswerBufferEntry(response_id=response.id)
+        entry.merge(
+            [AnswerCreate(question_id=question_id, answer_text="new", points_awarded=20), AnswerCreate(question_id=other_id, points_awarded=5)],
+            {"name": "Taro"},
+        )
+
+        view = build_buffered_view(response, entry)
+
+        answers = {answer.question_id: answer for answer in view.answers}
+        assert answers[question_id].id == persisted.id
+        assert answers[question_id].answer_text == "new"
+        assert view.total_score == 25
+        assert view.name == "Taro"
+
+
+class TestAnswerBufferService:
+    """Tests for AnswerBufferService"""
+
+    def test_submit_buffers_without_writing(self):
+        """Partial submissions do not touch the database"""
+        db = MagicMock()
+        response = make_response()
+        service = AnswerBufferService(db, MemoryAnswerBufferStore())
+
+        view = service.submit(response, [AnswerCreate(question_id=uuid4(), points_awarded=7)], {})
+
+        db.execute.assert_not_called()
+        db.commit.assert_not_called()
+        assert view.total_score == 7
+
+    def test_submit_flushes_full_buffer(self):
+        """Reaching the max buffer size persists the buffer"""
+        response = make_response()
+        db = locked_db(response)
+        store = MemoryAnswerBufferStore()
+        service = AnswerBufferService(db, store)
+
+        with patch("app.services.answer_buffer.settings.ANSWER_BUFFER_MAX_ANSWERS", 2):
+            with patch("app.services.answer_buffer.ResponseService") as response_service:
+                service.submit(response, [AnswerCreate(question_id=uuid4()), AnswerCreate(question_id=uuid4())], {})
+
+        response_service.return_value.save_answers.assert_called_once()
+        db.commit.assert_called_once()
+        assert store.get(response.id) is None
+
+    def test_submit_without_store_writes_through(self):
+        """With buffering disabled answers are persisted immediately"""
+        db = MagicMock()
+        response = make_response()
+        with patch("app.services.answer_buffer.get_answer_buffer", return_value=None):
+            service = AnswerBufferService(db)
+
+        with patch("app.services.answer_buffer.ResponseService") as response_service:
+            service.submit(response, [AnswerCreate(question_id=uuid4())], {"name": "Taro"})
+
+        response_service.return_value.save_answers.assert_called_once()
+        db.commit.assert_called_once()
+
+    def test_submit_writes_through_when_store_fails(self):
+        """A store outage does not fail the submission"""
+        db = MagicMock()
+        response = make_response()
+        store = MagicMock()
+        store.add.side_effect = ConnectionError("down")
+
+        with patch("app.services.answer_buffer.ResponseService") as response_service:
+            AnswerBufferService(db, store).submit(response, [AnswerCreate(question_id=uuid4())], {})
+
+        response_service.return_value.save_answers.assert_called_once()
+        db.commit.assert_called_once()
+
+    def test_failed_flush_keeps_buffer(self):
+        """Answers stay buffered when persisting them fails"""
+        response = make_response()
+        store = MemoryAnswerBufferStore()
+        store.add(response.id, TENANT_ID, [AnswerCreate(question_id=uuid4())], {})
+        db = locked_db(response)
+        db.commit.side_effect = RuntimeError("connection lost")
+
+        with patch("app.services.answer_buffer.ResponseService"), pytest.raises(RuntimeError):
+            AnswerBufferService(db, store).flush(response.id)
+
+        assert store.get(response.id) is not None
+
+    def test_flush_completed_response_keeps_status(self):
+        """Orphaned buffers of completed responses persist answers only"""
+        response = make_response(status="completed")
+        store = MemoryAnswerBufferStore()
+        store.add(response.id, TENANT_ID, [AnswerCreate(question_id=uuid4())], {"email": "late@example.com"})
+        db = locked_db(response)
+
+        with patch("app.services.answer_buffer.ResponseService") as response_service:
+            assert AnswerBufferService(db, store).flush(response.id) is True
+
+        args, kwargs = response_service.return_value.save_answers.call_args
+        assert kwargs == {}
+        db.commit.assert_called_once()
+        assert store.get(response.id) is None
+
+    def test_flush_scopes_lookup_to_tenant(self):
+        """The response is locked under the buffer's tenant"""
+        response = make_response()
+        store = MemoryAnswerBufferStore()
+        store.add(response.id, TENANT_ID, [AnswerCreate(question_id=uuid4())], {})
+        db = locked_db(response)
+
+        with patch("app.services.answer_buffer.ResponseService"):
+            assert AnswerBufferService(db, store).flush(response.id) is True
+
+        statement, params = db.execute.call_args.args
+        assert "set_config('app.current_tenant_id', :tenant_id, true)" in str(statement)
+        assert params == {"tenant_id": str(TENANT_ID)}
+
+    def test_flush_drops_buffer_of_deleted_response(self):
+        """A buffer is dropped when its tenant has no such response"""
+        store = MemoryAnswerBufferStore()
+        response_id = uuid4()
+        store.add(response_id, TENANT_ID, [AnswerCreate(question_id=uuid4())], {})
+        db = locked_db(None)
+
+        with patch("app.services.answer_buffer.ResponseService") as response_service:
+            assert AnswerBufferService(db, store).flush(response_id) is False
+
+        db.execute.assert_called_once()
+        response_service.return_value.save_answers.assert_not_called()
+        assert store.get(response_id) is None
+
+    def test_flush_keeps_buffer_without_tenant(self):
+        """Buffers without a tenant are kept rather than dropped as deleted"""
+        store = MemoryAnswerBufferStore()
+        response_id = uuid4()
+        store.add(response_id, None, [AnswerCreate(question_id=uuid4())], {})
+        db = locked_db(None)
+
+        assert AnswerBufferService(db, store).flush(response_id) is False
+
+        db.query.assert_not_called()
+        assert store.get(response_id) is not None
+
+    def test_flush_idle_buffers(self):
+        """The sweeper persists idle buffers with their own session"""
+        store = MemoryAnswerBufferStore()
+        response = make_response()
+        store.add(response.id, TENANT_ID, [AnswerCreate(question_id=uuid4())], {})
+        db = locked_db(response)
+
+        with (
+            patch("app.services.answer_buffer.get_answer_buffer", return_value=store),
+            patch("app.services.answer_buffer.SessionLocal", return_value=db),
+            patch("app.services.answer_buffer.ResponseService"),
+            patch("app.services.answer_buffer.time.time", return_value=time.time() + 3600),
+        ):
+            assert flush_idle_buffers(idle_timeout=60) == 1
+
+        db.close.assert_called_once()
@@ -0,0 +1,123 @@
+"""
+Tests for Assessment Rescoring
+
+The vectorized score computation, chunked processing with job progress and
+the set-based load / write statements (no database server required).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+
+from app.models.assessment_rescore_job import AssessmentRescoreJob, AssessmentRescoreStatus
+from app.services.assessment_rescore_service import LOAD_ANSWERS_SQL, WRITE_SCORES_SQL, AssessmentRescoreService, compute_scores
+
+
+class TestComputeScores:
+    """Tests for compute_scores"""
+
+    def test_option_points_replace_stored_points(self):
+        # (response, question, option, stored points)
+        answers = np.array(
+            [
+                [0, 0, 1, 5],  # option 1: 30 points
+                [0, 1, -1, 7],  # free text: stored points kept
+                [1, 0, 0, 99],  # option 0: 10 points
+            ]
+        )
+
+        totals, lead_scores = compute_scores(answers, 3, weights=np.array([1.0, 1.0]), option_points=np.array([10.0, 30.0]))
+
+        assert totals.tolist() == [37, 10, 0]  # The third response has no answers
+        assert lead_scores.tolist() == [37, 10, 0]
+
+    def test_question_weights_and_max_score(self):
+        answers = np.array([[0, 0, 0, 0], [0, 1, 1, 0], [1, 1, 1, 0]])
+
+        totals, lead_scores = compute_scores(answers, 2, weights=np.array([2.0, 0.5]), option_points=np.array([40.0, 20.0]), max_score=90)
+
+        assert totals.tolist() == [90, 10]
+        assert lead_scores.tolist() == [100, 11]
+
+    def test_lead_scores_are_clipped(self):
+        answers = np.array([[0, 0, -1, 250], [1, 0, -1, -20]])
+
+        _, lead_scores = compute_scores(answers, 2, weights=np.array([1.0]), option_points=np.array([]))
+
+        assert lead_scores.tolist() == [100, 0]
+
+    def test_empty_chunk(self):
+        totals, lead_scores = compute_scores(np.empty((0, 4), dtype=np.int64), 2, weights=np.array([1.0]), option_points=np.array([5.0]))
+
+        assert totals.tolist() == [0, 0]
+        assert lead_scores.tolist() == [0, 0]
+
+
+class TestAssessmentRescoreService:
+    """Tests for AssessmentRescoreService.run"""
+
+    def setup_method(self):
+        self.db = MagicMock()
+        self.lead_id = uuid4()
+        self.db.execute.return_value.one.return_value = SimpleNamespace(responses=1, lead_ids=[self.lead_id])
+        self.service = AssessmentRescoreService(self.db)
+        self.model = {"question_ids": [], "weights": np.array([1.0]), "option_ids": [], "option_points": np.array([10.0]), "max_score": None}
+        patch.object(self.service, "_load_scoring_model", return_value=self.model).start()
+        patch.object(self.service, "_load_answers", return_value=np.array([[0, 0, 0, 0]])).start()
+        self.outbox = patch("app.services.assessment_rescore_service.OutboxService").start()
+        self.crm_queue = patch("app.services.assessment_rescore_service.CRMSyncQueue").start()
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_chunks_with_progress_and_summary_event(self, make_job):
+        job = make_job(AssessmentRescoreJob)
+        chunks = [[uuid4(), uuid4()], [uuid4()]]
+        next_chunk = patch.object(self.service, "_next_chunk", side_effect=chunks).start()
+
+        self.service.run(job, chunk_size=2)
+
+        assert job.status == AssessmentRescoreStatus.COMPLETED
+        assert (job.processed_responses, job.updated_responses, job.updated_leads) == (3, 2, 2)
+        assert next_chunk.call_args_list[1].args == (job.assessment_id, chunks[0][-1], 2)
+        # Commits: start, one per chunk, finish
+        assert self.db.commit.call_count == 4
+        params = self.db.execute.call_args_list[0].args[1]
+        assert params["total_scores"] == [10, 0]
+        assert params["response_ids"] == [str(response_id) for response_id in chunks[0]]
+        event = self.outbox.return_value.enqueue.call_args.kwargs
+        assert event["payload"]["event_name"] == "leads_rescored"
+        # Rescored leads returned by each chunk's write are queued for CRM sync
+        assert [call.args for call in self.crm_queue.return_value.enqueue_many.call_args_list] == [(job.tenant_id, [self.lead_id])] * 2
+
+    def test_failure_marks_job_failed_and_reconciles_counters(self, make_job):
+        job = make_job(AssessmentRescoreJob)
+        patch.object(self.service, "_next_chunk", side_effect=RuntimeError("canceling statement due to statement timeout")).start()
+
+        with patch("app.services.job_runner.TenantCounterService") as counters:
+            self.service.run(job)
+
+        assert job.status == AssessmentRescoreStatus.FAILED
+        assert job.error_message == "canceling statement due to statement timeout"
+        self.db.rollback.assert_called_once()
+        counters.return_value.reconcile.assert_called_once_with(job.tenant_id)
+
+
+class TestRescoreStatements:
+    """Answers are loaded and scores written with one statement per chunk"""
+
+    def test_load_matches_options_by_answer_text(self):
+        sql = LOAD_ANSWERS_SQL.text
+
+        assert "WITH ORDINALITY" in sql
+        assert "question_options.text = answers.answer_text" in sql
+
+    def test_write_only_touches_changed_scores(self):
+        sql = WRITE_SCORES_SQL.text
+
+        assert "responses.total_score <> scores.total_score" in sql
+        assert "leads.score <> scores.lead_score" in sql
+        assert "ARRAY(SELECT id FROM rescored_leads) AS lead_ids" in sql
+        assert "crm_sync_queue" not in sql
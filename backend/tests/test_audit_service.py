@@ -128,10 +128,10 @@ class TestAuditServiceGetAuditLogs:
             action="UPDATE",
         )
 
-        logs, total = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id)
+        page = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id)
 
-        assert len(logs) == 2
-        assert total == 2
+        assert len(page.items) == 2
+        assert page.total == 2
 
     def test_get_audit_logs_filter_by_entity_type(self, db_session, test_tenant, test_user):
         """Test filtering audit logs by entity type"""
@@ -155,11 +155,11 @@ class TestAuditServiceGetAuditLogs:
             action="CREATE",
         )
 
-        logs, total = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, entity_type="USER")
+        page = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, entity_type="USER")
 
-        assert len(logs) == 1
-        assert total == 1
-        assert logs[0].entity_type == "USER"
+        assert len(page.items) == 1
+        assert page.total == 1
+        assert page.items[0].entity_type == "USER"
 
     def test_get_audit_logs_filter_by_entity_id(self, db_session, test_tenant, test_user):
         """Test filtering audit logs by entity ID"""
@@ -183,11 +183,11 @@ class TestAuditServiceGetAuditLogs:
             action="CREATE",
         )
 
-        logs, total = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, entity_id=entity_id1)
+        page = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, entity_id=entity_id1)
 
-        assert len(logs) == 1
-        assert total == 1
-        assert logs[0].entity_id == entity_id1
+        assert len(page.items) == 1
+        assert page.total == 1
+        assert page.items[0].entity_id == entity_id1
 
     def test_get_audit_logs_filter_by_action(self, db_session, test_tenant, test_user):
         """Test filtering audit logs by action"""
@@ -211,11 +211,11 @@ class TestAuditServiceGetAuditLogs:
             action="UPDATE",
         )
 
-        logs, total = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, action="UPDATE")
+        page = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, action="UPDATE")
 
-        assert len(logs) == 1
-        assert total == 1
-        assert logs[0].action == "UPDATE"
+        assert len(page.items) == 1
+        assert page.total == 1
+        assert page.items[0].action == "UPDATE"
 
     def test_get_audit_logs_filter_by_date_range(self, db_session, test_tenant, test_user):
         """Test filtering audit logs by date range"""
@@ -235,10 +235,10 @@ class TestAuditServiceGetAuditLogs:
         start_date = datetime.utcnow() - timedelta(days=1)
         end_date = datetime.utcnow() + timedelta(days=1)
 
-        logs, total = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, start_date=start_date, end_date=end_date)
+        page = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, start_date=start_date, end_date=end_date)
 
-        assert len(logs) == 1
-        assert total == 1
+        assert len(page.items) == 1
+        assert page.total == 1
 
     def test_get_audit_logs_pagination(self, db_session, test_tenant, test_user):
         """Test pagination of audit logs"""
@@ -254,16 +254,22 @@ class TestAuditServiceGetAuditLogs:
             )
 
         # Get first page
-        logs, total = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, skip=0, limit=2)
+        page = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, skip=0, limit=2)
 
-        assert len(logs) == 2
-        assert total == 5
+        assert len(page.items) == 2
+        assert page.total == 5
 
         # Get second page
-        logs, total = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, skip=2, limit=2)
+        page = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, skip=2, limit=2)
 
-        assert len(logs) == 2
-        assert total == 5
+        assert len(page.items) == 2
+        assert page.total == 5
+
+        # Continue from the first page's cursor
+        first = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, limit=2)
+        next_page = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id, limit=2, cursor=first.next_cursor)
+
+        assert [log.id for log in next_page.items] == [log.id for log in page.items]
 
     def test_get_audit_logs_tenant_isolation(self, db_session, test_tenant, test_tenant_2, test_user):
         """Test tenant isolation in audit logs"""
@@ -291,11 +297,11 @@ class TestAuditServiceGetAuditLogs:
         )
 
         # Get logs for test_tenant only
-        logs, total = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id)
+        page = AuditService.get_audit_logs(db=db_session, tenant_id=test_tenant.id)
 
-        assert len(logs) == 1
-        assert total == 1
-        assert logs[0].tenant_id == test_tenant.id
+        assert len(page.items) == 1
+        assert page.total == 1
+        assert page.items[0].tenant_id == test_tenant.id
 
 
 class TestAuditServiceGetUserActivity:
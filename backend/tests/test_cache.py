@@ -0,0 +1,75 @@
+"""
+Tests for Cache
+
+In-process LRU/TTL cache and the Redis cache wrapper.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from app.core.cache import MemoryCache, RedisCache
+
+
+class TestMemoryCache:
+    """Tests for MemoryCache"""
+
+    def test_set_get_delete(self):
+        """Values round-trip until deleted"""
+        cache = MemoryCache()
+
+        cache.set("a", b"1", ttl=60)
+        assert cache.get("a") == b"1"
+
+        cache.delete("a", "missing")
+        assert cache.get("a") is None
+
+    def test_expiry(self):
+        """Entries expire after their TTL"""
+        cache = MemoryCache()
+
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", b"1", ttl=10)
+        with patch("app.core.cache.time.monotonic", return_value=109.0):
+            assert cache.get("a") == b"1"
+        with patch("app.core.cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") is None
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted beyond max_entries"""
+        cache = MemoryCache(max_entries=2)
+
+        cache.set("a", b"1", ttl=60)
+        cache.set("b", b"2", ttl=60)
+        cache.get("a")
+        cache.set("c", b"3", ttl=60)
+
+        assert cache.get("a") == b"1"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"3"
+
+
+class TestRedisCache:
+    """Tests for RedisCache"""
+
+    def test_prefixed_commands(self):
+        """Keys are prefixed and TTL is passed to Redis"""
+        client = MagicMock()
+        client.get.return_value = b"1"
+        cache = RedisCache(client, key_prefix="app:")
+
+        cache.set("a", b"1", ttl=60)
+        assert cache.get("a") == b"1"
+        cache.delete("a", "b")
+
+        client.set.assert_called_once_with("app:a", b"1", ex=60)
+        client.get.assert_called_once_with("app:a")
+        client.delete.assert_called_once_with("app:a", "app:b")
+
+    def test_errors_are_misses(self):
+        """Redis failures do not propagate"""
+        client = MagicMock()
+        client.get.side_effect = ConnectionError("down")
+        client.set.side_effect = ConnectionError("down")
+        cache = RedisCache(client)
+
+        assert cache.get("a") is None
+        cache.set("a", b"1", ttl=60)
@@ -0,0 +1,161 @@
+"""
+Tests for Response Compression
+
+Accept-Encoding negotiation and the compression middleware on small, large,
+streamed and already-compressed responses.
+"""
+
+import gzip
+import json
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, is_compressible, negotiate_encoding
+
+ROWS = [{"id": i, "name": f"Lead {i}", "status": "qualified", "score": i % 101} for i in range(200)]
+
+
+async def large_json(request):
+    return JSONResponse(ROWS)
+
+
+async def small_json(request):
+    return JSONResponse({"status": "healthy"})
+
+
+async def png(request):
+    return Response(b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+
+async def precompressed(request):
+    return Response(gzip.compress(b"a" * 4096), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+
+async def stream_csv(request):
+    async def rows():
+        yield "id,name\n"
+        for row in ROWS:
+            yield f"{row['id']},{row['name']}\n"
+
+    return StreamingResponse(rows(), media_type="text/csv")
+
+
+async def stream_small(request):
+    async def chunks():
+        yield b'{"a":'
+        yield b"1}"
+
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
+@pytest.fixture
+def client():
+    app = Starlette(
+        routes=[
+            Route("/large", large_json),
+            Route("/small", small_json),
+            Route("/png", png),
+            Route("/precompressed", precompressed),
+            Route("/stream", stream_csv),
+            Route("/stream-small", stream_small),
+        ]
+    )
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    return TestClient(app)
+
+
+def raw_get(client, path, accept_encoding="gzip"):
+    """GET without decoding the body"""
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestNegotiateEncoding:
+    """Tests for negotiate_encoding"""
+
+    @pytest.mark.parametrize(
+        "accept_encoding,expected",
+        [
+            ("gzip, deflate, br", "br"),
+            ("gzip;q=1.0, br;q=0.5", "gzip"),
+            ("br;q=0, gzip", "gzip"),
+            ("*", "br"),
+            ("gzip;q=0, *;q=0.1", "br"),
+            ("identity", None),
+            ("", None),
+            ("gzip;q=abc", None),
+        ],
+    )
+    def test_negotiation(self, accept_encoding, expected):
+        assert negotiate_encoding(accept_encoding, ["br", "gzip"]) == expected
+
+    def test_only_available_codings(self):
+        assert negotiate_encoding("br", ["gzip"]) is None
+
+    def test_compressible_types(self):
+        assert is_compressible("application/json")
+        assert is_compressible("text/csv; charset=utf-8")
+        assert is_compressible("application/problem+json")
+        assert not is_compressible("image/png")
+        assert not is_compressible("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+        assert not is_compressible("")
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware"""
+
+    def test_large_json_gzipped_with_length(self, client):
+        response, body = raw_get(client, "/large")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-length"] == str(len(body))
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert json.loads(gzip.decompress(body)) == ROWS
+
+    def test_below_threshold_sent_as_is(self, client):
+        response, body = raw_get(client, "/small")
+
+        assert "content-encoding" not in response.headers
+        assert json.loads(body) == {"status": "healthy"}
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_client_without_gzip(self, client):
+        response, body = raw_get(client, "/large", accept_encoding="identity")
+
+        assert "content-encoding" not in response.headers
+        assert json.loads(body) == ROWS
+
+    @pytest.mark.parametrize("path", ["/png", "/precompressed"])
+    def test_incompressible_content_untouched(self, client, path):
+        direct, expected = raw_get(client, path, accept_encoding="identity")
+
+        response, body = raw_get(client, path)
+
+        assert body == expected
+        assert response.headers.get("content-encoding") == direct.headers.get("content-encoding")
+        assert "vary" not in response.headers
+
+    def test_streaming_response_compressed_incrementally(self, client):
+        response, body = raw_get(client, "/stream")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(body).decode().splitlines()[:2] == ["id,name", "0,Lead 0"]
+
+    def test_short_stream_sent_as_is(self, client):
+        response, body = raw_get(client, "/stream-small")
+
+        assert "content-encoding" not in response.headers
+        assert body == b'{"a":1}'
+
+    def test_brotli(self, client):
+        brotli = pytest.importorskip("brotli")
+
+        response, body = raw_get(client, "/large", accept_encoding="br, gzip")
+
+        assert response.headers["content-encoding"] == "br"
+        assert json.loads(brotli.decompress(body)) == ROWS
@@ -0,0 +1,291 @@
+"""
+Tests for Bulk CRM Sync
+
+Async batch clients (Salesforce sObject Collections, HubSpot batch API) and
+the chunked, concurrency-bounded bulk sync of the CRM integration service.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.integrations.crm.base import CRMBatchResult
+from app.integrations.crm.hubspot_client import AsyncHubSpotClient
+from app.integrations.crm.salesforce_client import AsyncSalesforceClient
+from app.services.crm_integration_service import CRMIntegrationService, hash_lead_fields
+
+
+def mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestAsyncSalesforceClient:
+    """Tests for AsyncSalesforceClient"""
+
+    @pytest.mark.asyncio
+    async def test_create_leads_uses_sobject_collections(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json=[
+                    {"id": "00Q1", "success": True, "errors": []},
+                    {"success": False, "errors": [{"statusCode": "REQUIRED_FIELD_MISSING", "message": "Required fields are missing: [LastName]"}]},
+                ],
+            )
+
+        client = AsyncSalesforceClient(
+            uuid4(),
+            {"access_token": "token", "instance_url": "https://example.my.salesforce.com"},
+            http_client=mock_client(handler),
+        )
+        results = await client.create_leads([{"name": "Taro Yamada", "email": "a@example.com"}, {"email": "b@example.com"}])
+
+        assert results == [
+            CRMBatchResult(success=True, crm_id="00Q1"),
+            CRMBatchResult(success=False, error="Required fields are missing: [LastName]"),
+        ]
+        assert len(requests) == 1
+        assert requests[0].method == "POST"
+        assert requests[0].url.path == "/services/data/v57.0/composite/sobjects"
+        body = json.loads(requests[0].content)
+        assert body["allOrNone"] is False
+        assert body["records"][0] == {"attributes": {"type": "Lead"}, "FirstName": "Taro", "LastName": "Yamada", "Email": "a@example.com"}
+
+    @pytest.mark.asyncio
+    async def test_update_leads_sends_ids(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[{"id": "00Q1", "success": True, "errors": []}])
+
+        client = AsyncSalesforceClient(
+            uuid4(),
+            {"access_token": "token", "instance_url": "https://example.my.salesforce.com"},
+            http_client=mock_client(handler),
+        )
+        results = await client.update_leads([("00Q1", {"score": 90})])
+
+        assert results == [CRMBatchResult(success=True, crm_id="00Q1")]
+        assert requests[0].method == "PATCH"
+        assert json.loads(requests[0].content)["records"] == [{"attributes": {"type": "Lead"}, "id": "00Q1", "LeadScore__c": 90}]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_sends_nothing(self):
+        client = AsyncSalesforceClient(uuid4(), {"access_token": "token"}, http_client=mock_client(lambda request: pytest.fail("unexpected request")))
+
+        assert await client.create_leads([]) == []
+
+
+class TestAsyncHubSpotClient:
+    """Tests for AsyncHubSpotClient"""
+
+    @pytest.mark.asyncio
+    async def test_create_results_are_matched_by_email(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/crm/v3/objects/contacts/batch/create"
+            assert len(json.loads(request.content)["inputs"]) == 3
+            # Results come back in arbitrary order; one input failed
+            return httpx.Response(
+                207,
+                json={
+                    "status": "COMPLETE",
+                    "results": [
+                        {"id": "202", "properties": {"email": "b@example.com"}},
+                        {"id": "101", "properties": {"email": "a@example.com"}},
+                    ],
+                    "errors": [{"status": "error", "message": "Property values were not valid"}],
+                },
+            )
+
+        client = AsyncHubSpotClient(uuid4(), {"access_token": "token"}, http_client=mock_client(handler))
+        results = await client.create_leads([{"email": "A@example.com"}, {"email": "b@example.com"}, {"email": "c@example.com"}])
+
+        assert [result.crm_id for result in results] == ["101", "202", None]
+        assert [result.success for result in results] == [True, True, False]
+        assert results[2].error == "Property values were not valid"
+
+    @pytest.mark.asyncio
+    async def test_update_leads(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/crm/v3/objects/contacts/batch/update"
+            assert json.loads(request.content)["inputs"] == [{"id": "101", "properties": {"hs_lead_score": "75"}}]
+            return httpx.Response(200, json={"status": "COMPLETE", "results": [{"id": "101", "properties": {}}]})
+
+        client = AsyncHubSpotClient(uuid4(), {"access_token": "token"}, http_client=mock_client(handler))
+
+        assert await client.update_leads([("101", {"score": 75})]) == [CRMBatchResult(success=True, crm_id="101")]
+
+
+class StubBatchClient:
+    """Async CRM client recording batch sizes and peak concurrency"""
+
+    MAX_BATCH_SIZE = 2
+
+    def __init__(self, fail_updates=False):
+        self.fail_updates = fail_updates
+        self.batches = []
+        self.active = 0
+        self.peak = 0
+
+    async def _call(self, sync_type, size):
+        self.batches.append((sync_type, size))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+    async def create_leads(self, leads):
+        await self._call("create", len(leads))
+        return [CRMBatchResult(success=True, crm_id=f"crm-{lead['email']}") for lead in leads]
+
+    async def update_leads(self, updates):
+        await self._call("update", len(updates))
+        if self.fail_updates:
+            raise httpx.HTTPStatusError("401 Unauthorized", request=httpx.Request("POST", "https://crm"), response=httpx.Response(401))
+        return [CRMBatchResult(success=True, crm_id=crm_id) for crm_id, _ in updates]
+
+
+def make_lead(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        name=f"Lead {index}",
+        email=f"lead{index}@example.com",
+        company="Example",
+        phone=None,
+        score=50,
+        priority_level="medium",
+    )
+
+
+class TestSyncLeadsBulk:
+    """Tests for CRMIntegrationService.sync_leads_bulk"""
+
+    def setup_service(self, leads, states, client):
+        db = MagicMock()
+        service = CRMIntegrationService(db)
+        integration = SimpleNamespace(id=uuid4(), enabled=True)
+        pages = iter([leads[i : i + 8] for i in range(0, len(leads), 8)] + [[]])
+
+        patch.object(service, "get_integration", return_value=integration).start()
+        patch.object(service, "get_access_token", return_value="token").start()
+        patch.object(service, "_get_async_crm_client", return_value=client).start()
+        patch.object(service, "_get_lead_page", side_effect=lambda *args: next(pages)).start()
+        patch.object(
+            service, "_get_sync_states", side_effect=lambda _, ids: {lead_id: states[lead_id] for lead_id in ids if lead_id in states}
+        ).start()
+        patch.object(service, "_save_sync_states").start()
+        patch.object(service, "_increment_sync_counters").start()
+        return service, db, integration
+
+    def teardown_method(self):
+        patch.stopall()
+
+    @pytest.mark.asyncio
+    async def test_chunks_with_bounded_concurrency_and_bulk_logs(self):
+        leads = [make_lead(i) for i in range(10)]
+        states = {leads[0].id: ("crm-existing", {})}
+        client = StubBatchClient()
+        service, db, integration = self.setup_service(leads, states, client)
+
+        summary = await service.sync_leads_bulk(uuid4(), chunk_size=50, concurrency=2)
+
+        assert summary == {"created": 9, "updated": 1, "skipped": 0, "failed": 0}
+        # chunk_size is capped at the client's batch limit
+        assert all(size <= 2 for _, size in client.batches)
+        assert ("update", 1) in client.batches
+        assert client.peak <= 2
+        # One bulk insert, counter update and commit per page
+        assert db.execute.call_count == 2
+        assert db.commit.call_count == 2
+        logged = [row for call in db.execute.call_args_list for row in call.args[1]]
+        assert len(logged) == 10
+        assert {row["lead_id"] for row in logged} == {lead.id for lead in leads}
+        assert [call.args for call in service._increment_sync_counters.call_args_list] == [(integration.id, 8, 0), (integration.id, 2, 0)]
+        saved = [state for call in service._save_sync_states.call_args_list for state in call.args[0]]
+        assert {state["lead_id"]: state["crm_record_id"] for state in saved}[leads[0].id] == "crm-existing"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_leads_are_skipped_and_updates_send_changed_fields(self):
+        unchanged, changed = make_lead(0), make_lead(1)
+        service = CRMIntegrationService(MagicMock())
+        states = {
+            unchanged.id: ("crm-0", hash_lead_fields(service._prepare_lead_data(unchanged))),
+            changed.id: ("crm-1", hash_lead_fields(service._prepare_lead_data(changed))),
+        }
+        changed.score = 95
+        client = StubBatchClient()
+        client.update_leads = MagicMock(side_effect=client.update_leads)
+        service, db, integration = self.setup_service([unchanged, changed], states, client)
+
+        summary = await service.sync_leads_bulk(uuid4())
+
+        assert summary == {"created": 0, "updated": 1, "skipped": 1, "failed": 0}
+        client.update_leads.assert_called_once_with([("crm-1", {"score": 95})])
+        saved = service._save_sync_states.call_args.args[0]
+        assert saved[0]["field_hashes"] == hash_lead_fields(service._prepare_lead_data(changed))
+
+    @pytest.mark.asyncio
+    async def test_failed_request_fails_its_chunk_and_invalidates_token(self):
+        leads = [make_lead(i) for i in range(3)]
+        states = {leads[0].id: ("crm-0", {}), leads[1].id: ("crm-1", {})}
+        client = StubBatchClient(fail_updates=True)
+        service, db, integration = self.setup_service(leads, states, client)
+        manager = MagicMock()
+
+        with patch("app.services.crm_integration_service.get_token_manager", return_value=manager):
+            summary = await service.sync_leads_bulk(uuid4())
+
+        assert summary == {"created": 1, "updated": 0, "skipped": 0, "failed": 2}
+        manager.invalidate.assert_called_once_with(f"crm:{integration.id}")
+        rows = db.execute.call_args.args[1]
+        assert sorted(row["status"] for row in rows) == ["failed", "failed", "success"]
+        service._increment_sync_counters.assert_called_once_with(integration.id, 1, 2)
+        assert len(service._save_sync_states.call_args.args[0]) == 1
+
+    @pytest.mark.asyncio
+    async def test_requires_enabled_integration(self):
+        service = CRMIntegrationService(MagicMock())
+
+        with patch.object(service, "get_integration", return_value=None):
+            with pytest.raises(ValueError):
+                await service.sync_leads_bulk(uuid4())
+
+
+class TestSyncBookkeeping:
+    """Sync counters and field hashes"""
+
+    def test_counters_are_incremented_in_sql(self):
+        db = MagicMock()
+
+        CRMIntegrationService(db)._increment_sync_counters(uuid4(), succeeded=3, failed=1)
+
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "total_synced=(crm_integrations.total_synced + " in sql
+        assert "failed_syncs=(crm_integrations.failed_syncs + " in sql
+
+    def test_sync_states_are_upserted(self):
+        db = MagicMock()
+
+        CRMIntegrationService(db)._save_sync_states(
+            [{"integration_id": uuid4(), "lead_id": uuid4(), "crm_record_id": "1", "field_hashes": {}, "synced_at": None}]
+        )
+
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (integration_id, lead_id) DO UPDATE" in sql
+
+    def test_hash_lead_fields_detects_changes_per_field(self):
+        before = hash_lead_fields({"email": "a@example.com", "score": 50})
+        after = hash_lead_fields({"email": "a@example.com", "score": 51})
+
+        assert before["email"] == after["email"]
+        assert before["score"] != after["score"]
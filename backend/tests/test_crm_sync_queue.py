@@ -0,0 +1,146 @@
+"""
+Tests for CRM Sync Queue
+
+Coalescing lead sync queue and its worker.
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.crm_sync_queue import CRMSyncQueue
+from app.services.crm_sync_worker import _sync_integration
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestCRMSyncQueue:
+    """Tests for CRMSyncQueue"""
+
+    def test_enqueue_coalesces_per_integration_and_lead(self):
+        db = MagicMock()
+
+        CRMSyncQueue(db).enqueue(tenant_id=uuid4(), lead_id=uuid4())
+
+        sql = compile_sql(db.execute.call_args.args[0])
+        assert sql.startswith("INSERT INTO crm_sync_queue (integration_id, lead_id, enqueued_at) SELECT crm_integrations.id")
+        assert "crm_integrations.enabled IS true" in sql
+        # Queued leads coalesce; leads being synced are marked as changed again
+        assert "ON CONFLICT (integration_id, lead_id) DO UPDATE SET enqueued_at = excluded.enqueued_at" in sql
+        assert "WHERE crm_sync_queue.claimed_until IS NOT NULL" in sql
+        db.commit.assert_not_called()
+
+    def test_claim_batch_leases_leads_by_integration(self):
+        integration_a, integration_b = uuid4(), uuid4()
+        leads = [uuid4() for _ in range(3)]
+        enqueued = [datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i) for i in range(3)]
+        db = MagicMock()
+        db.execute.return_value.all.return_value = [
+            (integration_a, leads[0], enqueued[0]),
+            (integration_b, leads[1], enqueued[1]),
+            (integration_a, leads[2], enqueued[2]),
+        ]
+
+        batches = CRMSyncQueue(db).claim_batch(limit=10)
+
+        assert batches == {integration_a: {leads[0]: enqueued[0], leads[2]: enqueued[2]}, integration_b: {leads[1]: enqueued[1]}}
+        sql = compile_sql(db.execute.call_args.args[0])
+        assert sql.startswith("UPDATE crm_sync_queue SET claimed_until=")
+        assert "crm_sync_queue.claimed_until IS NULL OR crm_sync_queue.claimed_until <=" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING crm_sync_queue.integration_id, crm_sync_queue.lead_id, crm_sync_queue.enqueued_at" in sql
+        db.commit.assert_called_once()
+
+    def test_settle_removes_synced_leads_only(self):
+        integration_id, synced, failed = uuid4(), uuid4(), uuid4()
+        enqueued_at = datetime.now(timezone.utc)
+        db = MagicMock()
+
+        CRMSyncQueue(db).settle(integration_id, {synced: enqueued_at, failed: enqueued_at}, [failed])
+
+        delete_stmt, release_stmt = (call.args[0] for call in db.execute.call_args_list)
+        # Unchanged since the claim: removed; changed again meanwhile: released
+        assert compile_sql(delete_stmt).startswith("DELETE FROM crm_sync_queue")
+        assert delete_stmt.compile().params["param_1"] == [(synced, enqueued_at)]
+        assert compile_sql(release_stmt).startswith("UPDATE crm_sync_queue SET claimed_until=")
+        assert release_stmt.compile().params["lead_id_1"] == [synced]
+        db.commit.assert_called_once()
+
+    def test_settle_keeps_lease_of_failed_batch(self):
+        db = MagicMock()
+        lead_id = uuid4()
+
+        CRMSyncQueue(db).settle(uuid4(), {lead_id: datetime.now(timezone.utc)}, [lead_id])
+
+        db.execute.assert_not_called()
+        db.commit.assert_called_once()
+
+
+class TestCRMSyncWorker:
+    """Tests for the CRM sync worker"""
+
+    @pytest.mark.asyncio
+    async def test_syncs_claimed_leads_and_settles_failures(self):
+        integration = SimpleNamespace(id=uuid4(), tenant_id=uuid4(), enabled=True)
+        synced, failed = uuid4(), uuid4()
+        claimed = {synced: datetime.now(timezone.utc), failed: datetime.now(timezone.utc)}
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = integration
+
+        async def sync(tenant_id, lead_ids, failed_lead_ids):
+            failed_lead_ids.append(failed)
+            return {"created": 1, "updated": 0, "skipped": 0, "failed": 1}
+
+        with (
+            patch("app.services.crm_sync_worker.SessionLocal", return_value=db),
+            patch("app.services.crm_sync_worker.scope_session_to_tenant") as scope_session_to_tenant,
+            patch("app.services.crm_sync_worker.CRMIntegrationService") as service,
+            patch("app.services.crm_sync_worker.CRMSyncQueue") as queue,
+        ):
+            service.return_value.sync_leads_bulk = AsyncMock(side_effect=sync)
+            await _sync_integration(integration.id, claimed)
+
+        assert service.return_value.sync_leads_bulk.await_args.args == (integration.tenant_id,)
+        scope_session_to_tenant.assert_called_once_with(db, integration.tenant_id)
+        queue.return_value.settle.assert_called_once_with(integration.id, claimed, [failed])
+        db.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_keeps_leads_queued(self):
+        integration = SimpleNamespace(id=uuid4(), tenant_id=uuid4(), enabled=True)
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = integration
+
+        with (
+            patch("app.services.crm_sync_worker.SessionLocal", return_value=db),
+            patch("app.services.crm_sync_worker.scope_session_to_tenant"),
+            patch("app.services.crm_sync_worker.CRMIntegrationService") as service,
+            patch("app.services.crm_sync_worker.CRMSyncQueue") as queue,
+        ):
+            service.return_value.sync_leads_bulk = AsyncMock(side_effect=RuntimeError("token refresh failed"))
+            await _sync_integration(integration.id, {uuid4(): datetime.now(timezone.utc)})
+
+        queue.return_value.settle.assert_not_called()
+        db.rollback.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_disabled_integration_is_skipped(self):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = SimpleNamespace(id=uuid4(), tenant_id=uuid4(), enabled=False)
+        claimed = {uuid4(): datetime.now(timezone.utc)}
+
+        with (
+            patch("app.services.crm_sync_worker.SessionLocal", return_value=db),
+            patch("app.services.crm_sync_worker.CRMIntegrationService") as service,
+            patch("app.services.crm_sync_worker.CRMSyncQueue") as queue,
+        ):
+            await _sync_integration(uuid4(), claimed)
+
+        service.assert_not_called()
+        assert queue.return_value.settle.call_args.args[1:] == (claimed, [])
@@ -0,0 +1,52 @@
+"""
+Tests for Database helpers
+
+Tenant scoping of background sessions (SQLite with a recording set_config,
+no database server required).
+"""
+
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.core.database import scope_session_to_tenant
+
+
+def make_session():
+    calls = []
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def register_set_config(dbapi_connection, connection_record):
+        def set_config(name, value, is_local):
+            calls.append((name, value, is_local))
+            return value
+
+        dbapi_connection.create_function("set_config", 3, set_config)
+
+    return Session(engine), calls
+
+
+class TestScopeSessionToTenant:
+    """Tests for scope_session_to_tenant"""
+
+    def test_sets_tenant_locally_in_every_transaction(self):
+        db, calls = make_session()
+        tenant_id = uuid4()
+
+        scope_session_to_tenant(db, tenant_id)
+        for _ in range(2):
+            db.execute(text("SELECT 1"))
+            db.commit()
+
+        assert calls == [("app.current_tenant_id", str(tenant_id), 1)] * 2
+
+    def test_scopes_the_open_transaction(self):
+        db, calls = make_session()
+        tenant_id = uuid4()
+        db.execute(text("SELECT 1"))
+
+        scope_session_to_tenant(db, tenant_id)
+
+        assert calls == [("app.current_tenant_id", str(tenant_id), 1)]
@@ -0,0 +1,129 @@
+"""
+Tests for GA4 Event Batcher
+
+Coalescing of Measurement Protocol events over a shared HTTP client
+(requests are served by an in-process mock transport).
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.integrations.google_analytics import GA4EventBatcher, GA4Target
+from app.services.lead_service import LeadService
+
+TARGET = GA4Target(measurement_id="G-TEST123456", api_secret="secret")
+
+
+def make_batcher(status_code=204, target=TARGET, **kwargs):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(status_code)
+
+    loader = AsyncMock(return_value=target)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return GA4EventBatcher(loader, http_client=client, **kwargs), requests, loader
+
+
+class TestGA4EventBatcher:
+    """Tests for GA4EventBatcher"""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_events_into_one_request(self):
+        batcher, requests, loader = make_batcher(max_wait_ms=10)
+        tenant_id = uuid4()
+
+        futures = [batcher.submit(tenant_id, "server-a", "lead_generated", {"n": i}) for i in range(10)]
+        results = await asyncio.gather(*futures)
+
+        assert results == [True] * 10
+        assert len(requests) == 1
+        assert requests[0]["client_id"] == "server-a"
+        assert [event["params"]["n"] for event in requests[0]["events"]] == list(range(10))
+        loader.assert_awaited_once_with(tenant_id)
+        assert batcher.stats()["sent_events"] == 10
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting(self):
+        batcher, requests, _ = make_batcher(max_wait_ms=60000)
+
+        futures = [batcher.submit("tenant", "server", "e", {}) for _ in range(30)]
+        await asyncio.wait_for(asyncio.gather(*futures[:25]), timeout=1)
+
+        assert [len(request["events"]) for request in requests] == [25]
+        assert batcher.pending == 5
+        await batcher.flush()
+        assert [len(request["events"]) for request in requests] == [25, 5]
+
+    @pytest.mark.asyncio
+    async def test_batches_per_tenant_and_client(self):
+        batcher, requests, _ = make_batcher()
+
+        batcher.submit("t1", "c1", "e")
+        batcher.submit("t2", "c1", "e")
+        batcher.submit("t1", "c2", "e")
+        await batcher.flush()
+
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_drops_oldest_when_full(self):
+        batcher, requests, _ = make_batcher(max_pending=2)
+
+        oldest = batcher.submit("t1", "c", "first")
+        batcher.submit("t2", "c", "second")
+        batcher.submit("t2", "c", "third")
+
+        assert await oldest is False
+        await batcher.flush()
+        assert [event["name"] for request in requests for event in request["events"]] == ["second", "third"]
+        assert batcher.stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_request_fails_all_events(self):
+        batcher, _, _ = make_batcher(status_code=500)
+
+        futures = [batcher.submit("t", "c", "e") for _ in range(3)]
+        await batcher.flush()
+
+        assert [future.result() for future in futures] == [False, False, False]
+
+    @pytest.mark.asyncio
+    async def test_tenant_without_target_is_delivered(self):
+        batcher, requests, _ = make_batcher(target=None)
+
+        future = batcher.submit("t", "c", "e")
+        await batcher.flush()
+
+        assert future.result() is True
+        assert requests == []
+
+
+class TestLeadServiceGA4Delivery:
+    """Outbox GA4 events go through the batcher"""
+
+    @pytest.mark.asyncio
+    async def test_deliver_ga4_event_uses_tenant_server_client_id(self):
+        tenant_id = uuid4()
+        batcher = MagicMock()
+        batcher.submit.return_value = asyncio.get_running_loop().create_future()
+        batcher.submit.return_value.set_result(True)
+
+        with patch("app.services.lead_service.get_ga4_batcher", return_value=batcher):
+            delivered = await LeadService(MagicMock()).deliver_ga4_event(
+                tenant_id, {"event_name": "lead_generated", "event_params": {"lead_score": 90}}
+            )
+
+        assert delivered is True
+        batcher.submit.assert_called_once_with(
+            tenant_id=tenant_id,
+            client_id=f"server-{tenant_id}",
+            event_name="lead_generated",
+            event_params={"lead_score": 90, "tenant_id": str(tenant_id)},
+        )
@@ -5,19 +5,32 @@ Comprehensive test coverage for utils/helpers.py
 Target: 100% coverage
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 
 from app.models.lead import Lead
 from app.utils.helpers import (
     apply_date_range_filter,
+    apply_keyset,
     calculate_average_score,
     calculate_conversion_rate,
     classify_lead_by_score,
     count_by_attribute,
+    cursor_for,
+    decode_cursor,
+    encode_cursor,
+    explain_statement,
     get_date_range_from_period,
     group_by_date,
+    next_page_cursor,
     paginate_query,
     parse_period_to_days,
+    plan_row_estimate,
     safe_divide,
     sanitize_filename,
     truncate_string,
@@ -256,6 +269,8 @@ class TestCalculateConversionRate:
 class TestPaginateQuery:
     """Tests for paginate_query function"""
 
+    ORDER = (Lead.created_at, Lead.id)
+
     def test_paginate_first_page(self, db_session, test_tenant, test_user):
         """Test paginating first page"""
         # Create 5 test leads
@@ -272,18 +287,107 @@ class TestPaginateQuery:
         db_session.commit()
 
         query = db_session.query(Lead)
-        items, total = paginate_query(query, page=1, page_size=2)
+        page = paginate_query(query, self.ORDER, limit=2)
+
+        assert len(page.items) == 2
+        assert page.total == 5
+        assert page.next_cursor is not None
 
-        assert len(items) == 2
-        assert total == 5
+    def test_cursor_pages_match_offset_pages(self, db_session, test_tenant, test_user):
+        """Test following cursors visits every row once, in offset order"""
+        for i in range(5):
+            db_session.add(
+                Lead(tenant_id=test_tenant.id, name=f"Lead {i}", email=f"lead{i}@example.com", score=50, status="new", created_by=test_user.id)
+            )
+        db_session.commit()
 
-    def test_paginate_exceeds_max_page_size(self, db_session):
-        """Test that page size is limited to max_page_size"""
         query = db_session.query(Lead)
-        items, total = paginate_query(query, page=1, page_size=200, max_page_size=100)
+        by_offset = [lead.id for offset in (0, 2, 4) for lead in paginate_query(query, self.ORDER, limit=2, offset=offset).items]
+        by_cursor, cursor = [], None
+        while True:
+            page = paginate_query(query, self.ORDER, limit=2, cursor=cursor, total="none")
+            by_cursor += [lead.id for lead in page.items]
+            assert page.total is None
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert by_cursor == by_offset
+        assert len(set(by_cursor)) == 5
+
+    def test_paginate_exceeds_max_limit(self, db_session):
+        """Test that page size is limited to max_limit"""
+        query = db_session.query(Lead)
+        page = paginate_query(query, self.ORDER, limit=200, max_limit=100)
+
+        assert page.total == 0  # No items in empty database
+        assert page.next_cursor is None
+
+
+class TestKeyset:
+    """Tests for keyset cursors (no database)"""
+
+    ORDER = (Lead.created_at, Lead.id)
+
+    def test_cursor_filters_after_position(self):
+        """Test the cursor becomes a row comparison on the sort keys"""
+        lead = SimpleNamespace(created_at=datetime(2026, 10, 19, 10, 0, tzinfo=timezone.utc), id=uuid4())
+        statement = apply_keyset(select(Lead), self.ORDER, cursor_for(lead, self.ORDER))
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "(leads.created_at, leads.id) < (%(param_1)s, %(param_2)s::UUID)" in sql
+        assert "ORDER BY leads.created_at DESC, leads.id DESC" in sql
+        assert statement.compile().params["param_1"] == lead.created_at
+
+    def test_first_page_is_only_ordered(self):
+        """Test no cursor means no position filter"""
+        sql = str(apply_keyset(select(Lead), self.ORDER, descending=False).compile(dialect=postgresql.dialect()))
+
+        assert "WHERE" not in sql
+        assert "ORDER BY leads.created_at ASC, leads.id ASC" in sql
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["not a cursor!", encode_cursor({"t": 1}), encode_cursor({"k": ["2026-10-19T10:00:00"]}), encode_cursor({"k": ["yesterday", "x"]})],
+    )
+    def test_invalid_cursor(self, cursor):
+        """Test malformed cursors and cursors of other sort orders raise ValueError"""
+        with pytest.raises(ValueError):
+            apply_keyset(select(Lead), self.ORDER, cursor)
+
+    def test_next_page_cursor_only_for_full_pages(self):
+        """Test a short page is the last one"""
+        items = [SimpleNamespace(created_at=datetime(2026, 10, 19), id=uuid4()) for _ in range(2)]
+
+        assert next_page_cursor(items, self.ORDER, limit=3) is None
+        assert decode_cursor(next_page_cursor(items, self.ORDER, limit=2)) == {"k": ["2026-10-19 00:00:00", str(items[1].id)]}
+
+    def test_estimated_total_needs_postgresql(self):
+        """Test EXPLAIN estimates are only used on PostgreSQL"""
+        statement = select(Lead).where(Lead.created_at > datetime(2026, 10, 19, 10, 0))
+
+        assert explain_statement(statement, sqlite.dialect()) is None
+        explain = explain_statement(statement, postgresql.dialect())
+        assert explain.text.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert explain.compile().params == {}
+        assert plan_row_estimate('[{"Plan": {"Plan Rows": 1234}}]') == 1234
+
+
+class TestCursor:
+    """Tests for encode_cursor / decode_cursor"""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the encoded position"""
+        cursor = encode_cursor({"t": "2026-10-19T10:00:00+00:00", "id": "abc"})
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == {"t": "2026-10-19T10:00:00+00:00", "id": "abc"}
 
-        # Should use max_page_size=100 instead of 200
-        assert total == 0  # No items in empty database
+    @pytest.mark.parametrize("cursor", ["not a cursor!", encode_cursor({"t": 1})[:-3] + "***", "WzFd"])
+    def test_invalid_cursor(self, cursor):
+        """Test malformed cursors raise ValueError"""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
 
 
 class TestSafeDivide:
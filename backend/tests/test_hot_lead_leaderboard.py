@@ -0,0 +1,235 @@
+"""
+Tests for the Hot Lead Leaderboard
+
+Memory and Redis leaderboard backends, leaderboard-served hot lead pages and
+ranks, and keeping leaderboards in sync with lead changes (no database or
+Redis server required).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from app.schemas.lead import LeadScoreUpdate
+from app.services.hot_lead_leaderboard import (
+    MemoryHotLeadLeaderboard,
+    RedisHotLeadLeaderboard,
+    decode_leaderboard_cursor,
+    ranked_entry,
+)
+from app.services.lead_bulk_update_service import LeadBulkUpdateService
+from app.services.lead_service import LeadService
+from app.services.leads.lead_scoring import HOT_LEAD_ORDER, LeadScoringService
+from app.utils.helpers import cursor_for
+
+
+def lead_id(n: int) -> UUID:
+    return UUID(int=n)
+
+
+@pytest.fixture
+def board():
+    board = MemoryHotLeadLeaderboard(ttl=60)
+    board.shared = True  # Stands in for a shared (Redis) backend
+    board.load("t1", [(70, lead_id(1)), (95, lead_id(2)), (70, lead_id(3)), (88, lead_id(4))])
+    return board
+
+
+class TestRankedEntry:
+    """Which leads are on the leaderboard"""
+
+    def test_open_hot_leads_only(self):
+        assert ranked_entry(lead_id(1), "qualified", 61) == (61, lead_id(1))
+        assert ranked_entry(lead_id(1), "new", 60) is None
+        assert ranked_entry(lead_id(1), "converted", 99) is None
+
+    def test_cursor_round_trip(self):
+        lead = SimpleNamespace(score=88, id=lead_id(4))
+        assert decode_leaderboard_cursor(cursor_for(lead, HOT_LEAD_ORDER)) == (88, lead_id(4))
+        with pytest.raises(ValueError):
+            decode_leaderboard_cursor("bm90LWEtY3Vyc29y")
+
+
+class TestMemoryHotLeadLeaderboard:
+    """Tests for MemoryHotLeadLeaderboard"""
+
+    def test_top_orders_by_score_then_id(self, board):
+        assert board.top("t1") == [(95, lead_id(2)), (88, lead_id(4)), (70, lead_id(3)), (70, lead_id(1))]
+
+    def test_pages_continue_after_cursor_entry(self, board):
+        first = board.top("t1", limit=3)
+        second = board.top("t1", limit=3, after=first[-1])
+
+        assert first[-1] == (70, lead_id(3))
+        assert second == [(70, lead_id(1))]
+
+    def test_min_score(self, board):
+        assert board.top("t1", min_score=88) == [(95, lead_id(2)), (88, lead_id(4))]
+
+    def test_rank(self, board):
+        assert board.rank("t1", (88, lead_id(4))) == 2
+        assert board.rank("t1", (70, lead_id(1))) == 4
+        assert board.rank("t1", (99, lead_id(9))) == 0
+
+    def test_lead_changes(self, board):
+        board.lead_changed("t1", lead_id(1), old=("new", 70), new=("new", 99))
+        board.lead_changed("t1", lead_id(2), old=("new", 95), new=("converted", 95))
+        board.lead_changed("t1", lead_id(5), new=("new", 65))
+
+        assert board.top("t1") == [(99, lead_id(1)), (88, lead_id(4)), (70, lead_id(3)), (65, lead_id(5))]
+
+    def test_unloaded_and_expired_tenants_read_as_missing(self, board):
+        board.lead_changed("t2", lead_id(1), new=("new", 90))
+        assert board.top("t2") is None
+        assert board.rank("t2", (90, lead_id(1))) is None
+
+        with patch("app.services.hot_lead_leaderboard.time.monotonic", return_value=float("inf")):
+            assert board.top("t1") is None
+
+    def test_least_recently_used_tenant_evicted(self):
+        board = MemoryHotLeadLeaderboard(max_tenants=2)
+        board.load("t1", [])
+        board.load("t2", [])
+        board.top("t1")
+        board.load("t3", [])
+
+        assert board.top("t2") is None
+        assert board.top("t1") == []
+
+
+class TestRedisHotLeadLeaderboard:
+    """Tests for RedisHotLeadLeaderboard (mocked client)"""
+
+    def make_board(self):
+        client = MagicMock()
+        return RedisHotLeadLeaderboard(client, key_prefix="dl:"), client
+
+    def test_members_sort_lexicographically_by_score(self):
+        assert RedisHotLeadLeaderboard._member((7, lead_id(1))) < RedisHotLeadLeaderboard._member((61, lead_id(1)))
+        assert RedisHotLeadLeaderboard._entry(b"061:" + str(lead_id(1)).encode()) == (61, lead_id(1))
+
+    def test_top_reads_lex_range_after_cursor(self):
+        board, client = self.make_board()
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = [1, [f"095:{lead_id(2)}".encode()]]
+
+        entries = board.top("t1", limit=10, min_score=61, after=(99, lead_id(1)))
+
+        assert entries == [(95, lead_id(2))]
+        pipe.zrevrangebylex.assert_called_once_with("dl:hot_leads:t1", f"(099:{lead_id(1)}", "[061:", start=0, num=10)
+
+    def test_missing_set_and_errors_read_as_missing(self):
+        board, client = self.make_board()
+        client.pipeline.return_value.execute.return_value = [0, []]
+        assert board.top("t1") is None
+
+        client.pipeline.return_value.execute.side_effect = ConnectionError("down")
+        assert board.rank("t1", (90, lead_id(1))) is None
+
+    def test_load_marks_empty_leaderboards_loaded(self):
+        board, client = self.make_board()
+
+        board.load("t1", [])
+
+        client.pipeline.return_value.zadd.assert_called_once_with("dl:hot_leads:t1", {"": 0})
+
+    def test_apply_runs_one_script(self):
+        board, client = self.make_board()
+
+        board.apply("t1", [(lead_id(1), (70, lead_id(1)), (80, lead_id(1))), (lead_id(2), None, (65, lead_id(2)))])
+
+        client.register_script.return_value.assert_called_once_with(
+            keys=["dl:hot_leads:t1"], args=[1, f"070:{lead_id(1)}", f"080:{lead_id(1)}", f"065:{lead_id(2)}"]
+        )
+
+
+class TestHotLeadQueries:
+    """Hot lead pages and ranks served from the leaderboard"""
+
+    def make_lead(self, n, score, status="new", tenant_id="t1"):
+        return SimpleNamespace(id=lead_id(n), tenant_id=tenant_id, score=score, status=status)
+
+    def test_page_served_from_leaderboard_in_rank_order(self, board):
+        leads = [self.make_lead(3, 70), self.make_lead(4, 88), self.make_lead(2, 95)]
+        db = MagicMock()
+        db.query.return_value.filter.return_value = leads
+
+        with patch("app.services.leads.lead_scoring.get_hot_lead_leaderboard", return_value=board):
+            page = LeadScoringService(db).get_hot_leads("t1", limit=3)
+
+        assert [lead.id for lead in page] == [lead_id(2), lead_id(4), lead_id(3)]
+        db.execute.assert_not_called()
+
+    def test_stale_entry_drops_leaderboard_and_queries_leads(self, board):
+        by_id, fallback = MagicMock(), MagicMock()
+        by_id.filter.return_value = [self.make_lead(2, 40)]
+        db = MagicMock()
+        db.query.side_effect = [by_id, fallback]
+
+        with patch("app.services.leads.lead_scoring.get_hot_lead_leaderboard", return_value=board):
+            page = LeadScoringService(db).get_hot_leads("t1", limit=1)
+
+        assert board.top("t1") is None
+        assert page is fallback.filter.return_value.order_by.return_value.limit.return_value.all.return_value
+
+    def test_missing_leaderboard_is_loaded(self):
+        board = MemoryHotLeadLeaderboard()
+        board.shared = True
+        db = MagicMock()
+        db.execute.return_value.all.return_value = [SimpleNamespace(score=90, id=lead_id(1))]
+
+        with patch("app.services.leads.lead_scoring.get_hot_lead_leaderboard", return_value=board):
+            rank = LeadScoringService(db).get_hot_lead_rank(self.make_lead(1, 90))
+
+        assert rank == 1
+        assert board.top("t1") == [(90, lead_id(1))]
+
+    def test_per_worker_leaderboard_is_not_served(self, board):
+        board.shared = False
+        db = MagicMock()
+
+        with patch("app.services.leads.lead_scoring.get_hot_lead_leaderboard", return_value=board):
+            page = LeadScoringService(db).get_hot_leads("t1", limit=3)
+            rank = LeadScoringService(db).get_hot_lead_rank(self.make_lead(2, 95))
+
+        assert page is db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value
+        assert rank == db.execute.return_value.scalar.return_value + 1
+        assert board.top("t1", limit=1) == [(95, lead_id(2))]
+
+    def test_low_threshold_queries_leads(self, board):
+        db = MagicMock()
+
+        with patch("app.services.leads.lead_scoring.get_hot_lead_leaderboard", return_value=board):
+            LeadScoringService(db).get_hot_leads("t1", threshold=40, limit=20)
+
+        db.query.return_value.filter.return_value.order_by.return_value.limit.assert_called_once_with(20)
+
+
+class TestLeaderboardSync:
+    """Lead mutations keep the leaderboard in sync"""
+
+    def test_score_update_applied_after_commit(self, board):
+        lead = SimpleNamespace(id=lead_id(1), tenant_id="t1", status="new", score=70, company=None)
+        db = MagicMock()
+        service = LeadService(db)
+
+        with (
+            patch.object(service, "get_by_id", return_value=lead),
+            patch("app.services.lead_service.get_hot_lead_leaderboard", return_value=board),
+        ):
+            service.update_score(lead.id, LeadScoreUpdate(score=99), "t1")
+
+        assert board.top("t1", limit=1) == [(99, lead_id(1))]
+
+    def test_bulk_update_chunk_applied(self, board):
+        rows = [
+            SimpleNamespace(id=lead_id(2), old_status="new", old_score=95, status="lost", score=95),
+            SimpleNamespace(id=lead_id(7), old_status="new", old_score=20, status="new", score=75),
+        ]
+
+        with patch("app.services.lead_bulk_update_service.get_hot_lead_leaderboard", return_value=board):
+            LeadBulkUpdateService(MagicMock())._update_leaderboard(SimpleNamespace(tenant_id="t1"), rows)
+
+        assert board.top("t1", limit=2) == [(88, lead_id(4)), (75, lead_id(7))]
@@ -0,0 +1,97 @@
+"""
+Tests for HTTP Clients
+
+Shared, pooled outbound HTTP clients per integration destination.
+"""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.core.http_clients import HTTPClientRegistry, close_http_clients, get_http_clients
+from app.integrations.crm.hubspot_client import HubSpotClient
+from app.integrations.crm.salesforce_client import SalesforceClient
+from app.integrations.google_analytics import GA4MeasurementProtocol
+from app.integrations.microsoft.teams_webhook_client import TeamsWebhookClient
+
+
+class TestHTTPClientRegistry:
+    """Tests for HTTPClientRegistry"""
+
+    @pytest.mark.asyncio
+    async def test_clients_are_shared_per_destination(self):
+        registry = HTTPClientRegistry()
+
+        assert registry.async_client("ga4") is registry.async_client("ga4")
+        assert registry.async_client("ga4") is not registry.async_client("hubspot")
+        assert registry.sync_client("hubspot") is registry.sync_client("hubspot")
+
+        await registry.aclose()
+
+    def test_unknown_destination(self):
+        with pytest.raises(ValueError):
+            HTTPClientRegistry().sync_client("unknown")
+
+    @pytest.mark.asyncio
+    async def test_profile_timeout_and_limits(self):
+        registry = HTTPClientRegistry()
+
+        client = registry.async_client("ga4")
+
+        assert client.timeout.read == 10.0
+        pool = client._transport._pool
+        assert pool._max_connections == 20
+        assert pool._max_keepalive_connections == 10
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http2_requires_h2(self):
+        with patch("app.core.http_clients.HTTP2_AVAILABLE", False):
+            assert HTTPClientRegistry()._client_kwargs("ga4")["http2"] is False
+        with patch("app.core.http_clients.HTTP2_AVAILABLE", True):
+            assert HTTPClientRegistry()._client_kwargs("ga4")["http2"] is True
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        registry = HTTPClientRegistry()
+        registry.async_client("ga4")
+        registry.sync_client("salesforce")
+
+        stats = registry.stats()
+
+        assert stats["ga4"]["async"] == {"connections": 0, "idle": 0, "active": 0, "requests": 0}
+        assert set(stats["salesforce"]) == {"sync"}
+        await registry.aclose()
+        assert registry.stats() == {}
+
+
+class TestIntegrationClients:
+    """Integration clients use the shared registry clients"""
+
+    @pytest.mark.asyncio
+    async def test_default_clients_come_from_registry(self):
+        registry = get_http_clients()
+        try:
+            assert SalesforceClient(uuid4(), {}).http_client is registry.sync_client("salesforce")
+            assert HubSpotClient(uuid4(), {}).http_client is registry.sync_client("hubspot")
+            assert GA4MeasurementProtocol("G-TEST123456", "secret").http_client is registry.async_client("ga4")
+            assert TeamsWebhookClient("https://example.webhook.office.com/x").http_client is registry.async_client("teams_webhook")
+        finally:
+            await close_http_clients()
+
+    def test_crm_requests_reuse_client(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"access_token": "new", "refresh_token": "refresh", "expires_in": 1800})
+
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        client = HubSpotClient(uuid4(), {}, http_client=http_client)
+
+        assert client.refresh_access_token("refresh")["access_token"] == "new"
+        assert client.refresh_access_token("refresh")["access_token"] == "new"
+        assert len(requests) == 2
+        assert not http_client.is_closed
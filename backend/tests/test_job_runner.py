@@ -0,0 +1,96 @@
+"""
+Tests for the Background Job Runner
+
+Stale job recovery and the background task entry point (no database server
+required).
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.job_runner import STALE_JOB_ERROR, recover_stale_jobs, run_job
+from app.services.lead_import_service import LeadImportService
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestFailStaleJobs:
+    """Tests for JobService.fail_stale_jobs"""
+
+    def test_marks_jobs_without_progress_failed(self):
+        db = MagicMock()
+        db.execute.return_value.rowcount = 0
+
+        assert LeadImportService(db).fail_stale_jobs(uuid4()) == 0
+
+        statement = db.execute.call_args.args[0]
+        sql = compile_sql(statement)
+        assert sql.startswith("UPDATE lead_import_jobs SET status=")
+        assert "lead_import_jobs.status IN (__[POSTCOMPILE_status_1])" in sql
+        assert "lead_import_jobs.updated_at < now() - " in sql
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert params["status_1"] == ["pending", "running"]
+        assert STALE_JOB_ERROR in params.values()
+        db.commit.assert_called_once()
+
+    def test_bulk_lead_writes_are_reconciled(self):
+        db = MagicMock()
+        db.execute.return_value.rowcount = 2
+        tenant_id = uuid4()
+
+        with (
+            patch("app.services.job_runner.TenantCounterService") as counters,
+            patch("app.services.job_runner.get_hot_lead_leaderboard") as leaderboard,
+        ):
+            assert LeadImportService(db).fail_stale_jobs(tenant_id) == 2
+
+        # Recounted in the transaction that fails the jobs
+        counters.return_value.reconcile.assert_called_once_with(tenant_id)
+        db.commit.assert_called_once()
+        leaderboard.return_value.invalidate.assert_called_once_with(tenant_id)
+
+
+class TestRecoverStaleJobs:
+    """Tests for recover_stale_jobs"""
+
+    def test_each_tenant_in_its_own_transaction(self):
+        db = MagicMock()
+        tenant_a, tenant_b = uuid4(), uuid4()
+        db.execute.return_value.scalars.return_value = [tenant_a, tenant_b]
+
+        with (
+            patch("app.services.job_runner.SessionLocal", return_value=db),
+            patch.object(LeadImportService, "fail_stale_jobs", side_effect=[RuntimeError("boom"), 3]) as fail_stale_jobs,
+        ):
+            assert recover_stale_jobs([LeadImportService]) == 3
+
+        assert [call.args[0] for call in fail_stale_jobs.call_args_list] == [tenant_a, tenant_b]
+        # RLS scope is set for every tenant
+        assert [call.args[1]["tenant_id"] for call in db.execute.call_args_list[1:]] == [str(tenant_a), str(tenant_b)]
+        db.rollback.assert_called()
+        db.close.assert_called_once()
+
+
+class TestRunJob:
+    """Tests for run_job"""
+
+    def test_missing_job_is_skipped(self):
+        db = MagicMock()
+
+        tenant_id = uuid4()
+
+        with (
+            patch("app.services.job_runner.SessionLocal", return_value=db),
+            patch("app.services.job_runner.scope_session_to_tenant") as scope_session_to_tenant,
+            patch.object(LeadImportService, "get_job", return_value=None),
+            patch.object(LeadImportService, "run") as run,
+        ):
+            run_job(LeadImportService, uuid4(), tenant_id, MagicMock())
+
+        scope_session_to_tenant.assert_called_once_with(db, tenant_id)
+        run.assert_not_called()
+        db.close.assert_called_once()
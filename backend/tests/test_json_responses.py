@@ -0,0 +1,81 @@
+"""
+Tests for JSON Responses
+
+orjson rendering of the default response class and TypeAdapter-serialized
+list responses.
+"""
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from types import SimpleNamespace
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import ORJSONResponse, json_response
+from app.main import app
+from app.schemas.audit_log import AUDIT_LOG_LIST_ADAPTER
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class TestORJSONResponse:
+    """Tests for ORJSONResponse"""
+
+    def test_matches_jsonable_encoder_output(self):
+        content = {
+            "id": UUID(int=1),
+            "created_at": datetime(2026, 10, 19, 9, 30, 0, 123456, tzinfo=timezone.utc),
+            "day": date(2026, 10, 19),
+            "average": Decimal("1.25"),
+            "total": Decimal("12"),
+            "color": Color.RED,
+            "tags": {"vip"},
+        }
+
+        body = ORJSONResponse(content).body
+
+        assert json.loads(body) == json.loads(json.dumps(jsonable_encoder(content)))
+
+    def test_non_string_keys(self):
+        assert json.loads(ORJSONResponse({1: "a", date(2026, 1, 1): "b"}).body) == {"1": "a", "2026-01-01": "b"}
+
+    def test_is_the_default_response_class(self):
+        route = next(route for route in app.routes if getattr(route, "path", "").endswith("/analytics/overview"))
+
+        assert route.response_class is ORJSONResponse
+
+
+class TestJsonResponse:
+    """Tests for json_response"""
+
+    def test_entities_serialized_by_adapter(self):
+        log = SimpleNamespace(
+            id=UUID(int=1),
+            tenant_id=UUID(int=2),
+            user_id=UUID(int=3),
+            entity_type="LEAD",
+            entity_id=UUID(int=4),
+            action="UPDATE",
+            entity_name=None,
+            old_values={"score": 10},
+            new_values={"score": 90},
+            reason=None,
+            ip_address=None,
+            user_agent=None,
+            created_at=datetime(2026, 10, 19),
+            password_hash="not serialized",
+        )
+
+        response = json_response(AUDIT_LOG_LIST_ADAPTER, [log], headers={"X-Next-Cursor": "abc"})
+
+        (item,) = json.loads(response.body)
+        assert item["entity_id"] == str(UUID(int=4))
+        assert item["created_at"] == "2026-10-19T00:00:00"
+        assert "password_hash" not in item
+        assert response.headers["X-Next-Cursor"] == "abc"
+        assert response.media_type == "application/json"
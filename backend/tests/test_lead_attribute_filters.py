@@ -0,0 +1,118 @@
+"""
+Tests for Lead Tag / Custom Field Filters
+
+JSONB containment predicates, their GIN indexes, query parameter parsing,
+and the filters of lead lists, search and reports (no database server
+required).
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import and_, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.models.lead import Lead
+from app.services.lead_service import LeadService
+from app.services.leads.lead_search import LeadSearchService, attribute_filters, parse_custom_field_filters
+from app.services.report_service import ReportService
+
+
+def compile_sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def compiled_params(clause) -> dict:
+    return clause.compile(dialect=postgresql.dialect()).params
+
+
+class TestAttributeFilters:
+    """Tests for attribute_filters"""
+
+    def test_tags_contain_all(self):
+        (condition,) = attribute_filters(tags=["vip", "webinar"])
+
+        assert compile_sql(condition) == "leads.tags @> %(tags_1)s::JSONB"
+        assert compiled_params(condition) == {"tags_1": ["vip", "webinar"]}
+
+    def test_custom_field_in(self):
+        (condition,) = attribute_filters(custom_fields={"industry": ["SaaS", "Fintech"]})
+
+        assert compile_sql(condition) == "(leads.custom_fields @> %(custom_fields_1)s::JSONB) OR (leads.custom_fields @> %(custom_fields_2)s::JSONB)"
+        assert list(compiled_params(condition).values()) == [{"industry": "SaaS"}, {"industry": "Fintech"}]
+
+    def test_no_filters(self):
+        assert attribute_filters() == []
+        assert attribute_filters(tags=[], custom_fields={"industry": []}) == []
+
+    def test_columns_are_gin_indexed(self):
+        indexes = {index.name: compile_sql(CreateIndex(index)) for index in Lead.__table__.indexes}
+
+        assert indexes["idx_leads_tags"] == "CREATE INDEX idx_leads_tags ON leads USING gin (tags jsonb_path_ops)"
+        assert indexes["idx_leads_custom_fields"] == "CREATE INDEX idx_leads_custom_fields ON leads USING gin (custom_fields jsonb_path_ops)"
+
+
+class TestParseCustomFieldFilters:
+    """Tests for parse_custom_field_filters"""
+
+    def test_repeated_names_and_typed_values(self):
+        filters = parse_custom_field_filters(["industry:SaaS", "industry:Fintech", "employees:50", "region:eu:west", "trial:true"])
+
+        assert filters == {
+            "industry": ["SaaS", "Fintech"],
+            "employees": ["50", 50],
+            "region": ["eu:west"],
+            "trial": ["true", True],
+        }
+
+    def test_non_json_constants_stay_strings(self):
+        assert parse_custom_field_filters(["score:NaN"]) == {"score": ["NaN"]}
+
+    @pytest.mark.parametrize("param", ["industry", ":SaaS"])
+    def test_invalid(self, param):
+        with pytest.raises(ValueError):
+            parse_custom_field_filters([param])
+
+
+class TestFilteredQueries:
+    """Filters are pushed into the lead list, search and report queries"""
+
+    def test_list_by_tenant(self):
+        db = MagicMock()
+
+        LeadService(db).list_by_tenant(tenant_id="t1", tags=["vip"], custom_fields={"industry": ["SaaS"]})
+
+        conditions = db.query.return_value.filter.return_value.filter.call_args.args
+        assert [compile_sql(condition) for condition in conditions] == [
+            "leads.tags @> %(tags_1)s::JSONB",
+            "leads.custom_fields @> %(custom_fields_1)s::JSONB",
+        ]
+
+    def test_search(self):
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "sqlite"
+
+        LeadSearchService(db).search("t1", "acme", tags=["vip"])
+
+        (condition,) = db.query.return_value.filter.call_args.args
+        assert "leads.tags @> %(tags_1)s::JSONB" in compile_sql(condition)
+
+    def test_report_filters(self):
+        query = ReportService(MagicMock())._apply_lead_filters(
+            select(Lead.id), {"status": ["new"], "tags": ["vip"], "custom_fields": {"industry": "SaaS", "employees": [50, 100]}}
+        )
+
+        sql = compile_sql(query)
+        assert "leads.tags @> %(tags_1)s::JSONB" in sql
+        assert "leads.custom_fields @> %(custom_fields_1)s::JSONB" in sql
+        assert [value for key, value in compiled_params(query).items() if key.startswith("custom_fields")] == [
+            {"industry": "SaaS"},
+            {"employees": 50},
+            {"employees": 100},
+        ]
+
+    def test_report_without_attribute_filters(self):
+        query = ReportService(MagicMock())._apply_lead_filters(select(Lead.id), {"status": ["new"]})
+
+        assert compile_sql(query) == compile_sql(select(Lead.id).where(and_(Lead.status.in_(["new"]))))
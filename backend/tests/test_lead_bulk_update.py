@@ -0,0 +1,203 @@
+"""
+Tests for Bulk Lead Update
+
+Request validation, the chunk UPDATE ... RETURNING statement, chunked
+processing with job progress and the aggregated side effects of each chunk
+(no database server required).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from app.models.lead_bulk_update_job import LeadBulkUpdateJob, LeadBulkUpdateStatus
+from app.models.outbox_event import OutboxEventType
+from app.schemas.lead import LeadBulkUpdate
+from app.services.crm_sync_queue import CRMSyncQueue
+from app.services.lead_bulk_update_service import LeadBulkUpdateService
+
+
+@pytest.fixture
+def make_bulk_job(make_job):
+    def make(changes=None, selection=None):
+        return make_job(
+            LeadBulkUpdateJob,
+            selection=selection or {"filter": {"status": "new"}},
+            changes=changes or {"status": "contacted"},
+            reason="Campaign follow-up",
+        )
+
+    return make
+
+
+def make_row(old_status="new", status="contacted", old_score=50, score=50):
+    lead_id = uuid4()
+    return SimpleNamespace(
+        id=lead_id,
+        name=f"Lead {lead_id.hex[:4]}",
+        status=status,
+        score=score,
+        assigned_to=None,
+        old_status=old_status,
+        old_score=old_score,
+        old_assigned_to=None,
+    )
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestLeadBulkUpdateSchema:
+    """Tests for LeadBulkUpdate validation"""
+
+    def test_requires_exactly_one_selection(self):
+        with pytest.raises(ValidationError):
+            LeadBulkUpdate(status="contacted")
+        with pytest.raises(ValidationError):
+            LeadBulkUpdate(lead_ids=[uuid4()], filter={"status": "new"}, status="contacted")
+
+    def test_requires_a_change(self):
+        with pytest.raises(ValidationError):
+            LeadBulkUpdate(lead_ids=[uuid4()], reason="nothing to do")
+
+    def test_explicit_null_unassigns(self):
+        assert LeadBulkUpdate(filter={"min_score": 80}, assigned_to=None).changes() == {"assigned_to": None}
+        assert LeadBulkUpdate(filter={"min_score": 80}, score=90).changes() == {"score": 90}
+
+    def test_rejects_null_status_and_score(self):
+        with pytest.raises(ValidationError):
+            LeadBulkUpdate.model_validate({"lead_ids": [str(uuid4())], "status": None})
+        with pytest.raises(ValidationError):
+            LeadBulkUpdate.model_validate({"filter": {"min_score": 80}, "score": None, "assigned_to": None})
+
+
+class TestChunkUpdateStatement:
+    """The chunk is locked and updated by one statement"""
+
+    def test_update_returning_with_locked_chunk(self, make_bulk_job):
+        job = make_bulk_job(changes={"status": "contacted", "score": 90})
+
+        sql = compile_sql(LeadBulkUpdateService(MagicMock())._chunk_update_statement(job, uuid4(), 500))
+
+        assert sql.startswith("WITH chunk AS")
+        assert "FOR UPDATE" in sql
+        assert "ORDER BY leads.id" in sql
+        assert "leads.id > " in sql
+        assert "UPDATE leads SET" in sql
+        assert "last_contacted_at=CASE WHEN (leads.status = " in sql
+        assert "RETURNING leads.id, leads.name, leads.status, leads.score, leads.assigned_to, chunk.old_status" in sql
+        # Converted leads keep their status; leads already holding the values are skipped
+        assert "leads.status != " in sql
+        assert "IS DISTINCT FROM" in sql
+
+    def test_id_selection(self, make_bulk_job):
+        lead_id = uuid4()
+        job = make_bulk_job(changes={"assigned_to": None}, selection={"lead_ids": [str(lead_id)]})
+
+        sql = compile_sql(LeadBulkUpdateService(MagicMock())._chunk_update_statement(job, None, 500))
+
+        assert "leads.id IN (" in sql
+        assert "leads.id > " not in sql
+        # Unassigning does not touch status
+        assert "last_contacted_at" not in sql
+        assert "leads.status != " not in sql
+
+
+class TestLeadBulkUpdateService:
+    """Tests for LeadBulkUpdateService.run"""
+
+    def setup_method(self):
+        self.db = MagicMock()
+        self.service = LeadBulkUpdateService(self.db)
+        self.outbox = patch("app.services.lead_bulk_update_service.OutboxService").start()
+        self.crm_queue = patch("app.services.lead_bulk_update_service.CRMSyncQueue").start()
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_chunks_with_progress_and_aggregated_events(self, make_bulk_job):
+        job = make_bulk_job(changes={"score": 85})
+        chunks = [
+            [make_row(status="new", old_score=50, score=85), make_row(status="new", old_score=85, score=85)],
+            [make_row(status="new", old_score=90, score=85)],
+        ]
+        update_chunk = patch.object(self.service, "_update_chunk", side_effect=chunks).start()
+
+        self.service.run(job, chunk_size=2)
+
+        assert job.status == LeadBulkUpdateStatus.COMPLETED
+        assert job.updated_rows == 3
+        # The second chunk starts after the last ID of the first
+        assert update_chunk.call_args_list[1].args[1] == max(row.id for row in chunks[0])
+        # Commits: start, one per chunk, finish
+        assert self.db.commit.call_count == 4
+        # One bulk audit insert per chunk
+        audit_rows = self.db.execute.call_args_list[0].args[1]
+        assert [row["new_values"] for row in audit_rows] == [{"score": 85}, {"score": 85}]
+        assert audit_rows[0]["old_values"] == {"score": 50}
+        assert audit_rows[0]["entity_type"] == "LEAD" and audit_rows[0]["reason"] == "Campaign follow-up"
+
+        events = [call.kwargs for call in self.outbox.return_value.enqueue.call_args_list]
+        assert [event["event_type"] for event in events] == [
+            OutboxEventType.GA4_EVENT,
+            OutboxEventType.TEAMS_HOT_LEADS_SUMMARY,
+            OutboxEventType.GA4_EVENT,
+        ]
+        assert events[0]["payload"]["event_params"]["became_hot"] == 1
+        assert events[1]["payload"] == {"lead_ids": [str(chunks[0][0].id)]}
+        assert self.crm_queue.return_value.enqueue_many.call_args_list[0].args == (job.tenant_id, [chunks[0][0].id])
+
+    def test_status_change_counts_conversions(self, make_bulk_job):
+        job = make_bulk_job(changes={"status": "converted"})
+        patch.object(self.service, "_update_chunk", return_value=[make_row(old_status="qualified", status="converted")]).start()
+
+        self.service.run(job)
+
+        params = self.outbox.return_value.enqueue.call_args.kwargs["payload"]["event_params"]
+        assert (params["status_changed"], params["converted"], params["became_hot"]) == (1, 1, 0)
+        self.crm_queue.return_value.enqueue_many.assert_not_called()
+
+    def test_empty_selection_completes(self, make_bulk_job):
+        job = make_bulk_job()
+        patch.object(self.service, "_update_chunk", return_value=[]).start()
+
+        self.service.run(job)
+
+        assert job.status == LeadBulkUpdateStatus.COMPLETED
+        self.outbox.return_value.enqueue.assert_not_called()
+
+    def test_failure_marks_job_failed_and_keeps_progress(self, make_bulk_job):
+        job = make_bulk_job()
+        patch.object(self.service, "_update_chunk", side_effect=[[make_row(), make_row()], RuntimeError("deadlock detected")]).start()
+
+        self.service.run(job, chunk_size=2)
+
+        assert job.status == LeadBulkUpdateStatus.FAILED
+        assert job.error_message == "deadlock detected"
+        assert job.updated_rows == 2
+        self.db.rollback.assert_called_once()
+
+
+class TestEnqueueMany:
+    """Leads are queued for every enabled integration in one statement"""
+
+    def test_insert_from_select(self):
+        db = MagicMock()
+
+        CRMSyncQueue(db).enqueue_many(uuid4(), [uuid4(), uuid4()])
+
+        sql = compile_sql(db.execute.call_args.args[0])
+        assert sql.startswith("INSERT INTO crm_sync_queue (integration_id, lead_id, enqueued_at) SELECT")
+        assert "ON CONFLICT (integration_id, lead_id) DO UPDATE SET enqueued_at = excluded.enqueued_at" in sql
+
+    def test_no_leads_no_statement(self):
+        db = MagicMock()
+
+        CRMSyncQueue(db).enqueue_many(uuid4(), [])
+
+        db.execute.assert_not_called()
@@ -0,0 +1,142 @@
+"""
+Tests for Bulk Lead Import
+
+Row parsing and validation, chunked processing with job progress, and the
+set-based merge statement (no database server required).
+"""
+
+import io
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.models.lead_import_job import LeadImportJob, LeadImportStatus
+from app.models.outbox_event import OutboxEventType
+from app.schemas.lead import LeadImportRow
+from app.services.lead_import_service import MERGE_SQL, ON_CONFLICT_ACTIONS, LeadImportService, iter_rows
+
+
+class TestIterRows:
+    """Tests for iter_rows"""
+
+    def test_csv_with_bom(self):
+        source = io.BytesIO("\ufeffname,email,tags\n山田 太郎,taro@example.com,vip;event\n".encode("utf-8"))
+
+        assert list(iter_rows(source, "csv")) == [(1, {"name": "山田 太郎", "email": "taro@example.com", "tags": "vip;event"}, None)]
+
+    def test_ndjson_reports_bad_lines(self):
+        source = io.BytesIO(b'{"name": "A", "email": "a@example.com"}\n\nnot json\n[1]\n')
+
+        rows = list(iter_rows(source, "ndjson"))
+
+        assert rows[0] == (1, {"name": "A", "email": "a@example.com"}, None)
+        assert rows[1][0] == 2 and rows[1][1] is None and rows[1][2].startswith("Invalid JSON")
+        assert rows[2] == (3, None, "Expected a JSON object")
+
+
+class TestLeadImportService:
+    """Tests for LeadImportService.run"""
+
+    def setup_method(self):
+        self.db = MagicMock()
+        self.service = LeadImportService(self.db)
+        self.merged = []
+        patch.object(self.service, "_merge", side_effect=self.fake_merge).start()
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def fake_merge(self, job, rows):
+        self.merged.append([row.email for _, row in rows])
+        return len(rows) - 1, 1
+
+    def test_chunks_are_merged_with_progress_and_one_summary_event(self, make_job):
+        job = make_job(LeadImportJob, format="csv")
+        csv_rows = "\n".join(f"Lead {i},lead{i}@example.com,Example,,,," for i in range(5))
+        source = io.BytesIO(f"name,email,company,job_title,phone,status,tags\n{csv_rows}\n".encode())
+
+        with patch("app.services.lead_import_service.OutboxService") as outbox:
+            self.service.run(job, source, chunk_size=2)
+
+        assert self.merged == [["lead0@example.com", "lead1@example.com"], ["lead2@example.com", "lead3@example.com"], ["lead4@example.com"]]
+        assert job.status == LeadImportStatus.COMPLETED
+        assert (job.processed_rows, job.inserted_rows, job.updated_rows, job.failed_rows) == (5, 2, 3, 0)
+        # Commits: start, one per chunk, finish
+        assert self.db.commit.call_count == 5
+        outbox.return_value.enqueue.assert_called_once()
+        event = outbox.return_value.enqueue.call_args.kwargs
+        assert event["event_type"] == OutboxEventType.GA4_EVENT
+        assert event["payload"]["event_name"] == "leads_imported"
+
+    def test_invalid_rows_are_reported_and_not_merged(self, make_job):
+        job = make_job(LeadImportJob, format="ndjson")
+        lines = [
+            {"name": "Valid", "email": "valid@example.com", "tags": ["a"]},
+            {"name": "", "email": "no-name@example.com"},
+            {"name": "Bad email", "email": "not-an-email"},
+        ]
+        source = io.BytesIO("\n".join(json.dumps(line) for line in lines).encode())
+
+        with patch("app.services.lead_import_service.OutboxService"):
+            self.service.run(job, source)
+
+        assert self.merged == [["valid@example.com"]]
+        assert job.failed_rows == 2
+        assert [error["row"] for error in job.errors] == [2, 3]
+        assert job.errors[0]["error"].startswith("name:")
+
+    def test_error_list_is_capped(self, make_job):
+        job = make_job(LeadImportJob, format="ndjson")
+        source = io.BytesIO(b"oops\n" * 5)
+
+        with (
+            patch("app.services.lead_import_service.settings", LEAD_IMPORT_CHUNK_SIZE=2, LEAD_IMPORT_MAX_ERRORS=3),
+            patch("app.services.lead_import_service.OutboxService"),
+        ):
+            self.service.run(job, source)
+
+        assert job.failed_rows == 5
+        assert len(job.errors) == 3
+
+    def test_failure_marks_job_failed_and_reconciles_counters(self, make_job):
+        job = make_job(LeadImportJob, format="csv")
+        self.service._merge.side_effect = RuntimeError("connection lost")
+
+        with (
+            patch("app.services.job_runner.TenantCounterService") as counters,
+            patch("app.services.job_runner.get_hot_lead_leaderboard") as leaderboard,
+        ):
+            self.service.run(job, io.BytesIO(b"name,email\nA,a@example.com\n"))
+
+        assert job.status == LeadImportStatus.FAILED
+        assert job.error_message == "connection lost"
+        self.db.rollback.assert_called_once()
+        # Chunks merged before the failure bypassed the counter deltas
+        counters.return_value.reconcile.assert_called_once_with(job.tenant_id)
+        leaderboard.return_value.invalidate.assert_called_once_with(job.tenant_id)
+        # Commits: start, failed status, recount
+        assert self.db.commit.call_count == 3
+
+    def test_merge_queues_merged_leads_for_crm_sync(self, make_job):
+        job = make_job(LeadImportJob, format="csv")
+        inserted, updated = SimpleNamespace(id=uuid4(), inserted=True), SimpleNamespace(id=uuid4(), inserted=False)
+        db = MagicMock()
+        db.execute.return_value.all.return_value = [inserted, updated]
+        row = LeadImportRow(name="A", email="a@example.com")
+
+        with patch("app.services.lead_import_service.CRMSyncQueue") as crm_queue:
+            assert LeadImportService(db)._merge(job, [(1, row)]) == (1, 1)
+
+        crm_queue.return_value.enqueue_many.assert_called_once_with(job.tenant_id, [inserted.id, updated.id])
+
+
+class TestMergeStatement:
+    """The merge relies on the tenant/email unique constraint"""
+
+    def test_conflict_target_and_actions(self):
+        assert "ON CONFLICT ON CONSTRAINT uq_leads_tenant_email {on_conflict}" in MERGE_SQL
+        assert "RETURNING leads.id, (xmax = 0) AS inserted" in MERGE_SQL
+        assert "crm_sync_queue" not in MERGE_SQL
+        assert ON_CONFLICT_ACTIONS["skip"] == "DO NOTHING"
+        assert "company = coalesce(EXCLUDED.company, leads.company)" in ON_CONFLICT_ACTIONS["update"]
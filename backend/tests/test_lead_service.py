@@ -5,14 +5,18 @@ Comprehensive test coverage for lead_service.py
 Target: 80%+ coverage
 """
 
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
 
+from app.core.config import settings
 from app.models.lead import Lead
 from app.schemas.lead import LeadCreate, LeadScoreUpdate, LeadStatusUpdate, LeadUpdate
-from app.services.lead_service import LeadService
+from app.services.lead_service import LEAD_LIST_ORDER, LeadService
+from app.services.tenant_counter_service import TenantCounterService
+from app.utils.helpers import decode_cursor, encode_cursor, next_page_cursor
 
 
 class TestLeadServiceList:
@@ -107,6 +111,10 @@ class TestLeadServiceList:
         assert len(page2) == 2
         assert page1[0].id != page2[0].id
 
+        # Keyset cursor continues where the first page ended
+        cursor = next_page_cursor(page1, LEAD_LIST_ORDER, limit=2)
+        assert [lead.id for lead in service.list_by_tenant(tenant_id=test_tenant.id, limit=2, cursor=cursor)] == [lead.id for lead in page2]
+
     def test_list_by_tenant_isolation(self, db_session, test_tenant, test_tenant_2, test_user):
         """Test tenant isolation - should not see other tenant's leads"""
         service = LeadService(db_session)
@@ -461,6 +469,9 @@ class TestLeadServiceSearch:
                 created_by=test_user.id,
             )
             db_session.add(lead)
+        db_session.flush()
+        # Rows added directly bypass the counter deltas
+        TenantCounterService(db_session).reconcile(test_tenant.id)
         db_session.commit()
 
         # Count all
@@ -509,3 +520,70 @@ class TestLeadServiceSearch:
         assert len(hot_leads) == 2
         assert all(lead.score >= 61 for lead in hot_leads)
         assert hot_leads[0].score >= hot_leads[1].score  # Sorted by score desc
+
+
+class TestLeadServiceChanges:
+    """Tests for list_changes method"""
+
+    def test_changes_resume_from_cursor(self, db_session, test_tenant, test_user):
+        """Test paging through the change feed and resuming after new changes"""
+        service = LeadService(db_session)
+
+        for i in range(3):
+            db_session.add(
+                Lead(
+                    tenant_id=test_tenant.id,
+                    name=f"Lead {i}",
+                    email=f"change{i}@example.com",
+                    score=10,
+                    status="new",
+                    created_by=test_user.id,
+                )
+            )
+        db_session.commit()
+
+        first = service.list_changes(tenant_id=test_tenant.id, limit=2)
+        second = service.list_changes(tenant_id=test_tenant.id, since=first["next_cursor"], limit=2)
+
+        assert first["has_more"] is True
+        assert second["has_more"] is False
+        seen = [change["lead_id"] for change in first["changes"] + second["changes"]]
+        assert len(set(seen)) == 3
+        assert all(change["op"] == "upsert" for change in first["changes"] + second["changes"])
+
+        # Nothing new since the last cursor
+        idle = service.list_changes(tenant_id=test_tenant.id, since=second["next_cursor"])
+        assert idle["changes"] == []
+        assert idle["next_cursor"] == second["next_cursor"]
+
+        # Deletions are reported via tombstones
+        service.delete(lead_id=seen[0], tenant_id=test_tenant.id)
+        after_delete = service.list_changes(tenant_id=test_tenant.id, since=second["next_cursor"])
+
+        assert [(change["op"], change["lead_id"]) for change in after_delete["changes"]] == [("delete", seen[0])]
+
+    def test_changes_invalid_cursor(self, db_session, test_tenant):
+        """Test malformed cursors are rejected"""
+        service = LeadService(db_session)
+
+        with pytest.raises(ValueError):
+            service.list_changes(tenant_id=test_tenant.id, since="bogus")
+
+    def test_changes_expired_cursor(self, db_session, test_tenant):
+        """Test cursors older than the tombstone retention are rejected"""
+        service = LeadService(db_session)
+        expired = datetime.now(timezone.utc) - timedelta(days=settings.LEAD_TOMBSTONE_RETENTION_DAYS + 1)
+
+        with pytest.raises(ValueError, match="expired"):
+            service.list_changes(tenant_id=test_tenant.id, since=encode_cursor({"t": expired.isoformat(), "id": str(uuid4())}))
+
+    def test_changes_idle_cursor_advances(self, db_session, test_tenant):
+        """Test caught-up cursors move up to the read horizon while nothing changes"""
+        service = LeadService(db_session)
+        stale = datetime.now(timezone.utc) - timedelta(days=settings.LEAD_TOMBSTONE_RETENTION_DAYS - 1)
+
+        idle = service.list_changes(tenant_id=test_tenant.id, since=encode_cursor({"t": stale.isoformat(), "id": str(uuid4())}))
+
+        assert idle["changes"] == []
+        horizon = datetime.fromisoformat(decode_cursor(idle["next_cursor"])["t"])
+        assert horizon > datetime.now(timezone.utc) - timedelta(minutes=1)
@@ -5,166 +5,118 @@ Test coverage for GA4 events, Teams notifications, and edge cases
 Target: 100% coverage for lead_service.py
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from starlette.concurrency import run_in_threadpool
 
+from app.integrations.google_analytics import GA4EventBatcher, GA4Target
 from app.models.google_analytics_integration import GoogleAnalyticsIntegration
 from app.models.lead import Lead
 from app.schemas.lead import LeadCreate, LeadStatusUpdate
+from app.services.google_analytics_service import GoogleAnalyticsService, load_ga4_target
 from app.services.lead_service import LeadService
 
 
-class TestLeadServiceGA4Integration:
-    """Tests for GA4 event tracking"""
-
-    @pytest.mark.asyncio
-    async def test_send_ga4_event_success(self, db_session, test_tenant, test_user):
-        """Test successful GA4 event sending"""
-        service = LeadService(db_session)
-
-        # Create GA4 integration
-        ga_integration = GoogleAnalyticsIntegration(
-            tenant_id=test_tenant.id,
-            measurement_id="G-TEST123456",
-            measurement_protocol_api_secret="test-secret",
-            enabled=True,
-            track_server_events=True,
-        )
-        db_session.add(ga_integration)
-        db_session.commit()
-
-        with patch("app.services.lead_service.GA4MeasurementProtocol") as mock_ga4:
-            mock_client = MagicMock()
-            mock_client.send_event = AsyncMock(return_value=True)
-            mock_ga4.return_value = mock_client
-
-            await service._send_ga4_event(tenant_id=test_tenant.id, event_name="lead_created", event_params={"score": 80})
+def add_ga4_integration(db_session, tenant, **values):
+    integration = GoogleAnalyticsIntegration(
+        tenant_id=tenant.id,
+        measurement_id="G-TEST123456",
+        measurement_protocol_api_secret=values.pop("measurement_protocol_api_secret", "test-secret"),
+        enabled=values.pop("enabled", True),
+        track_server_events=values.pop("track_server_events", True),
+        **values,
+    )
+    db_session.add(integration)
+    db_session.commit()
+    return integration
 
-            mock_client.send_event.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_send_ga4_event_no_integration(self, db_session, test_tenant):
-        """Test GA4 event when no integration exists"""
-        service = LeadService(db_session)
+class TestLeadServiceGA4Integration:
+    """Tests for GA4 event tracking (server targets and outbox delivery)"""
 
-        # Should not raise error, just return
-        await service._send_ga4_event(tenant_id=test_tenant.id, event_name="test_event", event_params={})
+    def test_get_server_target_success(self, db_session, test_tenant):
+        """Test the Measurement Protocol target of a configured integration"""
+        add_ga4_integration(db_session, test_tenant)
 
-    @pytest.mark.asyncio
-    async def test_send_ga4_event_disabled(self, db_session, test_tenant):
-        """Test GA4 event when integration is disabled"""
-        service = LeadService(db_session)
+        target = GoogleAnalyticsService(db_session).get_server_target(test_tenant.id)
 
-        # Create disabled GA4 integration
-        ga_integration = GoogleAnalyticsIntegration(
-            tenant_id=test_tenant.id,
-            measurement_id="G-TEST123456",
-            measurement_protocol_api_secret="test-secret",
-            enabled=False,  # Disabled
-            track_server_events=True,
-        )
-        db_session.add(ga_integration)
-        db_session.commit()
+        assert target == GA4Target(measurement_id="G-TEST123456", api_secret="test-secret")
 
-        with patch("app.services.lead_service.GA4MeasurementProtocol") as mock_ga4:
-            await service._send_ga4_event(tenant_id=test_tenant.id, event_name="test_event", event_params={})
+    def test_get_server_target_no_integration(self, db_session, test_tenant):
+        """Test GA4 target when no integration exists"""
+        assert GoogleAnalyticsService(db_session).get_server_target(test_tenant.id) is None
 
-            # Should not create client
-            mock_ga4.assert_not_called()
+    def test_get_server_target_disabled(self, db_session, test_tenant):
+        """Test GA4 target when integration is disabled"""
+        add_ga4_integration(db_session, test_tenant, enabled=False)
 
-    @pytest.mark.asyncio
-    async def test_send_ga4_event_server_tracking_disabled(self, db_session, test_tenant):
-        """Test GA4 event when server-side tracking is disabled"""
-        service = LeadService(db_session)
+        assert GoogleAnalyticsService(db_session).get_server_target(test_tenant.id) is None
 
-        # Create GA4 integration without server tracking
-        ga_integration = GoogleAnalyticsIntegration(
-            tenant_id=test_tenant.id,
-            measurement_id="G-TEST123456",
-            measurement_protocol_api_secret="test-secret",
-            enabled=True,
-            track_server_events=False,  # Server events disabled
-        )
-        db_session.add(ga_integration)
-        db_session.commit()
+    def test_get_server_target_server_tracking_disabled(self, db_session, test_tenant):
+        """Test GA4 target when server-side tracking is disabled"""
+        add_ga4_integration(db_session, test_tenant, track_server_events=False)
 
-        with patch("app.services.lead_service.GA4MeasurementProtocol") as mock_ga4:
-            await service._send_ga4_event(tenant_id=test_tenant.id, event_name="test_event", event_params={})
+        assert GoogleAnalyticsService(db_session).get_server_target(test_tenant.id) is None
 
-            mock_ga4.assert_not_called()
+    def test_get_server_target_no_api_secret(self, db_session, test_tenant):
+        """Test GA4 target when API secret is not configured"""
+        add_ga4_integration(db_session, test_tenant, measurement_protocol_api_secret=None)
 
-    @pytest.mark.asyncio
-    async def test_send_ga4_event_no_api_secret(self, db_session, test_tenant):
-        """Test GA4 event when API secret is not configured"""
-        service = LeadService(db_session)
+        assert GoogleAnalyticsService(db_session).get_server_target(test_tenant.id) is None
 
-        # Create GA4 integration without API secret
-        ga_integration = GoogleAnalyticsIntegration(
-            tenant_id=test_tenant.id,
-            measurement_id="G-TEST123456",
-            measurement_protocol_api_secret=None,  # No API secret
-            enabled=True,
-            track_server_events=True,
-        )
-        db_session.add(ga_integration)
-        db_session.commit()
+    def test_load_ga4_target_scopes_session_to_tenant(self):
+        """Test the target is loaded in a tenant-scoped session that is closed"""
+        tenant_id = uuid4()
+        session = MagicMock()
+        target = GA4Target(measurement_id="G-TEST123456", api_secret="test-secret")
 
-        with patch("app.services.lead_service.GA4MeasurementProtocol") as mock_ga4:
-            await service._send_ga4_event(tenant_id=test_tenant.id, event_name="test_event", event_params={})
+        with (
+            patch("app.services.google_analytics_service.SessionLocal", return_value=session),
+            patch.object(GoogleAnalyticsService, "get_server_target", return_value=target) as get_server_target,
+        ):
+            assert load_ga4_target(tenant_id) == target
 
-            mock_ga4.assert_not_called()
+        assert session.execute.call_args.args[1] == {"tenant_id": str(tenant_id)}
+        get_server_target.assert_called_once_with(tenant_id)
+        session.close.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_send_ga4_event_exception_handling(self, db_session, test_tenant):
-        """Test GA4 event handles exceptions gracefully"""
-        service = LeadService(db_session)
+    async def test_deliver_ga4_event_exception_handling(self):
+        """Test a failing target lookup is reported for retry instead of raising"""
+        session = MagicMock()
+        session.execute.side_effect = Exception("Connection error")
+        batcher = GA4EventBatcher(lambda tenant_id: run_in_threadpool(load_ga4_target, tenant_id), http_client=MagicMock())
 
-        # Create GA4 integration
-        ga_integration = GoogleAnalyticsIntegration(
-            tenant_id=test_tenant.id,
-            measurement_id="G-TEST123456",
-            measurement_protocol_api_secret="test-secret",
-            enabled=True,
-            track_server_events=True,
-        )
-        db_session.add(ga_integration)
-        db_session.commit()
+        with (
+            patch("app.services.google_analytics_service.SessionLocal", return_value=session),
+            patch("app.services.lead_service.get_ga4_batcher", return_value=batcher),
+        ):
+            delivery = asyncio.ensure_future(LeadService(MagicMock()).deliver_ga4_event(uuid4(), {"event_name": "test_event"}))
+            await asyncio.sleep(0)
+            await batcher.flush()
 
-        with patch("app.services.lead_service.GA4MeasurementProtocol") as mock_ga4:
-            mock_ga4.side_effect = Exception("Connection error")
+            assert await delivery is False
 
-            # Should not raise, just log error
-            await service._send_ga4_event(tenant_id=test_tenant.id, event_name="test_event", event_params={})
+        session.close.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_send_ga4_event_with_custom_client_id(self, db_session, test_tenant):
+    async def test_deliver_ga4_event_with_custom_client_id(self):
         """Test GA4 event with custom client ID"""
-        service = LeadService(db_session)
-
-        # Create GA4 integration
-        ga_integration = GoogleAnalyticsIntegration(
-            tenant_id=test_tenant.id,
-            measurement_id="G-TEST123456",
-            measurement_protocol_api_secret="test-secret",
-            enabled=True,
-            track_server_events=True,
-        )
-        db_session.add(ga_integration)
-        db_session.commit()
-
-        with patch("app.services.lead_service.GA4MeasurementProtocol") as mock_ga4:
-            mock_client = MagicMock()
-            mock_client.send_event = AsyncMock(return_value=True)
-            mock_ga4.return_value = mock_client
-
-            custom_client_id = "custom-client-123"
-            await service._send_ga4_event(tenant_id=test_tenant.id, event_name="test_event", event_params={}, client_id=custom_client_id)
-
-            # Verify client_id was passed
-            call_args = mock_client.send_event.call_args
-            assert call_args[1]["client_id"] == custom_client_id
+        tenant_id = uuid4()
+        batcher = MagicMock()
+        batcher.submit.return_value = asyncio.get_running_loop().create_future()
+        batcher.submit.return_value.set_result(True)
+
+        with patch("app.services.lead_service.get_ga4_batcher", return_value=batcher):
+            delivered = await LeadService(MagicMock()).deliver_ga4_event(
+                tenant_id, {"event_name": "test_event", "event_params": {}, "client_id": "custom-client-123"}
+            )
+
+        assert delivered is True
+        assert batcher.submit.call_args.kwargs["client_id"] == "custom-client-123"
 
 
 class TestLeadServiceTeamsIntegration:
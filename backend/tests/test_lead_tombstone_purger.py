@@ -0,0 +1,49 @@
+"""
+Tests for Lead Tombstone Purger
+
+Retention-based purge of change feed tombstones.
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.core.config import settings
+from app.services.lead_tombstone_purger import purge_expired_tombstones, purge_tenant_tombstones
+
+
+class TestLeadTombstonePurger:
+    """Tests for the tombstone purge"""
+
+    def test_purges_tombstones_past_retention(self):
+        db = MagicMock()
+        query = db.query.return_value.filter.return_value
+        query.delete.return_value = 3
+        tenant_id = uuid4()
+
+        with patch.object(settings, "LEAD_TOMBSTONE_RETENTION_DAYS", 7):
+            assert purge_tenant_tombstones(db, tenant_id) == 3
+
+        tenant_clause, age_clause = db.query.return_value.filter.call_args.args
+        assert tenant_clause.right.value == tenant_id
+        assert str(age_clause.right.right.value) == "7 days, 0:00:00"
+        query.delete.assert_called_once_with(synchronize_session=False)
+        db.commit.assert_not_called()
+
+    def test_purges_each_tenant_in_its_own_transaction(self):
+        db = MagicMock()
+        tenant_a, tenant_b = uuid4(), uuid4()
+        db.execute.return_value.scalars.return_value = [tenant_a, tenant_b]
+
+        with (
+            patch("app.services.lead_tombstone_purger.SessionLocal", return_value=db),
+            patch("app.services.lead_tombstone_purger.purge_tenant_tombstones", side_effect=[RuntimeError("boom"), 2]) as purge,
+        ):
+            assert purge_expired_tombstones() == 2
+
+        assert [call.args[1] for call in purge.call_args_list] == [tenant_a, tenant_b]
+        # RLS scope is set for every tenant before its purge
+        tenant_scopes = [call.args[1]["tenant_id"] for call in db.execute.call_args_list[1:]]
+        assert tenant_scopes == [str(tenant_a), str(tenant_b)]
+        db.rollback.assert_called()
+        db.commit.assert_called_once()
+        db.close.assert_called_once()
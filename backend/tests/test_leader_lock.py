@@ -0,0 +1,117 @@
+"""
+Tests for LeaderLock
+
+Advisory lock election of the process running a periodic job (no database
+server required).
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from app.core.database import LeaderLock
+from app.services.tenant_counter_service import run_counter_reconciler
+
+
+def make_connection(acquired=True):
+    connection = MagicMock()
+    connection.execute.return_value.scalar.return_value = acquired
+    return connection
+
+
+class TestLeaderLock:
+    """Tests for LeaderLock"""
+
+    def setup_method(self):
+        self.engine = patch("app.core.database.engine").start()
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def connect(self, *connections):
+        self.engine.connect.return_value.execution_options.side_effect = list(connections)
+
+    def test_acquires_on_an_autocommit_connection(self):
+        connection = make_connection()
+        self.connect(connection)
+
+        assert LeaderLock("reconciler").acquire() is True
+
+        self.engine.connect.return_value.execution_options.assert_called_once_with(isolation_level="AUTOCOMMIT")
+        statement, params = connection.execute.call_args.args
+        assert str(statement) == "SELECT pg_try_advisory_lock(hashtext(:name))"
+        assert params == {"name": "reconciler"}
+        connection.close.assert_not_called()
+
+    def test_lock_held_elsewhere(self):
+        connection = make_connection(acquired=False)
+        self.connect(connection)
+
+        leader = LeaderLock("reconciler")
+
+        assert leader.acquire() is False
+        assert leader.connection is None
+        connection.close.assert_called_once()
+
+    def test_held_lock_is_kept_between_passes(self):
+        connection = make_connection()
+        self.connect(connection)
+        leader = LeaderLock("reconciler")
+
+        assert leader.acquire() and leader.acquire()
+
+        assert self.engine.connect.call_count == 1
+        assert str(connection.execute.call_args.args[0]) == "SELECT 1"
+
+    def test_lost_connection_retakes_the_lock(self):
+        lost, fresh = make_connection(), make_connection()
+        self.connect(lost, fresh)
+        leader = LeaderLock("reconciler")
+        leader.acquire()
+        lost.execute.side_effect = RuntimeError("server closed the connection")
+
+        assert leader.acquire() is True
+
+        lost.invalidate.assert_called_once()
+        assert leader.connection is fresh
+
+    def test_release_unlocks_and_closes(self):
+        connection = make_connection()
+        self.connect(connection)
+        leader = LeaderLock("reconciler")
+        leader.acquire()
+
+        leader.release()
+
+        assert str(connection.execute.call_args.args[0]) == "SELECT pg_advisory_unlock(hashtext(:name))"
+        connection.close.assert_called_once()
+        assert leader.connection is None
+
+
+class TestCounterReconcilerElection:
+    """Only the elected process runs reconciliation passes"""
+
+    def run_pass(self, acquired):
+        async def run():
+            stop_event = asyncio.Event()
+            with (
+                patch("app.services.tenant_counter_service.settings", TENANT_COUNTER_RECONCILE_INTERVAL=0),
+                patch.object(LeaderLock, "acquire", side_effect=lambda: stop_event.set() or acquired),
+                patch.object(LeaderLock, "release") as release,
+                patch("app.services.tenant_counter_service.reconcile_all_tenants") as reconcile,
+            ):
+                await run_counter_reconciler(stop_event)
+            return reconcile, release
+
+        return asyncio.run(run())
+
+    def test_leader_reconciles(self):
+        reconcile, release = self.run_pass(acquired=True)
+
+        reconcile.assert_called_once()
+        release.assert_called_once()
+
+    def test_other_processes_skip(self):
+        reconcile, release = self.run_pass(acquired=False)
+
+        reconcile.assert_not_called()
+        release.assert_called_once()
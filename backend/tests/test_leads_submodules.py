@@ -4,13 +4,18 @@ Tests for Lead CRUD, Scoring, and Search Services
 Comprehensive test coverage for leads submodules
 """
 
+from unittest.mock import MagicMock
 from uuid import uuid4
 
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
 from app.models.lead import Lead
 from app.schemas.lead import LeadUpdate
 from app.services.leads.lead_crud import LeadCRUDService
 from app.services.leads.lead_scoring import LeadScoringService
-from app.services.leads.lead_search import LeadSearchService
+from app.services.leads.lead_search import LeadSearchService, trigram_search_available
 
 
 class TestLeadCRUDService:
@@ -409,3 +414,39 @@ class TestLeadSearchService:
         results = service.search(test_tenant.id, "Test", limit=3)
 
         assert len(results) == 3
+
+
+class TestLeadSearchQuery:
+    """Trigram search on PostgreSQL and the ILIKE fallback elsewhere (no database server)"""
+
+    def test_sqlite_falls_back_to_ilike(self):
+        engine = create_engine("sqlite://")
+        Lead.__table__.create(engine)
+        tenant_id, user_id = uuid4(), uuid4()
+        with Session(engine) as db:
+            db.add_all(
+                [
+                    Lead(tenant_id=tenant_id, name="Alice Johnson", email="alice@example.com", created_by=user_id, tags=[], custom_fields={}),
+                    Lead(tenant_id=tenant_id, name="Bob", email="bob@example.com", company="Alicorp", created_by=user_id, tags=[], custom_fields={}),
+                    Lead(tenant_id=uuid4(), name="Alice Other", email="other@example.com", created_by=user_id, tags=[], custom_fields={}),
+                ]
+            )
+            db.commit()
+
+            assert not trigram_search_available(db)
+            assert sorted(lead.name for lead in LeadSearchService(db).search(tenant_id, "ali")) == ["Alice Johnson", "Bob"]
+
+    def test_postgresql_ranks_by_word_similarity(self):
+        db = MagicMock()
+        db.get_bind.return_value = create_engine("postgresql://search-test/db")
+        db.execute.return_value.scalar.return_value = True
+        query = db.query.return_value
+
+        LeadSearchService(db).search(uuid4(), "yamda")
+
+        where = str(query.filter.call_args.args[0].compile(dialect=postgresql.dialect()))
+        order = [str(clause.compile(dialect=postgresql.dialect())) for clause in query.filter.return_value.order_by.call_args.args]
+        assert "(leads.name || %(name_1)s || leads.email || %(param_1)s || coalesce(leads.company, %(coalesce_1)s)) ILIKE" in where
+        assert "coalesce(leads.company, %(coalesce_1)s)) %%> " in where
+        assert order[0].startswith("word_similarity(%(word_similarity_1)s, (leads.name ||")
+        assert order[0].endswith("DESC")
@@ -0,0 +1,214 @@
+"""
+Tests for Outbox Service and Worker
+
+Transactional outbox enqueueing, retry scheduling and delivery dispatch
+(no database required).
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.outbox_event import OutboxEvent, OutboxEventStatus, OutboxEventType
+from app.schemas.lead import LeadScoreUpdate
+from app.services.lead_service import LeadService
+from app.services.outbox_service import OutboxService, compute_backoff
+from app.services.outbox_worker import process_outbox_batch
+
+
+def make_event(event_type=OutboxEventType.GA4_EVENT, attempts=1, payload=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        tenant_id=uuid4(),
+        event_type=event_type,
+        payload=payload or {"event_name": "lead_generated", "event_params": {}},
+        attempts=attempts,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+class TestComputeBackoff:
+    """Tests for compute_backoff"""
+
+    def test_grows_exponentially(self):
+        with patch("app.services.outbox_service.random.uniform", return_value=1.0):
+            assert compute_backoff(1) == 5
+            assert compute_backoff(2) == 10
+            assert compute_backoff(4) == 40
+
+    def test_capped(self):
+        with patch("app.services.outbox_service.random.uniform", return_value=1.0):
+            assert compute_backoff(50) == 3600
+
+    def test_jitter_bounds(self):
+        for _ in range(20):
+            assert 4 <= compute_backoff(1) <= 6
+
+
+class TestOutboxService:
+    """Tests for OutboxService"""
+
+    def test_enqueue_adds_pending_event_without_commit(self):
+        db = MagicMock()
+        tenant_id = uuid4()
+
+        event = OutboxService(db).enqueue(tenant_id, OutboxEventType.TEAMS_HOT_LEAD, {"lead_id": "x"})
+
+        assert isinstance(event, OutboxEvent)
+        assert event.tenant_id == tenant_id
+        assert event.status == OutboxEventStatus.PENDING
+        assert event.attempts == 0
+        db.add.assert_called_once_with(event)
+        db.commit.assert_not_called()
+
+    def test_mark_failed_schedules_retry(self):
+        db = MagicMock()
+
+        OutboxService(db).mark_failed(make_event(attempts=1), "boom")
+
+        params = db.execute.call_args[0][0].compile().params
+        assert params["last_error"] == "boom"
+        assert params["next_attempt_at"] > datetime.now(timezone.utc)
+        assert "status" not in params
+
+    def test_mark_failed_dead_letters_after_max_attempts(self):
+        db = MagicMock()
+
+        with patch("app.services.outbox_service.settings.OUTBOX_MAX_ATTEMPTS", 3):
+            OutboxService(db).mark_failed(make_event(attempts=3), "boom")
+
+        params = db.execute.call_args[0][0].compile().params
+        assert params["status"] == OutboxEventStatus.DEAD
+
+    def test_mark_delivered_skips_empty(self):
+        db = MagicMock()
+        OutboxService(db).mark_delivered([])
+        db.execute.assert_not_called()
+
+
+class TestProcessOutboxBatch:
+    """Tests for process_outbox_batch"""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_and_settles_events(self):
+        db = MagicMock()
+        ok, failed, unknown = make_event(), make_event(), make_event(event_type="unknown")
+        handler = AsyncMock(side_effect=[True, False])
+        sessions = [MagicMock(), MagicMock()]
+
+        with (
+            patch("app.services.outbox_worker.OutboxService") as MockOutbox,
+            patch("app.services.outbox_worker.SessionLocal", side_effect=sessions),
+            patch.dict("app.services.outbox_worker.OUTBOX_HANDLERS", {OutboxEventType.GA4_EVENT: handler}),
+        ):
+            outbox = MockOutbox.return_value
+            outbox.claim_batch.return_value = [ok, failed, unknown]
+
+            claimed = await process_outbox_batch(db, batch_size=10)
+
+        assert claimed == 3
+        outbox.claim_batch.assert_called_once_with(10)
+        handler.assert_any_await(sessions[0], ok.tenant_id, ok.payload)
+        for session, event in zip(sessions, [ok, failed]):
+            assert session.execute.call_args.args[1] == {"tenant_id": str(event.tenant_id)}
+            session.close.assert_called_once()
+        outbox.mark_delivered.assert_called_once_with([ok.id])
+        assert [call.args[0] for call in outbox.mark_failed.call_args_list] == [failed, unknown]
+        db.commit.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_handler_exception_rolls_back_and_retries(self):
+        db = MagicMock()
+        session = MagicMock()
+        event = make_event()
+        handler = AsyncMock(side_effect=RuntimeError("db gone"))
+
+        with (
+            patch("app.services.outbox_worker.OutboxService") as MockOutbox,
+            patch("app.services.outbox_worker.SessionLocal", return_value=session),
+            patch.dict("app.services.outbox_worker.OUTBOX_HANDLERS", {OutboxEventType.GA4_EVENT: handler}),
+        ):
+            outbox = MockOutbox.return_value
+            outbox.claim_batch.return_value = [event]
+
+            await process_outbox_batch(db)
+
+        # Only the failed delivery's own session is rolled back
+        session.rollback.assert_called_once()
+        db.rollback.assert_not_called()
+        outbox.mark_failed.assert_called_once_with(event, "RuntimeError: db gone")
+        outbox.mark_delivered.assert_called_once_with([])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_deliveries_are_bounded(self):
+        running, peak = 0, 0
+
+        async def handler(db, tenant_id, payload):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Long enough for the other deliveries to scope their sessions (threadpool)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return True
+
+        with (
+            patch("app.services.outbox_worker.OutboxService") as MockOutbox,
+            patch("app.services.outbox_worker.SessionLocal", side_effect=lambda: MagicMock()),
+            patch("app.services.outbox_worker.settings.OUTBOX_DELIVERY_CONCURRENCY", 2),
+            patch.dict("app.services.outbox_worker.OUTBOX_HANDLERS", {OutboxEventType.GA4_EVENT: handler}),
+        ):
+            MockOutbox.return_value.claim_batch.return_value = [make_event() for _ in range(5)]
+
+            await process_outbox_batch(MagicMock())
+
+        assert peak == 2
+
+
+class TestLeadServiceOutbox:
+    """Lead side effects are enqueued in the lead transaction"""
+
+    def test_update_score_enqueues_hot_lead_events_before_commit(self):
+        db = MagicMock()
+        lead = SimpleNamespace(id=uuid4(), tenant_id=uuid4(), status="new", score=40, company=None, last_activity_at=None)
+        service = LeadService(db)
+
+        with (
+            patch.object(service, "get_by_id", return_value=lead),
+            patch("app.services.lead_service.OutboxService") as MockOutbox,
+        ):
+            MockOutbox.return_value.enqueue.side_effect = lambda **kwargs: db.commit.assert_not_called()
+            service.update_score(lead.id, LeadScoreUpdate(score=90), lead.tenant_id)
+
+        event_types = [call.kwargs["event_type"] for call in MockOutbox.return_value.enqueue.call_args_list]
+        assert event_types == [OutboxEventType.GA4_EVENT, OutboxEventType.TEAMS_HOT_LEAD]
+        db.commit.assert_called_once()
+
+    def test_update_score_below_threshold_enqueues_nothing(self):
+        db = MagicMock()
+        lead = SimpleNamespace(id=uuid4(), tenant_id=uuid4(), status="new", score=10, company=None, last_activity_at=None)
+        service = LeadService(db)
+
+        with (
+            patch.object(service, "get_by_id", return_value=lead),
+            patch("app.services.lead_service.OutboxService") as MockOutbox,
+        ):
+            service.update_score(lead.id, LeadScoreUpdate(score=50), lead.tenant_id)
+
+        MockOutbox.return_value.enqueue.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deliver_teams_notification_skips_deleted_lead(self):
+        service = LeadService(MagicMock())
+
+        with (
+            patch.object(service, "get_by_id", return_value=None),
+            patch.object(service, "_send_teams_notification", new_callable=AsyncMock) as send,
+        ):
+            assert await service.deliver_teams_notification(uuid4(), {"lead_id": str(uuid4())}) is True
+
+        send.assert_not_awaited()
@@ -0,0 +1,220 @@
+"""
+Tests for Principal Service
+
+Cached user / tenant resolution and the get_current_user dependency, on an
+in-memory SQLite database holding only the tenants and users tables.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.core.cache import MemoryCache
+from app.core.deps import get_current_tenant, get_current_user
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services.auth import AuthService
+from app.services.principal_service import PrincipalService
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Tenant.__table__.create(engine)
+    User.__table__.create(engine)
+    return engine
+
+
+@pytest.fixture
+def queries(engine):
+    """SQL statements executed during the test"""
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+
+@pytest.fixture
+def principal(engine):
+    ids = SimpleNamespace(user_id=uuid4(), tenant_id=uuid4())
+    tenant = Tenant(id=ids.tenant_id, name="Acme", slug="acme", plan="pro", settings={"teams_webhook_url": "https://hook"})
+    user = User(id=ids.user_id, tenant_id=ids.tenant_id, email="admin@acme.test", password_hash="hash", name="Admin", role="tenant_admin")
+    with Session(engine) as session:
+        session.add(tenant)
+        session.flush()
+        session.add(user)
+        session.commit()
+    return ids
+
+
+@pytest.fixture
+def cache():
+    """A memory cache standing in for a shared (Redis) one"""
+    cache = MemoryCache()
+    cache.shared = True
+    with patch("app.services.principal_service.get_cache", return_value=cache):
+        yield cache
+
+
+def make_request(payload=None, token=None):
+    state = SimpleNamespace()
+    if payload is not None:
+        state.token = token
+        state.token_payload = payload
+    return SimpleNamespace(state=state)
+
+
+class TestPrincipalService:
+    """Tests for PrincipalService"""
+
+    def test_second_lookup_served_from_cache(self, engine, principal, cache, queries):
+        with Session(engine) as session:
+            PrincipalService(session).get_user(principal.user_id)
+        assert len(queries) == 1
+
+        with Session(engine) as session:
+            user = PrincipalService(session).get_user(principal.user_id)
+
+            assert (user.id, user.tenant_id, user.role, user.email) == (principal.user_id, principal.tenant_id, "tenant_admin", "admin@acme.test")
+            assert len(queries) == 1
+            assert user in session
+            assert not session.dirty
+
+    def test_uncached_columns_load_on_access(self, engine, principal, cache, queries):
+        with Session(engine) as session:
+            PrincipalService(session).get_tenant(principal.tenant_id)
+
+        with Session(engine) as session:
+            tenant = PrincipalService(session).get_tenant(principal.tenant_id)
+            assert len(queries) == 1
+
+            assert tenant.settings == {"teams_webhook_url": "https://hook"}
+            assert len(queries) == 2
+
+    def test_reuses_instance_already_in_session(self, engine, principal, cache):
+        with Session(engine) as session:
+            PrincipalService(session).get_user(principal.user_id)
+
+        with Session(engine) as session:
+            loaded = session.get(User, principal.user_id)
+            loaded.name = "Renamed"
+
+            assert PrincipalService(session).get_user(principal.user_id) is loaded
+            assert loaded.name == "Renamed"
+
+    def test_missing_user_not_cached(self, engine, cache, queries):
+        with Session(engine) as session:
+            service = PrincipalService(session)
+            assert service.get_user(uuid4()) is None
+            assert service.get_user(uuid4()) is None
+
+        assert len(queries) == 2
+
+    def test_invalidate_user(self, engine, principal, cache):
+        with Session(engine) as session:
+            PrincipalService(session).get_user(principal.user_id)
+            session.get(User, principal.user_id).role = "user"
+            session.commit()
+
+        with Session(engine) as session:
+            assert PrincipalService(session).get_user(principal.user_id).role == "tenant_admin"
+
+            PrincipalService(session).invalidate_user(principal.user_id)
+
+        with Session(engine) as session:
+            assert PrincipalService(session).get_user(principal.user_id).role == "user"
+
+    def test_per_worker_cache_not_used(self, engine, principal):
+        cache = MemoryCache()
+
+        with patch("app.services.principal_service.get_cache", return_value=cache):
+            with Session(engine) as session:
+                PrincipalService(session).get_user(principal.user_id)
+                session.get(User, principal.user_id).role = "user"
+                session.commit()
+
+            # A demotion committed on another worker is seen without invalidation
+            with Session(engine) as session:
+                assert PrincipalService(session).get_user(principal.user_id).role == "user"
+
+        assert cache.get(PrincipalService.user_cache_key(principal.user_id)) is None
+
+    def test_invalidate_tenant(self, engine, principal, cache):
+        with Session(engine) as session:
+            PrincipalService(session).get_tenant(principal.tenant_id)
+
+            PrincipalService(session).invalidate_tenant(principal.tenant_id)
+
+        assert cache.get(PrincipalService.tenant_cache_key(principal.tenant_id)) is None
+
+
+class TestCurrentPrincipalDependencies:
+    """Tests for get_current_user / get_current_tenant"""
+
+    @pytest.fixture
+    def token(self, principal):
+        return AuthService.create_access_token({"sub": str(principal.user_id), "tenant_id": str(principal.tenant_id)})
+
+    def test_reuses_middleware_payload(self, engine, principal, cache, token):
+        payload = {"sub": str(principal.user_id), "tenant_id": str(principal.tenant_id)}
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with Session(engine) as session, patch.object(AuthService, "decode_access_token") as decode:
+            user = get_current_user(make_request(payload, token), credentials, session)
+
+        decode.assert_not_called()
+        assert user.id == principal.user_id
+
+    def test_decodes_without_middleware_payload(self, engine, principal, cache, token):
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with Session(engine) as session:
+            user = get_current_user(make_request(), credentials, session)
+
+        assert user.id == principal.user_id
+
+    def test_payload_of_another_token_ignored(self, engine, principal, cache, token):
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        request = make_request({"sub": str(uuid4()), "tenant_id": str(principal.tenant_id)}, "other-token")
+
+        with Session(engine) as session:
+            user = get_current_user(request, credentials, session)
+
+        assert user.id == principal.user_id
+
+    def test_payload_without_sub_rejected(self, engine, cache, token):
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with Session(engine) as session, pytest.raises(HTTPException) as exc_info:
+            get_current_user(make_request({"tenant_id": str(uuid4())}, token), credentials, session)
+
+        assert exc_info.value.status_code == 401
+
+    def test_unknown_user(self, engine, cache):
+        token = AuthService.create_access_token({"sub": str(uuid4())})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with Session(engine) as session, pytest.raises(HTTPException) as exc_info:
+            get_current_user(make_request(), credentials, session)
+
+        assert exc_info.value.status_code == 401
+
+    def test_current_tenant(self, engine, principal, cache):
+        with Session(engine) as session:
+            tenant = get_current_tenant(SimpleNamespace(tenant_id=principal.tenant_id), session)
+
+        assert tenant.slug == "acme"
+
+    def test_current_tenant_not_found(self, cache):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_tenant(SimpleNamespace(tenant_id=uuid4()), db)
+
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,125 @@
+"""
+Tests for Row Projections
+
+Sparse fieldset parsing, column-projected list queries, and serialization of
+projected rows by reduced response schemas (no database server required).
+"""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.lead import Lead
+from app.schemas.audit_log import AuditLogResponse, AuditLogsListResponse
+from app.schemas.lead import LeadResponse
+from app.services.audit_service import AuditService
+from app.services.lead_service import LEAD_LIST_ORDER, LeadService
+from app.utils.projection import fieldset_schema, parse_fields, project, projected_list_response, projected_page_response
+
+
+def compile_sql(query) -> str:
+    statement = query.statement if hasattr(query, "statement") else query
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def selected_columns(query) -> list:
+    statement = query.statement if hasattr(query, "statement") else query
+    return [column.name for column in statement.selected_columns]
+
+
+class TestParseFields:
+    """Tests for parse_fields"""
+
+    def test_default_is_every_schema_field(self):
+        assert parse_fields(None, LeadResponse) == tuple(LeadResponse.model_fields)
+        assert parse_fields("", LeadResponse) == tuple(LeadResponse.model_fields)
+
+    def test_request_order_without_duplicates(self):
+        assert parse_fields(" score,id, name,score ", LeadResponse) == ("score", "id", "name")
+
+    @pytest.mark.parametrize("fields", ["id,password", ",", "tenant"])
+    def test_unknown_fields(self, fields):
+        with pytest.raises(ValueError):
+            parse_fields(fields, LeadResponse)
+
+
+class TestProject:
+    """Tests for project"""
+
+    def test_select_only_fields_and_sort_columns(self):
+        query = project(select(Lead), Lead, ("id", "name"), LEAD_LIST_ORDER)
+
+        assert selected_columns(query) == ["id", "name", "score", "created_at"]
+        assert "leads.notes" not in compile_sql(query)
+
+    def test_orm_query(self):
+        db = MagicMock()
+
+        project(db.query(Lead), Lead, ("id", "score"))
+
+        columns = db.query.return_value.with_entities.call_args.args
+        assert [column.name for column in columns] == ["id", "score"]
+
+    def test_lead_list_rows(self):
+        db = MagicMock()
+
+        LeadService(db).list_by_tenant(tenant_id="t1", fields=("id", "name"))
+
+        columns = db.query.return_value.filter.return_value.filter.return_value.with_entities.call_args.args
+        assert [column.name for column in columns] == ["id", "name", "score", "created_at"]
+
+    def test_entities_without_fields(self):
+        db = MagicMock()
+
+        LeadService(db).list_by_tenant(tenant_id="t1")
+
+        db.query.return_value.filter.return_value.filter.return_value.with_entities.assert_not_called()
+
+    def test_audit_log_page_rows(self):
+        db = MagicMock()
+
+        AuditService.get_audit_logs(db, tenant_id="t1", fields=("id", "action"), total="none")
+
+        columns = db.query.return_value.filter.return_value.with_entities.call_args.args
+        assert [column.name for column in columns] == ["id", "action", "created_at"]
+
+
+class TestProjectedResponses:
+    """Projected rows are serialized by the reduced response schema"""
+
+    def test_fieldset_schema_is_cached(self):
+        schema = fieldset_schema(LeadResponse, ("id", "score"))
+
+        assert schema is fieldset_schema(LeadResponse, ("id", "score"))
+        assert list(schema.model_fields) == ["id", "score"]
+        assert fieldset_schema(LeadResponse, tuple(LeadResponse.model_fields)) is LeadResponse
+
+    def test_list_response_drops_sort_columns(self):
+        row = SimpleNamespace(id=UUID(int=1), score=90, created_at=datetime(2026, 1, 1))
+
+        response = projected_list_response([row], LeadResponse, ("id", "score"), headers={"X-Next-Cursor": "abc"})
+
+        assert json.loads(response.body) == [{"id": str(UUID(int=1)), "score": 90}]
+        assert response.headers["X-Next-Cursor"] == "abc"
+        assert response.media_type == "application/json"
+
+    def test_page_response(self):
+        row = SimpleNamespace(id=UUID(int=2), action="UPDATE", created_at=datetime(2026, 1, 1))
+
+        response = projected_page_response(
+            AuditLogsListResponse, "items", [row], AuditLogResponse, ("id", "action"), total=None, skip=0, limit=10, next_cursor=None
+        )
+
+        assert json.loads(response.body) == {
+            "items": [{"id": str(UUID(int=2)), "action": "UPDATE"}],
+            "total": None,
+            "skip": 0,
+            "limit": 10,
+            "next_cursor": None,
+        }
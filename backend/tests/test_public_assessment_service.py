@@ -0,0 +1,143 @@
+"""
+Tests for Public Assessment Service
+
+Payload compilation and caching for the embed widget (no database required).
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.cache import MemoryCache, RedisCache
+from app.core.constants import CacheTTL
+from app.services.public_assessment_service import (
+    CompiledAssessment,
+    PublicAssessmentService,
+    build_public_payload,
+)
+
+
+def make_assessment(status="published"):
+    return SimpleNamespace(id=uuid4(), tenant_id=uuid4(), title="Title", description=None, status=status)
+
+
+def make_question(order, options=()):
+    return SimpleNamespace(
+        id=uuid4(),
+        text=f"Q{order}?",
+        type="single_choice",
+        order=order,
+        options=[SimpleNamespace(id=uuid4(), text=text, points=points, order=i) for i, (text, points) in enumerate(options)],
+    )
+
+
+@pytest.fixture
+def service():
+    with patch("app.services.public_assessment_service.get_cache", return_value=MemoryCache()):
+        yield PublicAssessmentService(MagicMock())
+
+
+class TestBuildPublicPayload:
+    """Tests for build_public_payload"""
+
+    def test_payload_shape(self):
+        """Payload contains questions, options and GA4 config"""
+        assessment = make_assessment()
+        question = make_question(1, [("Yes", 10), ("No", 0)])
+        ga = {"measurement_id": "G-ABC123", "enabled": True, "track_embed_widget": True}
+
+        payload = build_public_payload(assessment, [question], ga)
+
+        assert payload["id"] == str(assessment.id)
+        assert payload["questions"][0]["id"] == str(question.id)
+        assert [opt["text"] for opt in payload["questions"][0]["options"]] == ["Yes", "No"]
+        assert payload["questions"][0]["options"][0]["points"] == 10
+        assert payload["google_analytics"] == ga
+
+
+class TestCompiledAssessment:
+    """Tests for CompiledAssessment"""
+
+    def test_etag_is_content_based(self):
+        """Identical payloads share an ETag, changed payloads do not"""
+        first = CompiledAssessment.from_payload({"title": "A"})
+
+        assert CompiledAssessment.from_payload({"title": "A"}).etag == first.etag
+        assert CompiledAssessment.from_payload({"title": "B"}).etag != first.etag
+        assert first.etag.startswith('"') and first.etag.endswith('"')
+
+    def test_cache_round_trip(self):
+        """Cache encoding preserves body and ETag"""
+        compiled = CompiledAssessment.from_payload({"title": "改行\nあり"})
+
+        assert CompiledAssessment.from_cache_value(compiled.to_cache_value()) == compiled
+        assert json.loads(compiled.body)["title"] == "改行\nあり"
+
+
+class TestPublicAssessmentService:
+    """Tests for PublicAssessmentService caching"""
+
+    def test_get_compiles_once(self, service):
+        """Repeated gets are served from the cache"""
+        compiled = CompiledAssessment.from_payload({"title": "A"})
+        tenant_id, assessment_id = uuid4(), uuid4()
+
+        with patch.object(service, "compile", return_value=compiled) as compile_mock:
+            assert service.get(tenant_id, assessment_id) == compiled
+            assert service.get(tenant_id, assessment_id) == compiled
+
+        compile_mock.assert_called_once_with(tenant_id, assessment_id)
+
+    def test_get_does_not_cache_missing(self, service):
+        """Unpublished or missing assessments are not cached"""
+        with patch.object(service, "compile", return_value=None) as compile_mock:
+            assert service.get(uuid4(), uuid4()) is None
+
+        assert service.cache._entries == {}
+        compile_mock.assert_called_once()
+
+    def test_refresh_recompiles_published(self, service):
+        """refresh replaces the cached payload of a published assessment"""
+        assessment = make_assessment()
+        old = CompiledAssessment.from_payload({"title": "old"})
+        new = CompiledAssessment.from_payload({"title": "new"})
+        service.cache.set(service.cache_key(assessment.tenant_id, assessment.id), old.to_cache_value(), 60)
+
+        with patch.object(service, "compile", return_value=new):
+            service.refresh(assessment)
+
+            assert service.get(assessment.tenant_id, assessment.id) == new
+
+    def test_refresh_evicts_unpublished(self, service):
+        """refresh evicts assessments that are no longer published"""
+        assessment = make_assessment(status="draft")
+        compiled = CompiledAssessment.from_payload({"title": "A"})
+        service.cache.set(service.cache_key(assessment.tenant_id, assessment.id), compiled.to_cache_value(), 60)
+
+        with patch.object(service, "compile") as compile_mock:
+            service.refresh(assessment)
+
+        compile_mock.assert_not_called()
+        assert service.cache.get(service.cache_key(assessment.tenant_id, assessment.id)) is None
+
+    def test_invalidate_tenant(self, service):
+        """invalidate_tenant evicts every published assessment of the tenant"""
+        tenant_id = uuid4()
+        ids = [uuid4(), uuid4()]
+        for assessment_id in ids:
+            service.cache.set(service.cache_key(tenant_id, assessment_id), b'"e"\n{}', 60)
+        service.db.query.return_value.filter.return_value = [SimpleNamespace(id=i) for i in ids]
+
+        service.invalidate_tenant(tenant_id)
+
+        assert all(service.cache.get(service.cache_key(tenant_id, i)) is None for i in ids)
+
+    def test_memory_cache_uses_short_ttl(self, service):
+        """A per-worker cache keeps payloads briefly; a shared one for an hour"""
+        assert service.cache_ttl == CacheTTL.SHORT
+
+        with patch("app.services.public_assessment_service.get_cache", return_value=RedisCache(MagicMock())):
+            assert PublicAssessmentService(MagicMock()).cache_ttl == CacheTTL.LONG
@@ -0,0 +1,192 @@
+"""
+Tests for QR Analytics Service
+
+Rollup upsert construction and analytics assembly (no database required).
+"""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.qr_analytics_service import QRAnalyticsService, build_qr_analytics
+
+
+def make_row(day, device_type="mobile", country="", scans=0, started=0, completed=0, leads=0):
+    return SimpleNamespace(
+        day=day,
+        device_type=device_type,
+        country=country,
+        scans=scans,
+        started=started,
+        completed=completed,
+        leads=leads,
+    )
+
+
+def make_scan(**overrides):
+    values = {
+        "qr_code_id": uuid4(),
+        "scanned_at": datetime(2026, 10, 1, 23, 59),
+        "device_type": "mobile",
+        "country": "JP",
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestBuildQRAnalytics:
+    """Tests for build_qr_analytics"""
+
+    def test_empty_rollup(self):
+        """No rows produces zeroed analytics with the full response shape"""
+        result = build_qr_analytics([], unique_scans=0)
+
+        assert result["summary"] == {
+            "total_scans": 0,
+            "unique_scans": 0,
+            "assessment_started": 0,
+            "assessment_completed": 0,
+            "leads_created": 0,
+            "conversion_rate": 0.0,
+        }
+        assert result["scans_by_date"] == []
+        assert result["scans_by_device"] == {"mobile": 0, "tablet": 0, "desktop": 0, "unknown": 0}
+        assert result["scans_by_country"] == {"country_scans": {}}
+        assert result["funnel"] == {"scanned": 0, "started": 0, "completed": 0, "converted": 0}
+
+    def test_aggregates_buckets(self):
+        """Buckets are summed per date, device and country"""
+        rows = [
+            make_row(date(2026, 10, 1), "mobile", "JP", scans=3, started=2, completed=1, leads=1),
+            make_row(date(2026, 10, 1), "desktop", "US", scans=1, started=1),
+            make_row(date(2026, 10, 2), "tablet", "JP", scans=2, started=1, completed=1),
+            make_row(date(2026, 10, 2), "tv", "", scans=4),
+        ]
+
+        result = build_qr_analytics(rows, unique_scans=7)
+
+        assert result["summary"]["total_scans"] == 10
+        assert result["summary"]["unique_scans"] == 7
+        assert result["summary"]["assessment_started"] == 4
+        assert result["summary"]["assessment_completed"] == 2
+        assert result["summary"]["leads_created"] == 1
+        assert result["summary"]["conversion_rate"] == 20.0
+        assert result["scans_by_date"] == [
+            {"date": "2026-10-01", "scans": 4},
+            {"date": "2026-10-02", "scans": 6},
+        ]
+        assert result["scans_by_device"] == {"mobile": 3, "tablet": 2, "desktop": 1, "unknown": 4}
+        assert result["scans_by_country"] == {"country_scans": {"JP": 5, "US": 1}}
+        assert result["funnel"] == {"scanned": 10, "started": 4, "completed": 2, "converted": 1}
+
+    def test_funnel_only_bucket_not_listed_by_date(self):
+        """Days with funnel updates but no scans do not appear in scans_by_date"""
+        rows = [make_row(date(2026, 10, 1), scans=0, started=1)]
+
+        result = build_qr_analytics(rows, unique_scans=0)
+
+        assert result["scans_by_date"] == []
+        assert result["summary"]["assessment_started"] == 1
+
+    def test_top_countries_limited_to_ten(self):
+        """Only the ten most scanned countries are returned"""
+        rows = [make_row(date(2026, 10, 1), country=f"C{i}", scans=i + 1) for i in range(12)]
+
+        result = build_qr_analytics(rows, unique_scans=0)
+
+        countries = result["scans_by_country"]["country_scans"]
+        assert len(countries) == 10
+        assert "C0" not in countries
+        assert "C1" not in countries
+        assert list(countries)[0] == "C11"
+
+
+class TestRollupUpsert:
+    """Tests for rollup upsert statements"""
+
+    def test_increment_statement_is_upsert(self):
+        """Increments compile to INSERT ... ON CONFLICT DO UPDATE"""
+        stmt = QRAnalyticsService.build_increment_statement(
+            qr_code_id=uuid4(),
+            scanned_at=datetime(2026, 10, 1, 12, 0),
+            device_type="mobile",
+            country=None,
+            increments={"scans": 1},
+        )
+
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "INSERT INTO qr_scan_daily" in sql
+        assert "ON CONFLICT (qr_code_id, day, device_type, country) DO UPDATE" in sql
+        assert "scans = (qr_scan_daily.scans + excluded.scans)" in sql
+        assert "started = " not in sql
+
+    def test_increment_statement_buckets_scan(self):
+        """Bucket is derived from scan day, device and country"""
+        stmt = QRAnalyticsService.build_increment_statement(
+            qr_code_id=uuid4(),
+            scanned_at=datetime(2026, 10, 1, 23, 59),
+            device_type=None,
+            country=None,
+            increments={"started": 1, "completed": 1},
+        )
+
+        params = stmt.compile(dialect=postgresql.dialect()).params
+
+        assert params["day"] == date(2026, 10, 1)
+        assert params["device_type"] == "unknown"
+        assert params["country"] == ""
+        assert params["scans"] == 0
+        assert params["started"] == 1
+        assert params["completed"] == 1
+
+    def test_unknown_counter_rejected(self):
+        """Only rollup counters can be incremented"""
+        with pytest.raises(ValueError, match="Unknown rollup counters"):
+            QRAnalyticsService.build_increment_statement(
+                qr_code_id=uuid4(),
+                scanned_at=datetime(2026, 10, 1),
+                device_type="mobile",
+                country="JP",
+                increments={"bogus": 1},
+            )
+
+    @pytest.mark.asyncio
+    async def test_record_scan_executes_upsert(self):
+        """record_scan issues one statement on the session"""
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        await QRAnalyticsService(db).record_scan(make_scan())
+
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_record_funnel_progress_without_changes_is_noop(self):
+        """No flipped flags means no database round trip"""
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        await QRAnalyticsService(db).record_funnel_progress(make_scan())
+
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_analytics_reads_rollup(self):
+        """get_analytics assembles the response from rollup rows"""
+        result = MagicMock()
+        result.all.return_value = [make_row(date(2026, 10, 1), "desktop", "JP", scans=2, completed=1)]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        qr_code = SimpleNamespace(id=uuid4(), unique_scan_count=2)
+
+        analytics = await QRAnalyticsService(db).get_analytics(qr_code, days=30)
+
+        db.execute.assert_awaited_once()
+        assert analytics["summary"]["total_scans"] == 2
+        assert analytics["summary"]["conversion_rate"] == 50.0
+        assert analytics["scans_by_device"]["desktop"] == 2
@@ -6,6 +6,7 @@ from uuid import uuid4
 import pytest
 from PIL import Image
 
+from app.core.storage import LocalStorageBackend
 from app.models.assessment import Assessment
 from app.models.qr_code import QRCode
 from app.models.tenant import Tenant
@@ -201,16 +202,41 @@ class TestCloudStorageUpload:
         return QRCodeService(db=mock_db)
 
     @pytest.mark.asyncio
-    async def test_upload_to_storage_placeholder(self, service):
-        """Test storage upload returns placeholder URL"""
+    async def test_upload_to_storage_content_addressed(self, service, tmp_path):
+        """Test storage upload returns a content-addressed URL"""
+        storage = LocalStorageBackend(root=str(tmp_path), public_base_url="https://api.test.com/api/v1/files")
         file_data = b"fake image data"
-        filename = "test.png"
 
-        url = await service.upload_to_storage(file_data, filename)
+        with patch("app.services.qr_code_service.get_storage", return_value=storage):
+            url = await service.upload_to_storage(file_data, "test.png")
+            url_again = await service.upload_to_storage(file_data, "other.png")
 
-        assert isinstance(url, str)
-        assert filename in url
-        assert url.startswith("https://")
+        key = storage.key_from_url(url)
+        assert url.startswith("https://api.test.com/api/v1/files/")
+        assert url.endswith(".png")
+        assert url_again == url
+        assert storage.exists(key)
+
+    @pytest.mark.asyncio
+    async def test_get_stored_image_renders_once(self, service, tmp_path):
+        """Test QR image is rendered only when it is not stored yet"""
+        storage = LocalStorageBackend(root=str(tmp_path), public_base_url="https://api.test.com/api/v1/files")
+        qr_code = QRCode(
+            assessment_id=uuid4(),
+            short_code="abc123",
+            style={"color": "#000000", "size": 256},
+            qr_code_image_url="https://storage.diagnoleads.com/qr-codes/qr_abc123.png",
+        )
+
+        with patch("app.services.qr_code_service.get_storage", return_value=storage):
+            with patch.object(service, "render_qr_png", wraps=service.render_qr_png) as render:
+                first = await service.get_stored_image(qr_code)
+                second = await service.get_stored_image(qr_code)
+
+        assert render.call_count == 1
+        assert first == second
+        assert first.content_type == "image/png"
+        assert qr_code.qr_code_image_url == storage.url_for(first.key)
 
 
 class TestCompleteQRCodeCreation:
@@ -202,14 +202,14 @@ class TestQRCodeServiceStorageUpload:
 
     @pytest.mark.asyncio
     async def test_upload_to_storage_returns_url(self, service):
-        """Test that upload_to_storage returns placeholder URL"""
+        """Test that upload_to_storage returns the stored file URL"""
         file_data = b"test image data"
         filename = "test_qr.png"
 
         result = await service.upload_to_storage(file_data, filename)
 
         assert isinstance(result, str)
-        assert filename in result
+        assert result.endswith(".png")
 
     @pytest.mark.asyncio
     async def test_upload_to_storage_different_content_types(self, service):
@@ -218,11 +218,11 @@ class TestQRCodeServiceStorageUpload:
 
         # PNG
         result_png = await service.upload_to_storage(file_data, "test.png", "image/png")
-        assert "test.png" in result_png
+        assert result_png.endswith(".png")
 
         # JPEG
         result_jpeg = await service.upload_to_storage(file_data, "test.jpg", "image/jpeg")
-        assert "test.jpg" in result_jpeg
+        assert result_jpeg.endswith(".jpg")
 
 
 class TestQRCodeServiceColorHandling:
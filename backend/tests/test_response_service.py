@@ -0,0 +1,90 @@
+"""
+Tests for Response Service
+
+Set-based answer upsert statement construction (no database required).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.response import AnswerCreate
+from app.services.response_service import ResponseService, build_answer_upsert_statement
+
+
+def compile_pg(stmt):
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+class TestBuildAnswerUpsertStatement:
+    """Tests for build_answer_upsert_statement"""
+
+    def test_single_statement_upsert_and_score(self):
+        """Answers are upserted and the score returned by one statement"""
+        stmt = build_answer_upsert_statement(
+            uuid4(),
+            [AnswerCreate(question_id=uuid4(), points_awarded=10), AnswerCreate(question_id=uuid4(), points_awarded=20)],
+        )
+
+        sql = str(compile_pg(stmt))
+
+        assert sql.startswith("WITH upserted AS")
+        assert "ON CONFLICT (response_id, question_id) DO UPDATE" in sql
+        assert "UPDATE responses SET total_score=" in sql
+        assert "NOT IN (SELECT upserted.question_id" in sql
+        assert sql.endswith("RETURNING responses.total_score")
+
+    def test_duplicate_questions_last_wins(self):
+        """A question answered twice in one submission is inserted once"""
+        question_id = uuid4()
+        stmt = build_answer_upsert_statement(
+            uuid4(),
+            [
+                AnswerCreate(question_id=question_id, answer_text="A", points_awarded=10),
+                AnswerCreate(question_id=question_id, answer_text="B", points_awarded=30),
+            ],
+        )
+
+        params = compile_pg(stmt).params
+
+        assert params["answer_text_m0"] == "B"
+        assert params["points_awarded_m0"] == 30
+        assert "answer_text_m1" not in params
+
+    def test_response_values_are_set(self):
+        """Extra response columns are updated in the same statement"""
+        stmt = build_answer_upsert_statement(
+            uuid4(),
+            [AnswerCreate(question_id=uuid4(), points_awarded=5)],
+            {"status": "completed", "email": "user@example.com"},
+        )
+
+        params = compile_pg(stmt).params
+
+        assert params["status"] == "completed"
+        assert params["email"] == "user@example.com"
+
+    def test_no_answers_recomputes_score(self):
+        """Without answers only the score is recomputed"""
+        sql = str(compile_pg(build_answer_upsert_statement(uuid4(), [])))
+
+        assert "INSERT" not in sql
+        assert sql.startswith("UPDATE responses SET total_score=(SELECT coalesce(sum(answers.points_awarded)")
+
+
+class TestResponseService:
+    """Tests for ResponseService"""
+
+    def test_save_answers_single_round_trip(self):
+        """save_answers executes one statement and returns the new score"""
+        db = MagicMock()
+        db.execute.return_value.scalar_one.return_value = 42
+        response = SimpleNamespace(id=uuid4())
+
+        total = ResponseService(db).save_answers(response, [AnswerCreate(question_id=uuid4(), points_awarded=42)], name="Taro")
+
+        assert total == 42
+        db.execute.assert_called_once()
+        db.expire.assert_called_once_with(response)
@@ -73,6 +73,31 @@ class TestPublicAssessmentAPI:
         assert data["questions"][0]["text"] == "What is your goal?"
         assert len(data["questions"][0]["options"]) == 2
 
+    def test_get_published_assessment_revalidation(self, client: TestClient, db_session: Session, test_user: User):
+        """Test ETag/Cache-Control headers and 304 revalidation"""
+        assessment = Assessment(
+            title="Cached Assessment",
+            status="published",
+            tenant_id=test_user.tenant_id,
+            created_by=test_user.id,
+        )
+        db_session.add(assessment)
+        db_session.commit()
+        db_session.refresh(assessment)
+
+        url = f"/api/v1/tenants/{test_user.tenant_id}/assessments/{assessment.id}/public"
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert "max-age" in response.headers["cache-control"]
+        assert response.json()["google_analytics"] is None
+        etag = response.headers["etag"]
+
+        revalidated = client.get(url, headers={"If-None-Match": etag})
+
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == etag
+
     def test_get_draft_assessment_not_found(self, client: TestClient, db_session: Session, test_user: User):
         """Test that draft assessments are not publicly accessible"""
         # Create draft assessment
@@ -0,0 +1,230 @@
+"""
+Tests for File Storage
+
+Local and S3 storage backends, range parsing and the stored file endpoint.
+"""
+
+import hashlib
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import files
+from app.core.storage import (
+    IMMUTABLE_CACHE_CONTROL,
+    LocalStorageBackend,
+    RangeNotSatisfiable,
+    S3StorageBackend,
+    get_storage,
+    make_key,
+    parse_range_header,
+)
+
+BASE_URL = "https://api.test.com/api/v1/files"
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Local storage rooted in a temporary directory"""
+    return LocalStorageBackend(root=str(tmp_path), public_base_url=BASE_URL)
+
+
+class TestKeys:
+    """Tests for content-addressed keys"""
+
+    def test_make_key_is_sha256_with_extension(self):
+        """Key is the content hash plus a normalized extension"""
+        assert make_key(b"data", ".PNG") == f"{hashlib.sha256(b'data').hexdigest()}.png"
+        assert make_key(b"data") == hashlib.sha256(b"data").hexdigest()
+
+    def test_url_round_trip(self, storage):
+        """URLs built by url_for map back to their key"""
+        key = make_key(b"data", ".png")
+
+        assert storage.key_from_url(storage.url_for(key)) == key
+        assert storage.key_from_url("https://storage.diagnoleads.com/qr-codes/qr_abc.png") is None
+        assert storage.key_from_url(f"{BASE_URL}/../secret") is None
+        assert storage.key_from_url(None) is None
+
+
+class TestParseRangeHeader:
+    """Tests for parse_range_header"""
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            (None, None),
+            ("bytes=0-9", (0, 9)),
+            ("bytes=10-", (10, 99)),
+            ("bytes=-10", (90, 99)),
+            ("bytes=-500", (0, 99)),
+            ("bytes=50-500", (50, 99)),
+            ("bytes=0-1,5-9", None),
+            ("items=0-9", None),
+            ("bytes=9-0", None),
+        ],
+    )
+    def test_ranges(self, header, expected):
+        """Single ranges are parsed, unsupported forms serve the full file"""
+        assert parse_range_header(header, 100) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=100-", "bytes=200-300", "bytes=-0"])
+    def test_unsatisfiable(self, header):
+        """Ranges outside the file are rejected"""
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range_header(header, 100)
+
+
+class TestLocalStorageBackend:
+    """Tests for LocalStorageBackend"""
+
+    def test_save_and_read(self, storage, tmp_path):
+        """Saved content is sharded by hash and readable in chunks"""
+        data = bytes(range(256)) * 10
+
+        stored = storage.save(data, ".png", "image/png")
+
+        assert stored.size == len(data)
+        assert stored.content_type == "image/png"
+        assert (tmp_path / stored.key[:2] / stored.key[2:4] / stored.key).read_bytes() == data
+        assert b"".join(storage.iter_range(stored.key, 0, len(data) - 1, chunk_size=100)) == data
+
+    def test_save_is_idempotent(self, storage, tmp_path):
+        """Saving identical content writes once and leaves no temp files"""
+        first = storage.save(b"same", ".png")
+        second = storage.save(b"same", ".png")
+
+        assert first == second
+        files_on_disk = [p for p in tmp_path.rglob("*") if p.is_file()]
+        assert [p.name for p in files_on_disk] == [first.key]
+
+    def test_iter_range(self, storage):
+        """Ranges return exactly the requested bytes"""
+        stored = storage.save(b"0123456789", ".txt")
+
+        assert b"".join(storage.iter_range(stored.key, 2, 5, chunk_size=3)) == b"2345"
+
+    def test_stat(self, storage):
+        """stat returns metadata for stored keys only"""
+        stored = storage.save(b"abc", ".png")
+
+        assert storage.stat(stored.key) == stored
+        assert storage.stat(make_key(b"missing", ".png")) is None
+        assert storage.stat("../../etc/passwd") is None
+
+    def test_failed_write_leaves_no_partial_file(self, storage, tmp_path, monkeypatch):
+        """A failed write does not leave temp or partial files behind"""
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("app.core.storage.os.replace", fail_replace)
+
+        with pytest.raises(OSError):
+            storage.save(b"data", ".png")
+
+        assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
+
+
+class TestS3StorageBackend:
+    """Tests for S3StorageBackend with a mocked client"""
+
+    def test_save_uploads_with_cache_headers(self):
+        """New objects are uploaded once with immutable cache headers"""
+        client = MagicMock()
+        client.head_object.side_effect = type("ClientError", (Exception,), {"response": {"Error": {"Code": "404"}}})()
+        storage = S3StorageBackend(bucket="bucket", public_base_url=BASE_URL, prefix="files", client=client)
+
+        stored = storage.save(b"data", ".png", "image/png")
+
+        client.put_object.assert_called_once_with(
+            Bucket="bucket",
+            Key=f"files/{stored.key}",
+            Body=b"data",
+            ContentType="image/png",
+            CacheControl=IMMUTABLE_CACHE_CONTROL,
+        )
+
+    def test_save_existing_object_skips_upload(self):
+        """Existing objects are not uploaded again"""
+        client = MagicMock()
+        client.head_object.return_value = {"ContentLength": 4, "ContentType": "image/png"}
+        storage = S3StorageBackend(bucket="bucket", public_base_url=BASE_URL, client=client)
+
+        storage.save(b"data", ".png")
+
+        client.put_object.assert_not_called()
+
+    def test_iter_range_uses_range_request(self):
+        """Reads request only the needed byte range"""
+        body = MagicMock()
+        body.iter_chunks.return_value = iter([b"23", b"45"])
+        client = MagicMock()
+        client.get_object.return_value = {"Body": body}
+        storage = S3StorageBackend(bucket="bucket", public_base_url=BASE_URL, client=client)
+        key = make_key(b"0123456789", ".txt")
+
+        assert b"".join(storage.iter_range(key, 2, 5)) == b"2345"
+        client.get_object.assert_called_once_with(Bucket="bucket", Key=key, Range="bytes=2-5")
+        body.close.assert_called_once()
+
+
+class TestFilesEndpoint:
+    """Tests for GET /files/{key}"""
+
+    @pytest.fixture
+    def client(self, storage):
+        app = FastAPI()
+        app.include_router(files.router)
+        app.dependency_overrides[get_storage] = lambda: storage
+        return TestClient(app)
+
+    def test_full_response(self, client, storage):
+        """Full file is served with cache and range headers"""
+        stored = storage.save(b"0123456789", ".png")
+
+        response = client.get(f"/files/{stored.key}")
+
+        assert response.status_code == 200
+        assert response.content == b"0123456789"
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["content-length"] == "10"
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert response.headers["etag"] == stored.etag
+
+    def test_partial_response(self, client, storage):
+        """Range requests return 206 with Content-Range"""
+        stored = storage.save(b"0123456789", ".png")
+
+        response = client.get(f"/files/{stored.key}", headers={"Range": "bytes=2-5"})
+
+        assert response.status_code == 206
+        assert response.content == b"2345"
+        assert response.headers["content-range"] == "bytes 2-5/10"
+        assert response.headers["content-length"] == "4"
+
+    def test_unsatisfiable_range(self, client, storage):
+        """Out of bounds ranges return 416"""
+        stored = storage.save(b"0123456789", ".png")
+
+        response = client.get(f"/files/{stored.key}", headers={"Range": "bytes=50-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+    def test_not_modified(self, client, storage):
+        """Matching If-None-Match returns 304"""
+        stored = storage.save(b"0123456789", ".png")
+
+        response = client.get(f"/files/{stored.key}", headers={"If-None-Match": stored.etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_missing_file(self, client):
+        """Unknown and malformed keys return 404"""
+        assert client.get(f"/files/{make_key(b'missing', '.png')}").status_code == 404
+        assert client.get("/files/not-a-key.png").status_code == 404
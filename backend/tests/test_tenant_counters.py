@@ -0,0 +1,117 @@
+"""
+Tests for Tenant Counters
+
+Counter deltas of lead / assessment mutations, the delta upsert, drift
+reconciliation and O(1) count lookups (no database server required).
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.analytics_service import AnalyticsService
+from app.services.assessment_service import AssessmentService
+from app.services.lead_service import LeadService
+from app.services.tenant_counter_service import (
+    TenantCounterService,
+    assessment_counters,
+    counter_deltas,
+    lead_counters,
+    lead_temperature,
+)
+
+
+class TestCounterDeltas:
+    """Deltas of single mutations"""
+
+    def test_temperature_buckets(self):
+        assert [lead_temperature(score) for score in (0, 30, 31, 60, 61, 100)] == ["cold", "cold", "warm", "warm", "hot", "hot"]
+
+    def test_created_lead(self):
+        assert counter_deltas(new=lead_counters("new", 0)) == {"leads.total": 1, "leads.status.new": 1, "leads.temperature.cold": 1}
+
+    def test_status_change_moves_one_status(self):
+        assert counter_deltas(lead_counters("new", 70), lead_counters("contacted", 70)) == {"leads.status.new": -1, "leads.status.contacted": 1}
+
+    def test_score_change_within_bucket_is_a_no_op(self):
+        assert counter_deltas(lead_counters("new", 40), lead_counters("new", 55)) == {}
+
+    def test_deleted_assessment(self):
+        assert counter_deltas(old=assessment_counters("published")) == {"assessments.total": -1, "assessments.status.published": -1}
+
+
+class TestTenantCounterService:
+    """Tests for TenantCounterService"""
+
+    def test_apply_is_one_sorted_delta_upsert(self):
+        db = MagicMock()
+
+        TenantCounterService(db).apply(uuid4(), {"leads.status.new": -1, "leads.status.contacted": 1, "leads.total": 0})
+
+        statement = db.execute.call_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (tenant_id, counter) DO UPDATE SET value = (tenant_counters.value + excluded.value)" in sql
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert [params["counter_m0"], params["counter_m1"]] == ["leads.status.contacted", "leads.status.new"]
+        assert "counter_m2" not in params
+
+    def test_no_deltas_no_statement(self):
+        db = MagicMock()
+
+        TenantCounterService(db).lead_changed(uuid4(), old=("new", 10), new=("new", 20))
+
+        db.execute.assert_not_called()
+
+    def test_reconcile_applies_drift(self):
+        db = MagicMock()
+        db.execute.return_value.all.return_value = [("leads.total", 5), ("leads.status.new", 5), ("leads.status.lost", 1)]
+        service = TenantCounterService(db)
+        tenant_id = uuid4()
+
+        with (
+            patch.object(service, "count_rows", return_value={"leads.total": 6, "leads.status.new": 6}),
+            patch.object(service, "apply") as apply,
+        ):
+            drift = service.reconcile(tenant_id)
+
+        assert drift == {"leads.total": 1, "leads.status.new": 1, "leads.status.lost": -1}
+        apply.assert_called_once_with(tenant_id, drift)
+        lock = str(db.execute.call_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+        assert "FOR UPDATE" in lock
+
+
+class TestCountLookups:
+    """Count methods read counters instead of counting rows"""
+
+    def test_lead_and_assessment_counts(self):
+        tenant_id = uuid4()
+
+        with patch.object(TenantCounterService, "get", return_value=7) as get:
+            assert LeadService(MagicMock()).count_by_tenant(tenant_id) == 7
+            assert LeadService(MagicMock()).count_by_tenant(tenant_id, status="qualified") == 7
+            assert AssessmentService(MagicMock()).count_by_tenant(tenant_id, status="draft") == 7
+
+        assert [call.args[1] for call in get.call_args_list] == ["leads.total", "leads.status.qualified", "assessments.status.draft"]
+
+    def test_dashboard_counts(self):
+        counters = {
+            "leads.total": 3,
+            "leads.status.new": 2,
+            "leads.status.converted": 1,
+            "leads.status.lost": 0,
+            "leads.temperature.hot": 1,
+            "leads.temperature.cold": 2,
+            "assessments.total": 1,
+            "assessments.status.published": 1,
+        }
+
+        with patch.object(TenantCounterService, "get_all", return_value=counters):
+            counts = AnalyticsService(MagicMock()).get_counts(uuid4())
+
+        assert counts["leads"] == {
+            "total": 3,
+            "by_status": {"new": 2, "converted": 1},
+            "by_temperature": {"hot": 1, "warm": 0, "cold": 2},
+        }
+        assert counts["assessments"] == {"total": 1, "by_status": {"published": 1}}
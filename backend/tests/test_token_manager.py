@@ -0,0 +1,189 @@
+"""
+Tests for OAuth Token Manager
+
+Token caching, refresh-ahead and single-flight refreshes against a local
+stub token endpoint.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+import pytest
+from cryptography.fernet import Fernet
+
+from app.core.cache import MemoryCache
+from app.integrations.microsoft.teams_client import TeamsClient
+from app.integrations.token_manager import AccessToken, TokenManager
+from app.services.crm_integration_service import CRMIntegrationService
+
+
+class StubTokenEndpoint:
+    """Client credentials token endpoint issuing numbered tokens"""
+
+    def __init__(self, expires_in=3600, delay=0.0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return httpx.Response(200, json={"access_token": f"token-{self.calls}", "token_type": "Bearer", "expires_in": self.expires_in})
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+    def fetcher(self):
+        client = self.client()
+
+        async def fetch() -> AccessToken:
+            response = await client.post("https://login.example.com/token", data={"grant_type": "client_credentials"})
+            return AccessToken.from_response(response.json())
+
+        return fetch
+
+
+class TestTokenManager:
+    """Tests for TokenManager"""
+
+    @pytest.mark.asyncio
+    async def test_caches_token_until_refresh_margin(self):
+        endpoint = StubTokenEndpoint(expires_in=3600)
+        manager = TokenManager(refresh_margin=300)
+        fetch = endpoint.fetcher()
+
+        first = await manager.get_token("teams:a", fetch)
+        second = await manager.get_token("teams:a", fetch)
+
+        assert first.access_token == second.access_token == "token-1"
+        assert 3500 < first.expires_in() <= 3600
+        assert endpoint.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_are_single_flighted(self):
+        endpoint = StubTokenEndpoint(delay=0.05)
+        manager = TokenManager()
+        fetch = endpoint.fetcher()
+
+        tokens = await asyncio.gather(*(manager.get_token("teams:a", fetch) for _ in range(20)))
+
+        assert {token.access_token for token in tokens} == {"token-1"}
+        assert endpoint.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_token_in_margin_is_served_while_refreshing(self):
+        endpoint = StubTokenEndpoint(expires_in=3600)
+        manager = TokenManager(refresh_margin=300)
+        fetch = endpoint.fetcher()
+        manager._tokens["teams:a"] = AccessToken("old", time.time() + 60)
+
+        token = await manager.get_token("teams:a", fetch)
+        assert token.access_token == "old"
+
+        await asyncio.sleep(0.01)
+        assert endpoint.calls == 1
+        assert (await manager.get_token("teams:a", fetch)).access_token == "token-1"
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_refreshed_inline(self):
+        endpoint = StubTokenEndpoint()
+        manager = TokenManager()
+        manager._tokens["teams:a"] = AccessToken("expired", time.time() - 1)
+
+        assert (await manager.get_token("teams:a", endpoint.fetcher())).access_token == "token-1"
+
+    @pytest.mark.asyncio
+    async def test_valid_seed_avoids_fetch(self):
+        endpoint = StubTokenEndpoint()
+        manager = TokenManager()
+
+        token = await manager.get_token("crm:a", endpoint.fetcher(), seed=AccessToken("stored", time.time() + 3600))
+
+        assert token.access_token == "stored"
+        assert endpoint.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_raises_and_is_retried(self):
+        manager = TokenManager()
+        calls = []
+
+        async def failing_fetch():
+            calls.append(1)
+            raise httpx.ConnectError("down")
+
+        with pytest.raises(httpx.ConnectError):
+            await manager.get_token("teams:a", failing_fetch)
+        with pytest.raises(httpx.ConnectError):
+            await manager.get_token("teams:a", failing_fetch)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_tokens_are_shared_encrypted_across_workers(self):
+        endpoint = StubTokenEndpoint()
+        cache = MemoryCache()
+        cipher = Fernet(Fernet.generate_key())
+        worker_a = TokenManager(shared_cache=cache, cipher=cipher)
+        worker_b = TokenManager(shared_cache=cache, cipher=cipher)
+
+        await worker_a.get_token("teams:a", endpoint.fetcher())
+        token = await worker_b.get_token("teams:a", endpoint.fetcher())
+
+        assert token.access_token == "token-1"
+        assert endpoint.calls == 1
+        assert b"token-1" not in cache.get("oauth_token:teams:a")
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        endpoint = StubTokenEndpoint()
+        cache = MemoryCache()
+        manager = TokenManager(shared_cache=cache)
+        fetch = endpoint.fetcher()
+
+        await manager.get_token("teams:a", fetch)
+        manager.invalidate("teams:a")
+
+        assert cache.get("oauth_token:teams:a") is None
+        assert (await manager.get_token("teams:a", fetch)).access_token == "token-2"
+
+
+class TestIntegrationTokens:
+    """Integrations get their tokens through the token manager"""
+
+    @pytest.mark.asyncio
+    async def test_teams_client_reuses_cached_token(self):
+        endpoint = StubTokenEndpoint(expires_in=3599)
+        manager = TokenManager()
+
+        with patch("app.integrations.microsoft.teams_client.get_token_manager", return_value=manager):
+            client = TeamsClient("tenant", "client", "secret", http_client=endpoint.client())
+            assert await client.authenticate() == "token-1"
+
+            other = TeamsClient("tenant", "client", "secret", http_client=endpoint.client())
+            assert await other.authenticate() == "token-1"
+
+        assert endpoint.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_crm_access_token_refreshes_expired_stored_token(self):
+        manager = TokenManager()
+        integration = SimpleNamespace(
+            id=uuid4(),
+            access_token_encrypted="encrypted",
+            expires_at=SimpleNamespace(timestamp=lambda: time.time() - 10),
+            decrypt_access_token=lambda: "stored",
+        )
+        refreshed = AccessToken("refreshed", time.time() + 7200)
+
+        with (
+            patch("app.services.crm_integration_service.get_token_manager", return_value=manager),
+            patch("app.services.crm_integration_service.refresh_crm_token", return_value=refreshed) as refresh,
+        ):
+            token = await CRMIntegrationService(None).get_access_token(integration)
+
+        assert token == "refreshed"
+        refresh.assert_called_once_with(integration.id)